@@ -139,7 +139,12 @@ def create_app(apps: str = "all") -> FastAPI:
 
     if "all" in apps_list or "execution" in apps_list:
         task_exec_api_app = create_task_execution_api_app()
-        task_exec_api_app.state.dag_bag = dag_bag
+        if conf.getboolean("execution_api", "lazy_load_dag_tasks"):
+            # Task instances mostly need their own task, so the execution API gets a DagBag of its own
+            # rather than sharing the eagerly loaded Dags the UI and the public API walk in full.
+            task_exec_api_app.state.dag_bag = create_dag_bag(lazy_load_tasks=True)
+        else:
+            task_exec_api_app.state.dag_bag = dag_bag
         app.mount("/execution", task_exec_api_app)
 
     if "all" in apps_list or "core" in apps_list:
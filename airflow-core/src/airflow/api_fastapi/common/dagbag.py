@@ -30,20 +30,34 @@ if TYPE_CHECKING:
     from airflow.serialization.definitions.dag import SerializedDAG
 
 
-def create_dag_bag() -> CachedDBDagBag:
-    """Create DagBag with configurable LRU+TTL caching for API server usage."""
+def create_dag_bag(lazy_load_tasks: bool = False) -> CachedDBDagBag:
+    """
+    Create DagBag with configurable LRU, size and TTL caching for API server usage.
+
+    :param lazy_load_tasks: Should each task be de-serialized only when it is first accessed? Only worth it
+        for a DagBag whose users look up a few tasks of each Dag.
+    """
     cache_size = conf.getint("api", "dag_cache_size", fallback=64)
     cache_ttl = conf.getint("api", "dag_cache_ttl", fallback=3600)
+    cache_max_bytes = conf.getint("api", "dag_cache_max_bytes", fallback=0)
+    cache_idle_ttl = conf.getint("api", "dag_cache_idle_ttl", fallback=0)
 
     if cache_size < 0:
         raise ValueError("[api] dag_cache_size must be greater than or equal to 0")
     if cache_ttl < 0:
         raise ValueError("[api] dag_cache_ttl must be greater than or equal to 0")
+    if cache_max_bytes < 0:
+        raise ValueError("[api] dag_cache_max_bytes must be greater than or equal to 0")
+    if cache_idle_ttl < 0:
+        raise ValueError("[api] dag_cache_idle_ttl must be greater than or equal to 0")
 
     return CachedDBDagBag(
+        lazy_load_tasks=lazy_load_tasks,
         cache_size=cache_size,
         cache_ttl=cache_ttl,
         stats_prefix="api_server.dag_bag",
+        cache_max_bytes=cache_max_bytes,
+        cache_idle_ttl=cache_idle_ttl,
     )
 
 
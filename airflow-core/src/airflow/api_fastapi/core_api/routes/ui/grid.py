@@ -355,6 +355,8 @@ def get_grid_runs(
     # This comparison is to fall back to Dag timetable when no order_by is provided
     if order_by.value == [order_by.get_primary_key_string()]:
         latest_serdag = _get_latest_serdag(dag_id, session)
+        # Only the timetable is needed, none of the tasks
+        latest_serdag.lazy_load_tasks = True
         latest_dag = latest_serdag.dag
         ordering = list(latest_dag.timetable.run_ordering)
         order_by = SortParam(
@@ -20,9 +20,8 @@ from __future__ import annotations
 import asyncio
 import json
 import threading
-import time
 import weakref
-from contextlib import AsyncExitStack
+from contextlib import AsyncExitStack, suppress
 from functools import cached_property
 from typing import TYPE_CHECKING, Any, cast
 
@@ -44,6 +43,7 @@ from airflow.api_fastapi.auth.tokens import (
     get_sig_validation_args,
     get_signing_args,
 )
+from airflow.api_fastapi.execution_api.security import token_needs_refresh
 
 if TYPE_CHECKING:
     import httpx
@@ -92,6 +92,8 @@ def _jwt_generator():
 
 @svcs.fastapi.lifespan
 async def lifespan(app: FastAPI, registry: svcs.Registry):
+    from airflow.configuration import conf
+
     app.state.lifespan_called = True
 
     # According to svcs's docs this shouldn't be needed, but something about SubApps is odd, and we need to
@@ -105,8 +107,23 @@ async def lifespan(app: FastAPI, registry: svcs.Registry):
         # Create an app scoped validator, so that we don't have to fetch it every time
         registry.register_value(JWTValidator, _jwt_validator(), ping=JWTValidator.status)
 
+    flush_task = None
+    if (heartbeat_flush_interval := conf.getfloat("execution_api", "heartbeat_flush_interval")) > 0:
+        from airflow.api_fastapi.execution_api.services.heartbeats import HeartbeatBuffer
+
+        heartbeat_buffer = HeartbeatBuffer(flush_interval=heartbeat_flush_interval)
+        registry.register_value(HeartbeatBuffer, heartbeat_buffer)
+        flush_task = asyncio.create_task(heartbeat_buffer.run())
+
     yield
 
+    if flush_task:
+        flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await flush_task
+        # Don't lose the heartbeats received since the last flush
+        await asyncio.to_thread(heartbeat_buffer.flush)
+
 
 class CorrelationIdMiddleware(BaseHTTPMiddleware):
     """
@@ -154,11 +171,7 @@ class JWTReissueMiddleware(BaseHTTPMiddleware):
                     if claims.get("scope") == "workload":
                         return response
 
-                    now = int(time.time())
-                    token_lifetime = int(claims.get("exp", 0)) - int(claims.get("iat", 0))
-                    refresh_when_less_than = max(int(token_lifetime * 0.20), 30)
-                    valid_left = int(claims.get("exp", 0)) - now
-                    if valid_left <= refresh_when_less_than:
+                    if token_needs_refresh(claims):
                         generator: JWTGenerator = await services.aget(JWTGenerator)
                         refreshed_token = generator.generate(claims)
             except Exception as err:
@@ -391,7 +404,7 @@ class InProcessExecutionAPI:
             from airflow.api_fastapi.execution_api.routes.connections import has_connection_access
             from airflow.api_fastapi.execution_api.routes.variables import has_variable_access
             from airflow.api_fastapi.execution_api.routes.xcoms import has_xcom_access
-            from airflow.api_fastapi.execution_api.security import _jwt_bearer
+            from airflow.api_fastapi.execution_api.security import _jwt_bearer, get_ti_token_validator
 
             # Give this app its own lifespan + services registry so that stubbing services
             # (e.g. JWTValidator) doesn't affect the module-level ``lifespan.registry``.
@@ -419,6 +432,7 @@ class InProcessExecutionAPI:
             self._app.dependency_overrides[has_connection_access] = always_allow
             self._app.dependency_overrides[has_variable_access] = always_allow
             self._app.dependency_overrides[has_xcom_access] = always_allow
+            self._app.dependency_overrides[get_ti_token_validator] = lambda: lambda unvalidated, ti_id: {}
 
         return self._app
 
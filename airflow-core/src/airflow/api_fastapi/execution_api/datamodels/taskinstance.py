@@ -272,6 +272,46 @@ class TIHeartbeatInfo(StrictBaseModel):
     pid: int
 
 
+class TIBulkHeartbeatItem(StrictBaseModel):
+    """A TaskInstance heartbeating in a bulk heartbeat request, with the token it was issued."""
+
+    id: uuid.UUID
+    pid: int
+    token: str
+
+
+class TIBulkHeartbeatBody(StrictBaseModel):
+    """Schema for the bulk TaskInstance heartbeat endpoint, for TaskInstances running on the same host."""
+
+    hostname: str
+    heartbeats: Annotated[list[TIBulkHeartbeatItem], Field(min_length=1)]
+
+
+class TIHeartbeatStatus(str, Enum):
+    """Outcome of the heartbeat of a TaskInstance in a bulk heartbeat request."""
+
+    OK = "ok"
+    RUNNING_ELSEWHERE = "running_elsewhere"
+    NOT_RUNNING = "not_running"
+    GONE = "gone"
+    NOT_FOUND = "not_found"
+    UNAUTHORIZED = "unauthorized"
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """Outcome of the heartbeat of one TaskInstance, with a new token for it when its token expires soon."""
+
+    id: uuid.UUID
+    status: TIHeartbeatStatus
+    token: str | None = None
+
+
+class TIBulkHeartbeatResponse(BaseModel):
+    """Response of the bulk TaskInstance heartbeat endpoint, with one result per TaskInstance heartbeating."""
+
+    results: list[TIBulkHeartbeatResult]
+
+
 # This model is not used in the API, but it is included in generated OpenAPI schema
 # for use in the client SDKs.
 class TaskInstance(BaseModel):
@@ -28,7 +28,7 @@ from uuid import UUID
 import attrs
 import structlog
 from cadwyn import VersionedAPIRouter
-from fastapi import Body, HTTPException, Query, Response, Security, status
+from fastapi import Body, Depends, HTTPException, Query, Response, Security, status
 from opentelemetry import trace
 from opentelemetry.trace import StatusCode
 from opentelemetry.trace.propagation.tracecontext import TraceContextTextMapPropagator
@@ -58,9 +58,13 @@ from airflow.api_fastapi.execution_api.datamodels.taskinstance import (
     TaskBreadcrumbsResponse,
     TaskStatesResponse,
     TIAwaitingInputStatePayload,
+    TIBulkHeartbeatBody,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
+    TIHeartbeatStatus,
     TIRescheduleStatePayload,
     TIRetryStatePayload,
     TIRunContext,
@@ -75,8 +79,11 @@ from airflow.api_fastapi.execution_api.security import (
     CurrentTIToken,
     ExecutionAPIRoute,
     get_team_name_for_ti,
+    get_ti_token_validator,
     require_auth,
+    token_needs_refresh,
 )
+from airflow.api_fastapi.execution_api.services.heartbeats import HeartbeatBuffer
 from airflow.api_fastapi.execution_api.services.task_instances import (
     client_supports_arg_bindings,
     get_arg_bindings,
@@ -101,6 +108,7 @@ from airflow.utils.sqlalchemy import get_dialect_name
 from airflow.utils.state import DagRunState, TaskInstanceState, TerminalTIState
 
 if TYPE_CHECKING:
+    import svcs
     from sqlalchemy.sql.dml import Update
 
 router = VersionedAPIRouter()
@@ -910,6 +918,13 @@ def _raise_ti_not_in_live_table(task_instance_id: UUID, session: SessionDep) ->
     )
 
 
+def _get_heartbeat_buffer(services: svcs.Container) -> HeartbeatBuffer | None:
+    """Return the heartbeat buffer of the API server, if ``[execution_api] heartbeat_flush_interval`` is set."""
+    if HeartbeatBuffer not in services.registry:
+        return None
+    return services.get(HeartbeatBuffer)
+
+
 @ti_id_router.put(
     "/{task_instance_id}/heartbeat",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -932,11 +947,27 @@ def ti_heartbeat(
     task_instance_id: UUID,
     ti_payload: TIHeartbeatInfo,
     session: SessionDep,
+    services=DepContainer,
 ):
     """Update the heartbeat of a TaskInstance to mark it as alive & still running."""
     bind_contextvars(ti_id=str(task_instance_id))
     log.debug("Processing heartbeat", hostname=ti_payload.hostname, pid=ti_payload.pid)
 
+    if (heartbeat_buffer := _get_heartbeat_buffer(services)) is not None:
+        # Same hot path as below, but only reading the row: the buffer writes the heartbeat later.
+        is_running_here = session.scalar(
+            select(TI.id).where(
+                TI.id == task_instance_id,
+                TI.state == TaskInstanceState.RUNNING,
+                TI.hostname == ti_payload.hostname,
+                TI.pid == ti_payload.pid,
+            )
+        )
+        if is_running_here:
+            heartbeat_buffer.record(task_instance_id, ti_payload.hostname, ti_payload.pid, timezone.utcnow())
+            log.debug("Heartbeat buffered")
+            return
+
     # Hot path: in the common case the TI is still running on the same host and pid,
     # so we can update last_heartbeat_at directly without first taking a row lock.
     fast_path_result = cast(
@@ -1006,6 +1037,89 @@ def ti_heartbeat(
     log.debug("Heartbeat updated", state=previous_state)
 
 
+@router.put("/heartbeats")
+def ti_bulk_heartbeat(
+    body: TIBulkHeartbeatBody,
+    session: SessionDep,
+    validate_token: Annotated[Callable[[str, UUID], dict | None], Depends(get_ti_token_validator)],
+    services=DepContainer,
+) -> TIBulkHeartbeatResponse:
+    """
+    Update the heartbeat of many TaskInstances running on the same host at once.
+
+    Each TaskInstance comes with its own token and is only heartbeated if the token was issued to it, so
+    the request can only heartbeat the tasks whose tokens it holds. Instead of failing the request, the
+    status of each TaskInstance tells its supervisor whether the task should keep running, as
+    ``ti_heartbeat`` does.
+    """
+    pids = {item.id: item.pid for item in body.heartbeats}
+    log.debug("Processing bulk heartbeat", hostname=body.hostname, count=len(pids))
+
+    claims = {item.id: validate_token(item.token, item.id) for item in body.heartbeats}
+    statuses: dict[UUID, TIHeartbeatStatus] = {
+        ti_id: TIHeartbeatStatus.UNAUTHORIZED for ti_id, ti_claims in claims.items() if ti_claims is None
+    }
+    if statuses:
+        log.warning("Bulk heartbeat with invalid task instance tokens", count=len(statuses))
+
+    authorized = pids.keys() - statuses.keys()
+    rows = {
+        ti_id: (state, hostname, pid)
+        for ti_id, state, hostname, pid in session.execute(
+            select(TI.id, TI.state, TI.hostname, TI.pid).where(TI.id.in_(authorized))
+        )
+    }
+    for ti_id, (state, hostname, pid) in rows.items():
+        if hostname != body.hostname or pid != pids[ti_id]:
+            statuses[ti_id] = TIHeartbeatStatus.RUNNING_ELSEWHERE
+        elif state != TaskInstanceState.RUNNING:
+            statuses[ti_id] = TIHeartbeatStatus.NOT_RUNNING
+        else:
+            statuses[ti_id] = TIHeartbeatStatus.OK
+
+    if missing := authorized - rows.keys():
+        archived = set(
+            session.scalars(select(TIH.task_instance_id).where(TIH.task_instance_id.in_(missing)).distinct())
+        )
+        for ti_id in missing:
+            statuses[ti_id] = TIHeartbeatStatus.GONE if ti_id in archived else TIHeartbeatStatus.NOT_FOUND
+
+    alive = [
+        (ti_id, pids[ti_id]) for ti_id, ti_status in statuses.items() if ti_status is TIHeartbeatStatus.OK
+    ]
+    if (heartbeat_buffer := _get_heartbeat_buffer(services)) is not None:
+        now = timezone.utcnow()
+        for ti_id, pid in alive:
+            heartbeat_buffer.record(ti_id, body.hostname, pid, now)
+    elif alive:
+        # Guard on the state again, in case a TI finished since it was read.
+        session.execute(
+            update(TI)
+            .where(
+                tuple_(TI.id, TI.pid).in_(alive),
+                TI.hostname == body.hostname,
+                TI.state == TaskInstanceState.RUNNING,
+            )
+            .values(last_heartbeat_at=timezone.utcnow())
+            .execution_options(synchronize_session=False)
+        )
+    log.debug("Bulk heartbeat updated", hostname=body.hostname, updated=len(alive))
+
+    # The tokens of the TaskInstances are refreshed here, as JWTReissueMiddleware only refreshes the token
+    # of the request.
+    refreshed_tokens: dict[UUID, str] = {}
+    if expiring := [ti_id for ti_id, _ in alive if token_needs_refresh(claims[ti_id] or {})]:
+        generator: JWTGenerator = services.get(JWTGenerator)
+        refreshed_tokens = {ti_id: generator.generate(claims[ti_id]) for ti_id in expiring}
+
+    return TIBulkHeartbeatResponse(
+        results=[
+            TIBulkHeartbeatResult(id=ti_id, status=statuses[ti_id], token=refreshed_tokens.get(ti_id))
+            for ti_id in pids
+        ]
+    )
+
+
 @ti_id_router.put(
     "/{task_instance_id}/rtif",
     status_code=status.HTTP_201_CREATED,
@@ -67,7 +67,10 @@ Why ``ExecutionAPIRoute`` is needed:
 # Disable future annotations in this file to work around https://github.com/fastapi/fastapi/issues/13056
 # ruff: noqa: I002
 
+import time
+from collections.abc import Callable
 from typing import Any, get_args
+from uuid import UUID
 
 import structlog
 from fastapi import Depends, HTTPException, Request, status
@@ -203,6 +206,38 @@ async def require_auth(
 CurrentTIToken: TIToken = Depends(require_auth)
 
 
+def token_needs_refresh(claims: dict[str, Any]) -> bool:
+    """Whether a token expires soon enough that the API server should issue its holder a new one."""
+    if "exp" not in claims:
+        return False
+    token_lifetime = int(claims["exp"]) - int(claims.get("iat", 0))
+    refresh_when_less_than = max(int(token_lifetime * 0.20), 30)
+    return int(claims["exp"]) - int(time.time()) <= refresh_when_less_than
+
+
+async def get_ti_token_validator(services=DepContainer) -> Callable[[str, UUID], dict[str, Any] | None]:
+    """
+    Return a function validating a token sent in a request body for a task instance.
+
+    A request acting on many task instances, such as a bulk heartbeat, carries the token of each of them,
+    so that each task instance is authorized by its own token rather than by the token of the request. The
+    function returns the claims of the token, or None unless it is an execution token of that task instance.
+    """
+    validator: JWTValidator = await services.aget(JWTValidator)
+
+    def validate(unvalidated: str, ti_id: UUID) -> dict[str, Any] | None:
+        try:
+            claims = validator.validated_claims(unvalidated)
+        except Exception:
+            log.warning("Failed to validate JWT of task instance", ti_id=str(ti_id), exc_info=True)
+            return None
+        if claims.get("sub") != str(ti_id) or claims.get("scope", "execution") != "execution":
+            return None
+        return claims
+
+    return validate
+
+
 class ExecutionAPIRoute(APIRoute):
     """
     Custom route class that precomputes allowed token types from Security scopes.
@@ -0,0 +1,97 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""Write-behind buffering of task instance heartbeats."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+
+import attrs
+import structlog
+from sqlalchemy import bindparam, update
+
+from airflow.models.taskinstance import TaskInstance as TI
+from airflow.utils.session import create_session
+from airflow.utils.state import TaskInstanceState
+
+if TYPE_CHECKING:
+    from datetime import datetime
+    from uuid import UUID
+
+log = structlog.get_logger(logger_name=__name__)
+
+
+@attrs.define
+class HeartbeatBuffer:
+    """
+    Accumulate task instance heartbeats in memory and write them to the database in batches.
+
+    Only the latest heartbeat of each task instance is kept, so a task heartbeating several times between two
+    flushes costs a single row update. The time written is the one the heartbeat was received at, which
+    means ``last_heartbeat_at`` can lag behind the latest heartbeat by up to ``flush_interval`` seconds: the
+    scheduler allows for this when looking for task instances whose heartbeat timed out.
+
+    Heartbeats are only buffered once the route validated them; the flush re-checks that each task instance
+    is still running with the same hostname and pid, so a heartbeat is never written over a task instance
+    that finished or was restarted elsewhere in the meantime.
+    """
+
+    flush_interval: float
+    _pending: dict[UUID, tuple[str, int, datetime]] = attrs.field(factory=dict, init=False)
+    _lock: threading.Lock = attrs.field(factory=threading.Lock, init=False)
+
+    def record(self, ti_id: UUID, hostname: str, pid: int, when: datetime) -> None:
+        with self._lock:
+            self._pending[ti_id] = (hostname, pid, when)
+
+    def flush(self) -> int:
+        """Write the pending heartbeats to the database, returning the number of task instances written."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return 0
+
+        table = TI.__table__
+        with create_session() as session:
+            session.execute(
+                update(table)
+                .where(
+                    table.c.id == bindparam("ti_id"),
+                    table.c.state == TaskInstanceState.RUNNING,
+                    table.c.hostname == bindparam("ti_hostname"),
+                    table.c.pid == bindparam("ti_pid"),
+                )
+                .values(last_heartbeat_at=bindparam("ti_last_heartbeat_at")),
+                [
+                    {"ti_id": ti_id, "ti_hostname": hostname, "ti_pid": pid, "ti_last_heartbeat_at": when}
+                    for ti_id, (hostname, pid, when) in pending.items()
+                ],
+            )
+        log.debug("Flushed buffered heartbeats", count=len(pending))
+        return len(pending)
+
+    async def run(self) -> None:
+        """Flush the pending heartbeats every ``flush_interval`` seconds, until cancelled."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await asyncio.to_thread(self.flush)
+            except Exception:
+                # The heartbeats of this batch are lost; the tasks heartbeat again well within the timeout.
+                log.exception("Failed to flush buffered heartbeats")
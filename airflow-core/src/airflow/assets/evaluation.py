@@ -26,6 +26,7 @@ from airflow.models.asset import expand_alias_to_assets, resolve_ref_to_asset
 from airflow.serialization.definitions.assets import (
     SerializedAsset,
     SerializedAssetAlias,
+    SerializedAssetAll,
     SerializedAssetBase,
     SerializedAssetBooleanCondition,
     SerializedAssetRef,
@@ -33,6 +34,8 @@ from airflow.serialization.definitions.assets import (
 )
 
 if TYPE_CHECKING:
+    from uuid import UUID
+
     from sqlalchemy.orm import Session
 
 
@@ -71,3 +74,150 @@ class AssetEvaluator:
     @run.register
     def _(self, o: SerializedAssetBooleanCondition, statuses: dict[SerializedAssetUniqueKey, bool]) -> bool:
         return type(o).agg_func(self.run(x, statuses) for x in o.objects)
+
+
+@attrs.frozen
+class _CompiledNode:
+    """
+    An ``all`` or ``any`` of assets, checked with one mask, and of other conditions.
+
+    A lone asset, reference or alias is compiled into an ``all`` of itself.
+    """
+
+    all_of: bool
+    mask: int
+    others: tuple[_CompiledNode | SerializedAssetRef | SerializedAssetAlias, ...]
+
+
+@attrs.frozen
+class CompiledAssetCondition:
+    """
+    An asset condition compiled to be evaluated over and over again.
+
+    Each asset of the condition is given a bit, so that the statuses of the assets are one integer and
+    the assets directly under an ``all`` or an ``any`` are checked together with a mask, rather than
+    walking the condition tree for each of them. References and aliases, which resolve to different
+    assets over time, are still evaluated with an :class:`AssetEvaluator`.
+
+    Create one with :func:`compile_asset_condition`.
+    """
+
+    bits: dict[SerializedAssetUniqueKey, int]
+    root: _CompiledNode
+    dynamic: bool
+    """Whether the condition has references or aliases, i.e. is not made of assets only."""
+
+    def status_mask(self, statuses: dict[SerializedAssetUniqueKey, bool]) -> int:
+        """Return the bits of the assets of the condition that have a true status."""
+        mask = 0
+        for key, status in statuses.items():
+            if status and (bit := self.bits.get(key)):
+                mask |= bit
+        return mask
+
+    def evaluate(self, statuses: dict[SerializedAssetUniqueKey, bool], evaluator: AssetEvaluator) -> bool:
+        """Return whether the condition is met, as :meth:`AssetEvaluator.run` would."""
+        mask = self.status_mask(statuses)
+
+        def evaluate(o: _CompiledNode | SerializedAssetRef | SerializedAssetAlias) -> bool:
+            if not isinstance(o, _CompiledNode):
+                return evaluator.run(o, statuses)
+            if o.all_of:
+                return mask & o.mask == o.mask and all(evaluate(x) for x in o.others)
+            return bool(mask & o.mask) or any(evaluate(x) for x in o.others)
+
+        return evaluate(self.root)
+
+
+def compile_asset_condition(condition: SerializedAssetBase) -> CompiledAssetCondition:
+    """Compile an asset condition, see :class:`CompiledAssetCondition`."""
+    bits: dict[SerializedAssetUniqueKey, int] = {}
+    dynamic = False
+
+    def bit(asset: SerializedAsset) -> int:
+        return bits.setdefault(SerializedAssetUniqueKey.from_asset(asset), 1 << len(bits))
+
+    def compile_node(o: SerializedAssetBase) -> _CompiledNode:
+        nonlocal dynamic
+        if isinstance(o, SerializedAsset):
+            return _CompiledNode(all_of=True, mask=bit(o), others=())
+        if isinstance(o, (SerializedAssetRef, SerializedAssetAlias)):
+            dynamic = True
+            return _CompiledNode(all_of=True, mask=0, others=(o,))
+        if not isinstance(o, SerializedAssetBooleanCondition):
+            raise NotImplementedError(f"can not evaluate {o!r}")
+        mask = 0
+        others: list[_CompiledNode | SerializedAssetRef | SerializedAssetAlias] = []
+        for x in o.objects:
+            if isinstance(x, SerializedAsset):
+                mask |= bit(x)
+            elif isinstance(x, (SerializedAssetRef, SerializedAssetAlias)):
+                dynamic = True
+                others.append(x)
+            else:
+                others.append(compile_node(x))
+        return _CompiledNode(all_of=isinstance(o, SerializedAssetAll), mask=mask, others=tuple(others))
+
+    root = compile_node(condition)
+    return CompiledAssetCondition(bits=bits, root=root, dynamic=dynamic)
+
+
+@attrs.define
+class _DagAssetCondition:
+    dag_version: tuple[UUID, str]
+    condition: CompiledAssetCondition
+    # Bits of the queued assets the condition was last found unmet with
+    unmet_mask: int | None = None
+
+
+@attrs.define
+class DagAssetConditions:
+    """
+    The asset conditions of asset-triggered Dags, compiled once per Dag version.
+
+    A Dag version is its ID along with the hash of the serialized Dag, as a version without task instances
+    is updated in place when the Dag changes.
+
+    A condition made of assets only, without references or aliases, can only become met as more of its
+    assets are queued. So the queued assets it was last found unmet with are remembered, and it is not
+    evaluated again until assets other than these are queued for the Dag.
+
+    :meta private:
+    """
+
+    _conditions: dict[str, _DagAssetCondition] = attrs.field(factory=dict)
+
+    def missing(self, dag_versions: dict[str, tuple[UUID, str]]) -> list[str]:
+        """
+        Return the Dags whose asset condition must be compiled for the given version.
+
+        The conditions of the Dags not given are dropped: they have no queued assets anymore, so there is
+        nothing to remember about them.
+        """
+        for dag_id in self._conditions.keys() - dag_versions.keys():
+            del self._conditions[dag_id]
+        return [
+            dag_id
+            for dag_id, dag_version in dag_versions.items()
+            if (entry := self._conditions.get(dag_id)) is None or entry.dag_version != dag_version
+        ]
+
+    def add(self, dag_id: str, dag_version: tuple[UUID, str], condition: SerializedAssetBase) -> None:
+        """Compile and keep the asset condition of a Dag version."""
+        self._conditions[dag_id] = _DagAssetCondition(dag_version, compile_asset_condition(condition))
+
+    def is_met(
+        self, dag_id: str, statuses: dict[SerializedAssetUniqueKey, bool], evaluator: AssetEvaluator
+    ) -> bool:
+        """
+        Return whether the asset condition of a Dag is met by the queued assets.
+
+        :raise KeyError: The condition of the Dag was not added.
+        """
+        entry = self._conditions[dag_id]
+        mask = entry.condition.status_mask(statuses)
+        if entry.unmet_mask is not None and mask & entry.unmet_mask == mask:
+            return False
+        met = entry.condition.evaluate(statuses, evaluator)
+        entry.unmet_mask = None if met or entry.condition.dynamic else mask
+        return met
@@ -22,6 +22,7 @@ from __future__ import annotations
 import functools
 import gc
 import inspect
+import itertools
 import logging
 import os
 import random
@@ -38,6 +39,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
 
 import attrs
+import psutil
 import structlog
 from sqlalchemy import select, update
 from sqlalchemy.exc import OperationalError
@@ -55,7 +57,12 @@ from airflow.dag_processing.bundles.base import (
 )
 from airflow.dag_processing.bundles.manager import DagBundlesManager
 from airflow.dag_processing.collection import update_dag_parsing_results_in_db
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    get_dag_file_content_hash,
+    get_file_digest,
+)
 from airflow.models.asset import remove_references_to_deleted_dags
 from airflow.models.dag import DagModel
 from airflow.models.dagbag import DagPriorityParsingRequest
@@ -130,6 +137,12 @@ class DagFileStat:
     last_duration: float | None = None
     run_count: int = 0
     last_num_of_db_queries: int = 0
+    content_hash: str | None = None
+    """Hash of the file and of the modules it imported from its bundle, see ``skip_unchanged_files``."""
+    imported_files: tuple[str, ...] = ()
+    """Paths, relative to the bundle, of the modules the file imported from its bundle when last parsed."""
+    imports_hash: str | None = None
+    """Hash of the modules the file imported from its bundle when last parsed."""
 
 
 @dataclass(frozen=True)
@@ -246,6 +259,14 @@ class DagFileProcessorManager(LoggingMixin):
     stale_dag_threshold: float = attrs.field(
         factory=_config_int_factory("dag_processor", "stale_dag_threshold")
     )
+    _skip_unchanged_files: bool = attrs.field(
+        factory=_config_bool_factory("dag_processor", "skip_unchanged_files")
+    )
+    _unchanged_file_process_interval: float = attrs.field(
+        factory=_config_int_factory("dag_processor", "unchanged_file_process_interval")
+    )
+    _file_digests: dict[Path, tuple[tuple[int, int, int], str | None]] = attrs.field(factory=dict, init=False)
+    """Digest of the files hashed to find unchanged Dag files, with the ``os.stat`` they were read at."""
 
     _last_deactivate_stale_dags_time: float = attrs.field(default=0, init=False)
     _last_stale_bundle_cleanup_time: float = attrs.field(default=0, init=False)
@@ -270,6 +291,24 @@ class DagFileProcessorManager(LoggingMixin):
 
     _processors: dict[DagFileInfo, DagFileProcessorProcess] = attrs.field(factory=dict, init=False)
 
+    _parsing_worker_pool: bool = attrs.field(
+        factory=_config_bool_factory("dag_processor", "parsing_worker_pool")
+    )
+    """Parse files with long-lived workers, each parsing many files, instead of a process per file."""
+    parsing_worker_max_files: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_worker_max_files")
+    )
+    parsing_worker_max_rss: int = attrs.field(
+        factory=_config_int_factory("dag_processor", "parsing_worker_max_rss")
+    )
+    _idle_workers: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Workers of the parsing pool waiting for a file to parse."""
+    _stopping_workers: list[DagFileProcessorProcess] = attrs.field(factory=list, init=False)
+    """Workers of the parsing pool being replaced, waiting for them to exit."""
+    _worker_slots: dict[int, int] = attrs.field(factory=dict, init=False)
+    """Index of each worker of the parsing pool by PID, to tag their metrics with a bounded set of values."""
+    _worker_startup_time_saved: float = attrs.field(default=0, init=False)
+
     _parsing_start_time: float | None = attrs.field(default=None, init=False)
     _num_run: int = attrs.field(default=0, init=False)
 
@@ -850,6 +889,7 @@ class DagFileProcessorManager(LoggingMixin):
         self._bundles_last_refreshed = now_seconds
 
         any_refreshed = False
+        refreshed_files: list[DagFileInfo] = []
         for bundle in self._dag_bundles:
             # TODO: AIP-66 handle errors in the case of incomplete cloning? And test this.
             #  What if the cloning/refreshing took too long(longer than the dag processor timeout)
@@ -942,6 +982,7 @@ class DagFileProcessorManager(LoggingMixin):
             }
 
             known_files[bundle.name] = found_files
+            refreshed_files.extend(found_files)
 
             self.deactivate_deleted_dags(bundle_name=bundle.name, present=found_files)
             self.clear_orphaned_import_errors(
@@ -954,8 +995,65 @@ class DagFileProcessorManager(LoggingMixin):
             self._bundle_name_to_team_name = {}
             self.handle_removed_files(known_files=known_files)
             self._resort_file_queue()
+            # After the resort, which would otherwise move them back to the place of their own mtime
+            self._queue_files_with_changed_imports(refreshed_files)
             self._add_new_files_to_queue(known_files=known_files)
 
+    def _queue_files_with_changed_imports(self, files: Iterable[DagFileInfo]) -> None:
+        """
+        Queue the files importing a bundle module changed since they were last parsed, at the front.
+
+        Without this, a change to a helper module shared by many Dag files is only picked up as each of
+        these files is parsed again on its own schedule.
+        """
+        stats_by_presence_key = {file.presence_key: stat for file, stat in self._file_stats.items()}
+        in_progress_keys = {file.presence_key for file in self._processors}
+        module_mtimes: dict[Path, float | None] = {}
+
+        def module_changed_since(path: Path, last_time: datetime) -> bool:
+            if path not in module_mtimes:
+                try:
+                    module_mtimes[path] = os.path.getmtime(path)
+                except OSError:
+                    module_mtimes[path] = None
+            mtime = module_mtimes[path]
+            return mtime is None or datetime.fromtimestamp(mtime, tz=timezone.utc) > last_time
+
+        to_queue = []
+        hashed_paths: set[Path] = set()
+        for file in files:
+            stat = stats_by_presence_key.get(file.presence_key)
+            if (
+                stat is None
+                or not stat.imported_files
+                or stat.last_finish_time is None
+                or file.bundle_path is None
+                or file.presence_key in in_progress_keys
+            ):
+                continue
+            if self._skip_unchanged_files and stat.content_hash is not None:
+                changed = not self._is_file_unchanged(file, stat, set())
+            else:
+                last_time = stat.last_finish_time
+                # A checkout or a touch changes the modification time of modules whose content is the same
+                changed = any(
+                    module_changed_since(file.bundle_path / path, last_time) for path in stat.imported_files
+                ) and not self._are_imports_unchanged(file, stat, hashed_paths)
+            if changed:
+                to_queue.append(file)
+
+        if not self._skip_unchanged_files:
+            # Otherwise the digests are kept for, and pruned by, prepare_file_queue
+            self._file_digests = {
+                path: digest for path, digest in self._file_digests.items() if path in hashed_paths
+            }
+
+        if to_queue:
+            self.log.info(
+                "Adding %d files importing changed modules to the front of the queue", len(to_queue)
+            )
+            self._add_files_to_queue(to_queue, mode="frontprio")
+
     def _find_files_in_bundle(self, bundle: BaseDagBundle) -> list[Path]:
         """Get relative paths for dag files from bundle dir."""
         # Build up a list of Python files that could contain DAGs
@@ -1369,7 +1467,49 @@ class DagFileProcessorManager(LoggingMixin):
 
         for file in finished:
             processor = self._processors.pop(file)
-            processor.close()
+            if processor.waiting_for_file:
+                self._release_worker(processor)
+            else:
+                processor.close()
+
+        for worker in [worker for worker in self._stopping_workers if worker.is_ready]:
+            self._stopping_workers.remove(worker)
+            worker.close()
+
+    def _release_worker(self, worker: DagFileProcessorProcess) -> None:
+        """Make a worker of the parsing pool available for the next file, or replace it if it has done enough."""
+        replace = worker.needs_replacing or 0 < self.parsing_worker_max_files <= worker.files_processed
+        if not replace and self.parsing_worker_max_rss > 0:
+            try:
+                rss = psutil.Process(worker.pid).memory_info().rss
+            except psutil.Error:
+                rss = 0
+            replace = rss > self.parsing_worker_max_rss * 1024 * 1024
+        if replace:
+            self.log.debug("Replacing parsing worker with PID %s", worker.pid)
+            worker.stop()
+            self._stopping_workers.append(worker)
+        else:
+            self._idle_workers.append(worker)
+
+    def _get_idle_worker(self) -> DagFileProcessorProcess | None:
+        """Return a worker of the parsing pool waiting for a file to parse, if there is one."""
+        while self._idle_workers:
+            worker = self._idle_workers.pop()
+            if worker._check_subprocess_exit() is None:
+                return worker
+            worker.close()
+        return None
+
+    def _assign_worker_slot(self, worker: DagFileProcessorProcess) -> None:
+        live_pids = {proc.pid for proc in self._parsing_workers()}
+        self._worker_slots = {pid: slot for pid, slot in self._worker_slots.items() if pid in live_pids}
+        used_slots = set(self._worker_slots.values())
+        self._worker_slots[worker.pid] = next(slot for slot in itertools.count() if slot not in used_slots)
+
+    def _parsing_workers(self) -> list[DagFileProcessorProcess]:
+        """Return the live workers of the parsing pool, busy or not."""
+        return [proc for proc in self._processors.values() if proc.pooled] + self._idle_workers
 
     def _get_log_dir(self) -> str:
         return os.path.join(self.base_log_dir, timezone.utcnow().strftime("%Y-%m-%d"))
@@ -1434,7 +1574,19 @@ class DagFileProcessorManager(LoggingMixin):
         callback_to_execute_for_file = self._callback_to_execute.pop(dag_file, [])
         logger, logger_filehandle = self._get_logger_for_dag_file(dag_file)
 
-        return DagFileProcessorProcess.start(
+        if self._parsing_worker_pool and (worker := self._get_idle_worker()):
+            worker.parse_file(
+                path=dag_file.absolute_path,
+                bundle_path=cast("Path", dag_file.bundle_path),
+                bundle_name=dag_file.bundle_name,
+                dag_file_rel_path=str(dag_file.rel_path),
+                callbacks=callback_to_execute_for_file,
+                logger_filehandle=logger_filehandle,
+            )
+            self._worker_startup_time_saved += worker.worker_startup_time or 0
+            return worker
+
+        processor = DagFileProcessorProcess.start(
             id=id,
             path=dag_file.absolute_path,
             bundle_path=cast("Path", dag_file.bundle_path),
@@ -1446,7 +1598,11 @@ class DagFileProcessorManager(LoggingMixin):
             logger_filehandle=logger_filehandle,
             subprocess_logs_to_stdout=conf.get("logging", "dag_processor_log_target") == "stdout",
             client=self.client,
+            pooled=self._parsing_worker_pool,
         )
+        if self._parsing_worker_pool:
+            self._assign_worker_slot(processor)
+        return processor
 
     def _start_new_processes(self):
         """Start more processors if we have enough slots and files to process."""
@@ -1556,6 +1712,50 @@ class DagFileProcessorManager(LoggingMixin):
             return True
         return False
 
+    def _is_file_unchanged(self, file: DagFileInfo, stat: DagFileStat, hashed_paths: set[Path]) -> bool:
+        """
+        Whether the Dag file and the modules it imported have the same content as when it was last parsed.
+
+        :param hashed_paths: Set to add the paths of the files hashed to
+        """
+        if stat.content_hash is None or file.bundle_path is None:
+            return False
+        file_digests = []
+        for rel_path in (str(file.rel_path), *stat.imported_files):
+            path = file.bundle_path / rel_path
+            hashed_paths.add(path)
+            file_digests.append((rel_path, self._get_file_digest(path)))
+        return get_dag_file_content_hash(file_digests) == stat.content_hash
+
+    def _are_imports_unchanged(self, file: DagFileInfo, stat: DagFileStat, hashed_paths: set[Path]) -> bool:
+        """
+        Whether the modules the Dag file imported have the same content as when it was last parsed.
+
+        :param hashed_paths: Set to add the paths of the files hashed to
+        """
+        if stat.imports_hash is None or file.bundle_path is None:
+            return False
+        file_digests = []
+        for rel_path in stat.imported_files:
+            path = file.bundle_path / rel_path
+            hashed_paths.add(path)
+            file_digests.append((rel_path, self._get_file_digest(path)))
+        return get_dag_file_content_hash(file_digests) == stat.imports_hash
+
+    def _get_file_digest(self, path: Path) -> str | None:
+        """Return the digest of the file, only reading it again if its ``os.stat`` changed."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        key = (st.st_mtime_ns, st.st_size, st.st_ino)
+        cached = self._file_digests.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        digest = get_file_digest(path)
+        self._file_digests[path] = (key, digest)
+        return digest
+
     def prepare_file_queue(self, known_files: dict[str, set[DagFileInfo]]):
         """
         Scan dags dir to generate more file paths to process.
@@ -1568,8 +1768,19 @@ class DagFileProcessorManager(LoggingMixin):
             emit_metrics(
                 parse_time=time.perf_counter() - self._parsing_start_time,
                 dag_file_stats=list(self._file_stats.values()),
+                parsing_worker_reuse_counts={
+                    self._worker_slots[worker.pid]: max(worker.files_processed - 1, 0)
+                    for worker in self._parsing_workers()
+                    if worker.pid in self._worker_slots
+                }
+                if self._parsing_worker_pool
+                else None,
+                parsing_worker_startup_time_saved=self._worker_startup_time_saved
+                if self._parsing_worker_pool
+                else None,
             )
             self._parsing_start_time = None
+            self._worker_startup_time_saved = 0
 
         # If the file path is already being processed, or if a file was
         # processed recently, wait until the next batch
@@ -1579,19 +1790,35 @@ class DagFileProcessorManager(LoggingMixin):
 
         # Sort the file paths by the parsing order mode
         recently_processed = set()
+        unchanged = set()
         files = []
+        hashed_paths: set[Path] = set()
 
         for bundle_files in known_files.values():
             for file in bundle_files:
                 files.append(file)
                 stat = file_stats_by_presence_key.get(file.presence_key)
                 last_time = stat.last_finish_time if stat else None
-                if last_time and (now - last_time).total_seconds() < self._file_process_interval:
+                if not last_time:
+                    continue
+                process_interval = self._file_process_interval
+                if self._skip_unchanged_files and self._is_file_unchanged(file, stat, hashed_paths):
+                    unchanged.add(file)
+                    process_interval = max(process_interval, self._unchanged_file_process_interval)
+                if (now - last_time).total_seconds() < process_interval:
                     recently_processed.add(file)
 
+        if self._skip_unchanged_files:
+            # Forget the digests of the files no longer imported by any Dag file
+            self._file_digests = {
+                path: digest for path, digest in self._file_digests.items() if path in hashed_paths
+            }
+
         changed_recently: set[DagFileInfo] = set()
         if self._file_parsing_sort_mode == "modified_time":
             files, changed_recently = self._sort_by_mtime(files=files)
+            # A new modification time does not mean that the content changed
+            changed_recently -= unchanged
         elif self._file_parsing_sort_mode == "alphabetical":
             files.sort(key=attrgetter("rel_path"))
         elif self._file_parsing_sort_mode == "random_seeded_by_host":
@@ -1734,23 +1961,46 @@ class DagFileProcessorManager(LoggingMixin):
             # SIGTERM, wait 5s, SIGKILL if still alive
             processor.kill(signal.SIGTERM, escalation_delay=5.0)
 
+        for worker in self._idle_workers + self._stopping_workers:
+            worker.kill(signal.SIGTERM, escalation_delay=5.0)
+
     def end(self):
         """Kill all child processes on exit since we don't want to leave them as orphaned."""
-        pids_to_kill = [p.pid for p in self._processors.values()]
+        pids_to_kill = [
+            p.pid for p in [*self._processors.values(), *self._idle_workers, *self._stopping_workers]
+        ]
         if pids_to_kill:
             kill_child_processes_by_pids(pids_to_kill)
 
 
-def emit_metrics(*, parse_time: float, dag_file_stats: Sequence[DagFileStat]):
+def emit_metrics(
+    *,
+    parse_time: float,
+    dag_file_stats: Sequence[DagFileStat],
+    parsing_worker_reuse_counts: dict[int, int] | None = None,
+    parsing_worker_startup_time_saved: float | None = None,
+):
     """
     Emit metrics about dag parsing summary.
 
     This is called once every time around the parsing "loop" - i.e. after
     all files have been parsed.
+
+    :param parsing_worker_reuse_counts: When parsing with the worker pool, the number of files each worker
+        parsed after its first one, by worker slot.
+    :param parsing_worker_startup_time_saved: When parsing with the worker pool, the time that starting a
+        new process for each file parsed by a reused worker would have taken.
     """
     stats.gauge("dag_processing.total_parse_time", parse_time)
     stats.gauge("dagbag_size", sum(stat.num_dags for stat in dag_file_stats))
     stats.gauge("dag_processing.import_errors", sum(stat.import_errors for stat in dag_file_stats))
+    if parsing_worker_reuse_counts is not None:
+        for slot, reuse_count in parsing_worker_reuse_counts.items():
+            stats.gauge(
+                "dag_processing.parsing_worker.reuse_count", reuse_count, tags={"worker_slot": str(slot)}
+            )
+    if parsing_worker_startup_time_saved is not None:
+        stats.gauge("dag_processing.parsing_worker.startup_time_saved", parsing_worker_startup_time_saved)
 
 
 def process_parse_results(
@@ -1808,4 +2058,7 @@ def process_parse_results(
         stat.num_dags = len(parsing_result.serialized_dags)
         if parsing_result.import_errors:
             stat.import_errors = len(parsing_result.import_errors)
+        stat.content_hash = parsing_result.content_hash
+        stat.imported_files = tuple(parsing_result.imported_files or ())
+        stat.imports_hash = parsing_result.imports_hash
     return stat
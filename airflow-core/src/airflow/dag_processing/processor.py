@@ -18,14 +18,21 @@ from __future__ import annotations
 
 import contextlib
 import importlib
+import json
 import logging
 import os
+import select
+import sys
+import threading
+import time
 import traceback
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterable, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING, Annotated, BinaryIO, ClassVar, Literal
+from socket import SHUT_WR
+from typing import TYPE_CHECKING, Annotated, Any, BinaryIO, ClassVar, Literal, NamedTuple
 
 import attrs
+import structlog
 from pydantic import BaseModel, Field, TypeAdapter
 
 from airflow._shared.observability.metrics import stats
@@ -92,6 +99,7 @@ from airflow.sdk.log import mask_secret
 from airflow.serialization.serialized_objects import DagSerialization, LazyDeserializedDAG
 from airflow.utils.dag_version_inflation_checker import check_dag_file_stability
 from airflow.utils.file import iter_airflow_imports
+from airflow.utils.hashlib_wrapper import md5
 from airflow.utils.helpers import prune_dict
 from airflow.utils.log.logging_mixin import LoggingMixin
 from airflow.utils.state import TaskInstanceState
@@ -142,11 +150,51 @@ class DagFileParsingResult(BaseModel):
     serialized_dags: list[LazyDeserializedDAG]
     warnings: list | None = None
     import_errors: dict[str, str] | None = None
+    content_hash: str | None = None
+    """
+    Hash of the content of the file and of the modules it imported from its bundle.
+
+    Only set with ``[dag_processor] skip_unchanged_files``, when the file was imported without errors.
+    """
+    imported_files: list[str] | None = None
+    """
+    Paths, relative to the bundle, of the modules the file imported from its bundle.
+
+    These include the modules imported by the modules the file imported, and so on.
+    """
+    imports_hash: str | None = None
+    """
+    Hash of the content of the modules the file imported from its bundle.
+
+    Lets the manager tell a changed module from one whose modification time changed only.
+    """
     type: Literal["DagFileParsingResult"] = "DagFileParsingResult"
 
 
+class DagFileProcessed(BaseModel):
+    """
+    Sent by a parsing worker of the pool once it is done with a DAG file.
+
+    Only the workers of ``[dag_processor] parsing_worker_pool`` send this, the process parsing a single
+    file exits instead.
+    """
+
+    worker_startup_time: float | None = None
+    """Seconds the worker took to start, only sent for the first file it processed."""
+
+    changed_worker_state: list[str] = Field(default_factory=list)
+    """
+    The process state the file changed, e.g. ``os.environ``, in which case the worker must be replaced.
+
+    The state is restored, but the file may have changed more than can be checked, e.g. module globals.
+    """
+
+    type: Literal["DagFileProcessed"] = "DagFileProcessed"
+
+
 ToManager = Annotated[
     DagFileParsingResult
+    | DagFileProcessed
     | GetConnection
     | GetVariable
     | GetVariableKeys
@@ -232,11 +280,174 @@ def _parse_file_entrypoint():
         comms_decoder.send(result)
 
 
+def _import_parsing_worker_modules(log: FilteringBoundLogger) -> None:
+    """Import the modules listed in ``[dag_processor] parsing_worker_pre_import_modules``."""
+    for module in conf.getlist("dag_processor", "parsing_worker_pre_import_modules", fallback=[]):
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            log.warning("Error when trying to pre-import module '%s': %s", module, e)
+
+
+def _get_bundle_modules(bundle_path: Path, loaded_modules: set[str]) -> dict[str, str]:
+    """Return the file of each module imported from the bundle since ``loaded_modules`` were loaded."""
+    bundle_prefix = os.path.join(os.fspath(bundle_path), "")
+    bundle_modules = {}
+    for name in sys.modules.keys() - loaded_modules:
+        module_file = getattr(sys.modules[name], "__file__", None)
+        if module_file and module_file.startswith(bundle_prefix):
+            bundle_modules[name] = module_file
+    return bundle_modules
+
+
+def _unload_bundle_modules(bundle_path: Path, loaded_modules: set[str]) -> None:
+    """
+    Remove the modules imported from the bundle since ``loaded_modules`` were loaded.
+
+    This makes the next file parsed by the worker import them again, as a new process would, so that
+    changes to them are picked up. Other modules, such as providers, are kept for the next file.
+    """
+    for name in _get_bundle_modules(bundle_path, loaded_modules):
+        del sys.modules[name]
+
+
+class _WorkerState(NamedTuple):
+    """The state of a worker of the parsing pool which parsing a DAG file may change for the next files."""
+
+    environ: dict[str, str]
+    path: list[str]
+    modules: dict[str, Any]
+    stdout: Any
+    stderr: Any
+    threads: set[threading.Thread]
+
+    @classmethod
+    def capture(cls) -> _WorkerState:
+        return cls(
+            environ=dict(os.environ),
+            path=list(sys.path),
+            modules=dict(sys.modules),
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+            threads=set(threading.enumerate()),
+        )
+
+    def restore(self) -> list[str]:
+        """
+        Restore the state captured before a file was parsed, and return the names of what it changed.
+
+        Modules the file replaced in or removed from ``sys.modules`` are put back without being reported,
+        as some modules legitimately replace themselves when first used. Threads the file left running
+        cannot be stopped, and may keep writing output for it.
+        """
+        changed = []
+        with contextlib.suppress(ValueError, OSError):
+            # Output written for the file must reach the manager before the worker says it is done.
+            sys.stdout.flush()
+            sys.stderr.flush()
+        if sys.stdout is not self.stdout or sys.stderr is not self.stderr:
+            changed.append("sys.stdout/sys.stderr")
+            sys.stdout, sys.stderr = self.stdout, self.stderr
+        if os.environ != self.environ:
+            changed.append("os.environ")
+            os.environ.clear()
+            os.environ.update(self.environ)
+        if sys.path != self.path:
+            changed.append("sys.path")
+            sys.path[:] = self.path
+        for name, module in self.modules.items():
+            if sys.modules.get(name) is not module:
+                sys.modules[name] = module
+        if any(thread.is_alive() for thread in set(threading.enumerate()) - self.threads):
+            changed.append("threads")
+        return changed
+
+
+def get_file_digest(path: str | os.PathLike[str]) -> str | None:
+    """Return the MD5 digest of the content of a file, or None if it cannot be read."""
+    try:
+        with open(path, "rb") as f:
+            return md5(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def get_dag_file_content_hash(file_digests: Iterable[tuple[str, str | None]]) -> str:
+    """
+    Combine the digests of a DAG file and of the modules it imported from its bundle into one hash.
+
+    :param file_digests: Path, relative to the bundle, and digest of each file, the DAG file first
+    """
+    return md5(json.dumps(list(file_digests)).encode("utf-8")).hexdigest()
+
+
+def _parse_files_entrypoint():
+    """Entrypoint of the parsing workers of the pool, which parse DAG files until their stdin is closed."""
+    start_time = time.monotonic()
+    os.environ["_AIRFLOW_PROCESS_CONTEXT"] = "client"
+
+    import structlog
+
+    from airflow.sdk.execution_time import comms, task_runner
+
+    comms_decoder = comms.CommsDecoder[ToDagProcessor, ToManager](
+        body_decoder=TypeAdapter[ToDagProcessor](ToDagProcessor),
+    )
+    task_runner.SUPERVISOR_COMMS = comms_decoder
+    log = structlog.get_logger(logger_name="task")
+
+    _import_parsing_worker_modules(log)
+    startup_time: float | None = time.monotonic() - start_time
+
+    while True:
+        try:
+            msg = comms_decoder._get_response()
+        except EOFError:
+            # The manager is done with this worker.
+            return
+        if not isinstance(msg, DagFileParseRequest):
+            raise RuntimeError(f"Required message to be a DagFileParseRequest, it was {msg}")
+
+        # BundleDagBag adds the bundle to sys.path for good, which is not a change made by the file.
+        if (bundle_path := os.fspath(msg.bundle_path)) not in sys.path:
+            sys.path.append(bundle_path)
+        state = _WorkerState.capture()
+        # The manager cannot bind the file to the logs it forwards to stdout, as it does for a process
+        # parsing a single file, since this process parses many.
+        with structlog.contextvars.bound_contextvars(
+            dag_file=os.path.relpath(msg.file, msg.bundle_path), bundle_name=msg.bundle_name
+        ):
+            try:
+                result = _parse_file(msg, log)
+            finally:
+                _unload_bundle_modules(msg.bundle_path, set(state.modules))
+                changed_worker_state = state.restore()
+
+            if result is not None:
+                comms_decoder.send(result)
+            if changed_worker_state:
+                log.warning(
+                    "Parsing the DAG file changed the state of the parsing worker, which will be replaced",
+                    changed=changed_worker_state,
+                )
+        comms_decoder.send(
+            DagFileProcessed(worker_startup_time=startup_time, changed_worker_state=changed_worker_state)
+        )
+        startup_time = None
+
+
 def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileParsingResult | None:
     # TODO: Set known_pool names on DagBag!
 
     stability_check_result = check_dag_file_stability(os.fspath(msg.file))
 
+    # The file is hashed before it is imported, so that a change made while parsing it is seen next time.
+    hash_file = not msg.callback_requests and conf.getboolean(
+        "dag_processor", "skip_unchanged_files", fallback=False
+    )
+    file_digest = get_file_digest(msg.file) if hash_file else None
+    loaded_modules = set(sys.modules)
+
     # Callback runs must not be blocked by the stability check: callbacks for
     # already-scheduled runs still have to execute, and they never produce a
     # parsing result anyway.
@@ -270,6 +481,19 @@ def _parse_file(msg: DagFileParseRequest, log: FilteringBoundLogger) -> DagFileP
         import_errors=bag.import_errors,
         warnings=stability_check_result.get_formatted_warnings(bag.dag_ids),
     )
+    # Modules imported from a zip file are left out, as the zip file is the Dag file.
+    result.imported_files = sorted(
+        os.path.relpath(module_file, msg.bundle_path)
+        for module_file in _get_bundle_modules(msg.bundle_path, loaded_modules).values()
+        if module_file != msg.file and os.path.isfile(module_file)
+    )
+    module_digests = [(path, get_file_digest(msg.bundle_path / path)) for path in result.imported_files]
+    if module_digests:
+        result.imports_hash = get_dag_file_content_hash(module_digests)
+    if file_digest is not None and not bag.import_errors:
+        result.content_hash = get_dag_file_content_hash(
+            [(os.path.relpath(msg.file, msg.bundle_path), file_digest), *module_digests]
+        )
     return result
 
 
@@ -597,6 +821,20 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
     bundle_name: str
     dag_file_rel_path: str
 
+    pooled: bool = False
+    """Whether this is a worker of the parsing pool, which parses many files, or parses a single one."""
+
+    files_processed: int = attrs.field(default=0, init=False)
+    """Number of files a worker of the parsing pool has finished processing."""
+
+    worker_startup_time: float | None = attrs.field(default=None, init=False)
+    """Seconds a worker of the parsing pool took to be ready to parse its first file."""
+
+    needs_replacing: bool = attrs.field(default=False, init=False)
+    """Whether parsing a file changed the state of this worker of the parsing pool, so it must not be reused."""
+
+    _file_processed: bool = attrs.field(default=False, init=False)
+
     @classmethod
     def start(  # type: ignore[override]
         cls,
@@ -606,22 +844,34 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
         bundle_name: str,
         dag_file_rel_path: str,
         callbacks: list[CallbackRequest],
-        target: Callable[[], None] = _parse_file_entrypoint,
+        target: Callable[[], None] | None = None,
         client: Client,
+        pooled: bool = False,
         **kwargs,
     ) -> Self:
+        """
+        Start a process parsing the DAG file at ``path``.
+
+        :param pooled: Start a worker of the parsing pool, which is given more files to parse with
+            :meth:`parse_file` once it is done with this one, instead of exiting.
+        """
         logger = kwargs["logger"]
+        start_time = time.monotonic()
+        entrypoint = _parse_files_entrypoint if pooled else _parse_file_entrypoint
+        if target is None:
+            target = entrypoint
 
         # Parsing DAG files runs user code that can trigger macOS-unsafe ObjC
         # initialization (secret backends, connection/variable lookups, HTTP
         # clients). Fork+exec a clean interpreter there. Tests override `target`
         # with a stub to exercise the base infrastructure; keep bare fork for those.
-        use_exec = target is _parse_file_entrypoint and supervisor._should_use_exec()
+        use_exec = target is entrypoint and supervisor._should_use_exec()
 
         # Pre-importing only helps the bare-fork child (it inherits the imports via
         # copy-on-write). An exec'd child re-imports from scratch, so skip it there
         # to avoid leaking user modules into the long-lived processor manager.
-        if not use_exec:
+        # Workers of the pool import what they need themselves, and keep it for the next files.
+        if not use_exec and not pooled:
             _pre_import_airflow_modules(os.fspath(path), logger)
 
         proc: Self = super().start(
@@ -630,8 +880,12 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
             bundle_name=bundle_name,
             dag_file_rel_path=dag_file_rel_path,
             use_exec=use_exec,
+            pooled=pooled,
             **kwargs,
         )
+        if pooled:
+            # The worker adds the time it took to get ready once it has parsed this file.
+            proc.worker_startup_time = time.monotonic() - start_time
         proc.had_callbacks = bool(callbacks)  # Track if this process had callbacks
         proc._on_child_started(callbacks, path, bundle_path, bundle_name)
         return proc
@@ -651,9 +905,61 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
         )
         self.send_msg(msg, request_id=0)
 
+    def parse_file(
+        self,
+        *,
+        path: str | os.PathLike[str],
+        bundle_path: Path,
+        bundle_name: str,
+        dag_file_rel_path: str,
+        callbacks: list[CallbackRequest],
+        logger_filehandle: BinaryIO,
+    ) -> None:
+        """Give another file to parse to this worker of the parsing pool, once it is done with the last one."""
+        if not self.pooled or not self._file_processed:
+            raise RuntimeError(f"{self} is not a parsing worker waiting for a file to parse")
+
+        self._forward_pending_output()
+        # The log forwarders of this process all write through the same underlying logger: point it to the
+        # log file of the new file, before closing the previous one.
+        previous_filehandle = self.logger_filehandle
+        if isinstance(underlying_logger := getattr(self.process_log, "_logger", None), structlog.BytesLogger):
+            structlog.BytesLogger.__init__(underlying_logger, logger_filehandle, name=underlying_logger.name)
+        self.logger_filehandle = logger_filehandle
+        with contextlib.suppress(OSError):
+            previous_filehandle.close()
+
+        self.bundle_name = bundle_name
+        self.dag_file_rel_path = dag_file_rel_path
+        self.parsing_result = None
+        self.had_callbacks = bool(callbacks)
+        self.start_time = time.monotonic()
+        self._file_processed = False
+        self._on_child_started(callbacks, path, bundle_path, bundle_name)
+
+    def _forward_pending_output(self) -> None:
+        """Forward the output the worker already wrote to the log of its last file, before it is switched."""
+        output = [sock for sock, kind in self._open_sockets.items() if kind in ("stdout", "stderr", "logs")]
+        while output and (readable := select.select(output, [], [], 0)[0]):
+            for sock in readable:
+                if not self._handle_socket_event(self.selector.get_key(sock)):
+                    output.remove(sock)
+
+    @property
+    def waiting_for_file(self) -> bool:
+        """Whether this is a worker of the parsing pool done with its file, and waiting for the next one."""
+        return self._file_processed
+
+    def stop(self) -> None:
+        """Tell this worker of the parsing pool that there are no more files to parse, so that it exits."""
+        self._file_processed = False
+        with contextlib.suppress(OSError):
+            self.stdin.shutdown(SHUT_WR)
+
     def _get_target_loggers(self) -> tuple[FilteringBoundLogger, ...]:
         base = super()._get_target_loggers()
-        if not self.subprocess_logs_to_stdout:
+        if not self.subprocess_logs_to_stdout or self.pooled:
+            # Workers of the parsing pool bind the file they are parsing to their logs themselves.
             return base
         return tuple(
             logger.bind(dag_file=self.dag_file_rel_path, bundle_name=self.bundle_name) for logger in base
@@ -684,6 +990,12 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
         dump_opts: dict[str, bool] = {}
         if isinstance(msg, DagFileParsingResult):
             self.parsing_result = msg
+        elif isinstance(msg, DagFileProcessed):
+            self._file_processed = True
+            self.files_processed += 1
+            self.needs_replacing = self.needs_replacing or bool(msg.changed_worker_state)
+            if msg.worker_startup_time is not None and self.worker_startup_time is not None:
+                self.worker_startup_time += msg.worker_startup_time
         elif isinstance(msg, GetConnection):
             conn = self.client.connections.get(msg.conn_id)
             if isinstance(conn, ConnectionResponse):
@@ -747,6 +1059,9 @@ class DagFileProcessorProcess(WatchedSubprocess, LoggingMixin):
 
     @property
     def is_ready(self) -> bool:
+        if self._file_processed:
+            # A worker of the parsing pool is done with its file, and waits for the next one.
+            return True
         if self._check_subprocess_exit() is None:
             # Process still alive, def can't be finished yet
             return False
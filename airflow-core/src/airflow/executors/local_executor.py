@@ -27,6 +27,8 @@ from __future__ import annotations
 
 import contextlib
 import ctypes
+import functools
+import math
 import multiprocessing
 import multiprocessing.sharedctypes
 import os
@@ -70,11 +72,15 @@ def _run_worker(
 ):
     import signal
 
+    from airflow.sdk.execution_time.zygote import start_task_zygote
+
     # Ignore ctrl-c in this process -- we don't want to kill _this_ one. we let tasks run to completion
     signal.signal(signal.SIGINT, signal.SIG_IGN)
 
     log = structlog.get_logger(logger_name)
     log.info("Worker starting up pid=%d", os.getpid())
+    # Before anything is set up for a task, for the zygote to fork task processes from
+    start_task_zygote()
 
     while True:
         setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <idle>", log)
@@ -99,17 +105,150 @@ def _run_worker(
         if workload.running_state is not None:
             output.put((workload.key, workload.running_state, None))
 
-        try:
-            BaseExecutor.run_workload(
-                workload,
-                server=get_execution_api_server_url(team_conf),
-                proctitle=f"{_get_executor_process_title_prefix(team_conf.team_name)} {workload.display_name}",
-                subprocess_logs_to_stdout=True,
-            )
+        _execute_workload(logger_name, workload, output, team_conf)
+
+
+def _execute_workload(
+    logger_name: str,
+    workload: ExecutorWorkload,
+    output: Queue[WorkloadResultType],
+    team_conf,
+) -> None:
+    """Run the workload in this process, and report its outcome to the executor."""
+    try:
+        BaseExecutor.run_workload(
+            workload,
+            server=get_execution_api_server_url(team_conf),
+            proctitle=f"{_get_executor_process_title_prefix(team_conf.team_name)} {workload.display_name}",
+            subprocess_logs_to_stdout=True,
+        )
+        output.put((workload.key, workload.success_state, None))
+    except Exception as e:
+        structlog.get_logger(logger_name).exception(
+            "Workload execution failed.", workload_type=type(workload).__name__
+        )
+        output.put((workload.key, workload.failure_state, e))
+
+
+def _run_multi_task_worker(
+    logger_name: str,
+    input: SimpleQueue[ExecutorWorkload | None],
+    output: Queue[WorkloadResultType],
+    unread_messages: multiprocessing.sharedctypes.Synchronized[int],
+    team_conf,
+    tasks_per_supervisor: int,
+):
+    """
+    Run up to ``tasks_per_supervisor`` workloads at a time, supervising all their task processes from here.
+
+    A thread reads the workloads from ``input``, only while this worker has room for one more, and hands them
+    to the main thread which runs the tasks with a ``MultiTaskSupervisor``. The workloads it can't supervise
+    (callbacks, connection tests and tasks of other coordinators) are run in a process of their own, as
+    ``_run_worker`` would.
+
+    As this process has threads, it doesn't fork any process itself: the task processes are forked from the
+    task zygote of the ``MultiTaskSupervisor``, and the processes of the other workloads from a fork server.
+    """
+    import queue
+    import signal
+    import threading
+
+    from airflow.executors.workloads import ExecuteTask
+    from airflow.sdk.execution_time.supervisor import MultiTaskSupervisor
+
+    # Ignore ctrl-c in this process -- we don't want to kill _this_ one. we let tasks run to completion
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    log = structlog.get_logger(logger_name)
+    log.info("Multi-task worker starting up pid=%d", os.getpid())
+    setproctitle(f"{_get_executor_process_title_prefix(team_conf.team_name)} <multi-task supervisor>", log)
+
+    received: queue.SimpleQueue[ExecutorWorkload | None] = queue.SimpleQueue()
+    free_slots = threading.Semaphore(tasks_per_supervisor)
+    # Starts the task zygote, so before any thread
+    supervisor = MultiTaskSupervisor(
+        server=get_execution_api_server_url(team_conf), subprocess_logs_to_stdout=True
+    )
+    forkserver = multiprocessing.get_context("forkserver")
+    forkserver.set_forkserver_preload([__name__])
+    # The queues of the executor are of the fork context, which can't be passed to a forkserver process
+    forked_results: SimpleQueue[WorkloadResultType] = forkserver.SimpleQueue()
+
+    def read_workloads():
+        while True:
+            free_slots.acquire()
+            try:
+                workload = input.get()
+            except EOFError:
+                log.info(
+                    "Failed to read tasks from the task queue because the other "
+                    "end has closed the connection. Terminating worker %s.",
+                    multiprocessing.current_process().name,
+                )
+                workload = None
+            received.put(workload)
+            supervisor.wakeup()
+            if workload is None:
+                return
+
+    def on_task_finished(workload: ExecuteTask, exit_code: int, error: Exception | None):
+        if error is None:
             output.put((workload.key, workload.success_state, None))
-        except Exception as e:
-            log.exception("Workload execution failed.", workload_type=type(workload).__name__)
-            output.put((workload.key, workload.failure_state, e))
+        else:
+            output.put((workload.key, workload.failure_state, error))
+        free_slots.release()
+
+    threading.Thread(target=read_workloads, name="read-workloads", daemon=True).start()
+
+    processes: list[multiprocessing.Process] = []
+    stopping = False
+    with supervisor:
+        while not stopping or supervisor.running_tasks or processes:
+            while not received.empty():
+                workload = received.get()
+                if workload is None:
+                    # Received poison pill, no more tasks to run once the current ones are done
+                    stopping = True
+                    continue
+
+                # Decrement this as soon as we pick up a message off the queue
+                with unread_messages:
+                    unread_messages.value -= 1
+
+                if workload.running_state is not None:
+                    output.put((workload.key, workload.running_state, None))
+
+                if isinstance(workload, ExecuteTask) and supervisor.can_supervise(workload.ti.queue):
+                    try:
+                        supervisor.start_task(
+                            ti=workload.ti,  # type: ignore[arg-type]
+                            bundle_info=workload.bundle_info,
+                            dag_rel_path=workload.dag_rel_path,
+                            token=workload.token,
+                            log_path=workload.log_path,
+                            sentry_integration=workload.sentry_integration,
+                            on_finish=functools.partial(on_task_finished, workload),
+                        )
+                    except Exception as e:
+                        log.exception("Workload execution failed.", workload_type=type(workload).__name__)
+                        on_task_finished(workload, 1, e)
+                else:
+                    process = forkserver.Process(
+                        target=_execute_workload, args=(logger_name, workload, forked_results, team_conf)
+                    )
+                    process.start()
+                    processes.append(process)
+
+            supervisor.serve()
+
+            for process in [process for process in processes if not process.is_alive()]:
+                process.join()
+                process.close()
+                processes.remove(process)
+                free_slots.release()
+            # The processes that exited have put their result already
+            while not forked_results.empty():
+                output.put(forked_results.get())
 
 
 class LocalExecutor(BaseExecutor):
@@ -119,6 +258,9 @@ class LocalExecutor(BaseExecutor):
     It uses the multiprocessing Python library and queues to parallelize the execution of tasks.
 
     :param parallelism: how many parallel processes are run in the executor, must be > 0
+
+    With ``[workers] tasks_per_supervisor`` set above 1, each worker process supervises that many tasks
+    at a time, instead of being the supervisor of a single task.
     """
 
     is_local: bool = True
@@ -151,6 +293,9 @@ class LocalExecutor(BaseExecutor):
 
             self.conf = conf
 
+        self.tasks_per_supervisor = max(1, self.conf.getint("workers", "tasks_per_supervisor"))
+        self._max_workers = math.ceil(self.parallelism / self.tasks_per_supervisor)
+
     def start(self) -> None:
         """Start the executor."""
         # We delay opening these queues until the start method mostly for unit tests. ExecutorLoader caches
@@ -168,7 +313,7 @@ class LocalExecutor(BaseExecutor):
         if self.is_mp_using_fork:
             # This creates the maximum number of worker processes (parallelism) at once
             # to minimize gc freeze/unfreeze cycles when using fork in multiprocessing
-            self._spawn_workers_with_gc_freeze(self.parallelism)
+            self._spawn_workers_with_gc_freeze(self._max_workers)
 
     def _check_workers(self):
         # Reap any dead workers
@@ -192,27 +337,31 @@ class LocalExecutor(BaseExecutor):
         # If we're using spawn in multiprocessing (default on macOS now) to start tasks, this can get called a
         # via `sync()` a few times before the spawned process actually starts picking up messages. Try not to
         # create too much
-        if num_outstanding and len(self.workers) < self.parallelism:
+        if num_outstanding and len(self.workers) < self._max_workers:
             if self.is_mp_using_fork:
                 # This creates the maximum number of worker processes at once
                 # to minimize gc freeze/unfreeze cycles when using fork in multiprocessing
-                self._spawn_workers_with_gc_freeze(self.parallelism - len(self.workers))
+                self._spawn_workers_with_gc_freeze(self._max_workers - len(self.workers))
             else:
                 # This only creates one worker, which is fine as we call this directly after putting a message on
                 # activity_queue in execute_async when using spawn in multiprocessing
                 self._spawn_worker()
 
     def _spawn_worker(self):
-        p = multiprocessing.Process(
-            target=_run_worker,
-            kwargs={
-                "logger_name": self.log.name,
-                "input": self.activity_queue,
-                "output": self.result_queue,
-                "unread_messages": self._unread_messages,
-                "team_conf": self.conf,
-            },
-        )
+        kwargs = {
+            "logger_name": self.log.name,
+            "input": self.activity_queue,
+            "output": self.result_queue,
+            "unread_messages": self._unread_messages,
+            "team_conf": self.conf,
+        }
+        if self.tasks_per_supervisor > 1:
+            p = multiprocessing.Process(
+                target=_run_multi_task_worker,
+                kwargs={**kwargs, "tasks_per_supervisor": self.tasks_per_supervisor},
+            )
+        else:
+            p = multiprocessing.Process(target=_run_worker, kwargs=kwargs)
         p.start()
         if TYPE_CHECKING:
             assert p.pid  # Since we've called start
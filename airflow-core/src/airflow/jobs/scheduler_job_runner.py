@@ -146,6 +146,7 @@ if TYPE_CHECKING:
     from airflow.executors.base_executor import BaseExecutor
     from airflow.executors.executor_utils import ExecutorName
     from airflow.executors.workloads.types import SchedulerWorkload
+    from airflow.models.pool import PoolStats
     from airflow.serialization.definitions.dag import SerializedDAG
     from airflow.utils.sqlalchemy import CommitProhibitorGuard
 
@@ -291,6 +292,136 @@ class ConcurrencyMap:
                 self.dag_run_active_tasks_map[dag_id, run_id] += count
 
 
+def _decrement(counter: Counter, key: Any) -> None:
+    """Decrement a counter entry without letting it go below zero."""
+    if counter[key] > 1:
+        counter[key] -= 1
+    else:
+        counter.pop(key, None)
+
+
+class IncrementalSchedulingState:
+    """
+    Pool occupancy and concurrency counts kept in memory across critical section passes.
+
+    Used when ``[scheduler] use_incremental_scheduling_state`` is enabled. The counts are loaded from the
+    database on the first pass and every ``reconcile_interval`` seconds afterwards (or immediately when the
+    pool configuration changes). In between, they are adjusted in place as the scheduler queues task
+    instances, and released as executors report task instances finished.
+
+    Transitions the scheduler does not observe (e.g. a trigger moving a deferred task back to scheduled)
+    leave the counts too high until the next reconciliation, which can delay scheduling but does not let a
+    single scheduler exceed its limits.
+
+    :param reconcile_interval: Maximum age, in seconds, of the counts before they are reloaded.
+    """
+
+    def __init__(self, reconcile_interval: float):
+        self.reconcile_interval = reconcile_interval
+        self.pools: dict[str, PoolStats] = {}
+        self.concurrency_map = ConcurrencyMap()
+        # max_active_tasks of the Dags with active task instances, loaded on reconciliation and updated
+        # as Dags are seen in the critical section. Used to filter out full Dag runs without having to
+        # aggregate the task_instance table.
+        self.dag_max_active_tasks: dict[str, int] = {}
+        # Keys of the task instances included in the counts, loaded on reconciliation and added to as the
+        # scheduler queues task instances. Only these are released, so the counts never go too low.
+        self.counted_tis: set[TaskInstanceKey] = set()
+        self._pool_config: dict[str, tuple[float, bool]] = {}
+        self._last_reconciled_at: float | None = None
+
+    def invalidate(self) -> None:
+        """Force the counts to be reloaded from the database on the next pass."""
+        self._last_reconciled_at = None
+
+    def prepare(self, session: Session) -> tuple[dict[str, PoolStats], ConcurrencyMap]:
+        """
+        Lock the pool rows and return the counts to use for this critical section pass.
+
+        Locking the pool rows keeps the HA "critical section" semantics of ``Pool.slots_stats``; it only
+        skips the aggregation over the ``task_instance`` table while the in-memory counts are fresh.
+        """
+        from airflow.models.pool import Pool
+
+        query = select(Pool.pool, Pool.slots, Pool.include_deferred)
+        pool_config = {
+            pool_name: (float("inf") if slots == -1 else slots, include_deferred)
+            for pool_name, slots, include_deferred in session.execute(
+                with_row_locks(query, session=session, nowait=True)
+            )
+        }
+        if (
+            self._last_reconciled_at is None
+            or time.monotonic() - self._last_reconciled_at >= self.reconcile_interval
+            or pool_config != self._pool_config
+        ):
+            # The pool rows are already locked by the query above.
+            self.pools = Pool.slots_stats(session=session)
+            self.concurrency_map.load(session=session)
+            self._load_counted_tis(session=session)
+            self._load_dag_max_active_tasks(session=session)
+            self._pool_config = pool_config
+            self._last_reconciled_at = time.monotonic()
+            stats.incr("scheduler.scheduling_state.reconciled")
+        return self.pools, self.concurrency_map
+
+    def _load_counted_tis(self, session: Session) -> None:
+        """Load the keys of the task instances counted by the reloaded concurrency map."""
+        self.counted_tis = {
+            TaskInstanceKey(*row)
+            for row in session.execute(
+                select(TI.dag_id, TI.task_id, TI.run_id, TI.try_number, TI.map_index).where(
+                    TI.state.in_(ACTIVE_STATES)
+                )
+            )
+        }
+
+    def _load_dag_max_active_tasks(self, session: Session) -> None:
+        """Load max_active_tasks of every Dag with active task instances, to tell which runs are full."""
+        dag_ids = {dag_id for dag_id, _ in self.concurrency_map.dag_run_active_tasks_map}
+        self.dag_max_active_tasks = (
+            dict(
+                session.execute(
+                    select(DagModel.dag_id, DagModel.max_active_tasks).where(DagModel.dag_id.in_(dag_ids))
+                ).all()
+            )
+            if dag_ids
+            else {}
+        )
+
+    def full_dag_runs(self) -> set[tuple[str, str]]:
+        """Return the (dag_id, run_id) of Dag runs known to have reached their Dag's max_active_tasks."""
+        return {
+            dag_run_key
+            for dag_run_key, count in self.concurrency_map.dag_run_active_tasks_map.items()
+            if count >= self.dag_max_active_tasks.get(dag_run_key[0], float("inf"))
+        }
+
+    def release(self, ti: TaskInstance) -> None:
+        """
+        Release the slots held by a task instance the executor reported as finished.
+
+        The current state of the task instance decides what is released: a task instance that is still
+        queued or running (e.g. requeued) keeps everything, a deferred or awaiting-input task instance only
+        gives back its worker slot, and any other state gives back all its slots. Task instances which
+        are not part of the counts, e.g. ones which finished before the last reconciliation, release nothing.
+        """
+        if ti.state in EXECUTION_STATES or ti.key not in self.counted_tis:
+            return
+        self.counted_tis.discard(ti.key)
+        parked = ti.state in (TaskInstanceState.DEFERRED, TaskInstanceState.AWAITING_INPUT)
+        _decrement(self.concurrency_map.dag_run_active_tasks_map, (ti.dag_id, ti.run_id))
+        if not parked:
+            _decrement(self.concurrency_map.task_concurrency_map, (ti.dag_id, ti.task_id))
+            _decrement(self.concurrency_map.task_dagrun_concurrency_map, (ti.dag_id, ti.run_id, ti.task_id))
+        pool_stats = self.pools.get(ti.pool)
+        if pool_stats is None:
+            return
+        if ti.state == TaskInstanceState.DEFERRED and self._pool_config.get(ti.pool, (0, False))[1]:
+            return
+        pool_stats["open"] = min(pool_stats["total"], pool_stats["open"] + ti.pool_slots)
+
+
 def _is_parent_process() -> bool:
     """
     Whether this is a parent process.
@@ -356,6 +487,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         self._task_instance_heartbeat_timeout_secs = conf.getint(
             "scheduler", "task_instance_heartbeat_timeout"
         )
+        # The API servers may write heartbeats up to this late, see HeartbeatBuffer.
+        self._heartbeat_flush_interval = conf.getfloat("execution_api", "heartbeat_flush_interval")
         self._task_queued_timeout = conf.getfloat("scheduler", "task_queued_timeout")
         self._enable_tracemalloc = conf.getboolean("scheduler", "enable_tracemalloc")
 
@@ -383,6 +516,12 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if log:
             self._log = log
 
+        self._scheduling_state: IncrementalSchedulingState | None = None
+        if conf.getboolean("scheduler", "use_incremental_scheduling_state"):
+            self._scheduling_state = IncrementalSchedulingState(
+                reconcile_interval=conf.getfloat("scheduler", "scheduling_state_reconcile_interval"),
+            )
+
         self.scheduler_dag_bag = CachedDBDagBag(
             load_op_links=False,
             cache_size=SCHEDULER_DAG_CACHE_SIZE,
@@ -693,7 +832,13 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
         # Get the pool settings. We get a lock on the pool rows, treating this as a "critical section"
         # Throws an exception if lock cannot be obtained, rather than blocking
-        pools = Pool.slots_stats(lock_rows=True, session=session)
+        if self._scheduling_state is not None:
+            pools, concurrency_map = self._scheduling_state.prepare(session=session)
+        else:
+            pools = Pool.slots_stats(lock_rows=True, session=session)
+            # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
+            concurrency_map = ConcurrencyMap()
+            concurrency_map.load(session=session)
 
         # If the pools are full, there is no point doing anything!
         # If _somehow_ the pool is overfull, don't let the limit go negative - it breaks SQL
@@ -711,10 +856,6 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         if self._multi_team:
             pool_to_team_name = Pool.get_name_to_team_name_mapping(list(pools.keys()), session=session)
 
-        # dag_id to # of running tasks and (dag_id, task_id) to # of running tasks.
-        concurrency_map = ConcurrencyMap()
-        concurrency_map.load(session=session)
-
         # Number of tasks that cannot be scheduled because of no open slot in pool
         num_starving_tasks_total = 0
 
@@ -731,13 +872,6 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             num_starved_tasks = len(starved_tasks)
             num_starved_tasks_task_dagrun_concurrency = len(starved_tasks_task_dagrun_concurrency)
 
-            # This behaves the same as 'concurrency_map.load()' with the difference that
-            # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
-            # subquery object that is then executed along with main query.
-            # The results of 'load()' aren't used again here because by the time the main query
-            # executes, there could be a change that will be ignored.
-            dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
-
             query = (
                 select(TI)
                 .with_hint(TI, "USE INDEX (ti_state)", dialect_name="mysql")
@@ -747,19 +881,31 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 .where(~DM.is_paused)
                 .where(TI.state == TaskInstanceState.SCHEDULED)
                 .where(DM.bundle_name.is_not(None))
-                .join(
+                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
+            )
+
+            if self._scheduling_state is not None:
+                # The in-memory counts already know which Dag runs are full, so there is no need to
+                # aggregate the task_instance table again alongside the main query.
+                if full_dag_runs := self._scheduling_state.full_dag_runs():
+                    query = query.where(tuple_(TI.dag_id, TI.run_id).not_in(full_dag_runs))
+            else:
+                # This behaves the same as 'concurrency_map.load()' with the difference that
+                # 'load()' executes immediately while '_get_current_dr_task_concurrency' creates a
+                # subquery object that is then executed along with main query.
+                # The results of 'load()' aren't used again here because by the time the main query
+                # executes, there could be a change that will be ignored.
+                dr_task_concurrency_subquery = _get_current_dr_task_concurrency(states=EXECUTION_STATES)
+                query = query.join(
                     dr_task_concurrency_subquery,
                     and_(
                         TI.dag_id == dr_task_concurrency_subquery.c.dag_id,
                         TI.run_id == dr_task_concurrency_subquery.c.run_id,
                     ),
                     isouter=True,
-                )
-                .where(
+                ).where(
                     func.coalesce(dr_task_concurrency_subquery.c.task_per_dr_count, 0) < DM.max_active_tasks
                 )
-                .order_by(-TI.priority_weight, DR.logical_date, TI.map_index)
-            )
 
             # Starvation filters should be applied before computing the row_num based on the
             # max_active_tasks limit. That way, starved dags and tasks that shouldn't run,
@@ -962,6 +1108,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 dag_run_key = (dag_id, task_instance.run_id)
                 current_active_tasks_per_dag_run = concurrency_map.dag_run_active_tasks_map[dag_run_key]
                 dag_max_active_tasks = task_instance.dag_model.max_active_tasks
+                if self._scheduling_state is not None:
+                    self._scheduling_state.dag_max_active_tasks[dag_id] = dag_max_active_tasks
                 self.log.info(
                     "DAG %s has %s/%s running and queued tasks",
                     dag_id,
@@ -1026,6 +1174,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 concurrency_map.task_dagrun_concurrency_map[
                     (task_instance.dag_id, task_instance.run_id, task_instance.task_id)
                 ] += 1
+                if self._scheduling_state is not None:
+                    self._scheduling_state.counted_tis.add(task_instance.key)
 
                 pool_stats["open"] = open_slots
 
@@ -1345,6 +1495,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 scheduler_dag_bag=self.scheduler_dag_bag,
                 session=session,
                 eagerly_load_dag_tags=self._dag_tags_in_metrics,
+                scheduling_state=self._scheduling_state,
             )
         except Exception as exc:
             stats.incr("scheduler.executor_events.failed", tags={"exception_class": type(exc).__name__})
@@ -1363,6 +1514,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         scheduler_dag_bag: DBDagBag,
         session: Session,
         eagerly_load_dag_tags: bool = False,
+        scheduling_state: IncrementalSchedulingState | None = None,
     ) -> int:
         """
         Process task completion events from the executor and update task instance states.
@@ -1388,6 +1540,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         :param eagerly_load_dag_tags: When True, eager-load dag_model.tags so the per-finished-task
             metrics carry Dag tags without a per-TI lazy load. The scheduler passes its cached flag so
             the hot path never reads conf; other callers (e.g. ``dag.test()``) leave it at the default.
+        :param scheduling_state: The scheduler's in-memory scheduling state, if enabled. Slots held by
+            task instances reported as finished are released in it.
 
         :return: Number of events processed from the executor event buffer
 
@@ -1489,6 +1643,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
         # multi-schedulers
         locked_query = with_row_locks(query, of=TI, session=session, skip_locked=True)
         tis: Iterator[TI] = session.scalars(locked_query)
+        finished_tis: list[TI] = []
         for ti in tis:
             try_number = ti_primary_key_to_try_number_map[ti.key.primary]
             buffer_key = ti.key.with_try_number(try_number)
@@ -1510,6 +1665,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 cls.logger().info("Setting external_executor_id for %s to %s", ti, info)
                 continue
 
+            finished_tis.append(ti)
+
             msg = (
                 "TaskInstance Finished: dag_id=%s, task_id=%s, run_id=%s, map_index=%s, ti_id=%s, "
                 "run_start_date=%s, run_end_date=%s, "
@@ -1701,6 +1858,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                 # Update task state - emails are handled by DAG processor now
                 ti.handle_failure(error=msg, session=session)
 
+        if scheduling_state is not None:
+            for ti in finished_tis:
+                scheduling_state.release(ti)
+
         cls._emit_executor_events_batch_metrics(num_events)
         return len(event_buffer)
 
@@ -2072,6 +2233,10 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
                     timer.stop(send=True)
                 except OperationalError as e:
                     timer.stop(send=False)
+                    if self._scheduling_state is not None:
+                        # The in-memory counts may include task instances whose QUEUED update is
+                        # about to be rolled back.
+                        self._scheduling_state.invalidate()
 
                     if is_lock_not_available_error(error=e):
                         self.log.debug("Critical section lock held by another Scheduler")
@@ -3639,7 +3804,9 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
 
     def _find_task_instances_without_heartbeats(self, *, session: Session) -> list[TI]:
         self.log.debug("Finding 'running' jobs without a recent heartbeat")
-        limit_dttm = timezone.utcnow() - timedelta(seconds=self._task_instance_heartbeat_timeout_secs)
+        limit_dttm = timezone.utcnow() - timedelta(
+            seconds=self._task_instance_heartbeat_timeout_secs + self._heartbeat_flush_interval
+        )
         asset_loader, alias_loader = _eager_load_dag_run_for_validation()
         query = (
             select(TI)
@@ -3831,7 +3998,7 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
     @provide_session
     def _remove_unreferenced_triggers(self, *, session: Session = NEW_SESSION) -> None:
         """Remove triggers that are no longer used by anything."""
-        session.execute(
+        result = session.execute(
             delete(Trigger)
             .where(
                 ~exists(
@@ -3842,6 +4009,8 @@ class SchedulerJobRunner(BaseJobRunner, LoggingMixin):
             )
             .execution_options(synchronize_session="fetch")
         )
+        if getattr(result, "rowcount", 0):
+            Trigger.notify_changed(session)
 
     @provide_session
     def _update_asset_orphanage(self, *, session: Session = NEW_SESSION) -> None:
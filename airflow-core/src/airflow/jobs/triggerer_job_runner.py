@@ -17,7 +17,11 @@
 from __future__ import annotations
 
 import asyncio
+import bisect
 import functools
+import hashlib
+import heapq
+import itertools
 import logging
 import math
 import os
@@ -46,6 +50,7 @@ from pydantic import BaseModel, Field, TypeAdapter
 from sqlalchemy import func, select
 from structlog.contextvars import bind_contextvars as bind_log_contextvars
 
+from airflow import settings
 from airflow._shared.module_loading import import_string
 from airflow._shared.observability.metrics import stats
 from airflow._shared.timezones import timezone
@@ -55,7 +60,7 @@ from airflow.executors.workloads.task import TaskInstanceDTO
 from airflow.jobs.base_job_runner import BaseJobRunner
 from airflow.jobs.job import perform_heartbeat
 from airflow.models.dagbag import DBDagBag
-from airflow.models.trigger import Trigger
+from airflow.models.trigger import TRIGGER_CHANGES_CHANNEL, Trigger
 from airflow.observability.metrics import stats_utils
 from airflow.sdk.api.datamodels._generated import HITLDetailResponse
 from airflow.sdk.definitions.asset import Asset
@@ -180,6 +185,7 @@ def _make_trigger_span(
 
 
 __all__ = [
+    "ShardedTriggerRunnerSupervisor",
     "TriggerRunner",
     "TriggerRunnerSupervisor",
     "TriggererJobRunner",
@@ -213,9 +219,10 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
             raise ValueError(f"Capacity number {capacity!r} is invalid")
         self.queues = queues
         self.team_name = team_name
+        self.runner_processes = conf.getint("triggerer", "runner_processes", fallback=1)
         # Set up only when _execute() starts the subprocess; keep it defined so that
         # signal handlers (or other code) firing before startup don't hit AttributeError.
-        self.trigger_runner: TriggerRunnerSupervisor | None = None
+        self.trigger_runner: TriggerRunnerSupervisor | ShardedTriggerRunnerSupervisor | None = None
 
     def register_signals(self) -> None:
         """Register signals that stop child processes."""
@@ -268,14 +275,24 @@ class TriggererJobRunner(BaseJobRunner, LoggingMixin):
         )
         self.trigger_runner = None
         try:
-            # Kick off runner sub-process without DB access
-            self.trigger_runner = TriggerRunnerSupervisor.start(
-                job=self.job,
-                capacity=self.capacity,
-                logger=log,
-                queues=self.queues,
-                team_name=self.team_name,
-            )
+            # Kick off runner sub-process(es) without DB access
+            if self.runner_processes > 1:
+                self.trigger_runner = ShardedTriggerRunnerSupervisor.start(
+                    job=self.job,
+                    capacity=self.capacity,
+                    runner_processes=self.runner_processes,
+                    logger=log,
+                    queues=self.queues,
+                    team_name=self.team_name,
+                )
+            else:
+                self.trigger_runner = TriggerRunnerSupervisor.start(
+                    job=self.job,
+                    capacity=self.capacity,
+                    logger=log,
+                    queues=self.queues,
+                    team_name=self.team_name,
+                )
             # Run the main DB comms loop in this process
             self.trigger_runner.run()
             return self.trigger_runner._exit_code
@@ -343,6 +360,15 @@ class messages:
         # advances on receipt.
         events_persisted: list[int] | None = None
 
+    class WakeUp(BaseModel):
+        """
+        Tell the async trigger runner process to sync its triggers now, rather than once it next checks in.
+
+        Unlike the other messages, this is not the response to a request.
+        """
+
+        type: Literal["WakeUp"] = "WakeUp"
+
 
 class HITLDetailResponseResult(HITLDetailResponse):
     """Response to GetHITLDetailResponse request."""
@@ -364,6 +390,7 @@ class HITLDetailResponseResult(HITLDetailResponse):
 ToTriggerRunner = Annotated[
     messages.StartTriggerer
     | messages.TriggerStateSync
+    | messages.WakeUp
     | ConnectionResult
     | VariableResult
     | VariableKeysResult
@@ -468,6 +495,100 @@ def in_process_api_server() -> InProcessExecutionAPI:
     return api
 
 
+@attrs.define
+class TriggerChangeListener:
+    """
+    Decide when a triggerer looks for the triggers it should run.
+
+    On Postgres the triggerer listens on a connection of its own for the notifications
+    :meth:`Trigger.notify_changed` sends when triggers are added or removed, and only looks for its
+    triggers when notified, or every ``[triggerer] trigger_poll_interval`` seconds for the triggers of
+    triggerers which died. On other databases, or if it can't listen, it looks for them on every loop.
+    """
+
+    poll_interval: float = attrs.field(factory=lambda: conf.getfloat("triggerer", "trigger_poll_interval"))
+
+    _connection: Any = attrs.field(default=None, init=False, repr=False)
+    _fileno: int = attrs.field(default=-1, init=False, repr=False)
+    _selector: selectors.BaseSelector | None = attrs.field(default=None, init=False, repr=False)
+    _notified: bool = attrs.field(default=True, init=False)
+    _last_load: float = attrs.field(default=-math.inf, init=False)
+
+    @property
+    def listening(self) -> bool:
+        return self._connection is not None
+
+    def listen(self, selector: selectors.BaseSelector) -> None:
+        """Start listening for notifications if the database supports them, read when ``selector`` selects them."""
+        if not conf.getboolean("triggerer", "listen_for_trigger_changes"):
+            return
+        if settings.engine is None or settings.engine.dialect.name != "postgresql":
+            return
+        try:
+            connection = settings.engine.raw_connection()
+            # It's never given back, as it only listens from now on
+            connection.detach()
+            dbapi_connection = connection.driver_connection
+            dbapi_connection.rollback()
+            dbapi_connection.autocommit = True
+            dbapi_connection.cursor().execute(f"LISTEN {TRIGGER_CHANGES_CHANNEL}")
+            self._connection = connection
+            self._fileno = dbapi_connection.fileno()
+            selector.register(self, selectors.EVENT_READ, (self._read_notifications, lambda _: None))
+            self._selector = selector
+        except Exception:
+            log.warning(
+                "Unable to listen for trigger changes, looking for triggers on every loop", exc_info=True
+            )
+            self.close()
+            return
+        log.info("Listening for trigger changes", poll_interval=self.poll_interval)
+
+    def fileno(self) -> int:
+        # Not asking the connection, which may have been closed by then when unregistering
+        return self._fileno
+
+    def _read_notifications(self, _) -> bool:
+        dbapi_connection = self._connection.driver_connection
+        try:
+            if callable(dbapi_connection.notifies):
+                # psycopg 3
+                notifies = list(dbapi_connection.notifies(timeout=0))
+            else:
+                # psycopg2
+                dbapi_connection.poll()
+                notifies = list(dbapi_connection.notifies)
+                dbapi_connection.notifies.clear()
+        except Exception:
+            log.warning(
+                "Lost the connection listening for trigger changes, looking for triggers on every loop",
+                exc_info=True,
+            )
+            return False
+        if notifies:
+            self._notified = True
+        return True
+
+    def should_load_triggers(self) -> bool:
+        """Return whether to look for the triggers to run in this loop."""
+        now = time.monotonic()
+        if self.listening and not self._notified and now - self._last_load < self.poll_interval:
+            return False
+        self._notified = False
+        self._last_load = now
+        return True
+
+    def close(self) -> None:
+        if self._selector is not None:
+            with suppress(KeyError, ValueError):
+                self._selector.unregister(self)
+            self._selector = None
+        if self._connection is not None:
+            with suppress(Exception):
+                self._connection.close()
+            self._connection = None
+
+
 @attrs.define(kw_only=True)
 class TriggerRunnerSupervisor(WatchedSubprocess):
     """
@@ -503,6 +624,11 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
     _last_runner_comms: float = attrs.field(init=False, default=math.inf)
     _runner_comms_silence_logged: bool = attrs.field(init=False, default=False)
 
+    # Whether the TriggerRunner subprocess was woken up since it last checked in
+    _runner_woken: bool = attrs.field(init=False, default=False)
+
+    trigger_change_listener: TriggerChangeListener = attrs.field(factory=TriggerChangeListener, init=False)
+
     decoder: ClassVar[TypeAdapter[ToTriggerSupervisor]] = TypeAdapter(ToTriggerSupervisor)
 
     # Maps trigger IDs that we think are running in the sub process
@@ -586,6 +712,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         self._last_runner_comms = time.monotonic()
 
         if isinstance(msg, messages.TriggerStateChanges):
+            self._runner_woken = False
             if msg.events:
                 self.events.extend(msg.events)
             if msg.failures:
@@ -593,15 +720,7 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             for id in msg.finished or ():
                 self.running_triggers.discard(id)
                 self.cancelling_triggers.discard(id)
-                if factory := self.logger_cache.pop(id, None):
-                    try:
-                        factory.upload_to_remote()
-                    except Exception:
-                        log.exception("Failed to upload trigger logs to remote", trigger_id=id)
-                    finally:
-                        # Close the FD explicitly even if upload raised, otherwise the file
-                        # handle leaks for every failed upload.
-                        factory.close()
+                self.close_trigger_log(id)
 
             # Drain the persist confirmations accumulated since the last sync.
             events_persisted: list[int] = []
@@ -688,14 +807,30 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
         self.send_msg(resp, request_id=req_id, error=None, **dump_opts)
 
+    def close_trigger_log(self, trigger_id: int) -> None:
+        """Upload the log of a trigger that isn't running anymore to remote storage, and close it."""
+        if factory := self.logger_cache.pop(trigger_id, None):
+            try:
+                factory.upload_to_remote()
+            except Exception:
+                log.exception("Failed to upload trigger logs to remote", trigger_id=trigger_id)
+            finally:
+                # Close the FD explicitly even if upload raised, otherwise the file
+                # handle leaks for every failed upload.
+                factory.close()
+
     def run(self) -> None:
         """Run synchronously and handle all database reads/writes."""
         with self.run_context():
-            while not self.should_stop():
-                if not self.is_alive():
-                    log.error("Trigger runner process has died! Exiting.")
-                    break
-                self.run_once()
+            self.trigger_change_listener.listen(self.selector)
+            try:
+                while not self.should_stop():
+                    if not self.is_alive():
+                        log.error("Trigger runner process has died! Exiting.")
+                        break
+                    self.run_once()
+            finally:
+                self.trigger_change_listener.close()
 
     @contextmanager
     def run_context(self) -> Iterator[None]:
@@ -708,7 +843,8 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def run_once(self) -> None:
         """Perform a single iteration of the run loop."""
-        self.load_triggers()
+        if self.trigger_change_listener.should_load_triggers():
+            self.load_triggers()
 
         # Wait for up to 1 second for activity
         self._service_subprocess(1)
@@ -726,6 +862,15 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                 "TriggerRunnerSupervisor.heartbeat() requires a Job; "
                 "subclasses without a metadata-DB Job must override this method."
             )
+        if self.runner_is_responsive():
+            perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
+
+    def runner_is_responsive(self) -> bool:
+        """
+        Return whether the TriggerRunner subprocess communicated recently enough to heartbeat for it.
+
+        The first time it doesn't, an error is logged.
+        """
         elapsed = time.monotonic() - self._last_runner_comms
         if self.runner_health_check_threshold > 0 and elapsed > self.runner_health_check_threshold:
             if not self._runner_comms_silence_logged:
@@ -737,9 +882,9 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
                     self.runner_health_check_threshold,
                 )
                 self._runner_comms_silence_logged = True
-            return
+            return False
         self._runner_comms_silence_logged = False
-        perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
+        return True
 
     def heartbeat_callback(self, session: Session | None = None) -> None:
         stats.incr("triggerer_heartbeat", 1, 1, tags=prune_dict({"team_name": self.team_name}))
@@ -763,20 +908,44 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
 
     def handle_events(self):
         """Dispatch outbound events to the Trigger model which pushes them to the relevant task instances."""
-        while self.events:
-            entry = self.events.popleft()
-            # Tell the model to wake up its tasks
+        if not self.events:
+            return
+        # The events stay queued until they are persisted, so that a failure loses none of them
+        entries = list(self.events)
+        try:
+            # Tell the model to wake up the tasks, all the events in one transaction
+            self.on_trigger_events([(entry.trigger_id, entry.event) for entry in entries])
+        except Exception:
+            log.exception(
+                "Failed to submit the trigger events together, submitting them one by one", count=len(entries)
+            )
+        else:
+            for entry in entries:
+                self.events.popleft()
+                self._on_event_persisted(entry)
+            return
+
+        # So that one event failing to persist doesn't hold up the others
+        for entry in entries:
+            # A raise leaves this event and the following ones queued
             self.on_trigger_event(trigger_id=entry.trigger_id, event=entry.event)
-            # Only reached when on_trigger_event returned, i.e. the event was
-            # persisted; a raise above leaves the seq unconfirmed so the
-            # bound shared-stream advance fails out and the broker redelivers.
-            if entry.persist_seq is not None:
-                self.persisted_event_seqs.append(entry.persist_seq)
-            # Emit stat event
-            stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
+            self.events.popleft()
+            self._on_event_persisted(entry)
+
+    def _on_event_persisted(self, entry: TriggerEventEntry) -> None:
+        # Only called once the event was persisted; an event failing to persist leaves its seq
+        # unconfirmed so the bound shared-stream advance fails out and the broker redelivers.
+        if entry.persist_seq is not None:
+            self.persisted_event_seqs.append(entry.persist_seq)
+        # Emit stat event
+        stats.incr("triggers.succeeded", tags=prune_dict({"team_name": self.team_name}))
+
+    def on_trigger_events(self, events: list[tuple[int, TriggerEvent]]) -> None:
+        """Record that triggers fired events, given as ``(trigger_id, event)`` pairs in the order they fired."""
+        Trigger.submit_event_many(events)
 
     def on_trigger_event(self, trigger_id: int, event: TriggerEvent) -> None:
-        """Record that a trigger fired an event."""
+        """Record that a trigger fired an event, when the events could not be recorded together."""
         Trigger.submit_event(trigger_id=trigger_id, event=event)
 
     def clean_unused(self) -> None:
@@ -966,15 +1135,9 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         adds them to the dequeues so the subprocess can actually mutate the running
         trigger set.
         """
-        known_trigger_ids = self.running_triggers.union(
-            (x[0] for x in self.events),
-            self.cancelling_triggers,
-            (trigger[0] for trigger in self.failed_triggers),
-            (trigger.id for trigger in self.creating_triggers),
-        )
         # Work out the two difference sets
-        new_trigger_ids = requested_trigger_ids - known_trigger_ids
-        cancel_trigger_ids = self.running_triggers - requested_trigger_ids
+        new_trigger_ids = requested_trigger_ids - self.known_trigger_ids()
+        cancel_trigger_ids = self.running_triggers - requested_trigger_ids - self.cancelling_triggers
 
         if new_trigger_ids:
             workloads_to_create = self.build_trigger_workloads(new_trigger_ids)
@@ -990,6 +1153,26 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
             # Enqueue orphaned triggers for cancellation
             self.cancelling_triggers.update(cancel_trigger_ids)
 
+        if self.creating_triggers or cancel_trigger_ids:
+            self.wake_runner()
+
+    def wake_runner(self) -> None:
+        """Have the TriggerRunner subprocess sync its triggers now, rather than once it next checks in."""
+        if self._runner_woken or self._exit_code is not None:
+            return
+        self._runner_woken = True
+        with suppress(BrokenPipeError, ConnectionResetError):
+            self.send_msg(messages.WakeUp(), request_id=0)
+
+    def known_trigger_ids(self) -> set[int]:
+        """Return the IDs of the triggers the subprocess runs, or is about to start or finish running."""
+        return self.running_triggers.union(
+            (x[0] for x in self.events),
+            self.cancelling_triggers,
+            (trigger[0] for trigger in self.failed_triggers),
+            (trigger.id for trigger in self.creating_triggers),
+        )
+
     def _register_pipe_readers(
         self,
         stdout: socket,
@@ -1061,10 +1244,280 @@ class TriggerRunnerSupervisor(WatchedSubprocess):
         TriggerRunner().run()
 
 
+@attrs.define
+class _HashRing:
+    """
+    Consistent hashing of keys onto numbered nodes.
+
+    Every node is placed at ``replicas`` points of a ring of hashes, and a key belongs to the node at the
+    first point after the hash of the key. Removing a node only moves the keys that belonged to it.
+    """
+
+    replicas: int = 64
+    _points: list[int] = attrs.field(factory=list, init=False)
+    _nodes: list[int] = attrs.field(factory=list, init=False)
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # Not ``hash()``, which is salted differently in every process
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def add(self, node: int) -> None:
+        for replica in range(self.replicas):
+            point = self._hash(f"{node}-{replica}")
+            index = bisect.bisect(self._points, point)
+            self._points.insert(index, point)
+            self._nodes.insert(index, node)
+
+    def remove(self, node: int) -> None:
+        kept = [(point, n) for point, n in zip(self._points, self._nodes) if n != node]
+        self._points = [point for point, _ in kept]
+        self._nodes = [n for _, n in kept]
+
+    def get(self, key: str) -> int:
+        if not self._points:
+            raise LookupError("The ring has no nodes")
+        return self._nodes[bisect.bisect(self._points, self._hash(key)) % len(self._points)]
+
+
+@attrs.define(kw_only=True)
+class ShardedTriggerRunnerSupervisor:
+    """
+    Run the triggers of a triggerer job in several TriggerRunner subprocesses.
+
+    Each subprocess is monitored by a :class:`TriggerRunnerSupervisor`, and all of them are serviced from
+    this process by one loop over a shared selector, while the triggerer job's database work -- assigning
+    triggers, recording their events and heartbeating -- is done once for all of them here.
+
+    New triggers are assigned to a subprocess by consistent hashing: triggers deferring a task on their id,
+    other triggers on their classpath, which keeps the triggers that may share a stream (see
+    :meth:`~airflow.triggers.base.BaseEventTrigger.shared_stream_key`) in the same subprocess. When a
+    subprocess dies its triggers are started again in the others; only once all of them died does this
+    stop.
+    """
+
+    job: Job
+    capacity: int
+    queues: set[str] | None = None
+    team_name: str | None = None
+
+    stop: bool = False
+
+    selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, init=False, repr=False)
+
+    # The supervisors of the subprocesses which are still alive, by their number
+    runners: dict[int, TriggerRunnerSupervisor] = attrs.field(factory=dict, init=False)
+
+    # Shared by the runners, so that a trigger's log can be set up before knowing which one will run it
+    logger_cache: dict[int, TriggerLoggingFactory] = attrs.field(factory=dict, init=False)
+
+    trigger_change_listener: TriggerChangeListener = attrs.field(factory=TriggerChangeListener, init=False)
+
+    _ring: _HashRing = attrs.field(factory=_HashRing, init=False, repr=False)
+    # Runners whose subprocess died, until the last of its output was read
+    _dead_runners: list[TriggerRunnerSupervisor] = attrs.field(factory=list, init=False)
+    _all_runners: list[TriggerRunnerSupervisor] = attrs.field(factory=list, init=False, repr=False)
+
+    @classmethod
+    def start(
+        cls,
+        *,
+        job: Job,
+        capacity: int,
+        runner_processes: int,
+        logger=None,
+        queues: set[str] | None = None,
+        team_name: str | None = None,
+    ) -> ShardedTriggerRunnerSupervisor:
+        """Start ``runner_processes`` TriggerRunner subprocesses, sharing ``capacity`` between them."""
+        self = cls(job=job, capacity=capacity, queues=queues, team_name=team_name)
+        try:
+            for index in range(runner_processes):
+                runner = TriggerRunnerSupervisor.start(
+                    job=job,
+                    capacity=math.ceil(capacity / runner_processes),
+                    logger=logger,
+                    queues=queues,
+                    team_name=team_name,
+                    selector=self.selector,
+                )
+                runner.logger_cache = self.logger_cache
+                self.runners[index] = runner
+                self._all_runners.append(runner)
+                self._ring.add(index)
+        except BaseException:
+            self.kill(escalation_delay=10, force=True)
+            raise
+        return self
+
+    @property
+    def _exit_code(self) -> int | None:
+        """The first non-zero exit code of the subprocesses, or ``0`` once all of them exited cleanly."""
+        exit_codes = [runner._exit_code for runner in self._all_runners]
+        return next((code for code in exit_codes if code), None if None in exit_codes else 0)
+
+    def kill(
+        self,
+        signal_to_send: signal.Signals = signal.SIGINT,
+        escalation_delay: float = 5.0,
+        force: bool = False,
+    ) -> None:
+        """Terminate all the subprocesses, see :meth:`WatchedSubprocess.kill`."""
+        runners = [runner for runner in self._all_runners if runner._exit_code is None]
+        # Signal all of them first, so that they all stop their triggers at the same time
+        for runner in runners:
+            with suppress(Exception):
+                runner._signal_subprocess(signal_to_send)
+        for runner in runners:
+            runner.kill(signal_to_send, escalation_delay=escalation_delay, force=force)
+
+    def run(self) -> None:
+        """Run synchronously and handle all database reads/writes."""
+        self.trigger_change_listener.listen(self.selector)
+        try:
+            while not self.stop:
+                if not self.runners:
+                    log.error("All trigger runner processes have died! Exiting.")
+                    break
+                self.run_once()
+        finally:
+            self.trigger_change_listener.close()
+
+    def run_once(self) -> None:
+        """Perform a single iteration of the run loop."""
+        if self.trigger_change_listener.should_load_triggers():
+            self.load_triggers()
+
+        # Service the subprocesses for a second, which they all check in within
+        deadline = time.monotonic() + 1
+        while (remaining := deadline - time.monotonic()) > 0:
+            for key, _ in self.selector.select(timeout=remaining):
+                WatchedSubprocess._handle_socket_event(key)
+            if self._check_runners_alive():
+                break
+
+        for runner in (*self.runners.values(), *self._dead_runners):
+            runner.handle_events()
+            runner.handle_failed_triggers()
+        self._reap_dead_runners()
+        Trigger.clean_unused()
+        self.heartbeat()
+
+        self.emit_metrics()
+
+    def _check_runners_alive(self) -> bool:
+        """Move the triggers of the subprocesses that died to the other ones, returning if any did."""
+        died = False
+        for index, runner in list(self.runners.items()):
+            if runner._check_subprocess_exit() is None:
+                continue
+            died = True
+            del self.runners[index]
+            self._ring.remove(index)
+            self._dead_runners.append(runner)
+            log.error(
+                "Trigger runner process has died! Moving its triggers to the other runner processes.",
+                runner=index,
+                pid=runner.pid,
+                exit_code=runner._exit_code,
+                triggers=len(runner.running_triggers),
+            )
+            # Not running anymore, so the next load_triggers starts them in another subprocess
+            for trigger_id in (*runner.running_triggers, *(w.id for w in runner.creating_triggers)):
+                runner.close_trigger_log(trigger_id)
+            runner.running_triggers.clear()
+            runner.creating_triggers.clear()
+            runner.cancelling_triggers.clear()
+        return died
+
+    def _reap_dead_runners(self) -> None:
+        for runner in list(self._dead_runners):
+            if (
+                runner._open_sockets
+                and runner._process_exit_monotonic
+                and time.monotonic() - runner._process_exit_monotonic > supervisor.SOCKET_CLEANUP_TIMEOUT
+            ):
+                runner._cleanup_open_sockets(close_selector=False)
+            if not runner._open_sockets:
+                self._dead_runners.remove(runner)
+
+    def load_triggers(self) -> None:
+        """Assign triggers to this triggerer and update the runners with the IDs they should run."""
+        Trigger.assign_unassigned(
+            self.job.id,
+            self.capacity,
+            TriggerRunnerSupervisor.health_check_threshold,
+            queues=self.queues,
+            team_name=self.team_name,
+        )
+        ids = Trigger.ids_for_triggerer(self.job.id, queues=self.queues, team_name=self.team_name)
+        self.update_triggers(set(ids))
+
+    def update_triggers(self, requested_trigger_ids: set[int]) -> None:
+        """
+        Request that we update what triggers we're running.
+
+        The triggers to cancel are cancelled by the runner running them, and new ones are sent to the runner
+        they hash onto.
+        """
+        if not self.runners:
+            return
+        known_trigger_ids: set[int] = set()
+        for runner in self.runners.values():
+            known_trigger_ids |= runner.known_trigger_ids()
+            if (
+                cancel_trigger_ids := runner.running_triggers
+                - requested_trigger_ids
+                - runner.cancelling_triggers
+            ):
+                runner.cancelling_triggers.update(cancel_trigger_ids)
+                runner.wake_runner()
+
+        if new_trigger_ids := requested_trigger_ids - known_trigger_ids:
+            # Any runner can build the workloads, the logs they set up are shared by all
+            workloads_to_create = next(iter(self.runners.values())).build_trigger_workloads(new_trigger_ids)
+            queued_at = time.monotonic()
+            for workload in workloads_to_create:
+                workload.queued_at = queued_at
+                runner = self.runners[self._ring.get(self._shard_key(workload))]
+                runner.creating_triggers.append(workload)
+                runner.wake_runner()
+
+    @staticmethod
+    def _shard_key(workload: workloads.RunTrigger) -> str:
+        if workload.ti is None:
+            # Triggers can only share a stream with triggers of the same class
+            return workload.classpath
+        return str(workload.id)
+
+    def heartbeat(self) -> None:
+        # Check all of them, for each of them to log when it stops communicating
+        responsive = [runner.runner_is_responsive() for runner in self.runners.values()]
+        if all(responsive):
+            perform_heartbeat(self.job, heartbeat_callback=self.heartbeat_callback, only_if_necessary=True)
+
+    def heartbeat_callback(self, session: Session | None = None) -> None:
+        stats.incr("triggerer_heartbeat", 1, 1, tags=prune_dict({"team_name": self.team_name}))
+
+    def emit_metrics(self) -> None:
+        tags = prune_dict({"hostname": self.job.hostname, "team_name": self.team_name})
+        running = 0
+        for index, runner in self.runners.items():
+            running += len(runner.running_triggers)
+            stats.gauge(
+                "triggerer.runner.triggers_running",
+                len(runner.running_triggers),
+                tags={**tags, "runner": str(index)},
+            )
+        stats.gauge("triggers.running", running, tags=tags)
+        stats.gauge("triggerer.capacity_left", self.capacity - running, tags=tags)
+
+
 class TriggerDetails(TypedDict):
     """Type class for the trigger details dictionary."""
 
-    task: asyncio.Task
+    # Just a future, done once it fired, for the triggers waiting in the timer queue
+    task: asyncio.Future
     is_watcher: bool
     name: str
     events: int
@@ -1083,6 +1536,8 @@ class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
     _loop: asyncio.AbstractEventLoop | None = attrs.field(default=None, repr=False)
     _loop_thread_id: int | None = attrs.field(default=None, repr=False)
     _reader_task: asyncio.Task | None = attrs.field(default=None, repr=False)
+    # Called when the supervisor sends a WakeUp message
+    _on_wake_up: Callable[[], None] | None = attrs.field(default=None, alias="on_wake_up", repr=False)
 
     async def _aread_frame(self):
         try:
@@ -1100,6 +1555,10 @@ class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
         try:
             while True:
                 frame = await self._aread_frame()
+                if frame.body is not None and frame.body.get("type") == "WakeUp":
+                    if self._on_wake_up is not None:
+                        self._on_wake_up()
+                    continue
                 future = self._pending.pop(frame.id, None)
                 if future is not None and not future.done():
                     future.set_result(frame)
@@ -1155,6 +1614,16 @@ class TriggerCommsDecoder(CommsDecoder[ToTriggerRunner, ToTriggerSupervisor]):
             raise
 
 
+class _Timer(NamedTuple):
+    """A trigger waiting in the timer queue of :class:`TriggerRunner`, ordered by when it fires."""
+
+    fires_at: float
+    seq: int
+    trigger_id: int
+    future: asyncio.Future
+    trigger: BaseTrigger
+
+
 class TriggerRunner:
     """
     Runtime environment for all triggers.
@@ -1181,12 +1650,16 @@ class TriggerRunner:
     # Outbound queue of failed triggers
     failed_triggers: deque[tuple[int, BaseException | None]]
 
+    # Heap of the triggers only waiting for a moment, see BaseTrigger.fires_at
+    timers: list[_Timer]
+
     # Team associated with this triggerer instance.
     team_name: str | None
 
     # Should-we-stop flag
     stop: bool = False
-    _stop_event: anyio.Event | None = None
+    # Set to end the current sleep of the main loop early
+    _wake_up: anyio.Event | None = None
 
     # TODO: connect this to the parent process
     log: FilteringBoundLogger = structlog.get_logger()
@@ -1201,9 +1674,13 @@ class TriggerRunner:
         self.to_cancel = deque()
         self.events = deque()
         self.failed_triggers = deque()
+        self.timers = []
+        self._timer_seq = itertools.count()
+        # Timers cancelled before they fired, still in the heap
+        self._cancelled_timers = 0
         self.team_name = None
         self.job_id = None
-        self._stop_event = None
+        self._wake_up = None
         self._shared_streams = SharedStreamManager(
             log=self.log,
             max_subscriber_queue=conf.getint("triggerer", "shared_stream_subscriber_queue_size"),
@@ -1217,8 +1694,12 @@ class TriggerRunner:
     def _handle_signal(self, signum, frame) -> None:
         """Handle termination signals gracefully."""
         self.stop = True
-        if self._stop_event is not None:
-            self._stop_event.set()
+        self.wake_up()
+
+    def wake_up(self) -> None:
+        """End the current sleep of the main loop, for it to sync its triggers with the supervisor."""
+        if self._wake_up is not None:
+            self._wake_up.set()
 
     def run(self):
         """Sync entrypoint - just run arun in an async loop."""
@@ -1246,14 +1727,18 @@ class TriggerRunner:
         await self.init_comms()
 
         watchdog = asyncio.create_task(self.block_watchdog())
-        stop_event = self._stop_event = anyio.Event()
+        timers = asyncio.create_task(self.run_timers(), name="trigger-timers")
 
         last_status = time.monotonic()
         try:
             while not self.stop:
+                # Before syncing, so that waking up while syncing means syncing again
+                wake_up = self._wake_up = anyio.Event()
                 # Raise exceptions from the tasks
                 if watchdog.done():
                     watchdog.result()
+                if timers.done():
+                    timers.result()
 
                 if self.comms_decoder._reader_task.done():
                     self.comms_decoder._reader_task.result()
@@ -1266,9 +1751,9 @@ class TriggerRunner:
                 await self.sync_state_to_supervisor(finished_ids)
                 await self.create_triggers()
                 await self.cancel_triggers()
-                # Sleep for a bit, or exit early if stop is requested.
+                # Sleep for a bit, or less if woken up to sync again or to stop.
                 with anyio.move_on_after(1):
-                    await stop_event.wait()
+                    await wake_up.wait()
                 # Every minute, log status
                 if (now := time.monotonic()) - last_status >= 60:
                     watchers = len([trigger for trigger in self.triggers.values() if trigger["is_watcher"]])
@@ -1283,6 +1768,9 @@ class TriggerRunner:
             self.stop = True
             raise
         finally:
+            timers.cancel()
+            with suppress(asyncio.CancelledError):
+                await timers
             if (reader_task := self.comms_decoder._reader_task) is not None:
                 reader_task.cancel()
                 with suppress(asyncio.CancelledError):
@@ -1311,6 +1799,7 @@ class TriggerRunner:
         self.comms_decoder = TriggerCommsDecoder(
             async_writer=writer,
             async_reader=reader,
+            on_wake_up=self.wake_up,
         )
 
         task_runner.SUPERVISOR_COMMS = self.comms_decoder
@@ -1415,8 +1904,19 @@ class TriggerRunner:
                     tags=prune_dict({"team_name": self.team_name}),
                 )
 
+            fires_at: datetime | None = None
+            if context is None and not isinstance(trigger_instance, BaseEventTrigger):
+                try:
+                    fires_at = trigger_instance.fires_at()
+                except Exception:
+                    self.log.exception(
+                        "fires_at() raised; running the trigger instead", trigger_id=trigger_id
+                    )
+
             self.triggers[trigger_id] = {
-                "task": asyncio.create_task(
+                "task": self.start_timer(trigger_id, trigger_instance, fires_at)
+                if fires_at is not None
+                else asyncio.create_task(
                     self.run_trigger(trigger_id, trigger_instance, workload.timeout_after, context),
                     name=trigger_name,
                 ),
@@ -1432,6 +1932,61 @@ class TriggerRunner:
                 tags=prune_dict({"team_name": self.team_name}),
             )
 
+    def start_timer(self, trigger_id: int, trigger: BaseTrigger, fires_at: datetime) -> asyncio.Future:
+        """Put a trigger in the timer queue, returning the future done once it fired."""
+        future = asyncio.get_running_loop().create_future()
+        future.add_done_callback(self._on_timer_done)
+        heapq.heappush(
+            self.timers, _Timer(fires_at.timestamp(), next(self._timer_seq), trigger_id, future, trigger)
+        )
+        self.log.info("Trigger waiting in the timer queue", fires_at=fires_at, trigger_id=trigger_id)
+        return future
+
+    def _on_timer_done(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self._cancelled_timers += 1
+
+    async def run_timers(self) -> None:
+        """
+        Fire the events of the triggers in the timer queue whose moment passed.
+
+        This wakes up when the next one is due, or every second in case the system clock changes, and
+        fires all of those due by then in one go.
+        """
+        while True:
+            now = timezone.utcnow().timestamp()
+            while self.timers and self.timers[0].fires_at <= now:
+                timer = heapq.heappop(self.timers)
+                if timer.future.done():
+                    self._cancelled_timers -= 1
+                else:
+                    self._fire_timer(timer)
+            # Cancelled timers stay in the heap until they're due, unless they're the most of it
+            if self._cancelled_timers > len(self.timers) // 2:
+                self.timers = [timer for timer in self.timers if not timer.future.done()]
+                heapq.heapify(self.timers)
+                self._cancelled_timers = 0
+            await asyncio.sleep(min(self.timers[0].fires_at - now, 1) if self.timers else 1)
+
+    def _fire_timer(self, timer: _Timer) -> None:
+        details = self.triggers[timer.trigger_id]
+        with _make_trigger_span(
+            ti=timer.trigger.task_instance, trigger_id=timer.trigger_id, name=details["name"]
+        ) as span:
+            try:
+                event = timer.trigger.timer_event()
+            except Exception as e:
+                span.set_status(Status(StatusCode.ERROR), description=str(e))
+                timer.future.set_exception(e)
+                return
+            self.log.info(
+                "Trigger fired event", name=details["name"], result=event, trigger_id=timer.trigger_id
+            )
+            details["events"] += 1
+            self.events.append(TriggerEventEntry(trigger_id=timer.trigger_id, event=event, persist_seq=None))
+            span.set_status(Status(StatusCode.OK))
+        timer.future.set_result(None)
+
     async def cancel_triggers(self):
         """
         Drain the to_cancel queue and ensure all triggers that are not in the DB are cancelled.
@@ -57,7 +57,7 @@ from sqlalchemy.sql import expression
 
 from airflow import settings
 from airflow._shared.timezones import timezone
-from airflow.assets.evaluation import AssetEvaluator
+from airflow.assets.evaluation import AssetEvaluator, DagAssetConditions
 from airflow.configuration import conf as airflow_conf
 from airflow.exceptions import AirflowException
 from airflow.models.asset import AssetDagRunQueue
@@ -104,6 +104,9 @@ if TYPE_CHECKING:
 
 log = structlog.getLogger(__name__)
 
+_asset_conditions = DagAssetConditions()
+"""The asset conditions of asset-triggered Dags, kept across the calls of ``dags_needing_dagruns``."""
+
 TAG_MAX_LEN = 100
 
 _team_name_cache_ttl = airflow_conf.getint("core", "team_name_cache_ttl", fallback=30)
@@ -679,16 +682,30 @@ class DagModel(Base):
         from airflow.models.serialized_dag import SerializedDagModel
 
         evaluator = AssetEvaluator(session)
+        unready_dag_ids: set[str] = set()
 
-        def dag_ready(dag_id: str, cond: SerializedAssetBase, statuses: dict[UKey, bool]) -> bool:
+        def add_asset_condition(ser_dag: SerializedDagModel) -> None:
             try:
-                return evaluator.run(cond, statuses)
+                _asset_conditions.add(
+                    ser_dag.dag_id,
+                    (ser_dag.dag_version_id, ser_dag.dag_hash),
+                    ser_dag.dag.timetable.asset_condition,
+                )
             except AttributeError:
                 # if dag was serialized before 2.9 and we *just* upgraded,
                 # we may be dealing with old version.  In that case,
                 # just wait for the dag to be reserialized.
-                log.warning("Dag '%s' has old serialization; skipping run creation.", dag_id)
+                log.warning("Dag '%s' has old serialization; skipping run creation.", ser_dag.dag_id)
+                unready_dag_ids.add(ser_dag.dag_id)
+            except Exception:
+                log.exception("Dag '%s' failed to be evaluated; assuming not ready", ser_dag.dag_id)
+                unready_dag_ids.add(ser_dag.dag_id)
+
+        def dag_ready(dag_id: str, statuses: dict[UKey, bool]) -> bool:
+            if dag_id in unready_dag_ids:
                 return False
+            try:
+                return _asset_conditions.is_met(dag_id, statuses, evaluator)
             except Exception:
                 log.exception("Dag '%s' failed to be evaluated; assuming not ready", dag_id)
                 return False
@@ -719,9 +736,9 @@ class DagModel(Base):
             dag_id: {SerializedAssetUniqueKey.from_asset(adrq.asset): True for adrq in adrqs}
             for dag_id, adrqs in adrq_by_dag.items()
         }
-        ser_dags = SerializedDagModel.get_latest_serialized_dags(dag_ids=list(dag_statuses), session=session)
-        ser_dag_ids = {ser_dag.dag_id for ser_dag in ser_dags}
-        if missing_from_serialized := set(adrq_by_dag.keys()) - ser_dag_ids:
+        # Asset conditions are compiled once per Dag version, only the versions not seen yet are read
+        dag_versions = SerializedDagModel.get_latest_dag_versions(dag_ids=list(dag_statuses), session=session)
+        if missing_from_serialized := set(adrq_by_dag.keys()) - dag_versions.keys():
             log.info(
                 "Dags have queued asset events (ADRQ), but are not found in the serialized_dag table."
                 " — skipping Dag run creation: %s",
@@ -730,11 +747,12 @@ class DagModel(Base):
             for dag_id in missing_from_serialized:
                 del adrq_by_dag[dag_id]
                 del dag_statuses[dag_id]
-        for ser_dag in ser_dags:
-            dag_id = ser_dag.dag_id
-            statuses = dag_statuses[dag_id]
-            ready = dag_ready(dag_id, cond=ser_dag.dag.timetable.asset_condition, statuses=statuses)
-            if not ready:
+        for ser_dag in SerializedDagModel.get_latest_serialized_dags(
+            dag_ids=_asset_conditions.missing(dag_versions), session=session
+        ):
+            add_asset_condition(ser_dag)
+        for dag_id in dag_versions:
+            if not dag_ready(dag_id, statuses=dag_statuses[dag_id]):
                 log.debug("Asset condition not met for dag '%s'", dag_id)
                 del adrq_by_dag[dag_id]
                 del dag_statuses[dag_id]
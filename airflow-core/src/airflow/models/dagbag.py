@@ -20,7 +20,8 @@ from __future__ import annotations
 import hashlib
 import math
 import time
-from collections.abc import MutableMapping
+from collections import OrderedDict
+from collections.abc import Callable, MutableMapping
 from contextlib import nullcontext
 from threading import RLock
 from typing import TYPE_CHECKING, Any, NamedTuple
@@ -57,6 +58,95 @@ class _CacheEntry(NamedTuple):
     # different clock than the dag processor's write throttle, worst-case staleness is bounded to
     # roughly one-to-two update intervals -- still bounded, vs. the previous unbounded-until-restart.
     last_validated: float
+    # Estimated size of the deserialized DAG in bytes, only measured when the cache is bounded by size.
+    size: int = 0
+
+
+class _DagCache(LRUCache):
+    """
+    LRU cache of Dag entries bounded by both entry count and estimated size in bytes.
+
+    Entries expire ``ttl`` seconds after they were stored, and ``idle_ttl`` seconds after they were
+    last read. Expired entries are dropped lazily on the next lookup or insertion, so both checks only
+    look at the oldest entries. An entry larger than ``max_bytes`` on its own is not cached at all.
+
+    ``on_evict`` is called for every entry dropped for space or because it expired, but not for
+    entries explicitly removed (e.g. when a stale version is replaced).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 0,
+        max_bytes: int = 0,
+        ttl: float = 0,
+        idle_ttl: float = 0,
+        on_evict: Callable[[], None] = lambda: None,
+        timer: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(maxsize=max_bytes or math.inf, getsizeof=lambda entry: entry.size)
+        self.max_entries = max_entries or math.inf
+        self.ttl = ttl
+        self.idle_ttl = idle_ttl
+        self._on_evict = on_evict
+        self._timer = timer
+        # Keys in the order they were stored and read. The times are monotonic, so the entries
+        # to expire are always at the front.
+        self._stored_at: OrderedDict[Any, float] = OrderedDict()
+        self._read_at: OrderedDict[Any, float] = OrderedDict()
+
+    def expire(self) -> None:
+        """Drop the entries that are past their TTL or idle TTL."""
+        now = self._timer()
+        for times, ttl in ((self._stored_at, self.ttl), (self._read_at, self.idle_ttl)):
+            if not ttl:
+                continue
+            while times:
+                key, at = next(iter(times.items()))
+                if now - at < ttl:
+                    break
+                del self[key]
+                self._on_evict()
+
+    def get(self, key, default=None):
+        self.expire()
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self._read_at[key] = self._timer()
+        self._read_at.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value) -> None:
+        self.expire()
+        if self.getsizeof(value) > self.maxsize:
+            self.pop(key, None)
+            self._on_evict()
+            return
+        if key not in self:
+            while len(self) >= self.max_entries:
+                self.popitem()
+        super().__setitem__(key, value)
+        now = self._timer()
+        for times in (self._stored_at, self._read_at):
+            times[key] = now
+            times.move_to_end(key)
+
+    def __delitem__(self, key) -> None:
+        super().__delitem__(key)
+        self._stored_at.pop(key, None)
+        self._read_at.pop(key, None)
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_evict()
+        return item
+
+    def clear(self) -> None:
+        super().clear()
+        self._stored_at.clear()
+        self._read_at.clear()
 
 
 class DBDagBag:
@@ -69,13 +159,16 @@ class DBDagBag:
     :meta private:
     """
 
-    def __init__(self, load_op_links: bool = True) -> None:
+    def __init__(self, load_op_links: bool = True, lazy_load_tasks: bool = False) -> None:
         """
         Initialize DBDagBag.
 
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
+        :param lazy_load_tasks: Should each task be de-serialized only when it is first accessed? Only
+            worth it when most lookups need a few tasks of a Dag, not all of them.
         """
         self.load_op_links = load_op_links
+        self.lazy_load_tasks = lazy_load_tasks
         self._dags: MutableMapping[UUID | str, _CacheEntry] = {}
         self._revalidation_interval = conf.getint("core", "min_serialized_dag_update_interval")
         self._lock: RLock | nullcontext = nullcontext()
@@ -89,17 +182,30 @@ class DBDagBag:
     def _on_cache_clear(self) -> None:
         """Handle the Dag cache being cleared."""
 
+    def _on_cache_eviction(self) -> None:
+        """Handle a Dag being evicted from the cache."""
+
     def _on_cache_size(self, *, rate: float = 1.0) -> None:
         """Handle a change in the Dag cache size."""
 
+    def _entry_size(self, serdag: SerializedDagModel) -> int:
+        """Estimate the memory held by the Dag deserialized from ``serdag``, if the cache needs it."""
+        return 0
+
     def _read_dag(self, serdag: SerializedDagModel) -> SerializedDAG | None:
         """Read and cache a SerializedDAG (with its ``dag_hash`` for staleness detection)."""
         serdag.load_op_links = self.load_op_links
+        serdag.lazy_load_tasks = self.lazy_load_tasks
         dag = serdag.dag
         if not dag:
             return None
+        if not self.lazy_load_tasks:
+            # Build the topology index once per Dag version, before the Dag is shared through the cache.
+            # It needs every task, so a lazily loaded Dag only builds it if it is used.
+            dag.topology
+        entry = _CacheEntry(dag, serdag.dag_hash, time.monotonic(), self._entry_size(serdag))
         with self._lock:
-            self._dags[serdag.dag_version_id] = _CacheEntry(dag, serdag.dag_hash, time.monotonic())
+            self._dags[serdag.dag_version_id] = entry
         self._on_cache_size(rate=0.1)
         return dag
 
@@ -176,6 +282,7 @@ class DBDagBag:
         if not dag_version or not (serdag := dag_version.serialized_dag):
             return None
         serdag.load_op_links = self.load_op_links
+        serdag.lazy_load_tasks = self.lazy_load_tasks
         return serdag
 
     def clear_cache(self) -> int:
@@ -237,26 +344,41 @@ class CachedDBDagBag(DBDagBag):
     def __init__(
         self,
         load_op_links: bool = True,
+        lazy_load_tasks: bool = False,
         *,
         cache_size: int,
         cache_ttl: int,
         stats_prefix: str,
+        cache_max_bytes: int = 0,
+        cache_idle_ttl: int = 0,
     ) -> None:
         """
         Initialize CachedDBDagBag.
 
         :param load_op_links: Should the extra operator link be loaded when de-serializing the DAG?
+        :param lazy_load_tasks: Should each task be de-serialized only when it is first accessed?
         :param cache_size: Maximum cached entries. Zero means no size limit.
         :param cache_ttl: Seconds until a cached entry expires. Zero disables TTL.
         :param stats_prefix: Metric namespace for this component's cache.
+        :param cache_max_bytes: Maximum estimated size of the cached Dags in bytes, measured as the length
+            of their serialized JSON. Zero means no limit.
+        :param cache_idle_ttl: Seconds until a cached entry that is not read expires. Zero disables it.
         :raises ValueError: If the metrics namespace is empty.
         """
         if not stats_prefix:
             raise ValueError("CachedDBDagBag requires a stats_prefix")
 
-        super().__init__(load_op_links=load_op_links)
-
-        if cache_ttl > 0:
+        super().__init__(load_op_links=load_op_links, lazy_load_tasks=lazy_load_tasks)
+
+        if cache_max_bytes > 0 or cache_idle_ttl > 0:
+            self._dags = _DagCache(
+                max_entries=cache_size,
+                max_bytes=cache_max_bytes,
+                ttl=cache_ttl,
+                idle_ttl=cache_idle_ttl,
+                on_evict=self._on_cache_eviction,
+            )
+        elif cache_ttl > 0:
             self._dags = TTLCache(maxsize=cache_size or math.inf, ttl=cache_ttl)
         elif cache_size > 0:
             self._dags = LRUCache(maxsize=cache_size)
@@ -275,10 +397,21 @@ class CachedDBDagBag(DBDagBag):
     def _on_cache_clear(self) -> None:
         stats.incr(f"{self._stats_prefix}.cache_clear")
 
+    def _on_cache_eviction(self) -> None:
+        stats.incr(f"{self._stats_prefix}.cache_eviction")
+
     def _on_cache_size(self, *, rate: float = 1.0) -> None:
         with self._lock:
             size = len(self._dags)
+            size_bytes = self._dags.currsize if isinstance(self._dags, _DagCache) else None
         stats.gauge(f"{self._stats_prefix}.cache_size", size, rate=rate)
+        if size_bytes is not None:
+            stats.gauge(f"{self._stats_prefix}.cache_bytes", size_bytes, rate=rate)
+
+    def _entry_size(self, serdag: SerializedDagModel) -> int:
+        if isinstance(self._dags, _DagCache):
+            return serdag.data_size
+        return 0
 
 
 def generate_md5_hash(context):
@@ -94,6 +94,7 @@ from airflow.models.tasklog import LogTemplate
 from airflow.models.taskmap import TaskMap
 from airflow.serialization.definitions.deadline import SerializedReferenceModels
 from airflow.serialization.definitions.notset import NOTSET, ArgNotSet, is_arg_set
+from airflow.serialization.definitions.topology import get_leaf_task_ids
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.dependencies_states import SCHEDULEABLE_STATES
 from airflow.utils.helpers import chunks, is_container, prune_dict
@@ -1173,23 +1174,13 @@ class DagRun(Base, LoggingMixin):
         Teardown tasks by default are not considered for the purpose of dag run state.  But
         users may enable such consideration with on_failure_fail_dagrun.
         """
+        from airflow.serialization.definitions.dag import SerializedDAG
 
-        def is_effective_leaf(task):
-            for down_task_id in task.downstream_task_ids:
-                down_task = dag.get_task(down_task_id)
-                if not down_task.is_teardown or down_task.on_failure_fail_dagrun:
-                    # we found a down task that is not ignorable; not a leaf
-                    return False
-            # we found no ignorable downstreams
-            # evaluate whether task is itself ignorable
-            return not task.is_teardown or task.on_failure_fail_dagrun
-
-        leaf_task_ids = {x.task_id for x in dag.tasks if is_effective_leaf(x)}
-        if not leaf_task_ids:
-            # can happen if dag is exclusively teardown tasks
-            leaf_task_ids = {x.task_id for x in dag.tasks if not x.downstream_list}
-        leaf_tis = {ti for ti in tis if ti.task_id in leaf_task_ids if ti.state != TaskInstanceState.REMOVED}
-        return leaf_tis
+        # Serialized Dags keep their leaves in their topology index; other Dags are walked.
+        leaf_task_ids = (
+            dag.topology.leaf_task_ids if isinstance(dag, SerializedDAG) else get_leaf_task_ids(dag)
+        )
+        return {ti for ti in tis if ti.task_id in leaf_task_ids if ti.state != TaskInstanceState.REMOVED}
 
     def _emit_dagrun_span(self, state: DagRunState):
         # just to be safe
@@ -1708,6 +1699,7 @@ class DagRun(Base, LoggingMixin):
                     # trigger-rule upstream-count memo on this DepContext (a downstream evaluated
                     # later in this same pass must see the post-expansion count).
                     dep_context.invalidate_upstream_task_id_counts()
+                    dep_context.invalidate_upstream_ti_states()
             if new_tis is None and schedulable.state in SCHEDULEABLE_STATES:
                 # It's enough to revise map index once per task id,
                 # checking the map index for each mapped task significantly slows down scheduling
@@ -1722,6 +1714,10 @@ class DagRun(Base, LoggingMixin):
                         # the same way expansion does. Drop the upstream-count memo so a downstream
                         # evaluated later in this pass recomputes it instead of reading a stale value.
                         dep_context.invalidate_upstream_task_id_counts()
+                    if schedulable.task.get_needs_expansion():
+                        # Revising can also mark surplus finished instances REMOVED in place, which
+                        # changes the memoized trigger-rule upstream states without changing counts.
+                        dep_context.invalidate_upstream_ti_states()
 
                 # _revise_map_indexes_if_mapped might mark the current task as REMOVED
                 # after calculating mapped task length, so we need to re-check
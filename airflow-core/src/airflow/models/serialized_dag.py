@@ -21,21 +21,39 @@ from __future__ import annotations
 
 import copy
 import logging
+import operator
+import threading
 import zlib
 from collections.abc import Callable, Iterable, Iterator, Sequence
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Any, Literal, NamedTuple
 from uuid import UUID
 
+import msgspec
 import uuid6
-from sqlalchemy import JSON, ForeignKey, Index, LargeBinary, String, Uuid, exists, select, tuple_, update
+from cachetools import LRUCache
+from sqlalchemy import (
+    JSON,
+    ForeignKey,
+    Index,
+    LargeBinary,
+    String,
+    Text,
+    Uuid,
+    cast,
+    exists,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB
-from sqlalchemy.orm import Mapped, backref, foreign, mapped_column, relationship
+from sqlalchemy.orm import Mapped, backref, column_property, foreign, mapped_column, relationship
 from sqlalchemy.sql.expression import func, literal
 
 from airflow._shared.observability.metrics import stats
 from airflow._shared.timezones import timezone
 from airflow.configuration import conf
+from airflow.exceptions import AirflowConfigException
 from airflow.models.asset import (
     AssetAliasModel,
     AssetModel,
@@ -72,6 +90,167 @@ log = logging.getLogger(__name__)
 # If set to True, serialized DAGs is compressed before writing to DB,
 _COMPRESS_SERIALIZED_DAGS = conf.getboolean("core", "compress_serialized_dags", fallback=False)
 
+# Format of the serialized DAGs compressed in the ``data_compressed`` column: "json" or "msgpack".
+# Either format is read back whatever this is set to.
+_COMPRESSED_SERIALIZED_DAGS_FORMAT = conf.get("core", "compressed_serialized_dags_format", fallback="json")
+
+# Preset zlib dictionary for serialized DAGs stored as msgpack: the msgpack encoding of the keys and type
+# names found in most serialized DAGs, most frequent last. Small DAGs are mostly made of these, and would
+# otherwise compress poorly. Rows record the Adler-32 checksum of the dictionary they were compressed with,
+# so this must never be changed: add a new dictionary to _ZLIB_DICTIONARIES and compress with it instead.
+_MSGPACK_ZLIB_DICTIONARY = b"".join(
+    msgspec.msgpack.encode(key)
+    for key in (
+        "airflow.timetables.simple.PartitionedAssetTimetable",
+        "airflow.timetables.trigger.CronTriggerTimetable",
+        "airflow.timetables.simple.AssetTriggeredTimetable",
+        "default_partition_mapper",
+        "partition_mapper_config",
+        "trigger_rule",
+        "retries",
+        "asset_all",
+        "run_immediately",
+        "interval",
+        "expression",
+        "objects",
+        "asset_condition",
+        "airflow.timetables.simple.NullTimetable",
+        "outlets",
+        "_is_empty",
+        "start_date",
+        "doc_md",
+        "asset",
+        "extra",
+        "uri",
+        "template_ext",
+        "env",
+        "dependency_id",
+        "dependency_type",
+        "target",
+        "source",
+        "group",
+        "label",
+        "tags",
+        "edge_info",
+        "allowed_run_types",
+        "deadline",
+        "dag_dependencies",
+        "tasks",
+        "_processor_dags_folder",
+        "relative_fileloc",
+        "catchup",
+        "disable_bundle_versioning",
+        "max_active_tasks",
+        "max_active_runs",
+        "max_consecutive_failed_dag_runs",
+        "fileloc",
+        "upstream_task_ids",
+        "downstream_group_ids",
+        "upstream_group_ids",
+        "children",
+        "ui_fgcolor",
+        "tooltip",
+        "prefix_group_id",
+        "group_display_name",
+        "_group_id",
+        "task_group",
+        "dag",
+        "__version",
+        "timetable",
+        "dag_id",
+        "name",
+        "_operator_name",
+        "params",
+        "dict",
+        "python_callable_name",
+        "templates_dict",
+        "timezone",
+        "bash_command",
+        "template_fields_renderers",
+        "downstream_task_ids",
+        "has_retry_policy",
+        "_needs_expansion",
+        "retry_delay",
+        "op_kwargs",
+        "op_args",
+        "operator",
+        "_task_module",
+        "task_type",
+        "template_fields",
+        "task_id",
+        "ui_color",
+        "__var",
+        "__type",
+    )
+)
+
+# Preset zlib dictionaries, by the Adler-32 checksum recorded in the header of the data compressed with them.
+_ZLIB_DICTIONARIES = {zlib.adler32(_MSGPACK_ZLIB_DICTIONARY): _MSGPACK_ZLIB_DICTIONARY}
+
+_msgpack_encoder = msgspec.msgpack.Encoder()
+_msgpack_decoder = msgspec.msgpack.Decoder()
+
+# Same output as ``json.dumps(obj, sort_keys=True)``, without creating an encoder for every call.
+_json_encoder = json.JSONEncoder(sort_keys=True)
+
+# Canonical JSON (as hashed by SerializedDagModel.hash) of parts of serialized Dags, by their JSON as
+# stored. Most tasks are unchanged between two parses of a Dag file, so they need not be sorted again.
+# Each entry records the number of characters it keeps: its key, and its value unless it is the key itself.
+_canonical_json_cache: LRUCache[str, tuple[str, int]] = LRUCache(
+    maxsize=conf.getint("core", "serialized_dag_hash_cache_size", fallback=64 * 1024 * 1024),
+    getsizeof=operator.itemgetter(1),
+)
+_canonical_json_cache_lock = threading.Lock()
+
+# Not part of the Dag hash, so that moving a Dag file does not create a new Dag version.
+_UNHASHED_DAG_KEYS = frozenset(("fileloc", "bundle_name"))
+
+
+def _compress_dag_data(dag_data: dict[str, Any], dag_data_json: bytes) -> tuple[bytes, int]:
+    """
+    Compress a serialized DAG, in the format set by ``[core] compressed_serialized_dags_format``.
+
+    :return: The compressed data, and the length of the data before compression.
+    """
+    if _COMPRESSED_SERIALIZED_DAGS_FORMAT == "json":
+        return zlib.compress(dag_data_json), len(dag_data_json)
+    if _COMPRESSED_SERIALIZED_DAGS_FORMAT == "msgpack":
+        data = _msgpack_encoder.encode(dag_data)
+        compressor = zlib.compressobj(zdict=_MSGPACK_ZLIB_DICTIONARY)
+        return compressor.compress(data) + compressor.flush(), len(data)
+    raise AirflowConfigException(
+        f'Invalid value for "compressed_serialized_dags_format" in "core" section: '
+        f"{_COMPRESSED_SERIALIZED_DAGS_FORMAT!r}. It must be one of json, msgpack"
+    )
+
+
+def _decompress_dag_data(data_compressed: bytes) -> bytes:
+    """Decompress a serialized DAG written by :func:`_compress_dag_data`, in any format."""
+    # The FDICT bit of the zlib header flags is set when a preset dictionary was used, and the
+    # Adler-32 checksum of that dictionary follows the two header bytes.
+    if data_compressed[1] & 0x20:
+        dictionary_id = int.from_bytes(data_compressed[2:6], "big")
+        decompressor = zlib.decompressobj(zdict=_ZLIB_DICTIONARIES[dictionary_id])
+        return decompressor.decompress(data_compressed) + decompressor.flush()
+    return zlib.decompress(data_compressed)
+
+
+def _load_dag_data(data: bytes) -> dict[str, Any]:
+    """Load a decompressed serialized DAG, stored either as JSON or as msgpack."""
+    # A JSON object starts with "{", a msgpack map with a byte in 0x80-0x8f, 0xde or 0xdf.
+    if data[:1] != b"{":
+        return _msgpack_decoder.decode(data)
+    try:
+        return msgspec.json.decode(data)
+    except msgspec.DecodeError:
+        # json.dumps writes out-of-range floats as NaN or Infinity, which msgspec does not accept.
+        return json.loads(data)
+
+
+def _join_json_object(items: dict[str, str]) -> str:
+    """Join the JSON of the values of a dict, as ``json.dumps(..., sort_keys=True)`` would encode it."""
+    return "{" + ", ".join(f"{_json_encoder.encode(k)}: {v}" for k, v in sorted(items.items())) + "}"
+
 
 class DagWriteMetadata(NamedTuple):
     """Pre-fetched metadata for write_dag to avoid per-DAG queries."""
@@ -309,6 +488,8 @@ class SerializedDagModel(Base):
         "data", JSON().with_variant(JSONB, "postgresql"), nullable=True
     )
     _data_compressed: Mapped[bytes | None] = mapped_column("data_compressed", LargeBinary, nullable=True)
+    # Length of the JSON in the ``data`` column, measured by the database and only loaded on access.
+    _data_length: Mapped[int | None] = column_property(func.length(cast(_data, Text)), deferred=True)
     created_at: Mapped[datetime] = mapped_column(UtcDateTime, nullable=False, default=timezone.utcnow)
     last_updated: Mapped[datetime] = mapped_column(
         UtcDateTime, nullable=False, default=timezone.utcnow, onupdate=timezone.utcnow
@@ -345,26 +526,28 @@ class SerializedDagModel(Base):
     )
 
     load_op_links = True
+    # Deserialize each task of ``dag`` only when it is first accessed.
+    lazy_load_tasks = False
     __table_args__ = (Index("idx_serialized_dag_dag_id_created_at", dag_id, created_at),)
 
     def __init__(self, dag: LazyDeserializedDAG) -> None:
         self.dag_id = dag.dag_id
         dag_data = dag.data
-        self.dag_hash = SerializedDagModel.hash(dag_data)
-
         # partially ordered json data
-        dag_data_json = json.dumps(dag_data, sort_keys=True).encode("utf-8")
+        dag_data_json, self.dag_hash = SerializedDagModel._encode(dag_data)
 
         if _COMPRESS_SERIALIZED_DAGS:
             self._data = None
-            self._data_compressed = zlib.compress(dag_data_json)
+            self._data_compressed, data_size = _compress_dag_data(dag_data, dag_data_json)
         else:
             self._data = dag_data
             self._data_compressed = None
+            data_size = len(dag_data_json)
 
         # serve as cache so no need to decompress and load, when accessing data field
         # when COMPRESS_SERIALIZED_DAGS is True
         self.__data_cache: dict[Any, Any] | None = dag_data
+        self.__data_size: int | None = data_size
 
     def __repr__(self) -> str:
         return f"<SerializedDag: {self.dag_id}>"
@@ -372,16 +555,74 @@ class SerializedDagModel(Base):
     @classmethod
     def hash(cls, dag_data):
         """Hash the data to get the dag_hash."""
-        dag_data = cls._sort_serialized_dag_dict(dag_data)
-        data_ = dag_data.copy()
-        # Remove fileloc from the hash so changes to fileloc
-        # does not affect the hash. In 3.0+, a combination of
-        # bundle_path and relative fileloc more correctly determines the
-        # dag file location.
-        data_["dag"].pop("fileloc", None)
-        data_["dag"].pop("bundle_name", None)
-        data_json = json.dumps(data_, sort_keys=True).encode("utf-8")
-        return md5(data_json).hexdigest()
+        return cls._encode(dag_data)[1]
+
+    @classmethod
+    def _encode(cls, dag_data: dict[str, Any]) -> tuple[bytes, str]:
+        """
+        Encode serialized Dag data to the JSON stored in the database, and compute its hash.
+
+        The hash is the md5 of the JSON of the data sorted by ``_sort_serialized_dag_dict``, without
+        the keys in ``_UNHASHED_DAG_KEYS``. Each task and other top-level value is dumped once, and both
+        the stored JSON and the hashed JSON are joined from the results, so that the canonical JSON of
+        the values can be cached by their stored JSON.
+        """
+        stored: dict[str, str] = {}
+        hashed: dict[str, str] = {}
+        for key, value in dag_data.items():
+            if key != "dag":
+                stored[key] = raw = _json_encoder.encode(value)
+                hashed[key] = cls._canonical_json(raw, value)
+                continue
+            stored_dag: dict[str, str] = {}
+            hashed_dag: dict[str, str] = {}
+            for dag_key, dag_value in value.items():
+                if dag_key == "tasks":
+                    stored_dag[dag_key], hashed_dag[dag_key] = cls._encode_tasks(dag_value)
+                    continue
+                stored_dag[dag_key] = raw = _json_encoder.encode(dag_value)
+                if dag_key not in _UNHASHED_DAG_KEYS:
+                    hashed_dag[dag_key] = cls._canonical_json(raw, dag_value)
+            stored[key] = _join_json_object(stored_dag)
+            hashed[key] = _join_json_object(hashed_dag)
+        hashed_json = _join_json_object(hashed).encode("utf-8")
+        return _join_json_object(stored).encode("utf-8"), md5(hashed_json).hexdigest()
+
+    @classmethod
+    def _encode_tasks(cls, tasks: Any) -> tuple[str, str]:
+        """Encode the serialized tasks of a Dag; return their stored JSON and their canonical JSON."""
+        if not isinstance(tasks, list) or not all(
+            isinstance(t, dict) and isinstance(var := t.get("__var", {}), Iterable) and "task_id" in var
+            for t in tasks
+        ):
+            raw = _json_encoder.encode(tasks)
+            return raw, cls._canonical_json(raw, tasks)
+        raws = [_json_encoder.encode(t) for t in tasks]
+        # Sorted by task id, as _sort_serialized_dag_dict does. The sort is stable, like it.
+        canonical = sorted(
+            ((t["__var"]["task_id"], cls._canonical_json(raw, t)) for raw, t in zip(raws, tasks)),
+            key=operator.itemgetter(0),
+        )
+        return f"[{', '.join(raws)}]", f"[{', '.join(c for _, c in canonical)}]"
+
+    @classmethod
+    def _canonical_json(cls, raw: str, value: Any) -> str:
+        """Return the JSON of ``value`` sorted by ``_sort_serialized_dag_dict``, given its JSON ``raw``."""
+        if not isinstance(value, (dict, list)):
+            return raw
+        with _canonical_json_cache_lock:
+            cached = _canonical_json_cache.get(raw)
+        if cached is not None:
+            return cached[0]
+        canonical = _json_encoder.encode(cls._sort_serialized_dag_dict(value))
+        if canonical == raw:
+            # Share the string rather than keeping a copy.
+            canonical = raw
+        size = len(raw) if canonical is raw else len(raw) + len(canonical)
+        if size <= _canonical_json_cache.maxsize:
+            with _canonical_json_cache_lock:
+                _canonical_json_cache[raw] = (canonical, size)
+        return canonical
 
     @classmethod
     def _sort_serialized_dag_dict(cls, serialized_dag: Any):
@@ -871,6 +1112,28 @@ class SerializedDagModel(Base):
         latest_serdags = session.scalars(cls._latest_by_version_select(dag_ids)).all()
         return latest_serdags or []
 
+    @classmethod
+    @provide_session
+    def get_latest_dag_versions(
+        cls, *, dag_ids: list[str], session: Session = NEW_SESSION
+    ) -> dict[str, tuple[UUID, str]]:
+        """
+        Get the dag version and hash of the latest serialized dags of given DAGs, without reading them.
+
+        The hash is needed along the version, as a dag version without task instances is updated in place
+        by :meth:`write_dag` when its DAG changes.
+
+        :param dag_ids: The list of DAG IDs.
+        :param session: The database session.
+        :return: The dag version ID and the dag hash of the latest serialized dag of each DAG that has one.
+        """
+        stmt = cls._latest_by_version_select(dag_ids).with_only_columns(
+            cls.dag_id, cls.dag_version_id, cls.dag_hash
+        )
+        return {
+            dag_id: (dag_version_id, dag_hash) for dag_id, dag_version_id, dag_hash in session.execute(stmt)
+        }
+
     @classmethod
     @provide_session
     def read_all_dags(cls, *, session: Session = NEW_SESSION) -> dict[str, SerializedDAG]:
@@ -903,12 +1166,29 @@ class SerializedDagModel(Base):
         # use __data_cache to avoid decompress and loads
         if not hasattr(self, "_SerializedDagModel__data_cache") or self.__data_cache is None:
             if self._data_compressed:
-                self.__data_cache = json.loads(zlib.decompress(self._data_compressed))
+                data_json = _decompress_dag_data(self._data_compressed)
+                self.__data_size = len(data_json)
+                self.__data_cache = _load_dag_data(data_json)
             else:
                 self.__data_cache = self._data
 
         return self.__data_cache
 
+    @property
+    def data_size(self) -> int:
+        """
+        Length in bytes of the serialized Dag JSON, or msgpack if it was stored as msgpack.
+
+        This is used as an estimate of the memory held by the Dag once deserialized.
+        """
+        if (size := getattr(self, "_SerializedDagModel__data_size", None)) is None:
+            if self._data_compressed:
+                size = len(_decompress_dag_data(self._data_compressed))
+            else:
+                size = self._data_length or 0
+            self.__data_size = size
+        return size
+
     @property
     def dag(self) -> SerializedDAG:
         """The DAG deserialized from the ``data`` column."""
@@ -919,7 +1199,7 @@ class SerializedDagModel(Base):
             data = json.loads(self.data)
         else:
             raise ValueError("invalid or missing serialized DAG data")
-        return DagSerialization.from_dict(data)
+        return DagSerialization.from_dict(data, lazy=self.lazy_load_tasks)
 
     @classmethod
     @provide_session
@@ -982,7 +1262,9 @@ class SerializedDagModel(Base):
             data_col_to_select = cls._data_compressed
 
             def load_json(deps_data):
-                return json.loads(zlib.decompress(deps_data))["dag"]["dag_dependencies"] if deps_data else []
+                if not deps_data:
+                    return []
+                return _load_dag_data(_decompress_dag_data(deps_data))["dag"]["dag_dependencies"]
 
         latest_sdag_subquery = (
             select(cls.dag_id, func.max(cls.created_at).label("max_created")).group_by(cls.dag_id).subquery()
@@ -24,7 +24,20 @@ from functools import singledispatch
 from traceback import format_exception
 from typing import TYPE_CHECKING, Any
 
-from sqlalchemy import ForeignKey, Index, Integer, String, Text, delete, func, or_, select, update
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    delete,
+    event,
+    func,
+    or_,
+    select,
+    text,
+    update,
+)
 from sqlalchemy.ext.associationproxy import association_proxy
 from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, selectinload
 from sqlalchemy.sql.functions import coalesce
@@ -35,6 +48,7 @@ from airflow.configuration import conf
 from airflow.models.asset import AssetWatcherModel
 from airflow.models.base import Base
 from airflow.models.taskinstance import TaskInstance
+from airflow.models.taskinstancekey import TaskInstanceKey
 from airflow.serialization.enums import stringify_encoding_keys
 from airflow.triggers.base import BaseTaskEndEvent
 from airflow.utils.retries import run_with_db_retries
@@ -43,7 +57,7 @@ from airflow.utils.sqlalchemy import UtcDateTime, get_dialect_name, with_row_loc
 from airflow.utils.state import TaskInstanceState
 
 if TYPE_CHECKING:
-    from sqlalchemy import Row
+    from sqlalchemy import Connection, Row
     from sqlalchemy.sql import Select
 
     from airflow.triggers.base import BaseTrigger, TriggerEvent
@@ -56,6 +70,9 @@ Internal use only.
 :meta private:
 """
 
+TRIGGER_CHANGES_CHANNEL = "airflow_trigger_changes"
+"""Postgres channel notified when triggers are added or removed, see :meth:`Trigger.notify_changed`."""
+
 log = logging.getLogger(__name__)
 
 
@@ -203,6 +220,17 @@ class Trigger(Base):
         classpath, kwargs = trigger.serialize()
         return cls(classpath=classpath, kwargs=kwargs, queue=trigger.queue)
 
+    @staticmethod
+    def notify_changed(session: Session) -> None:
+        """
+        Tell the triggerers that triggers were added or removed, for them to look for their triggers now.
+
+        This is a ``NOTIFY`` on Postgres, sent once the transaction is committed, and does nothing on
+        the other databases, where triggerers only poll for their triggers.
+        """
+        if get_dialect_name(session) == "postgresql":
+            session.execute(text(f"NOTIFY {TRIGGER_CHANGES_CHANNEL}"))
+
     @classmethod
     @provide_session
     def bulk_fetch(cls, ids: Iterable[int], *, session: Session = NEW_SESSION) -> dict[int, Trigger]:
@@ -260,13 +288,15 @@ class Trigger(Base):
         if get_dialect_name(session) == "mysql":
             # MySQL doesn't support DELETE with JOIN, so we need to do it in two steps
             ids_list = list(session.scalars(ids).all())
-            session.execute(
+            result = session.execute(
                 delete(Trigger).where(Trigger.id.in_(ids_list)).execution_options(synchronize_session=False)
             )
         else:
-            session.execute(
+            result = session.execute(
                 delete(Trigger).where(Trigger.id.in_(ids)).execution_options(synchronize_session=False)
             )
+        if getattr(result, "rowcount", 0):
+            cls.notify_changed(session)
 
     @classmethod
     @provide_session
@@ -303,6 +333,56 @@ class Trigger(Base):
         if trigger.callback:
             trigger.callback.handle_event(event, session)
 
+    @classmethod
+    @provide_session
+    def submit_event_many(
+        cls, events: Iterable[tuple[int, TriggerEvent]], *, session: Session = NEW_SESSION
+    ) -> None:
+        """
+        Fire many events at once.
+
+        Does what :meth:`submit_event` does for each event in turn, but reads the task instances and the
+        triggers of all the events together, and resumes the task instances with one bulk update rather
+        than with a flush each.
+
+        :param events: ``(trigger_id, event)`` pairs, in the order the triggers fired the events.
+        """
+        events = list(events)
+        if not events:
+            return
+
+        # Only the first event of a trigger resumes its task instances: they are no longer deferred
+        # once it is submitted
+        first_events: dict[int, TriggerEvent] = {}
+        for trigger_id, trigger_event in events:
+            first_events.setdefault(trigger_id, trigger_event)
+        _resume_task_instances(first_events, session=session)
+
+        # Send the events to assets and callbacks
+        triggers = {
+            trigger.id: trigger
+            for trigger in session.scalars(
+                select(cls)
+                .where(cls.id.in_(first_events))
+                .options(
+                    selectinload(cls.asset_watchers).selectinload(AssetWatcherModel.asset),
+                    selectinload(cls.callback),
+                )
+            )
+        }
+        for trigger_id, trigger_event in events:
+            if (trigger := triggers.get(trigger_id)) is None:
+                # Already deleted for some reason
+                continue
+            for asset in trigger.assets:
+                AssetManager.register_asset_change(
+                    asset=asset.to_serialized(),
+                    extra={"from_trigger": True, "payload": trigger_event.payload},
+                    session=session,
+                )
+            if trigger.callback:
+                trigger.callback.handle_event(trigger_event, session)
+
     @classmethod
     @provide_session
     def submit_failure(cls, trigger_id, exc=None, *, session: Session = NEW_SESSION) -> None:
@@ -501,6 +581,13 @@ class Trigger(Base):
         return result
 
 
+@event.listens_for(Trigger, "after_insert")
+def _notify_trigger_inserted(mapper, connection: Connection, target: Trigger) -> None:
+    # Postgres sends a notification once per transaction, however many triggers were added in it
+    if connection.dialect.name == "postgresql":
+        connection.execute(text(f"NOTIFY {TRIGGER_CHANGES_CHANNEL}"))
+
+
 def _decode_next_kwargs(next_kwargs_raw: Any) -> dict[str, Any]:
     """
     Decode the stored ``next_kwargs`` of a task instance into a plain dict.
@@ -529,54 +616,34 @@ def _decode_next_kwargs(next_kwargs_raw: Any) -> dict[str, Any]:
     return next_kwargs
 
 
-def _fail_unresumable_task_instance(
-    task_instance: TaskInstance, reason: str, exc: BaseException, *, session: Session
-) -> None:
+def _unresumable_task_instance_values(reason: str, exc: BaseException) -> dict[str, Any]:
     """
-    Route through ``__fail__`` so a worker fails the task normally instead of stranding it.
+    Return the values routing a task instance through ``__fail__``, for a worker to fail it normally.
 
     Mirrors ``Trigger.submit_failure``: without this the task is left with no event to resume it.
     Traceback goes into ``next_kwargs`` as a list -- the only channel reaching the task log --
     since ``format_exception`` returns it that way and the runtime joins it.
     """
-    task_instance.next_method = TRIGGER_FAIL_REPR
-    task_instance.next_kwargs = {
-        "error": reason,
-        "traceback": format_exception(type(exc), exc, exc.__traceback__),
+    return {
+        "next_method": TRIGGER_FAIL_REPR,
+        "next_kwargs": {"error": reason, "traceback": format_exception(type(exc), exc, exc.__traceback__)},
+        "trigger_id": None,
+        "state": TaskInstanceState.SCHEDULED,
+        "scheduled_dttm": timezone.utcnow(),
     }
-    task_instance.trigger_id = None
-    task_instance.state = TaskInstanceState.SCHEDULED
-    task_instance.scheduled_dttm = timezone.utcnow()
-    session.flush()
 
 
-@singledispatch
-def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, session: Session) -> None:
+def _resumed_task_instance_values(
+    next_kwargs_raw: Any, event: TriggerEvent, *, task_instance: Any
+) -> dict[str, Any]:
     """
-    Handle the submit event for a given task instance.
-
-    This function sets the next method and next kwargs of the task instance,
-    as well as its state to scheduled. It also adds the event's payload
-    into the kwargs for the task.
+    Return the values resuming a deferred task instance with the event, or failing it if it cannot be.
 
-    A task instance whose stored kwargs cannot be decoded, or which the event payload cannot be
-    encoded into, is failed rather than resumed. This runs in the triggerer, the scheduler and the
-    API processes, each of which handles every waiting task instance in one pass, so a single
-    unusable payload must not be able to abort the caller. The triggerer had the worst of it: an
-    event whose submit raised was left unconfirmed and redelivered indefinitely.
-
-    Failing the task instance is not free for every caller: a Human-in-the-loop response whose
-    ``params_input`` serde cannot encode is now recorded and discarded rather than rejected, which
-    the submitter cannot retry. That wants validating on the write side; tracked at
-    https://github.com/apache/airflow/issues/71036
-
-    :param task_instance: The task instance to handle the submit event for.
-    :param session: The session to be used for the database callback sink.
+    :param next_kwargs_raw: The stored ``next_kwargs`` of the task instance.
+    :param task_instance: The task instance, or its key, to name it in the logs.
     """
     from airflow.sdk.serde import serialize
 
-    next_kwargs_raw = task_instance.next_kwargs or {}
-
     # Decoding and re-encoding fail for different reasons and are reported separately: blaming the
     # stored kwargs for a payload the trigger just yielded would point the author at DB state that
     # was never the problem.
@@ -587,14 +654,11 @@ def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, ses
             "Could not decode the stored next_kwargs of %s; failing it instead of resuming it",
             task_instance,
         )
-        _fail_unresumable_task_instance(
-            task_instance,
+        return _unresumable_task_instance_values(
             "Could not resume the task: its stored next_kwargs could not be decoded "
             f"({type(exc).__name__}: {exc})",
             exc,
-            session=session,
         )
-        return
 
     # Add event to the plain dict, then serialize everything together so nested
     # non-primitive values get proper serde encoding.
@@ -609,23 +673,50 @@ def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, ses
             "Could not serialize the event payload for %s; failing it instead of resuming it",
             task_instance,
         )
-        _fail_unresumable_task_instance(
-            task_instance,
+        return _unresumable_task_instance_values(
             f"Could not resume the task: the event payload could not be serialized "
             f"({type(exc).__name__}: {exc})",
             exc,
-            session=session,
         )
-        return
 
-    task_instance.next_kwargs = serialized_next_kwargs
+    return {
+        "next_kwargs": serialized_next_kwargs,
+        # Remove ourselves as its trigger
+        "trigger_id": None,
+        # Set the state of the task instance to scheduled
+        "state": TaskInstanceState.SCHEDULED,
+        "scheduled_dttm": timezone.utcnow(),
+    }
 
-    # Remove ourselves as its trigger
-    task_instance.trigger_id = None
 
-    # Set the state of the task instance to scheduled
-    task_instance.state = TaskInstanceState.SCHEDULED
-    task_instance.scheduled_dttm = timezone.utcnow()
+@singledispatch
+def handle_event_submit(event: TriggerEvent, *, task_instance: TaskInstance, session: Session) -> None:
+    """
+    Handle the submit event for a given task instance.
+
+    This function sets the next method and next kwargs of the task instance,
+    as well as its state to scheduled. It also adds the event's payload
+    into the kwargs for the task.
+
+    A task instance whose stored kwargs cannot be decoded, or which the event payload cannot be
+    encoded into, is failed rather than resumed. This runs in the triggerer, the scheduler and the
+    API processes, each of which handles every waiting task instance in one pass, so a single
+    unusable payload must not be able to abort the caller. The triggerer had the worst of it: an
+    event whose submit raised was left unconfirmed and redelivered indefinitely.
+
+    Failing the task instance is not free for every caller: a Human-in-the-loop response whose
+    ``params_input`` serde cannot encode is now recorded and discarded rather than rejected, which
+    the submitter cannot retry. That wants validating on the write side; tracked at
+    https://github.com/apache/airflow/issues/71036
+
+    :param task_instance: The task instance to handle the submit event for.
+    :param session: The session to be used for the database callback sink.
+    """
+    values = _resumed_task_instance_values(
+        task_instance.next_kwargs or {}, event, task_instance=task_instance
+    )
+    for key, value in values.items():
+        setattr(task_instance, key, value)
     session.flush()
 
 
@@ -727,3 +818,74 @@ def _(event: BaseTaskEndEvent, *, task_instance: TaskInstance, session: Session)
 
     _push_xcoms_if_necessary()
     session.flush()
+
+
+def _resume_task_instances(events: dict[int, TriggerEvent], *, session: Session) -> None:
+    """
+    Handle the submit event of each trigger for all the task instances deferred on the triggers.
+
+    Task instances resumed with the event as :func:`handle_event_submit` does for a plain
+    :class:`~airflow.triggers.base.TriggerEvent` are read and updated together, with one bulk update
+    by primary key; the others go through :func:`handle_event_submit` one by one.
+
+    The bulk update skips the unit of work, which is safe for resuming: ``TaskInstance`` has no mapper or
+    attribute events, and ``updated_at`` is still set by the ``onupdate`` of its column. The task instances
+    of the session, if any, are expired so that they don't keep the values from before the update.
+
+    :param events: The event to handle for each trigger ID.
+    """
+    resume = handle_event_submit.dispatch(object)
+    resumed_trigger_ids = []
+    handled_trigger_ids = []
+    for trigger_id, trigger_event in events.items():
+        if handle_event_submit.dispatch(type(trigger_event)) is resume:
+            resumed_trigger_ids.append(trigger_id)
+        else:
+            handled_trigger_ids.append(trigger_id)
+
+    if resumed_trigger_ids:
+        rows = session.execute(
+            select(
+                TaskInstance.id,
+                TaskInstance.dag_id,
+                TaskInstance.task_id,
+                TaskInstance.run_id,
+                TaskInstance.try_number,
+                TaskInstance.map_index,
+                TaskInstance.trigger_id,
+                TaskInstance.next_kwargs,
+            ).where(
+                TaskInstance.trigger_id.in_(resumed_trigger_ids),
+                TaskInstance.state == TaskInstanceState.DEFERRED,
+            )
+        )
+        values = [
+            {
+                "id": row.id,
+                **_resumed_task_instance_values(
+                    row.next_kwargs or {},
+                    events[row.trigger_id],
+                    task_instance=TaskInstanceKey(
+                        row.dag_id, row.task_id, row.run_id, row.try_number, row.map_index
+                    ),
+                ),
+            }
+            for row in rows
+        ]
+        if values:
+            session.execute(update(TaskInstance), values)
+            for value in values:
+                key = session.identity_key(TaskInstance, (value["id"],))
+                if (task_instance := session.identity_map.get(key)) is not None:
+                    session.expire(task_instance)
+
+    if handled_trigger_ids:
+        for task_instance in session.scalars(
+            select(TaskInstance).where(
+                TaskInstance.trigger_id.in_(handled_trigger_ids),
+                TaskInstance.state == TaskInstanceState.DEFERRED,
+            )
+        ):
+            handle_event_submit(
+                events[task_instance.trigger_id], task_instance=task_instance, session=session
+            )
@@ -74,6 +74,7 @@ if TYPE_CHECKING:
     from airflow.models.taskinstance import TaskInstance
     from airflow.sdk import DAG
     from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
+    from airflow.serialization.definitions.topology import DagTopology
     from airflow.serialization.serialized_objects import LazyDeserializedDAG, SerializedOperator
     from airflow.timetables.base import Timetable
     from airflow.utils.types import DagRunTriggeredByType
@@ -392,9 +393,22 @@ class SerializedDAG:
             t.downstream_task_ids.intersection_update(dag.task_dict)
 
         dag.partial = len(dag.tasks) < len(self.tasks)
+        # The copy has a different graph, so it must not share this Dag's topology index.
+        dag.__dict__.pop("topology", None)
 
         return dag
 
+    @functools.cached_property
+    def topology(self) -> DagTopology:
+        """
+        Index of the graph of this Dag, built on first access.
+
+        :meta private:
+        """
+        from airflow.serialization.definitions.topology import DagTopology
+
+        return DagTopology.build(self)
+
     @functools.cached_property
     def _time_restriction(self) -> TimeRestriction:
         start_dates = [t.start_date for t in self.tasks if t.start_date]
@@ -31,7 +31,7 @@ from airflow._shared.dagnode.node import TaskGroupMixin
 from airflow.serialization.definitions.node import DAGNode
 
 if TYPE_CHECKING:
-    from collections.abc import Generator, Iterator
+    from collections.abc import Generator, Iterator, MutableMapping
     from typing import Any, ClassVar
 
     from airflow.models.expandinput import SchedulerExpandInput
@@ -55,7 +55,7 @@ class SerializedTaskGroup(TaskGroupMixin, DAGNode):
     ui_color: str = attrs.field(default="CornflowerBlue")
     ui_fgcolor: str = attrs.field(default="#000")
 
-    children: dict[str, DAGNode] = attrs.field(factory=dict, init=False)
+    children: MutableMapping[str, DAGNode] = attrs.field(factory=dict, init=False)
     upstream_group_ids: set[str | None] = attrs.field(factory=set, init=False)
     downstream_group_ids: set[str | None] = attrs.field(factory=set, init=False)
     upstream_task_ids: set[str] = attrs.field(factory=set, init=False)
@@ -0,0 +1,134 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import attrs
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from airflow.sdk import DAG
+    from airflow.serialization.definitions.dag import SerializedDAG
+
+__all__ = ["DagTopology", "get_leaf_task_ids"]
+
+
+def get_leaf_task_ids(dag: SerializedDAG | DAG) -> frozenset[str]:
+    """
+    Return the ids of the tasks considered when determining the terminal state of a Dag run.
+
+    A task is an effective leaf if it is not an ignorable teardown and all of its downstreams are.
+    Teardowns are ignorable for the Dag run state unless ``on_failure_fail_dagrun`` is set.
+    """
+
+    def is_ignorable(task) -> bool:
+        return task.is_teardown and not task.on_failure_fail_dagrun
+
+    leaf_task_ids = frozenset(
+        task.task_id
+        for task in dag.tasks
+        if not is_ignorable(task)
+        and all(is_ignorable(dag.get_task(down_task_id)) for down_task_id in task.downstream_task_ids)
+    )
+    if not leaf_task_ids:
+        # can happen if dag is exclusively teardown tasks
+        leaf_task_ids = frozenset(task.task_id for task in dag.tasks if not task.downstream_task_ids)
+    return leaf_task_ids
+
+
+def _flat_relative_ids(dag: SerializedDAG, task_id: str, *, upstream: bool) -> set[str]:
+    """Return the ids of all the upstreams or downstreams of a task, walking the relatives of the tasks."""
+    relatives: set[str] = set()
+    to_trace = [task_id]
+    while to_trace:
+        task = dag.task_dict[to_trace.pop()]
+        for relative_id in task.upstream_task_ids if upstream else task.downstream_task_ids:
+            if relative_id not in relatives and relative_id in dag.task_dict:
+                relatives.add(relative_id)
+                to_trace.append(relative_id)
+    return relatives
+
+
+@attrs.frozen(eq=False)
+class DagTopology:
+    """
+    Immutable index of a serialized Dag, for repeated lookups by the scheduler.
+
+    It holds the sets the scheduler otherwise recomputes by walking the graph for every task instance
+    (effective leaves, teardown scopes, mapped task group ancestry), keyed by task id. The direct relatives
+    of each task are not copied: they are read from the tasks when the index is built.
+
+    The index reflects the Dag when it was built, and must not be used after the Dag is modified.
+    Serialized Dags loaded from the database are not modified, so it is built once per Dag version.
+
+    :meta private:
+    """
+
+    leaf_task_ids: frozenset[str]
+    """Tasks considered when determining the terminal state of a Dag run."""
+    _mapped_task_group_ids: Mapping[str, tuple[str, ...]]
+    _teardown_scopes: Mapping[str, frozenset[str]]
+
+    @classmethod
+    def build(cls, dag: SerializedDAG) -> DagTopology:
+        mapped_task_group_ids = {
+            task.task_id: group_ids
+            for task in dag.tasks
+            if (group_ids := tuple(g.group_id for g in task.iter_mapped_task_groups()))
+        }
+
+        teardown_scopes = {}
+        for task in dag.tasks:
+            if not task.is_teardown:
+                continue
+            indirect_upstream_ids = (
+                _flat_relative_ids(dag, task.task_id, upstream=True) - task.upstream_task_ids
+            )
+            in_scope_ids: set[str] = set()
+            for setup_id in task.upstream_task_ids:
+                if (setup := dag.task_dict.get(setup_id)) is not None and setup.is_setup:
+                    in_scope_ids.update(
+                        indirect_upstream_ids & _flat_relative_ids(dag, setup_id, upstream=False)
+                    )
+            if in_scope_ids:
+                teardown_scopes[task.task_id] = frozenset(in_scope_ids)
+
+        return cls(
+            leaf_task_ids=get_leaf_task_ids(dag),
+            mapped_task_group_ids=mapped_task_group_ids,
+            teardown_scopes=teardown_scopes,
+        )
+
+    def get_mapped_task_group_ids(self, task_id: str) -> tuple[str, ...]:
+        """Return the ids of the mapped task groups containing a task, from the innermost to the outermost."""
+        return self._mapped_task_group_ids.get(task_id, ())
+
+    def is_in_mapped_task_group(self, task_id: str) -> bool:
+        """Whether a task is nested in a mapped task group, at any depth."""
+        return task_id in self._mapped_task_group_ids
+
+    def get_teardown_scope(self, task_id: str) -> frozenset[str]:
+        """
+        Return the ids of the tasks in scope of a teardown.
+
+        These are the indirect upstreams of the teardown that are downstream of one of its direct setups,
+        i.e. the tasks that must complete before the teardown can run.
+        """
+        return self._teardown_scopes.get(task_id, frozenset())
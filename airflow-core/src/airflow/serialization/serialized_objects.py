@@ -28,8 +28,9 @@ import itertools
 import logging
 import math
 import sys
+import threading
 import weakref
-from collections.abc import Collection, Iterable, Mapping
+from collections.abc import Callable, Collection, Iterable, Mapping, MutableMapping
 from functools import cache, cached_property, lru_cache
 from inspect import Parameter, signature
 from textwrap import dedent
@@ -1265,13 +1266,21 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         setattr(op, "start_from_trigger", bool(encoded_op.get("start_from_trigger", False)))
 
     @staticmethod
-    def set_task_dag_references(task: SerializedOperator | MappedOperator, dag: SerializedDAG) -> None:
+    def set_task_dag_references(
+        task: SerializedOperator | MappedOperator,
+        dag: SerializedDAG,
+        *,
+        upstream_task_ids: Iterable[str] | None = None,
+    ) -> None:
         """
         Handle DAG references on an operator.
 
         The operator should have been mostly populated earlier by calling
         ``populate_operator``. This function further fixes object references
         that were not possible before the task's containing DAG is hydrated.
+
+        :param upstream_task_ids: Upstreams of the task, when they are known in advance. Otherwise
+            the task is added as upstream of each of its downstreams, which must be already deserialized.
         """
         task.dag = dag
 
@@ -1284,6 +1293,10 @@ class OperatorSerialization(DAGNode, BaseSerialization):
             if isinstance(kwargs_ref := getattr(task, k, None), _ExpandInputRef):
                 setattr(task, k, kwargs_ref.deref(dag))
 
+        if upstream_task_ids is not None:
+            task.upstream_task_ids.update(upstream_task_ids)
+            return
+
         for task_id in task.downstream_task_ids:
             # Bypass set_upstream etc here - it does more than we want
             dag.task_dict[task_id].upstream_task_ids.add(task.task_id)
@@ -1720,6 +1733,73 @@ class OperatorSerialization(DAGNode, BaseSerialization):
         return result
 
 
+class _DeferredTask:
+    """An encoded task of a Dag deserialized with ``lazy=True``, not deserialized yet."""
+
+    __slots__ = ("encoded_op", "task_group", "task_id", "upstream_task_ids")
+
+    def __init__(self, encoded_op: dict[str, Any]) -> None:
+        self.encoded_op = encoded_op
+        self.task_id: str = encoded_op["task_id"]
+        self.task_group: SerializedTaskGroup | None = None
+        self.upstream_task_ids: set[str] = set()
+
+
+class _LazyNodeDict(MutableMapping[str, Any]):
+    """
+    Dict of Dag nodes, of which tasks are only deserialized when first accessed.
+
+    This is the ``task_dict`` of a Dag deserialized with ``lazy=True``, and the ``children`` of its
+    task groups. Iterating over keys or checking membership does not deserialize anything, but
+    iterating over values or items deserializes every task. Copies are plain dicts.
+
+    :meta private:
+    """
+
+    __slots__ = ("_load", "_nodes")
+
+    def __init__(self, nodes: dict[str, Any], load: Callable[[_DeferredTask], DAGNode]) -> None:
+        self._nodes = nodes
+        self._load = load
+
+    def __getitem__(self, key: str) -> Any:
+        node = self._nodes[key]
+        if isinstance(node, _DeferredTask):
+            node = self._nodes[key] = self._load(node)
+        return node
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._nodes[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._nodes[key]
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._nodes
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __repr__(self) -> str:
+        loaded = sum(not isinstance(node, _DeferredTask) for node in self._nodes.values())
+        return f"<{type(self).__name__}: {loaded} of {len(self)} loaded>"
+
+    def __reduce__(self):
+        return dict, (dict(self.items()),)
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> dict[str, Any]:
+        import copy
+
+        return {key: copy.deepcopy(node, memo) for key, node in self.items()}
+
+    def peek(self, key: str) -> Any:
+        """Return the node for ``key`` without deserializing it."""
+        return self._nodes[key]
+
+
 class DagSerialization(BaseSerialization):
     """Logic to encode a ``DAG`` object and decode the data into ``SerializedDAG``."""
 
@@ -1803,9 +1883,17 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def deserialize_dag(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls,
+        encoded_dag: dict[str, Any],
+        client_defaults: dict[str, Any] | None = None,
+        *,
+        lazy: bool = False,
     ) -> SerializedDAG:
-        """Deserializes a DAG from a JSON object."""
+        """
+        Deserializes a DAG from a JSON object.
+
+        :param lazy: Only deserialize each task when it is first accessed, rather than all of them now.
+        """
         if "dag_id" not in encoded_dag:
             raise DeserializationError(
                 message="Encoded dag object has no dag_id key. "
@@ -1815,7 +1903,7 @@ class DagSerialization(BaseSerialization):
         dag_id = encoded_dag["dag_id"]
 
         try:
-            return cls._deserialize_dag_internal(encoded_dag, client_defaults)
+            return cls._deserialize_dag_internal(encoded_dag, client_defaults, lazy=lazy)
         except (TimetableNotRegistered, DeserializationError):
             # Let specific errors bubble up unchanged
             raise
@@ -1825,7 +1913,11 @@ class DagSerialization(BaseSerialization):
 
     @classmethod
     def _deserialize_dag_internal(
-        cls, encoded_dag: dict[str, Any], client_defaults: dict[str, Any] | None = None
+        cls,
+        encoded_dag: dict[str, Any],
+        client_defaults: dict[str, Any] | None = None,
+        *,
+        lazy: bool = False,
     ) -> SerializedDAG:
         """Handle the main Dag deserialization logic."""
         dag = SerializedDAG(dag_id=encoded_dag["dag_id"])
@@ -1838,6 +1930,9 @@ class DagSerialization(BaseSerialization):
             v = v_in  # surpass PLW2901
             if k == "_downstream_task_ids":
                 v = set(v)
+            elif k == "tasks" and lazy:
+                k = "task_dict"
+                v = cls._deserialize_tasks_lazily(dag, v, client_defaults)
             elif k == "tasks":
                 OperatorSerialization._load_operator_extra_links = cls._load_operator_extra_links
                 tasks = {}
@@ -1913,11 +2008,59 @@ class DagSerialization(BaseSerialization):
         for k in keys_to_set_none:
             setattr(dag, k, None)
 
-        for t in dag.task_dict.values():
-            OperatorSerialization.set_task_dag_references(t, dag)
+        if not isinstance(dag.task_dict, _LazyNodeDict):
+            for t in dag.task_dict.values():
+                OperatorSerialization.set_task_dag_references(t, dag)
 
         return dag
 
+    @classmethod
+    def _deserialize_tasks_lazily(
+        cls,
+        dag: SerializedDAG,
+        encoded_tasks: list[dict[str, Any]],
+        client_defaults: dict[str, Any] | None,
+    ) -> _LazyNodeDict:
+        """Index the encoded tasks of a Dag by task id, to deserialize each when first accessed."""
+        deferred = {
+            (d := _DeferredTask(obj[Encoding.VAR])).task_id: d
+            for obj in encoded_tasks
+            if obj.get(Encoding.TYPE) == DAT.OP
+        }
+        # Upstreams are not serialized. When all tasks are deserialized at once each task adds itself
+        # to its downstreams, but here they are collected from the encoded downstream ids instead.
+        for task_id, d in deferred.items():
+            downstream_ids = d.encoded_op.get("downstream_task_ids", d.encoded_op.get("_downstream_task_ids"))
+            for downstream_id in downstream_ids or ():
+                if (downstream := deferred.get(downstream_id)) is not None:
+                    downstream.upstream_task_ids.add(task_id)
+
+        load_operator_extra_links = cls._load_operator_extra_links
+        # The Dag may be shared between threads, which must all get the same task.
+        lock = threading.RLock()
+
+        def load(d: _DeferredTask) -> SerializedOperator:
+            with lock:
+                if not isinstance(task := task_dict.peek(d.task_id), _DeferredTask):
+                    return task
+                try:
+                    OperatorSerialization._load_operator_extra_links = load_operator_extra_links
+                    task = OperatorSerialization.deserialize_operator(d.encoded_op, client_defaults)
+                    if d.task_group is not None:
+                        task.task_group = weakref.proxy(d.task_group)
+                    # Store the task before dereferencing its expand input, which may look it up.
+                    task_dict[d.task_id] = task
+                    OperatorSerialization.set_task_dag_references(
+                        task, dag, upstream_task_ids=d.upstream_task_ids
+                    )
+                except Exception as err:
+                    task_dict[d.task_id] = d
+                    raise DeserializationError(dag.dag_id) from err
+                return task
+
+        task_dict = _LazyNodeDict(deferred, load)
+        return task_dict
+
     @classmethod
     def _is_excluded(cls, var: Any, attrname: str, op: DAGNode):
         # {} is explicitly different from None in the case of DAG-level access control
@@ -2115,8 +2258,14 @@ class DagSerialization(BaseSerialization):
         ser_obj["__version"] = 3
 
     @classmethod
-    def from_dict(cls, serialized_obj: dict) -> SerializedDAG:
-        """Deserializes a python dict in to the DAG and operators it contains."""
+    def from_dict(cls, serialized_obj: dict, *, lazy: bool = False) -> SerializedDAG:
+        """
+        Deserializes a python dict in to the DAG and operators it contains.
+
+        :param lazy: Only deserialize each operator when it is first accessed. Dag attributes, the task
+            ids and the task groups are still deserialized immediately. This is much faster when only a
+            few tasks of a large Dag are used.
+        """
         ver = serialized_obj.get("__version", "<not present>")
         if ver not in (1, 2, 3):
             raise ValueError(f"Unsure how to deserialize version {ver!r}")
@@ -2129,7 +2278,7 @@ class DagSerialization(BaseSerialization):
         client_defaults = serialized_obj.get("client_defaults", {})
 
         # Pass client_defaults directly to deserialize_dag
-        return cls.deserialize_dag(serialized_obj["dag"], client_defaults)
+        return cls.deserialize_dag(serialized_obj["dag"], client_defaults, lazy=lazy)
 
 
 class TaskGroupSerialization(BaseSerialization):
@@ -2173,7 +2322,7 @@ class TaskGroupSerialization(BaseSerialization):
         cls,
         encoded_group: dict[str, Any],
         parent_group: SerializedTaskGroup | None,
-        task_dict: dict[str, SerializedOperator],
+        task_dict: MutableMapping[str, SerializedOperator],
         dag: SerializedDAG,
     ) -> SerializedTaskGroup:
         """Deserializes a TaskGroup from a JSON object."""
@@ -2197,18 +2346,29 @@ class TaskGroupSerialization(BaseSerialization):
                 **kwargs,
             )
 
-        def set_ref(task: SerializedOperator) -> SerializedOperator:
+        def set_ref(task_id: str) -> SerializedOperator | _DeferredTask:
+            if isinstance(task_dict, _LazyNodeDict) and isinstance(
+                deferred := task_dict.peek(task_id), _DeferredTask
+            ):
+                # Set on the task when it is deserialized.
+                deferred.task_group = group
+                return deferred
+            task = task_dict[task_id]
             task.task_group = weakref.proxy(group)
             return task
 
-        group.children = {
+        children = {
             label: (
-                set_ref(task_dict[val])
+                set_ref(val)
                 if _type == DAT.OP
                 else cls.deserialize_task_group(val, group, task_dict, dag=dag)
             )
             for label, (_type, val) in sorted(encoded_group["children"].items())
         }
+        if isinstance(task_dict, _LazyNodeDict):
+            group.children = _LazyNodeDict(children, lambda d: task_dict[d.task_id])
+        else:
+            group.children = children
         group.upstream_group_ids.update(cls.deserialize(encoded_group["upstream_group_ids"]))
         group.downstream_group_ids.update(cls.deserialize(encoded_group["downstream_group_ids"]))
         group.upstream_task_ids.update(cls.deserialize(encoded_group["upstream_task_ids"]))
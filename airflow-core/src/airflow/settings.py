@@ -691,6 +691,8 @@ def _configure_secrets_masker():
 
     min_length_to_mask = conf.getint("logging", "min_length_masked_secret", fallback=5)
     secret_mask_adapter = conf.getimport("logging", "secret_mask_adapter", fallback=None)
+    secret_mask_engine = conf.get("logging", "secret_mask_engine", fallback="trie")
+    redact_cache_size = conf.getint("logging", "redact_cache_size", fallback=0)
     sensitive_fields = DEFAULT_SENSITIVE_FIELDS.copy()
     sensitive_variable_fields = conf.get("core", "sensitive_var_conn_names")
     if sensitive_variable_fields:
@@ -702,6 +704,8 @@ def _configure_secrets_masker():
     core_masker.min_length_to_mask = min_length_to_mask
     core_masker.sensitive_variables_fields = list(sensitive_fields)
     core_masker.secret_mask_adapter = secret_mask_adapter
+    core_masker.secret_mask_engine = secret_mask_engine
+    core_masker.redact_cache_size = redact_cache_size
     core_masker.hide_sensitive_var_conn_fields = hide_sensitive_var_conn_fields
 
     from airflow.sdk._shared.secrets_masker import _secrets_masker as sdk_secrets_masker
@@ -710,6 +714,8 @@ def _configure_secrets_masker():
     sdk_masker.min_length_to_mask = min_length_to_mask
     sdk_masker.sensitive_variables_fields = list(sensitive_fields)
     sdk_masker.secret_mask_adapter = secret_mask_adapter
+    sdk_masker.secret_mask_engine = secret_mask_engine
+    sdk_masker.redact_cache_size = redact_cache_size
     sdk_masker.hide_sensitive_var_conn_fields = hide_sensitive_var_conn_fields
 
 
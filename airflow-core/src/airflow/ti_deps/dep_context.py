@@ -30,6 +30,7 @@ if TYPE_CHECKING:
 
     from airflow.models.dagrun import DagRun
     from airflow.models.taskinstance import TaskInstance
+    from airflow.ti_deps.deps.trigger_rule_dep import _UpstreamTIStates
 
 
 @attr.define
@@ -107,6 +108,30 @@ class DepContext:
     fresh empty dict, so they would neither read the memo nor warm it for anything else.
     """
 
+    finished_tis_by_task_id: dict[str, list[TaskInstance]] | None = attr.ib(default=None, repr=False)
+    """
+    Index of ``finished_tis`` by ``task_id``, built lazily by :meth:`ensure_finished_tis_by_task_id`.
+
+    The trigger rule dependency uses this to visit only the finished instances of a task's upstreams,
+    instead of scanning every finished task instance of the run for every task instance evaluated.
+    Like ``finished_tis`` it holds the task instance objects themselves, so it never goes stale when
+    their states change; it is reset whenever :meth:`ensure_finished_tis` loads ``finished_tis``.
+    """
+
+    upstream_ti_states: dict[tuple[str, str, frozenset[str]], _UpstreamTIStates] = attr.ib(
+        factory=dict, repr=False
+    )
+    """
+    Per-pass memo of the aggregated trigger-rule upstream states, keyed by
+    ``(dag_id, run_id, frozenset of relevant upstream task_ids)``.
+
+    Like ``upstream_task_id_counts``, this is only populated outside of mapped task groups, where
+    every finished instance of a relevant upstream counts and the aggregate is therefore the same for
+    all downstreams sharing those upstreams. It is an ``init=True`` field for the same reason, and is
+    invalidated via :meth:`invalidate_upstream_ti_states` when a finished instance may have changed
+    state mid-pass.
+    """
+
     def ensure_finished_tis(self, dag_run: DagRun, session: Session) -> list[TaskInstance]:
         """
         Ensure finished_tis is populated if it's currently None, which allows running tasks without dag_run.
@@ -122,6 +147,7 @@ class DepContext:
                 with contextlib.suppress(TaskNotFound):
                     ti.task = dag.get_task(ti.task_id)
             self.finished_tis = finished_tis
+            self.finished_tis_by_task_id = None
         else:
             finished_tis = self.finished_tis
         return finished_tis
@@ -134,3 +160,30 @@ class DepContext:
         later in the same pass recomputes the count instead of reading a stale one.
         """
         self.upstream_task_id_counts.clear()
+
+    def ensure_finished_tis_by_task_id(
+        self, dag_run: DagRun, session: Session
+    ) -> dict[str, list[TaskInstance]]:
+        """
+        Ensure finished_tis_by_task_id is populated, grouping finished_tis by task_id in a single pass.
+
+        :param dag_run: The DagRun for which to find finished tasks
+        :return: The finished tasks of this DAG and logical_date, by task_id
+        """
+        finished_tis = self.ensure_finished_tis(dag_run, session)
+        if self.finished_tis_by_task_id is None:
+            by_task_id: dict[str, list[TaskInstance]] = {}
+            for ti in finished_tis:
+                by_task_id.setdefault(ti.task_id, []).append(ti)
+            self.finished_tis_by_task_id = by_task_id
+        return self.finished_tis_by_task_id
+
+    def invalidate_upstream_ti_states(self) -> None:
+        """
+        Drop the memoized trigger-rule upstream states.
+
+        Call this whenever the state of a finished task instance may have changed mid-pass (e.g. when
+        a mapped task's surplus instances are marked REMOVED), so a downstream evaluated later in the
+        same pass recounts them.
+        """
+        self.upstream_ti_states.clear()
@@ -35,8 +35,10 @@ if TYPE_CHECKING:
     from sqlalchemy.sql import ColumnElement
 
     from airflow.models.taskinstance import TaskInstance
+    from airflow.serialization.definitions.dag import SerializedDAG
     from airflow.serialization.definitions.mappedoperator import Operator
     from airflow.serialization.definitions.taskgroup import SerializedTaskGroup
+    from airflow.serialization.definitions.topology import DagTopology
     from airflow.ti_deps.dep_context import DepContext
     from airflow.ti_deps.deps.base_ti_dep import TIDepStatus
 
@@ -89,6 +91,35 @@ class _UpstreamTIStates(NamedTuple):
         )
 
 
+def _get_topology(dag: SerializedDAG) -> DagTopology | None:
+    """Return the topology index of a serialized Dag, or None if the Dag is not serialized."""
+    from airflow.serialization.definitions.dag import SerializedDAG
+
+    if isinstance(dag, SerializedDAG):
+        return dag.topology
+    return None
+
+
+def _get_teardown_scope(task: Operator) -> set[str]:
+    """Return the ids of the tasks between the setups of a teardown and the teardown, by walking the Dag."""
+    if TYPE_CHECKING:
+        assert task.dag
+
+    setup_task_ids = {t.task_id for t in task.upstream_list if t.is_setup}
+
+    all_upstream_ids = task.get_flat_relative_ids(upstream=True)
+    indirect_upstream_ids = all_upstream_ids - task.upstream_task_ids
+
+    if not indirect_upstream_ids:
+        return set()
+
+    in_scope_ids: set[str] = set()
+    for setup_id in setup_task_ids:
+        setup_obj = task.dag.get_task(setup_id)
+        in_scope_ids.update(indirect_upstream_ids & setup_obj.get_flat_relative_ids(upstream=False))
+    return in_scope_ids
+
+
 class TriggerRuleDep(BaseTIDep):
     """Determines if a task's upstream tasks are in a state that allows a given task instance to run."""
 
@@ -138,6 +169,14 @@ class TriggerRuleDep(BaseTIDep):
         if TYPE_CHECKING:
             assert task
 
+        # Looked up once on the Dag's topology index, rather than walking the task
+        # group hierarchy again for every upstream ti.
+        topology = _get_topology(task.dag) if task.dag else None
+        if topology is not None:
+            in_mapped_task_group = topology.is_in_mapped_task_group(task.task_id)
+        else:
+            in_mapped_task_group = task.get_closest_mapped_task_group() is not None
+
         @functools.lru_cache
         def _get_expanded_ti_count() -> int:
             """
@@ -184,7 +223,7 @@ class TriggerRuleDep(BaseTIDep):
             # expanded instance (see #50210). The task may be nested in plain task
             # groups inside the mapped one (see #39801), so check the closest mapped
             # ancestor rather than only the immediate parent group.
-            if ti.map_index < 0 and task.get_closest_mapped_task_group() is not None:
+            if ti.map_index < 0 and in_mapped_task_group:
                 is_fast_triggered = task.trigger_rule in (
                     TR.ONE_SUCCESS,
                     TR.ONE_FAILED,
@@ -221,7 +260,7 @@ class TriggerRuleDep(BaseTIDep):
                 return False
             # The current task is not in a mapped task group. All tis from an
             # upstream task are relevant.
-            if task.get_closest_mapped_task_group() is None:
+            if not in_mapped_task_group:
                 return True
             # The upstream ti is not expanded. The upstream may be mapped or
             # not, but the ti is relevant either way.
@@ -238,12 +277,46 @@ class TriggerRuleDep(BaseTIDep):
                 return True
             return False
 
+        def _iter_finished_relevant_upstreams(
+            relevant_ids: set[str] | KeysView[str],
+        ) -> Iterator[TaskInstance]:
+            """
+            Iterate through the finished upstream tis relevant to the current ti.
+
+            Only the finished tis of the relevant upstream tasks are visited, instead
+            of every finished ti of the dag run.
+            """
+            finished_tis_by_task_id = dep_context.ensure_finished_tis_by_task_id(
+                ti.get_dagrun(session=session), session=session
+            )
+            for upstream_id in relevant_ids:
+                for finished_ti in finished_tis_by_task_id.get(upstream_id, ()):
+                    if _is_relevant_upstream(upstream=finished_ti, relevant_ids=relevant_ids):
+                        yield finished_ti
+
+        def _calculate_upstream_states(relevant_ids: set[str] | KeysView[str]) -> _UpstreamTIStates:
+            """
+            Calculate the states of the finished upstream tis relevant to the current ti.
+
+            Outside of a mapped task group, every finished ti of a relevant upstream
+            counts, so the states are the same for all the tis sharing those upstreams
+            and are memoized on the DepContext for the rest of the scheduling pass.
+            """
+            if in_mapped_task_group:
+                return _UpstreamTIStates.calculate(_iter_finished_relevant_upstreams(relevant_ids))
+            cache_key = (ti.dag_id, ti.run_id, frozenset(relevant_ids))
+            upstream_states = dep_context.upstream_ti_states.get(cache_key)
+            if upstream_states is None:
+                upstream_states = _UpstreamTIStates.calculate(_iter_finished_relevant_upstreams(relevant_ids))
+                dep_context.upstream_ti_states[cache_key] = upstream_states
+            return upstream_states
+
         def _iter_upstream_conditions(relevant_tasks: dict) -> Iterator[ColumnElement]:
             # Optimization: If the current task is not in a mapped task group,
             # it depends on all upstream task instances.
             from airflow.models.taskinstance import TaskInstance
 
-            if task.get_closest_mapped_task_group() is None:
+            if not in_mapped_task_group:
                 yield TaskInstance.task_id.in_(relevant_tasks.keys())
                 return
             # Otherwise we need to figure out which map indexes are depended on
@@ -281,12 +354,7 @@ class TriggerRuleDep(BaseTIDep):
                 return
 
             indirect_setups = {k: v for k, v in relevant_setups.items() if k not in task.upstream_task_ids}
-            finished_upstream_tis = (
-                x
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=indirect_setups.keys())
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(indirect_setups.keys())
 
             # all of these counts reflect indirect setups which are relevant for this ti
             success = upstream_states.success
@@ -364,14 +432,7 @@ class TriggerRuleDep(BaseTIDep):
             trigger_rule = task.trigger_rule
             trigger_rule_str = getattr(trigger_rule, "value", trigger_rule)
 
-            finished_upstream_tis = (
-                finished_ti
-                for finished_ti in dep_context.ensure_finished_tis(
-                    ti.get_dagrun(session=session), session=session
-                )
-                if _is_relevant_upstream(upstream=finished_ti, relevant_ids=task.upstream_task_ids)
-            )
-            upstream_states = _UpstreamTIStates.calculate(finished_upstream_tis)
+            upstream_states = _calculate_upstream_states(task.upstream_task_ids)
 
             success = upstream_states.success
             skipped = upstream_states.skipped
@@ -389,8 +450,8 @@ class TriggerRuleDep(BaseTIDep):
                 upstream_setup = sum(1 for x in upstream_tasks.values() if x.is_setup)
             else:
                 # In the simple case, `_iter_upstream_conditions` emits exactly
-                # `task_id IN (upstream_task_ids)` (the matching `get_closest_mapped_task_group()
-                # is None` branch). That predicate, and therefore the resulting counts, are
+                # `task_id IN (upstream_task_ids)` (the matching `not in_mapped_task_group`
+                # branch). That predicate, and therefore the resulting counts, are
                 # identical for every downstream that shares the same set of direct upstreams, so
                 # we memoize them on the DepContext and run the query once per pass instead of
                 # once per downstream. The mapped-task-group case uses per-ti map-index predicates
@@ -402,7 +463,7 @@ class TriggerRuleDep(BaseTIDep):
                 # need no invalidation.
                 cache_key: tuple[str, str, frozenset[str]] | None = None
                 task_id_counts: list[tuple[str, int]] | None = None
-                if task.get_closest_mapped_task_group() is None:
+                if not in_mapped_task_group:
                     cache_key = (ti.dag_id, ti.run_id, frozenset(upstream_tasks))
                     task_id_counts = dep_context.upstream_task_id_counts.get(cache_key)
                 if task_id_counts is None:
@@ -676,29 +737,16 @@ class TriggerRuleDep(BaseTIDep):
             if not task.dag:
                 return
 
-            setup_task_ids = {t.task_id for t in task.upstream_list if t.is_setup}
-
-            all_upstream_ids = task.get_flat_relative_ids(upstream=True)
-            indirect_upstream_ids = all_upstream_ids - task.upstream_task_ids
-
-            if not indirect_upstream_ids:
-                return
-
-            in_scope_ids = set()
-            for setup_id in setup_task_ids:
-                setup_obj = task.dag.get_task(setup_id)
-                in_scope_ids.update(indirect_upstream_ids & setup_obj.get_flat_relative_ids(upstream=False))
-
+            if topology is not None:
+                in_scope_ids = set(topology.get_teardown_scope(task.task_id))
+            else:
+                in_scope_ids = _get_teardown_scope(task)
             if not in_scope_ids:
                 return
 
             in_scope_tasks = {tid: task.dag.get_task(tid) for tid in in_scope_ids}
 
-            done = sum(
-                1
-                for x in dep_context.ensure_finished_tis(ti.get_dagrun(session=session), session=session)
-                if _is_relevant_upstream(upstream=x, relevant_ids=in_scope_ids)
-            )
+            done = sum(1 for _ in _iter_finished_relevant_upstreams(in_scope_ids))
 
             if not any(t.get_needs_expansion() for t in in_scope_tasks.values()):
                 expected = len(in_scope_tasks)
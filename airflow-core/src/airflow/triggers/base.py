@@ -20,7 +20,7 @@ import abc
 import json
 from collections.abc import AsyncIterator, Hashable
 from dataclasses import dataclass
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Annotated, Any
 
 import structlog
@@ -196,6 +196,24 @@ class BaseTrigger(abc.ABC, Templater, LoggingMixin):
         raise NotImplementedError("Triggers must implement run()")
         yield  # To convince Mypy this is an async iterator.
 
+    def fires_at(self) -> datetime | None:
+        """
+        Return the moment this trigger fires, for a trigger that only waits for it.
+
+        Such a trigger is not run: the triggerer keeps it in a timer queue shared by all of them, and
+        fires the event returned by :meth:`timer_event` once the moment has passed, together with the
+        other triggers whose moment passed by then. Neither :meth:`run`, :meth:`cleanup` nor
+        :meth:`on_kill` are called.
+
+        Returning ``None`` (the default) runs the trigger as usual. It is not called for triggers
+        rendering templated fields, nor for event triggers (:class:`BaseEventTrigger`).
+        """
+        return None
+
+    def timer_event(self) -> TriggerEvent:
+        """Return the event to fire when the moment returned by :meth:`fires_at` has passed."""
+        raise NotImplementedError(f"{type(self).__name__} implements fires_at() but not timer_event()")
+
     async def cleanup(self) -> None:
         """
         Cleanup the trigger.
@@ -26,12 +26,15 @@ class XComEncoder(json.JSONEncoder):
 
     def default(self, o: object) -> Any:
         try:
-            from airflow.sdk.serde import serialize
+            from airflow.sdk.serde import encode_bytes, serialize
         except ImportError as e:
             raise ImportError(
                 "apache-airflow-task-sdk is required for XCom serialization. "
                 "Install the package to use XcomEncoder."
             ) from e
+        # serialize leaves binary data, such as a DataFrame serialized to Parquet, as bytes
+        if isinstance(o, bytes):
+            return encode_bytes(o)
         try:
             return serialize(o)
         except TypeError:
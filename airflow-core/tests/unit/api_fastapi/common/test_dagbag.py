@@ -25,7 +25,7 @@ from cachetools import LRUCache, TTLCache
 
 from airflow.api_fastapi.app import purge_cached_app
 from airflow.api_fastapi.common.dagbag import create_dag_bag
-from airflow.models.dagbag import CachedDBDagBag
+from airflow.models.dagbag import CachedDBDagBag, _DagCache
 from airflow.sdk import BaseOperator
 
 from tests_common.test_utils.config import conf_vars
@@ -114,6 +114,7 @@ class TestCreateDagBag:
             dag_bag = create_dag_bag()
 
         assert type(dag_bag) is expected_bag_type
+        assert dag_bag.lazy_load_tasks is False
         assert isinstance(dag_bag._dags, expected_dags_type)
         if expected_maxsize is not None:
             assert dag_bag._dags.maxsize == expected_maxsize
@@ -139,3 +140,28 @@ class TestCreateDagBag:
         with conf_vars({("api", "dag_cache_size"): cache_size, ("api", "dag_cache_ttl"): cache_ttl}):
             with pytest.raises(ValueError, match=re.escape(expected_message)):
                 create_dag_bag()
+
+    def test_create_dag_bag_size_bounded(self):
+        with conf_vars(
+            {
+                ("api", "dag_cache_size"): "64",
+                ("api", "dag_cache_ttl"): "3600",
+                ("api", "dag_cache_max_bytes"): "1048576",
+                ("api", "dag_cache_idle_ttl"): "600",
+            }
+        ):
+            dag_bag = create_dag_bag()
+
+        assert isinstance(dag_bag._dags, _DagCache)
+        assert dag_bag._dags.maxsize == 1048576
+        assert dag_bag._dags.max_entries == 64
+        assert dag_bag._dags.ttl == 3600
+        assert dag_bag._dags.idle_ttl == 600
+
+    @pytest.mark.parametrize("option", ["dag_cache_max_bytes", "dag_cache_idle_ttl"])
+    def test_create_dag_bag_rejects_negative_size_bounds(self, option):
+        with conf_vars({("api", option): "-1"}):
+            with pytest.raises(
+                ValueError, match=re.escape(f"[api] {option} must be greater than or equal to 0")
+            ):
+                create_dag_bag()
@@ -45,6 +45,7 @@ from airflow.api_fastapi.execution_api.app import lifespan
 from airflow.api_fastapi.execution_api.datamodels.token import TIClaims, TIToken
 from airflow.api_fastapi.execution_api.routes.task_instances import _emit_task_span
 from airflow.api_fastapi.execution_api.security import require_auth
+from airflow.api_fastapi.execution_api.services.heartbeats import HeartbeatBuffer
 from airflow.exceptions import AirflowSkipException
 from airflow.models import RenderedTaskInstanceFields, TaskReschedule, Trigger
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetEvent, AssetModel
@@ -98,6 +99,10 @@ def _where_column_keys(statement) -> set[str]:
     return keys
 
 
+def _last_heartbeat_at(session, ti_id):
+    return session.scalar(select(TaskInstance.last_heartbeat_at).where(TaskInstance.id == ti_id))
+
+
 def _is_task_instance_update(statement) -> bool:
     return getattr(statement, "is_update", False) and statement.table.name == TaskInstance.__table__.name
 
@@ -3166,6 +3171,340 @@ class TestTIHealthEndpoint:
         session.refresh(ti)
         assert ti.last_heartbeat_at == new_time
 
+    def test_ti_heartbeat_buffered(self, client, session, create_task_instance, monkeypatch, time_machine):
+        """With a heartbeat buffer, heartbeats only read the TI and are written by the next flush."""
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        ti = create_task_instance(
+            task_id="test_ti_heartbeat_buffered",
+            state=State.RUNNING,
+            hostname="random-hostname",
+            pid=1547,
+            last_heartbeat_at=time_now,
+            session=session,
+        )
+        session.commit()
+        heartbeat_buffer = HeartbeatBuffer(flush_interval=60)
+        lifespan.registry.register_value(HeartbeatBuffer, heartbeat_buffer)
+
+        new_time = time_now.add(minutes=10)
+        time_machine.move_to(new_time, tick=False)
+
+        original_execute = Session.execute
+        task_instance_updates = []
+
+        def counting_execute(session_obj, statement, *args, **kwargs):
+            if _is_task_instance_update(statement):
+                task_instance_updates.append(statement)
+            return original_execute(session_obj, statement, *args, **kwargs)
+
+        monkeypatch.setattr(Session, "execute", counting_execute)
+
+        for _ in range(3):
+            response = client.put(
+                f"/execution/task-instances/{ti.id}/heartbeat",
+                json={"hostname": "random-hostname", "pid": 1547},
+            )
+            assert response.status_code == 204
+        assert task_instance_updates == []
+        session.refresh(ti)
+        assert ti.last_heartbeat_at == time_now
+
+        # A TI running elsewhere still gets the heartbeat rejected straight away
+        response = client.put(
+            f"/execution/task-instances/{ti.id}/heartbeat",
+            json={"hostname": "other-hostname", "pid": 1547},
+        )
+        assert response.status_code == 409
+
+        ti_id = ti.id
+        assert heartbeat_buffer.flush() == 1
+        # The flush closes the (scoped) test session: read the heartbeat back instead of refreshing
+        assert _last_heartbeat_at(session, ti_id) == new_time
+        assert heartbeat_buffer.flush() == 0
+
+    def test_heartbeat_buffer_flush_skips_tis_no_longer_running(
+        self, session, create_task_instance, time_machine
+    ):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        running, finished, restarted = (
+            create_task_instance(
+                dag_id=f"test_heartbeat_buffer_flush_{name}",
+                task_id="task",
+                state=State.RUNNING,
+                hostname="host",
+                pid=pid,
+                last_heartbeat_at=time_now,
+                session=session,
+            )
+            for name, pid in [("running", 1), ("finished", 2), ("restarted", 3)]
+        )
+        session.commit()
+
+        heartbeat_buffer = HeartbeatBuffer(flush_interval=60)
+        new_time = time_now.add(minutes=1)
+        for ti in (running, finished, restarted):
+            heartbeat_buffer.record(ti.id, "host", ti.pid, new_time)
+
+        finished.state = State.SUCCESS
+        restarted.pid = 4
+        session.commit()
+        ti_ids = [running.id, finished.id, restarted.id]
+
+        assert heartbeat_buffer.flush() == 3
+        assert [_last_heartbeat_at(session, ti_id) for ti_id in ti_ids] == [new_time, time_now, time_now]
+
+
+class TestTIBulkHeartbeat:
+    def setup_method(self):
+        clear_db_runs()
+
+    def teardown_method(self):
+        clear_db_runs()
+
+    @pytest.fixture(autouse=True)
+    def jwt_generator(self, client):
+        # Registered once the client started the app, whose lifespan registers its own generator
+        generator = JWTGenerator(secret_key="secret", audience="test-audience", issuer=None, valid_for=600)
+        lifespan.registry.register_value(JWTGenerator, generator)
+        lifespan.registry.register_value(
+            JWTValidator, JWTValidator(secret_key="secret", audience="test-audience", issuer=None)
+        )
+        return generator
+
+    @staticmethod
+    def _auth_as(exec_app, ti_id):
+        async def ti_token(request: Request) -> TIToken:
+            return TIToken(id=ti_id, claims=TIClaims(scope="execution"))
+
+        exec_app.dependency_overrides[require_auth] = ti_token
+
+    @staticmethod
+    def _heartbeat(jwt_generator, ti_id, pid, **claims):
+        return {
+            "id": str(ti_id),
+            "pid": pid,
+            "token": jwt_generator.generate(extras={"sub": str(ti_id), "scope": "execution"} | claims),
+        }
+
+    def test_ti_bulk_heartbeat(
+        self, client, exec_app, session, create_task_instance, time_machine, jwt_generator
+    ):
+        time_now = timezone.parse("2024-10-31T12:00:00Z")
+        time_machine.move_to(time_now, tick=False)
+
+        tis = {
+            name: create_task_instance(
+                dag_id=f"test_ti_bulk_heartbeat_{name}",
+                task_id="task",
+                state=state,
+                hostname=hostname,
+                pid=pid,
+                session=session,
+            )
+            for name, state, hostname, pid in [
+                ("ok", State.RUNNING, "random-hostname", 1),
+                ("other_pid", State.RUNNING, "random-hostname", 20),
+                ("other_host", State.RUNNING, "other-hostname", 3),
+                ("not_running", State.SUCCESS, "random-hostname", 4),
+                ("cleared", State.RUNNING, "random-hostname", 5),
+            ]
+        }
+        session.commit()
+        cleared_id = tis["cleared"].id
+        tis["cleared"].prepare_db_for_next_try(session)
+        session.commit()
+        missing_id = UUID("0182e924-0f1e-77e6-ab50-e977118bc139")
+
+        self._auth_as(exec_app, tis["ok"].id)
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "hostname": "random-hostname",
+                "heartbeats": [
+                    self._heartbeat(jwt_generator, tis["ok"].id, 1),
+                    self._heartbeat(jwt_generator, tis["other_pid"].id, 2),
+                    self._heartbeat(jwt_generator, tis["other_host"].id, 3),
+                    self._heartbeat(jwt_generator, tis["not_running"].id, 4),
+                    self._heartbeat(jwt_generator, cleared_id, 5),
+                    self._heartbeat(jwt_generator, missing_id, 6),
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "results": [
+                {"id": str(tis["ok"].id), "status": "ok", "token": None},
+                {"id": str(tis["other_pid"].id), "status": "running_elsewhere", "token": None},
+                {"id": str(tis["other_host"].id), "status": "running_elsewhere", "token": None},
+                {"id": str(tis["not_running"].id), "status": "not_running", "token": None},
+                {"id": str(cleared_id), "status": "gone", "token": None},
+                {"id": str(missing_id), "status": "not_found", "token": None},
+            ]
+        }
+        session.expire_all()
+        assert session.get(TaskInstance, tis["ok"].id).last_heartbeat_at == time_now
+        for name in ("other_pid", "other_host", "not_running"):
+            assert session.get(TaskInstance, tis[name].id).last_heartbeat_at is None
+
+    def test_ti_bulk_heartbeat_updates_in_one_statement(
+        self, client, exec_app, session, create_task_instance, monkeypatch, jwt_generator
+    ):
+        tis = [
+            create_task_instance(
+                dag_id=f"test_ti_bulk_heartbeat_{i}",
+                task_id="task",
+                state=State.RUNNING,
+                hostname="random-hostname",
+                pid=i,
+                session=session,
+            )
+            for i in range(5)
+        ]
+        session.commit()
+
+        original_execute = Session.execute
+        task_instance_updates = []
+
+        def counting_execute(session_obj, statement, *args, **kwargs):
+            if _is_task_instance_update(statement):
+                task_instance_updates.append(statement)
+            return original_execute(session_obj, statement, *args, **kwargs)
+
+        monkeypatch.setattr(Session, "execute", counting_execute)
+
+        self._auth_as(exec_app, tis[0].id)
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "hostname": "random-hostname",
+                "heartbeats": [self._heartbeat(jwt_generator, ti.id, ti.pid) for ti in tis],
+            },
+        )
+
+        assert response.status_code == 200
+        assert {result["status"] for result in response.json()["results"]} == {"ok"}
+        assert len(task_instance_updates) == 1
+
+    def test_ti_bulk_heartbeat_authorizes_each_ti_with_its_token(
+        self, client, exec_app, session, create_task_instance, jwt_generator
+    ):
+        tis = {
+            name: create_task_instance(
+                dag_id=f"test_ti_bulk_heartbeat_{name}",
+                task_id="task",
+                state=State.RUNNING,
+                hostname="random-hostname",
+                pid=1,
+                session=session,
+            )
+            for name in ("valid", "invalid", "of_other_ti", "workload", "not_heartbeating")
+        }
+        session.commit()
+
+        self._auth_as(exec_app, tis["valid"].id)
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "hostname": "random-hostname",
+                "heartbeats": [
+                    self._heartbeat(jwt_generator, tis["valid"].id, 1),
+                    {"id": str(tis["invalid"].id), "pid": 1, "token": "not-a-token"},
+                    self._heartbeat(jwt_generator, tis["of_other_ti"].id, 1, sub=str(tis["valid"].id)),
+                    self._heartbeat(jwt_generator, tis["workload"].id, 1, scope="workload"),
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        assert [result["status"] for result in response.json()["results"]] == [
+            "ok",
+            "unauthorized",
+            "unauthorized",
+            "unauthorized",
+        ]
+        session.expire_all()
+        assert session.get(TaskInstance, tis["valid"].id).last_heartbeat_at is not None
+        for name in ("invalid", "of_other_ti", "workload", "not_heartbeating"):
+            assert session.get(TaskInstance, tis[name].id).last_heartbeat_at is None
+
+    def test_ti_bulk_heartbeat_with_stale_ti_of_request_token(
+        self, client, exec_app, session, create_task_instance, jwt_generator
+    ):
+        """A stale TaskInstance, even the one of the request token, does not stop the others heartbeating."""
+        tis = {
+            name: create_task_instance(
+                dag_id=f"test_ti_bulk_heartbeat_{name}",
+                task_id="task",
+                state=state,
+                hostname="random-hostname",
+                pid=1,
+                session=session,
+            )
+            for name, state in [("stale", State.SUCCESS), ("running", State.RUNNING)]
+        }
+        session.commit()
+
+        self._auth_as(exec_app, tis["stale"].id)
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "hostname": "random-hostname",
+                "heartbeats": [self._heartbeat(jwt_generator, ti.id, 1) for ti in tis.values()],
+            },
+        )
+
+        assert response.status_code == 200
+        assert [result["status"] for result in response.json()["results"]] == ["not_running", "ok"]
+        session.expire_all()
+        assert session.get(TaskInstance, tis["running"].id).last_heartbeat_at is not None
+
+    def test_ti_bulk_heartbeat_refreshes_expiring_tokens(
+        self, client, exec_app, session, create_task_instance, jwt_generator
+    ):
+        tis = [
+            create_task_instance(
+                dag_id=f"test_ti_bulk_heartbeat_{i}",
+                task_id="task",
+                state=State.RUNNING,
+                hostname="random-hostname",
+                pid=1,
+                session=session,
+            )
+            for i in range(2)
+        ]
+        session.commit()
+        expiring, fresh = tis
+        expiring_token = jwt_generator.generate(
+            extras={"sub": str(expiring.id), "scope": "execution"}, valid_for=20
+        )
+
+        self._auth_as(exec_app, fresh.id)
+        response = client.put(
+            "/execution/task-instances/heartbeats",
+            json={
+                "hostname": "random-hostname",
+                "heartbeats": [
+                    {"id": str(expiring.id), "pid": 1, "token": expiring_token},
+                    self._heartbeat(jwt_generator, fresh.id, 1),
+                ],
+            },
+        )
+
+        assert response.status_code == 200
+        expiring_result, fresh_result = response.json()["results"]
+        assert fresh_result["token"] is None
+        assert expiring_result["token"] is not None
+        claims = JWTValidator(secret_key="secret", audience="test-audience", issuer=None).validated_claims(
+            expiring_result["token"]
+        )
+        assert claims["sub"] == str(expiring.id)
+        assert claims["exp"] - claims["iat"] == 600
+
 
 class TestTIPutRTIF:
     def setup_method(self):
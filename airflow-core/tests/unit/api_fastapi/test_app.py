@@ -25,6 +25,8 @@ from fastapi import FastAPI
 import airflow.api_fastapi.app as app_module
 import airflow.plugins_manager as plugins_manager
 
+from tests_common.test_utils.config import conf_vars
+
 pytestmark = pytest.mark.db_test
 
 
@@ -86,6 +88,18 @@ def test_all_apps(mock_create_task_exec_api, mock_init_plugins, mock_init_views,
     mock_create_task_exec_api.assert_called_once_with()
 
 
+@pytest.mark.parametrize("lazy_load_dag_tasks", [True, False])
+def test_execution_api_dag_bag(client, get_execution_app, lazy_load_dag_tasks):
+    with conf_vars({("execution_api", "lazy_load_dag_tasks"): str(lazy_load_dag_tasks)}):
+        test_client = client(apps="all")
+    execution_app = get_execution_app(test_client)
+
+    assert test_client.app.state.dag_bag.lazy_load_tasks is False
+    assert execution_app.state.dag_bag.lazy_load_tasks is lazy_load_dag_tasks
+    # The execution API only gets a DagBag of its own when it loads tasks lazily.
+    assert (execution_app.state.dag_bag is test_client.app.state.dag_bag) is not lazy_load_dag_tasks
+
+
 def test_catch_all_route_last(client):
     """
     Ensure the catch all route that returns the initial html is the last route in the fastapi app.
@@ -17,14 +17,19 @@
 
 from __future__ import annotations
 
+import itertools
+import uuid
+from unittest import mock
+
 import pytest
 
-from airflow.assets.evaluation import AssetEvaluator
+from airflow.assets.evaluation import AssetEvaluator, DagAssetConditions, compile_asset_condition
 from airflow.serialization.definitions.assets import (
     SerializedAsset,
     SerializedAssetAlias,
     SerializedAssetAll,
     SerializedAssetAny,
+    SerializedAssetNameRef,
     SerializedAssetUniqueKey,
 )
 
@@ -196,3 +201,107 @@ class TestAssetAlias:
         assert (
             evaluator.run(resolved_asset_alias_2, {SerializedAssetUniqueKey.from_asset(asset): True}) is True
         )
+
+
+class TestCompiledAssetCondition:
+    assets = [SerializedAsset(f"asset_{i}", f"s3://abc/{i}", "asset", {}, []) for i in range(4)]
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            pytest.param(assets[0], id="asset"),
+            pytest.param(SerializedAssetAll(assets[:3]), id="all"),
+            pytest.param(SerializedAssetAny(assets[:3]), id="any"),
+            pytest.param(SerializedAssetAll([]), id="empty-all"),
+            pytest.param(SerializedAssetAny([]), id="empty-any"),
+            pytest.param(
+                SerializedAssetAll(
+                    [assets[0], SerializedAssetAny([assets[1], SerializedAssetAll(assets[2:])])]
+                ),
+                id="nested",
+            ),
+            pytest.param(
+                SerializedAssetAny(
+                    [SerializedAssetAll(assets[:2]), SerializedAssetAll([assets[1], assets[3]])]
+                ),
+                id="shared-asset",
+            ),
+        ],
+    )
+    def test_evaluate_as_evaluator_runs(self, evaluator, condition):
+        compiled = compile_asset_condition(condition)
+        assert not compiled.dynamic
+        for status_values in itertools.product((True, False), repeat=len(self.assets)):
+            statuses = {
+                SerializedAssetUniqueKey.from_asset(asset): status
+                for asset, status in zip(self.assets, status_values)
+            }
+            assert compiled.evaluate(statuses, evaluator) is evaluator.run(condition, statuses), status_values
+
+    def test_references_and_aliases_are_evaluated_by_the_evaluator(self):
+        alias = SerializedAssetAlias("alias", "test")
+        ref = SerializedAssetNameRef("asset_1")
+        compiled = compile_asset_condition(
+            SerializedAssetAll([self.assets[0], SerializedAssetAny([alias, ref])])
+        )
+        assert compiled.dynamic
+
+        evaluator = mock.Mock(spec=AssetEvaluator)
+        evaluator.run.side_effect = [False, True]
+        statuses = {SerializedAssetUniqueKey.from_asset(self.assets[0]): True}
+        assert compiled.evaluate(statuses, evaluator) is True
+        assert evaluator.run.mock_calls == [mock.call.run(alias, statuses), mock.call.run(ref, statuses)]
+
+        # The assets are checked first, the evaluator is not needed when they decide
+        evaluator.reset_mock()
+        assert compiled.evaluate({}, evaluator) is False
+        evaluator.run.assert_not_called()
+
+
+class TestDagAssetConditions:
+    assets = [SerializedAsset(f"asset_{i}", f"s3://abc/{i}", "asset", {}, []) for i in range(3)]
+    keys = [SerializedAssetUniqueKey.from_asset(asset) for asset in assets]
+
+    def test_compiles_once_per_dag_version(self):
+        conditions = DagAssetConditions()
+        version_id = uuid.uuid4()
+        assert conditions.missing({"dag": (version_id, "hash")}) == ["dag"]
+        conditions.add("dag", (version_id, "hash"), SerializedAssetAll(self.assets[:2]))
+        assert conditions.missing({"dag": (version_id, "hash")}) == []
+        assert conditions.missing({"dag": (uuid.uuid4(), "hash")}) == ["dag"]
+        # A Dag version without task instances is updated in place
+        assert conditions.missing({"dag": (version_id, "other hash")}) == ["dag"]
+
+    def test_drops_the_conditions_of_dags_no_longer_given(self):
+        conditions = DagAssetConditions()
+        conditions.add("dag", (uuid.uuid4(), "hash"), SerializedAssetAll(self.assets[:2]))
+        assert conditions.missing({}) == []
+        with pytest.raises(KeyError):
+            conditions.is_met("dag", {}, mock.Mock(spec=AssetEvaluator))
+
+    def test_unmet_condition_is_only_evaluated_again_when_other_assets_are_queued(self):
+        conditions = DagAssetConditions()
+        conditions.add("dag", (uuid.uuid4(), "hash"), SerializedAssetAll(self.assets))
+        evaluator = mock.Mock(spec=AssetEvaluator)
+
+        with mock.patch(
+            "airflow.assets.evaluation.CompiledAssetCondition.evaluate", autospec=True, return_value=False
+        ) as evaluate:
+            assert conditions.is_met("dag", {self.keys[0]: True, self.keys[1]: True}, evaluator) is False
+            assert conditions.is_met("dag", {self.keys[0]: True, self.keys[1]: True}, evaluator) is False
+            assert conditions.is_met("dag", {self.keys[1]: True}, evaluator) is False
+            assert evaluate.call_count == 1
+
+        assert conditions.is_met("dag", {key: True for key in self.keys}, evaluator) is True
+        evaluator.run.assert_not_called()
+
+    def test_dynamic_condition_is_always_evaluated(self):
+        conditions = DagAssetConditions()
+        alias = SerializedAssetAlias("alias", "test")
+        conditions.add("dag", (uuid.uuid4(), "hash"), SerializedAssetAny([self.assets[0], alias]))
+        evaluator = mock.Mock(spec=AssetEvaluator)
+        evaluator.run.side_effect = [False, True]
+
+        assert conditions.is_met("dag", {}, evaluator) is False
+        # The alias resolved to an asset queued in the meantime
+        assert conditions.is_met("dag", {}, evaluator) is True
@@ -54,8 +54,14 @@ from airflow.dag_processing.manager import (
     DagFileInfo,
     DagFileProcessorManager,
     DagFileStat,
+    emit_metrics,
+)
+from airflow.dag_processing.processor import (
+    DagFileParsingResult,
+    DagFileProcessorProcess,
+    get_dag_file_content_hash,
+    get_file_digest,
 )
-from airflow.dag_processing.processor import DagFileParsingResult, DagFileProcessorProcess
 from airflow.models import DagModel, DbCallbackRequest
 from airflow.models.asset import TaskOutletAssetReference
 from airflow.models.dag_version import DagVersion
@@ -1057,6 +1063,176 @@ class TestDagFileProcessorManager:
         assert known_file not in manager._file_stats
         assert versioned_file in manager._file_stats
 
+    @pytest.mark.parametrize(
+        ("change", "parsed_seconds_ago", "expected_queued"),
+        [
+            pytest.param(None, 60, False, id="unchanged"),
+            pytest.param("touch", 60, False, id="only-mtime-changed"),
+            pytest.param("dag", 60, True, id="dag-file-changed"),
+            pytest.param("dag", 10, True, id="dag-file-changed-recently"),
+            pytest.param("module", 60, True, id="imported-module-changed"),
+            pytest.param("module-deleted", 60, True, id="imported-module-deleted"),
+            pytest.param(None, 7200, True, id="unchanged-interval-passed"),
+        ],
+    )
+    @conf_vars(
+        {
+            ("dag_processor", "file_parsing_sort_mode"): "modified_time",
+            ("dag_processor", "skip_unchanged_files"): "True",
+            ("dag_processor", "min_file_process_interval"): "30",
+            ("dag_processor", "unchanged_file_process_interval"): "3600",
+        }
+    )
+    def test_prepare_file_queue_skips_unchanged_files(
+        self, tmp_path, change, parsed_seconds_ago, expected_queued
+    ):
+        dag_path = tmp_path / "dag.py"
+        dag_path.write_text("from util import NAME")
+        module_path = tmp_path / "util.py"
+        module_path.write_text("NAME = 'dag'")
+        dag_file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+
+        manager = DagFileProcessorManager(max_runs=-1)
+        manager._file_stats[dag_file] = DagFileStat(
+            num_dags=1,
+            last_finish_time=timezone.utcnow() - timedelta(seconds=parsed_seconds_ago),
+            run_count=1,
+            content_hash=get_dag_file_content_hash(
+                [("dag.py", get_file_digest(dag_path)), ("util.py", get_file_digest(module_path))]
+            ),
+            imported_files=("util.py",),
+        )
+        # All the files are newer than the last parse
+        if change == "dag":
+            dag_path.write_text("from util import NAME, OTHER_NAME")
+        elif change == "module":
+            module_path.write_text("NAME = 'changed'")
+        elif change == "module-deleted":
+            module_path.unlink()
+        future = time.time() + 5
+        for path in (dag_path, module_path):
+            if path.exists():
+                os.utime(path, (future, future))
+
+        manager.prepare_file_queue(known_files={"testing": {dag_file}})
+
+        assert (dag_file in manager._file_queue) is expected_queued
+
+    @conf_vars({("dag_processor", "skip_unchanged_files"): "True"})
+    def test_unchanged_file_digests_are_cached(self, tmp_path):
+        dag_path = tmp_path / "dag.py"
+        dag_path.write_text("")
+        dag_file = DagFileInfo(bundle_name="testing", rel_path=Path("dag.py"), bundle_path=tmp_path)
+        stat = DagFileStat(content_hash=get_dag_file_content_hash([("dag.py", get_file_digest(dag_path))]))
+        manager = DagFileProcessorManager(max_runs=-1)
+
+        with mock.patch(
+            "airflow.dag_processing.manager.get_file_digest", side_effect=get_file_digest
+        ) as mock_digest:
+            assert manager._is_file_unchanged(dag_file, stat, set())
+            assert manager._is_file_unchanged(dag_file, stat, set())
+            assert mock_digest.call_count == 1
+
+            dag_path.write_text("# changed")
+            assert not manager._is_file_unchanged(dag_file, stat, set())
+            assert mock_digest.call_count == 2
+
+    @pytest.mark.parametrize(
+        ("skip_unchanged_files", "change", "expected_queued"),
+        [
+            pytest.param("False", "touch", [], id="mtime-touched"),
+            pytest.param("False", "edit", ["uses_util.py"], id="mtime-edited"),
+            pytest.param("False", "delete", ["uses_util.py"], id="mtime-deleted"),
+            pytest.param("True", "touch", [], id="hash-touched"),
+            pytest.param("True", "edit", ["uses_util.py"], id="hash-edited"),
+        ],
+    )
+    def test_queue_files_with_changed_imports(self, tmp_path, skip_unchanged_files, change, expected_queued):
+        util_path = tmp_path / "util.py"
+        util_path.write_text("NAME = 'util'")
+        with conf_vars({("dag_processor", "skip_unchanged_files"): skip_unchanged_files}):
+            manager = DagFileProcessorManager(max_runs=-1)
+        dag_files = {}
+        for rel_path, imported_files in [
+            ("uses_util.py", ("util.py",)),
+            ("no_imports.py", ()),
+            ("in_progress.py", ("util.py",)),
+        ]:
+            tmp_path.joinpath(rel_path).write_text("")
+            dag_file = DagFileInfo(bundle_name="testing", rel_path=Path(rel_path), bundle_path=tmp_path)
+            dag_files[rel_path] = dag_file
+            manager._file_stats[dag_file] = DagFileStat(
+                num_dags=1,
+                last_finish_time=timezone.utcnow() - timedelta(seconds=10),
+                run_count=1,
+                content_hash=get_dag_file_content_hash(
+                    (path, get_file_digest(tmp_path / path)) for path in (rel_path, *imported_files)
+                ),
+                imported_files=imported_files,
+                imports_hash=get_dag_file_content_hash(
+                    (path, get_file_digest(tmp_path / path)) for path in imported_files
+                ),
+            )
+        manager._processors[dag_files["in_progress.py"]] = MagicMock()
+        manager._file_queue = OrderedDict.fromkeys([dag_files["no_imports.py"], dag_files["uses_util.py"]])
+
+        if change == "edit":
+            util_path.write_text("NAME = 'changed'")
+        elif change == "delete":
+            util_path.unlink()
+        if util_path.exists():
+            future = time.time() + 5
+            os.utime(util_path, (future, future))
+
+        manager._queue_files_with_changed_imports(dag_files.values())
+
+        queue = list(manager._file_queue)
+        assert queue[: len(expected_queued)] == [dag_files[rel_path] for rel_path in expected_queued]
+        assert dag_files["in_progress.py"] not in queue
+
+    @conf_vars({("dag_processor", "file_parsing_sort_mode"): "modified_time"})
+    def test_refresh_dag_bundles_queues_files_with_changed_imports_first(
+        self, tmp_path, configure_dag_bundles
+    ):
+        """The files importing a changed module stay at the front of the queue resorted by modification time."""
+        bundle_path = tmp_path / "bundleone"
+        bundle_path.mkdir()
+        util_path = bundle_path / "util.py"
+        util_path.write_text("NAME = 'util'")
+        parsed_at = timezone.utcnow() - timedelta(seconds=10)
+        for rel_path, seconds_ago in [("uses_util.py", 100), ("recent.py", 1)]:
+            dag_path = bundle_path / rel_path
+            dag_path.write_text("from airflow.sdk import DAG\n")
+            mtime = time.time() - seconds_ago
+            os.utime(dag_path, (mtime, mtime))
+
+        with configure_dag_bundles({"bundleone": bundle_path}):
+            DagBundlesManager().sync_bundles_to_db()
+            manager = DagFileProcessorManager(max_runs=1)
+            manager._dag_bundles = list(DagBundlesManager().get_all_dag_bundles())
+            dag_files = {
+                rel_path: DagFileInfo(
+                    bundle_name="bundleone", rel_path=Path(rel_path), bundle_path=bundle_path
+                )
+                for rel_path in ("uses_util.py", "recent.py", "util.py")
+            }
+            for rel_path, imported_files in [
+                ("uses_util.py", ("util.py",)),
+                ("recent.py", ()),
+                ("util.py", ()),
+            ]:
+                manager._file_stats[dag_files[rel_path]] = DagFileStat(
+                    num_dags=1, last_finish_time=parsed_at, run_count=1, imported_files=imported_files
+                )
+            manager._file_queue = OrderedDict.fromkeys([dag_files["recent.py"]])
+            # The module changed since the files were parsed, but not the file importing it
+            future = time.time() + 5
+            os.utime(util_path, (future, future))
+
+            manager._refresh_dag_bundles({})
+
+        assert list(manager._file_queue)[:2] == [dag_files["uses_util.py"], dag_files["recent.py"]]
+
     def test_file_paths_in_queue_sorted_by_priority(self):
         from airflow.models.dagbag import DagPriorityParsingRequest
 
@@ -2351,6 +2527,7 @@ class TestDagFileProcessorManager:
                     logger_filehandle=mock_filehandle,
                     subprocess_logs_to_stdout=False,
                     client=mock.ANY,
+                    pooled=False,
                 ),
                 mock.call(
                     id=mock.ANY,
@@ -2364,6 +2541,7 @@ class TestDagFileProcessorManager:
                     logger_filehandle=mock_filehandle,
                     subprocess_logs_to_stdout=False,
                     client=mock.ANY,
+                    pooled=False,
                 ),
             ]
             # And removed from the queue
@@ -3165,6 +3343,105 @@ class TestDagFileProcessorManager:
                 dag_path.touch()  # make the loop run faster
                 gauge_values.clear()
 
+    def test_parsing_worker_pool_reuses_workers(self, tmp_path, configure_testing_dag_bundle, session):
+        for i in range(3):
+            tmp_path.joinpath(f"dag_{i}.py").write_text(
+                f"from airflow.sdk import DAG\nwith DAG('pooled_{i}', schedule=None):\n    pass\n"
+            )
+
+        with (
+            configure_testing_dag_bundle(tmp_path),
+            conf_vars(
+                {
+                    ("dag_processor", "parsing_worker_pool"): "True",
+                    ("dag_processor", "parsing_processes"): "1",
+                }
+            ),
+        ):
+            manager = DagFileProcessorManager(max_runs=1)
+            try:
+                manager.run()
+                workers = manager._idle_workers + manager._stopping_workers
+                assert len(workers) == 1
+                assert workers[0].files_processed == 3
+            finally:
+                manager.terminate()
+                manager.end()
+
+        dag_ids = session.scalars(select(DagModel.dag_id).where(DagModel.dag_id.like("pooled_%"))).all()
+        assert sorted(dag_ids) == ["pooled_0", "pooled_1", "pooled_2"]
+
+    @mock.patch.object(DagFileProcessorManager, "_get_logger_for_dag_file")
+    def test_create_process_reuses_idle_parsing_worker(self, mock_get_logger):
+        mock_filehandle = MagicMock()
+        mock_get_logger.return_value = (MagicMock(), mock_filehandle)
+        with conf_vars({("dag_processor", "parsing_worker_pool"): "True"}):
+            manager = DagFileProcessorManager(max_runs=1)
+        worker, _ = self.mock_processor()
+        worker.worker_startup_time = 0.5
+        manager._idle_workers = [worker]
+        dag_file = DagFileInfo(bundle_name="testing", rel_path=Path("my_dag.py"), bundle_path=Path("/tmp"))
+
+        with (
+            mock.patch.object(DagFileProcessorProcess, "start") as mock_start,
+            mock.patch.object(DagFileProcessorProcess, "parse_file") as mock_parse_file,
+            mock.patch.object(DagFileProcessorProcess, "_check_subprocess_exit", return_value=None),
+        ):
+            assert manager._create_process(dag_file) is worker
+
+        mock_start.assert_not_called()
+        mock_parse_file.assert_called_once_with(
+            path=Path("/tmp/my_dag.py"),
+            bundle_path=Path("/tmp"),
+            bundle_name="testing",
+            dag_file_rel_path="my_dag.py",
+            callbacks=[],
+            logger_filehandle=mock_filehandle,
+        )
+        assert manager._idle_workers == []
+        assert manager._worker_startup_time_saved == 0.5
+
+    @pytest.mark.parametrize(
+        ("files_processed", "rss", "needs_replacing", "replaced"),
+        [
+            pytest.param(1, 10, False, False, id="within-limits"),
+            pytest.param(2, 10, False, True, id="max-files"),
+            pytest.param(1, 200, False, True, id="max-rss"),
+            pytest.param(1, 10, True, True, id="changed-worker-state"),
+        ],
+    )
+    def test_release_parsing_worker(self, files_processed, rss, needs_replacing, replaced):
+        manager = DagFileProcessorManager(max_runs=1)
+        manager.parsing_worker_max_files = 2
+        manager.parsing_worker_max_rss = 100
+        worker, _ = self.mock_processor()
+        worker.files_processed = files_processed
+        worker.needs_replacing = needs_replacing
+
+        with (
+            mock.patch("airflow.dag_processing.manager.psutil.Process") as mock_process,
+            mock.patch.object(DagFileProcessorProcess, "stop") as mock_stop,
+        ):
+            mock_process.return_value.memory_info.return_value.rss = rss * 1024 * 1024
+            manager._release_worker(worker)
+
+        assert mock_stop.called is replaced
+        assert (worker in manager._stopping_workers) is replaced
+        assert (worker in manager._idle_workers) is not replaced
+
+    @mock.patch("airflow.dag_processing.manager.stats.gauge")
+    def test_emit_metrics_parsing_worker_pool(self, mock_gauge):
+        emit_metrics(
+            parse_time=1.0,
+            dag_file_stats=[],
+            parsing_worker_reuse_counts={0: 4, 1: 2},
+            parsing_worker_startup_time_saved=3.0,
+        )
+
+        mock_gauge.assert_any_call("dag_processing.parsing_worker.reuse_count", 4, tags={"worker_slot": "0"})
+        mock_gauge.assert_any_call("dag_processing.parsing_worker.reuse_count", 2, tags={"worker_slot": "1"})
+        mock_gauge.assert_any_call("dag_processing.parsing_worker.startup_time_saved", 3.0)
+
     # --- get_bundle_state / update_bundle_state ---
 
     def test_get_bundle_state_returns_none_for_missing_bundle(self):
@@ -19,6 +19,7 @@ from __future__ import annotations
 
 import inspect
 import logging
+import os
 import pathlib
 import sys
 import textwrap
@@ -64,6 +65,8 @@ from airflow.dag_processing.processor import (
     _parse_file,
     _parse_file_entrypoint,
     _pre_import_airflow_modules,
+    get_dag_file_content_hash,
+    get_file_digest,
 )
 from airflow.models import DagRun
 from airflow.sdk import DAG, BaseOperator
@@ -417,6 +420,174 @@ class TestDagFileProcessor:
         assert result.import_errors == {}
         assert result.serialized_dags[0].dag_id == "dag_name"
 
+    def test_parsing_worker_parses_many_files(self, tmp_path: pathlib.Path, inprocess_client):
+        tmp_path.joinpath("util.py").write_text("NAME = 'first'")
+        dag_path = tmp_path.joinpath("dag1.py")
+        dag_path.write_text("from util import NAME\nfrom airflow.sdk import DAG\nwith DAG(NAME):\n    pass\n")
+
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=dag_path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="dag1.py",
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+            pooled=True,
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        assert proc.waiting_for_file
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "first"
+        assert proc.worker_startup_time > 0
+
+        # Modules imported from the bundle are imported again for the next file.
+        tmp_path.joinpath("util.py").write_text("NAME = 'second'")
+        proc.parse_file(
+            path=dag_path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="dag1.py",
+            callbacks=[],
+            logger_filehandle=MagicMock(spec=BinaryIO),
+        )
+        assert not proc.is_ready
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+        assert proc.parsing_result is not None
+        assert proc.parsing_result.serialized_dags[0].dag_id == "second"
+        assert proc.files_processed == 2
+        assert not proc.needs_replacing
+
+        proc.stop()
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc._exit_code == 0
+
+    def test_parsing_worker_restores_state_between_files(self, tmp_path: pathlib.Path, inprocess_client):
+        """A file changing the environment or sys.path of a worker does not change them for the next file."""
+        mutating_path = tmp_path.joinpath("mutating.py")
+        mutating_path.write_text(
+            "import os, sys\n"
+            "os.environ['LEAKED_VARIABLE'] = 'leaked'\n"
+            "sys.path.insert(0, '/leaked/path')\n"
+            "from airflow.sdk import DAG\n"
+            "with DAG('mutating'):\n"
+            "    pass\n"
+        )
+        reading_path = tmp_path.joinpath("reading.py")
+        reading_path.write_text(
+            "import os, sys\n"
+            "from airflow.sdk import DAG\n"
+            "dag_id = f\"{os.environ.get('LEAKED_VARIABLE', 'clean')}_{'/leaked/path' in sys.path}\"\n"
+            "with DAG(dag_id):\n"
+            "    pass\n"
+        )
+
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=mutating_path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="mutating.py",
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+            pooled=True,
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc.parsing_result.serialized_dags[0].dag_id == "mutating"
+        # The manager replaces the worker, as the file may have changed more than can be restored.
+        assert proc.needs_replacing
+
+        proc.parse_file(
+            path=reading_path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="reading.py",
+            callbacks=[],
+            logger_filehandle=MagicMock(spec=BinaryIO),
+        )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc.parsing_result.serialized_dags[0].dag_id == "clean_False"
+
+        proc.stop()
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+        assert proc._exit_code == 0
+
+    def test_parse_file_requires_waiting_worker(self, tmp_path: pathlib.Path, inprocess_client):
+        path = tmp_path.joinpath("dag1.py")
+        path.write_text("")
+        proc = DagFileProcessorProcess.start(
+            id=1,
+            path=path,
+            bundle_path=tmp_path,
+            bundle_name="testing",
+            dag_file_rel_path="dag1.py",
+            callbacks=[],
+            logger=MagicMock(spec=FilteringBoundLogger),
+            logger_filehandle=MagicMock(spec=BinaryIO),
+            client=inprocess_client,
+        )
+        with pytest.raises(RuntimeError, match="not a parsing worker"):
+            proc.parse_file(
+                path=path,
+                bundle_path=tmp_path,
+                bundle_name="testing",
+                dag_file_rel_path="dag1.py",
+                callbacks=[],
+                logger_filehandle=MagicMock(spec=BinaryIO),
+            )
+        while not proc.is_ready:
+            proc._service_subprocess(0.1)
+
+    @pytest.mark.parametrize("skip_unchanged_files", [True, False])
+    def test_parse_file_hashes_dag_file_and_bundle_imports(
+        self, tmp_path: pathlib.Path, monkeypatch, skip_unchanged_files
+    ):
+        monkeypatch.setattr(sys, "path", list(sys.path))
+        monkeypatch.setattr(sys, "modules", dict(sys.modules))
+        helpers = tmp_path.joinpath("skip_unchanged_helpers")
+        helpers.mkdir()
+        helpers.joinpath("__init__.py").write_text("")
+        helpers.joinpath("names.py").write_text("NAME = 'hashed'")
+        dag_path = tmp_path.joinpath("dag1.py")
+        dag_path.write_text(
+            "from skip_unchanged_helpers.names import NAME\nfrom airflow.sdk import DAG\nwith DAG(NAME):\n    pass\n"
+        )
+
+        with conf_vars({("dag_processor", "skip_unchanged_files"): str(skip_unchanged_files)}):
+            result = _parse_file(
+                DagFileParseRequest(file=str(dag_path), bundle_path=tmp_path, bundle_name="testing"),
+                log=structlog.get_logger(),
+            )
+
+        assert result is not None
+        assert result.serialized_dags[0].dag_id == "hashed"
+        imported_files = [
+            os.path.join("skip_unchanged_helpers", "__init__.py"),
+            os.path.join("skip_unchanged_helpers", "names.py"),
+        ]
+        assert result.imported_files == imported_files
+        assert result.imports_hash == get_dag_file_content_hash(
+            (path, get_file_digest(tmp_path / path)) for path in imported_files
+        )
+        if not skip_unchanged_files:
+            assert result.content_hash is None
+            return
+        assert result.content_hash == get_dag_file_content_hash(
+            (path, get_file_digest(tmp_path / path)) for path in ["dag1.py", *imported_files]
+        )
+
     def test__pre_import_airflow_modules_when_disabled(self):
         logger = MagicMock(spec=FilteringBoundLogger)
         with (
@@ -488,6 +659,7 @@ class TestDagFileProcessor:
         (True, _parse_file_entrypoint, True),
         (False, _parse_file_entrypoint, False),
         (True, lambda: None, False),
+        (True, None, True),
     ],
 )
 def test_start_opts_into_fork_exec(monkeypatch, mocker, platform_uses_exec, target, expected_use_exec):
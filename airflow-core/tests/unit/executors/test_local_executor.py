@@ -239,6 +239,94 @@ class TestLocalExecutor:
             assert executor.event_buffer[ti.key][0] == State.SUCCESS
         assert executor.event_buffer[fail_ti.key][0] == State.FAILED
 
+    @skip_non_fork_mp_start
+    @conf_vars({("workers", "tasks_per_supervisor"): "3"})
+    @mock.patch("airflow.executors.base_executor.BaseExecutor.run_workload")
+    def test_execution_with_multi_task_workers(self, mock_run_workload):
+        """Tasks are handed to a MultiTaskSupervisor, other workloads are run in a process of their own."""
+        tis = [
+            TaskInstanceDTO(
+                id=uuid7(),
+                dag_version_id=uuid7(),
+                task_id=task_id,
+                dag_id="mydag",
+                run_id="run1",
+                try_number=1,
+                state="queued",
+                pool_slots=1,
+                queue="java" if task_id == "other_coordinator" else "default",
+                priority_weight=1,
+                map_index=-1,
+                start_date=timezone.utcnow(),
+            )
+            for task_id in ("success_0", "success_1", "failure", "other_coordinator")
+        ]
+        mock_run_workload.return_value = 0
+
+        class FakeMultiTaskSupervisor:
+            def __init__(self, **kwargs):
+                self.finishing = []
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc_info):
+                pass
+
+            @property
+            def running_tasks(self):
+                return len(self.finishing)
+
+            @staticmethod
+            def can_supervise(queue):
+                return queue != "java"
+
+            def start_task(self, *, ti, on_finish, **kwargs):
+                if ti.task_id == "failure":
+                    raise RuntimeError("fake failure")
+                self.finishing.append(on_finish)
+
+            def serve(self):
+                while self.finishing:
+                    self.finishing.pop()(0, None)
+
+            def wakeup(self):
+                pass
+
+        executor = LocalExecutor(parallelism=6)
+        assert executor.tasks_per_supervisor == 3
+
+        with (
+            mock.patch("airflow.sdk.execution_time.supervisor.MultiTaskSupervisor", FakeMultiTaskSupervisor),
+            # Instead of from a fork server, which wouldn't see mock_run_workload
+            mock.patch.object(
+                multiprocessing, "get_context", return_value=multiprocessing.get_context("fork")
+            ),
+        ):
+            executor.start()
+            assert len(executor.workers) == 2
+
+            for ti in tis:
+                executor.queue_workload(
+                    workloads.ExecuteTask(
+                        token="",
+                        ti=ti,
+                        dag_rel_path="some/path",
+                        log_path=None,
+                        bundle_info=dict(name="hi", version="hi"),
+                    ),
+                    session=mock.MagicMock(spec=Session),
+                )
+            executor._process_workloads(list(executor.queued_tasks.values()))
+            executor.end()
+
+        assert executor._unread_messages.value == 0
+        assert executor.event_buffer[tis[0].key][0] == State.SUCCESS
+        assert executor.event_buffer[tis[1].key][0] == State.SUCCESS
+        assert executor.event_buffer[tis[2].key][0] == State.FAILED
+        # Run by BaseExecutor.run_workload in a process of its own
+        assert executor.event_buffer[tis[3].key][0] == State.SUCCESS
+
     @mock.patch("airflow.executors.local_executor.LocalExecutor.sync")
     @mock.patch("airflow.executors.base_executor.BaseExecutor.trigger_tasks")
     @mock.patch("airflow.executors.base_executor.stats.gauge")
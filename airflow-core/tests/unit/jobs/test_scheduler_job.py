@@ -3000,6 +3000,159 @@ class TestSchedulerJob:
 
         session.rollback()
 
+    @conf_vars({("scheduler", "use_incremental_scheduling_state"): "True"})
+    def test_find_executable_task_instances_incremental_scheduling_state(self, dag_maker, session):
+        """Counts are carried over between passes and only refreshed on release or reconciliation."""
+        with dag_maker(dag_id="test_incremental_scheduling_state", session=session):
+            for i in range(3):
+                EmptyOperator(task_id=f"op{i}", pool="pool_a")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        session.add(Pool(pool="pool_a", slots=2, include_deferred=False))
+        for ti in dr.task_instances:
+            ti.state = State.SCHEDULED
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        scheduling_state = self.job_runner._scheduling_state
+        assert scheduling_state is not None
+
+        queued = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued) == 2
+        assert scheduling_state.pools["pool_a"]["open"] == 0
+        assert scheduling_state.concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 2
+
+        # Finishing a task behind the scheduler's back is not seen until the next reconciliation.
+        finished = session.get(TaskInstance, queued[0].id)
+        finished.state = State.SUCCESS
+        session.flush()
+        assert self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session) == []
+
+        # ... but a release from an executor event frees the slot without reloading the counts.
+        scheduling_state.release(finished)
+        assert scheduling_state.pools["pool_a"]["open"] == 1
+        queued = self.job_runner._executable_task_instances_to_queued(max_tis=32, session=session)
+        assert len(queued) == 1
+
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_incremental_scheduling_state"): "True"})
+    def test_incremental_scheduling_state_reconciles(self, dag_maker, session):
+        with dag_maker(dag_id="test_incremental_scheduling_state_reconciles", session=session):
+            EmptyOperator(task_id="op", pool="pool_a")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        session.add(Pool(pool="pool_a", slots=1, include_deferred=False))
+        ti = dr.get_task_instance("op", session=session)
+        ti.state = State.RUNNING
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        scheduling_state = self.job_runner._scheduling_state
+        pools, concurrency_map = scheduling_state.prepare(session=session)
+        assert pools["pool_a"]["open"] == 0
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "op")] == 1
+
+        ti.state = State.SUCCESS
+        session.flush()
+        pools, _ = scheduling_state.prepare(session=session)
+        assert pools["pool_a"]["open"] == 0
+
+        # A pool configuration change forces a reconciliation.
+        session.execute(update(Pool).where(Pool.pool == "pool_a").values(slots=2))
+        pools, concurrency_map = scheduling_state.prepare(session=session)
+        assert pools["pool_a"]["open"] == 2
+        assert concurrency_map.task_concurrency_map[(dr.dag_id, "op")] == 0
+
+        ti.state = State.RUNNING
+        session.flush()
+        scheduling_state.invalidate()
+        pools, _ = scheduling_state.prepare(session=session)
+        assert pools["pool_a"]["open"] == 1
+
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_incremental_scheduling_state"): "True"})
+    def test_incremental_scheduling_state_reconcile_keeps_full_dag_runs(self, dag_maker, session):
+        """Reconciling loads max_active_tasks, so full Dag runs are still filtered out right after it."""
+        with dag_maker(dag_id="test_incremental_scheduling_state_full", max_active_tasks=1, session=session):
+            EmptyOperator(task_id="op1")
+            EmptyOperator(task_id="op2")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        dr.get_task_instance("op1", session=session).state = State.RUNNING
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        scheduling_state = self.job_runner._scheduling_state
+        scheduling_state.prepare(session=session)
+        assert scheduling_state.dag_max_active_tasks == {dr.dag_id: 1}
+        assert scheduling_state.full_dag_runs() == {(dr.dag_id, dr.run_id)}
+
+        scheduling_state.invalidate()
+        scheduling_state.prepare(session=session)
+        assert scheduling_state.full_dag_runs() == {(dr.dag_id, dr.run_id)}
+
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_incremental_scheduling_state"): "True"})
+    def test_incremental_scheduling_state_only_releases_counted_tis(self, dag_maker, session):
+        """A task instance which is not part of the counts, e.g. finished before reconciling, releases nothing."""
+        with dag_maker(dag_id="test_incremental_scheduling_state_uncounted", session=session):
+            EmptyOperator(task_id="running", pool="pool_a")
+            EmptyOperator(task_id="finished", pool="pool_a")
+        dr = dag_maker.create_dagrun(run_type=DagRunType.SCHEDULED)
+        session.add(Pool(pool="pool_a", slots=2, include_deferred=False))
+        running = dr.get_task_instance("running", session=session)
+        running.state = State.RUNNING
+        finished = dr.get_task_instance("finished", session=session)
+        finished.state = State.SUCCESS
+        session.flush()
+
+        self.job_runner = SchedulerJobRunner(job=Job())
+        scheduling_state = self.job_runner._scheduling_state
+        scheduling_state.prepare(session=session)
+        assert scheduling_state.counted_tis == {running.key}
+
+        scheduling_state.release(finished)
+        assert scheduling_state.pools["pool_a"]["open"] == 1
+        assert scheduling_state.concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 1
+        assert scheduling_state.concurrency_map.task_concurrency_map[(dr.dag_id, "running")] == 1
+
+        # A counted task instance is only released once.
+        running.state = State.SUCCESS
+        session.flush()
+        scheduling_state.release(running)
+        scheduling_state.release(running)
+        assert scheduling_state.pools["pool_a"]["open"] == 2
+        assert scheduling_state.concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 0
+        assert scheduling_state.counted_tis == set()
+
+        session.rollback()
+
+    @conf_vars({("scheduler", "use_incremental_scheduling_state"): "True"})
+    def test_process_executor_events_releases_incremental_scheduling_state(self, dag_maker, session):
+        with dag_maker(dag_id="test_process_executor_events_releases", session=session):
+            EmptyOperator(task_id="op")
+        dr = dag_maker.create_dagrun()
+        ti = dr.get_task_instance("op", session=session)
+        ti.state = State.QUEUED
+        session.commit()
+
+        executor = MockExecutor(do_update=False)
+        self.job_runner = SchedulerJobRunner(job=Job(), executors=[executor])
+        scheduling_state = self.job_runner._scheduling_state
+        scheduling_state.prepare(session=session)
+        assert scheduling_state.concurrency_map.task_concurrency_map[(dr.dag_id, "op")] == 1
+        open_slots = scheduling_state.pools[Pool.DEFAULT_POOL_NAME]["open"]
+
+        ti.state = State.SUCCESS
+        session.merge(ti)
+        session.commit()
+        executor.event_buffer[ti.key] = State.SUCCESS, None
+        self.job_runner._process_executor_events(executor=executor, session=session)
+
+        assert scheduling_state.concurrency_map.task_concurrency_map[(dr.dag_id, "op")] == 0
+        assert scheduling_state.concurrency_map.dag_run_active_tasks_map[(dr.dag_id, dr.run_id)] == 0
+        assert scheduling_state.pools[Pool.DEFAULT_POOL_NAME]["open"] == open_slots + 1
+
     @mock.patch("airflow._shared.observability.metrics.stats._get_backend")
     def test_emit_pool_starving_tasks_metrics(self, mock_get_backend, dag_maker):
         mock_stats = mock.MagicMock(spec=StatsLogger)
@@ -9206,6 +9359,35 @@ class TestSchedulerJob:
 
         self.job_runner.executor.callback_sink.send.assert_called_once()
 
+    @pytest.mark.parametrize(("heartbeat_flush_interval", "timed_out"), [("0", True), ("120", False)])
+    def test_heartbeat_timeout_allows_for_heartbeat_flush_interval(
+        self, dag_maker, session, heartbeat_flush_interval, timed_out
+    ):
+        """Heartbeats buffered by the API server can be written up to the flush interval late."""
+        with dag_maker(dag_id="test_heartbeat_flush_interval", session=session):
+            EmptyOperator(task_id="test_task")
+
+        dag_run = dag_maker.create_dagrun(run_id="test_run", state=DagRunState.RUNNING)
+
+        scheduler_job = Job()
+        with conf_vars(
+            {
+                ("scheduler", "task_instance_heartbeat_timeout"): "300",
+                ("execution_api", "heartbeat_flush_interval"): heartbeat_flush_interval,
+            }
+        ):
+            self.job_runner = SchedulerJobRunner(scheduler_job, executors=[MockExecutor(do_update=False)])
+
+        ti = dag_run.get_task_instance(task_id="test_task")
+        ti.state = TaskInstanceState.RUNNING
+        ti.queued_by_job_id = scheduler_job.id
+        ti.last_heartbeat_at = timezone.utcnow() - timedelta(seconds=360)
+        session.merge(ti)
+        session.commit()
+
+        found = self.job_runner._find_task_instances_without_heartbeats(session=session)
+        assert [found_ti.id for found_ti in found] == ([ti.id] if timed_out else [])
+
     @pytest.mark.parametrize(
         ("retries", "callback_kind", "expected"),
         [
@@ -55,14 +55,17 @@ from airflow.executors.workloads.trigger import RunTrigger
 from airflow.jobs.job import Job
 from airflow.jobs.triggerer_job_runner import (
     _USER_ACTION_CANCEL_MSG,
+    ShardedTriggerRunnerSupervisor,
     ToTriggerRunner,
     ToTriggerSupervisor,
+    TriggerChangeListener,
     TriggerCommsDecoder,
     TriggererJobRunner,
     TriggerEventEntry,
     TriggerLoggingFactory,
     TriggerRunner,
     TriggerRunnerSupervisor,
+    _HashRing,
     _make_trigger_span,
     messages,
 )
@@ -99,7 +102,7 @@ from airflow.sdk.execution_time.comms import (
 )
 from airflow.sdk.execution_time.context import AssetStateStoreAccessors
 from airflow.serialization.serialized_objects import LazyDeserializedDAG
-from airflow.triggers.base import BaseEventTrigger, BaseTrigger, TriggerEvent
+from airflow.triggers.base import BaseEventTrigger, BaseTrigger, TaskSuccessEvent, TriggerEvent
 from airflow.triggers.shared_stream import SharedStreamProducer
 from airflow.triggers.testing import FailureTrigger, SuccessTrigger
 from airflow.utils.state import State, TaskInstanceState
@@ -1777,6 +1780,79 @@ class TestTriggerRunner:
         runner.triggers[trigger_orm.id]["task"].cancel()
         await runner.cleanup_finished_triggers()
 
+    @pytest.mark.asyncio
+    @patch("airflow.jobs.triggerer_job_runner.Trigger._decrypt_kwargs", return_value={})
+    async def test_create_triggers_puts_time_triggers_in_the_timer_queue(self, mock_decrypt_kwargs):
+        moment = timezone.utcnow() + datetime.timedelta(hours=1)
+        runner = TriggerRunner()
+        runner.trigger_cache = {"time": DateTimeTrigger, "success": SuccessTrigger}
+        mock_decrypt_kwargs.side_effect = [{"moment": moment}, {}]
+        runner.to_create.extend(
+            workloads.RunTrigger.model_construct(id=trigger_id, classpath=classpath, encrypted_kwargs="")
+            for trigger_id, classpath in ((1, "time"), (2, "success"))
+        )
+
+        await runner.create_triggers()
+
+        assert not isinstance(runner.triggers[1]["task"], asyncio.Task)
+        assert [(timer.trigger_id, timer.fires_at) for timer in runner.timers] == [(1, moment.timestamp())]
+        assert isinstance(runner.triggers[2]["task"], asyncio.Task)
+        await runner.triggers[2]["task"]
+
+    @pytest.mark.asyncio
+    async def test_run_timers_fires_the_due_triggers(self):
+        now = timezone.utcnow()
+        runner = TriggerRunner()
+        moments = {
+            1: now - datetime.timedelta(minutes=1),
+            2: now + datetime.timedelta(hours=1),
+            3: now - datetime.timedelta(seconds=1),
+        }
+        for trigger_id, moment in moments.items():
+            trigger = DateTimeTrigger(moment, end_from_trigger=trigger_id == 3)
+            runner.triggers[trigger_id] = {
+                "task": runner.start_timer(trigger_id, trigger, moment),
+                "is_watcher": False,
+                "name": f"ID {trigger_id}",
+                "events": 0,
+            }
+
+        timers = asyncio.create_task(runner.run_timers())
+        await asyncio.sleep(0.1)
+        timers.cancel()
+
+        assert [(entry.trigger_id, entry.event) for entry in runner.events] == [
+            (1, TriggerEvent(moments[1])),
+            (3, TaskSuccessEvent()),
+        ]
+        assert await runner.cleanup_finished_triggers() == [1, 3]
+        assert not runner.failed_triggers
+        assert list(runner.triggers) == [2]
+        assert [timer.trigger_id for timer in runner.timers] == [2]
+
+    @pytest.mark.asyncio
+    async def test_run_timers_drops_cancelled_timers(self):
+        moment = timezone.utcnow() + datetime.timedelta(hours=1)
+        runner = TriggerRunner()
+        for trigger_id in range(3):
+            runner.triggers[trigger_id] = {
+                "task": runner.start_timer(trigger_id, DateTimeTrigger(moment), moment),
+                "is_watcher": False,
+                "name": f"ID {trigger_id}",
+                "events": 0,
+            }
+        runner.to_cancel.extend([0, 1])
+
+        await runner.cancel_triggers()
+        timers = asyncio.create_task(runner.run_timers())
+        await asyncio.sleep(0.1)
+        timers.cancel()
+
+        assert [timer.trigger_id for timer in runner.timers] == [2]
+        assert await runner.cleanup_finished_triggers() == [0, 1]
+        assert not runner.events
+        assert not runner.failed_triggers
+
     @pytest.mark.asyncio
     @patch("airflow.sdk.execution_time.task_runner.SUPERVISOR_COMMS", create=True)
     async def test_sync_state_to_supervisor(self, supervisor_builder):
@@ -2470,6 +2546,33 @@ def test_update_triggers_prevents_duplicate_creation_queue_entries(session, supe
     assert not any(trigger_id == trigger_orm.id for trigger_id, _ in supervisor.failed_triggers)
 
 
+def test_update_triggers_wakes_the_runner_up_once_until_it_checks_in(session, supervisor_builder, mocker):
+    trigger = TimeDeltaTrigger(datetime.timedelta(days=7))
+    _, _, trigger_orm, _ = create_trigger_in_db(session, trigger)
+    supervisor = supervisor_builder()
+
+    def wake_ups():
+        return sum(b"WakeUp" in call.args[0] for call in supervisor.stdin.sendall.call_args_list)
+
+    supervisor.update_triggers({trigger_orm.id})
+    assert wake_ups() == 1
+
+    # Not again before it checked in, however much there is to do
+    supervisor.update_triggers(set())
+    assert wake_ups() == 1
+
+    supervisor._handle_request(messages.TriggerStateChanges(), log=mocker.Mock(), req_id=1)
+    assert supervisor.running_triggers == {trigger_orm.id}
+
+    # Nothing to do
+    supervisor.update_triggers({trigger_orm.id})
+    assert wake_ups() == 1
+
+    supervisor.update_triggers(set())
+    assert supervisor.cancelling_triggers == {trigger_orm.id}
+    assert wake_ups() == 2
+
+
 def test_update_triggers_delegates_workload_creation(supervisor_builder, mocker):
     supervisor = supervisor_builder()
     supervisor.running_triggers = {1, 3}
@@ -2611,6 +2714,272 @@ def test_update_triggers_skips_when_ti_has_no_dag_version(session, supervisor_bu
     supervisor.stdin.write.assert_not_called()
 
 
+def test_hash_ring_moves_only_the_keys_of_a_removed_node():
+    ring = _HashRing()
+    for node in range(4):
+        ring.add(node)
+    keys = [str(i) for i in range(2000)]
+    before = {key: ring.get(key) for key in keys}
+    # Spread roughly evenly
+    assert all(300 < list(before.values()).count(node) < 700 for node in range(4))
+
+    ring.remove(2)
+
+    after = {key: ring.get(key) for key in keys}
+    assert {key for key in keys if before[key] != after[key]} == {key for key in keys if before[key] == 2}
+
+
+class TestTriggerChangeListener:
+    @pytest.fixture
+    def monotonic(self, mocker):
+        return mocker.patch("airflow.jobs.triggerer_job_runner.time.monotonic", return_value=100.0)
+
+    @pytest.fixture
+    def postgres_engine(self, mocker):
+        engine = mocker.patch("airflow.jobs.triggerer_job_runner.settings.engine")
+        engine.dialect.name = "postgresql"
+        engine.raw_connection.return_value.driver_connection.fileno.return_value = 42
+        return engine
+
+    def test_looks_for_triggers_on_every_loop_when_not_listening(self, monotonic):
+        listener = TriggerChangeListener(poll_interval=10)
+        selector = mock.Mock(spec=selectors.DefaultSelector)
+
+        # The tests don't run against Postgres, which is the only database supporting it
+        listener.listen(selector)
+
+        assert not listener.listening
+        selector.register.assert_not_called()
+        assert listener.should_load_triggers()
+        assert listener.should_load_triggers()
+
+    def test_listen(self, postgres_engine):
+        listener = TriggerChangeListener(poll_interval=10)
+        selector = mock.Mock(spec=selectors.DefaultSelector)
+
+        listener.listen(selector)
+
+        connection = postgres_engine.raw_connection.return_value
+        connection.detach.assert_called_once()
+        assert connection.driver_connection.autocommit is True
+        connection.driver_connection.cursor.return_value.execute.assert_called_once_with(
+            "LISTEN airflow_trigger_changes"
+        )
+        selector.register.assert_called_once_with(listener, selectors.EVENT_READ, mock.ANY)
+        assert listener.listening
+        assert listener.fileno() == 42
+
+        listener.close()
+
+        selector.unregister.assert_called_once_with(listener)
+        connection.close.assert_called_once()
+        assert not listener.listening
+
+    @conf_vars({("triggerer", "listen_for_trigger_changes"): "False"})
+    def test_listen_disabled(self, postgres_engine):
+        listener = TriggerChangeListener(poll_interval=10)
+
+        listener.listen(mock.Mock(spec=selectors.DefaultSelector))
+
+        assert not listener.listening
+        postgres_engine.raw_connection.assert_not_called()
+
+    @pytest.mark.parametrize("driver", ["psycopg2", "psycopg"])
+    def test_looks_for_triggers_when_notified_or_every_poll_interval(
+        self, postgres_engine, monotonic, driver
+    ):
+        listener = TriggerChangeListener(poll_interval=10)
+        selector = mock.Mock(spec=selectors.DefaultSelector)
+        listener.listen(selector)
+        _, _, (read_notifications, _) = selector.register.call_args.args
+        dbapi_connection = postgres_engine.raw_connection.return_value.driver_connection
+
+        def notify():
+            if driver == "psycopg2":
+                dbapi_connection.notifies = [mock.Mock()]
+            else:
+                dbapi_connection.notifies = mock.Mock(return_value=iter([mock.Mock()]))
+            assert read_notifications(listener)
+
+        assert listener.should_load_triggers()
+        assert not listener.should_load_triggers()
+
+        notify()
+        assert listener.should_load_triggers()
+        assert not listener.should_load_triggers()
+
+        monotonic.return_value += 10
+        assert listener.should_load_triggers()
+        assert not listener.should_load_triggers()
+
+    def test_looks_for_triggers_on_every_loop_once_the_connection_is_lost(self, postgres_engine, monotonic):
+        listener = TriggerChangeListener(poll_interval=10)
+        selector = mock.Mock(spec=selectors.DefaultSelector)
+        listener.listen(selector)
+        key = selectors.SelectorKey(listener, 42, selectors.EVENT_READ, selector.register.call_args.args[2])
+        dbapi_connection = postgres_engine.raw_connection.return_value.driver_connection
+        dbapi_connection.notifies = []
+        dbapi_connection.poll.side_effect = OSError("server closed the connection unexpectedly")
+        listener.should_load_triggers()
+
+        assert not supervisor.WatchedSubprocess._handle_socket_event(key)
+
+        selector.unregister.assert_called_once_with(listener)
+        assert not listener.listening
+        assert listener.should_load_triggers()
+        assert listener.should_load_triggers()
+
+
+class TestShardedTriggerRunnerSupervisor:
+    @pytest.fixture
+    def sharded(self, supervisor_builder, session):
+        job = Job()
+        session.add(job)
+        session.flush()
+        sharded = ShardedTriggerRunnerSupervisor(job=job, capacity=30)
+        for index in range(3):
+            runner = supervisor_builder(job=job)
+            runner.logger_cache = sharded.logger_cache
+            sharded.runners[index] = runner
+            sharded._all_runners.append(runner)
+            sharded._ring.add(index)
+        return sharded
+
+    @staticmethod
+    def _creating(sharded):
+        return {index: {w.id for w in runner.creating_triggers} for index, runner in sharded.runners.items()}
+
+    def test_update_triggers_spreads_new_triggers(self, sharded, mocker):
+        task_workloads = [
+            workloads.RunTrigger.model_construct(
+                id=i, classpath="some.trigger", encrypted_kwargs="", ti=mock.Mock()
+            )
+            for i in range(60)
+        ]
+        watcher_workloads = [
+            workloads.RunTrigger(id=i, classpath="some.watcher", encrypted_kwargs="", ti=None)
+            for i in range(100, 110)
+        ]
+        mocker.patch.object(
+            TriggerRunnerSupervisor,
+            "build_trigger_workloads",
+            return_value=task_workloads + watcher_workloads,
+        )
+
+        sharded.update_triggers(set(range(60)) | set(range(100, 110)))
+
+        creating = self._creating(sharded)
+        assert set().union(*creating.values()) == set(range(60)) | set(range(100, 110))
+        # Spread over all the runners, but the triggers of the same class not deferring a task together
+        assert all(creating.values())
+        assert sum(set(range(100, 110)) <= ids for ids in creating.values()) == 1
+
+    def test_update_triggers_cancels_in_the_runner_running_it(self, sharded, mocker):
+        build_trigger_workloads = mocker.patch.object(TriggerRunnerSupervisor, "build_trigger_workloads")
+        sharded.runners[0].running_triggers = {1, 2}
+        sharded.runners[1].running_triggers = {3}
+
+        sharded.update_triggers({1, 3})
+
+        assert sharded.runners[0].cancelling_triggers == {2}
+        assert not sharded.runners[1].cancelling_triggers
+        assert not sharded.runners[2].cancelling_triggers
+        build_trigger_workloads.assert_not_called()
+        # Only the runner with something to do is woken up
+        assert [runner._runner_woken for runner in sharded.runners.values()] == [True, False, False]
+
+    def test_dead_runner_triggers_move_to_other_runners(self, sharded, mocker):
+        dead = sharded.runners[1]
+        dead.running_triggers = {1, 2}
+        sharded.runners[0].running_triggers = {3}
+        factory = mock.Mock(spec=TriggerLoggingFactory)
+        sharded.logger_cache[1] = factory
+        dead._exit_code = -9
+        mocker.patch.object(
+            TriggerRunnerSupervisor,
+            "_check_subprocess_exit",
+            autospec=True,
+            side_effect=lambda runner: runner._exit_code,
+        )
+
+        assert sharded._check_runners_alive() is True
+
+        assert set(sharded.runners) == {0, 2}
+        assert sharded._dead_runners == [dead]
+        factory.close.assert_called_once()
+        assert 1 not in sharded.logger_cache
+        assert sharded._exit_code == -9
+
+        mocker.patch.object(
+            TriggerRunnerSupervisor,
+            "build_trigger_workloads",
+            return_value=[
+                workloads.RunTrigger.model_construct(
+                    id=i, classpath="some.trigger", encrypted_kwargs="", ti=mock.Mock()
+                )
+                for i in (1, 2)
+            ],
+        )
+        sharded.update_triggers({1, 2, 3})
+
+        assert set().union(*self._creating(sharded).values()) == {1, 2}
+
+    def test_run_stops_once_all_runners_died(self, sharded, mocker):
+        run_once = mocker.patch.object(ShardedTriggerRunnerSupervisor, "run_once", autospec=True)
+        sharded.runners.clear()
+
+        sharded.run()
+
+        run_once.assert_not_called()
+
+    def test_heartbeat_skipped_when_a_runner_is_silent(self, sharded, mocker):
+        perform_heartbeat = mocker.patch("airflow.jobs.triggerer_job_runner.perform_heartbeat")
+        for runner in sharded.runners.values():
+            runner._last_runner_comms = time.monotonic()
+
+        sharded.heartbeat()
+        assert perform_heartbeat.call_count == 1
+
+        sharded.runners[2]._last_runner_comms = time.monotonic() - 9999.0
+        sharded.heartbeat()
+        assert perform_heartbeat.call_count == 1
+        assert sharded.runners[2]._runner_comms_silence_logged is True
+
+    def test_emit_metrics_per_runner(self, sharded, mocker):
+        gauge = mocker.patch("airflow.jobs.triggerer_job_runner.stats.gauge")
+        sharded.runners[0].running_triggers = {1, 2}
+        sharded.runners[2].running_triggers = {3}
+
+        sharded.emit_metrics()
+
+        tags = {"hostname": sharded.job.hostname}
+        gauge.assert_any_call("triggers.running", 3, tags=tags)
+        gauge.assert_any_call("triggerer.capacity_left", 27, tags=tags)
+        gauge.assert_any_call("triggerer.runner.triggers_running", 2, tags={**tags, "runner": "0"})
+        gauge.assert_any_call("triggerer.runner.triggers_running", 0, tags={**tags, "runner": "1"})
+        gauge.assert_any_call("triggerer.runner.triggers_running", 1, tags={**tags, "runner": "2"})
+
+    def test_kill_signals_all_runners_first(self, sharded, mocker):
+        calls = []
+        index = {id(runner): i for i, runner in sharded.runners.items()}
+        mocker.patch.object(
+            TriggerRunnerSupervisor,
+            "_signal_subprocess",
+            autospec=True,
+            side_effect=lambda runner, sig: calls.append(index[id(runner)]),
+        )
+        mocker.patch.object(
+            TriggerRunnerSupervisor,
+            "kill",
+            autospec=True,
+            side_effect=lambda runner, *args, **kwargs: calls.append(f"kill {index[id(runner)]}"),
+        )
+
+        sharded.kill(escalation_delay=10, force=True)
+
+        assert calls == [0, 1, 2, "kill 0", "kill 1", "kill 2"]
+
+
 class TestTriggererJobRunner:
     @patch("airflow.jobs.triggerer_job_runner.stats.initialize")
     @patch.object(TriggerRunnerSupervisor, "start")
@@ -2674,6 +3043,32 @@ class TestTriggererJobRunner:
         # Verify env var is restored after _execute() returns.
         assert os.environ.get("_AIRFLOW_PROCESS_CONTEXT") is None
 
+    @pytest.mark.parametrize(
+        ("runner_processes", "supervisor_class"),
+        [
+            pytest.param("1", TriggerRunnerSupervisor, id="single"),
+            pytest.param("3", ShardedTriggerRunnerSupervisor, id="sharded"),
+        ],
+    )
+    def test_execute_starts_runner_processes(self, runner_processes, supervisor_class, session):
+        job = Job()
+        session.add(job)
+        session.flush()
+        with conf_vars({("triggerer", "runner_processes"): runner_processes}):
+            job_runner = TriggererJobRunner(job)
+
+        with (
+            patch.object(supervisor_class, "start") as start,
+            patch.object(job_runner, "register_signals"),
+            patch("airflow.jobs.triggerer_job_runner.stats.initialize"),
+        ):
+            start.return_value._exit_code = 0
+            job_runner._execute()
+
+        start.assert_called_once()
+        if supervisor_class is ShardedTriggerRunnerSupervisor:
+            assert start.call_args.kwargs["runner_processes"] == 3
+
     def test_trigger_runner_sets_client_process_context(self, monkeypatch):
         """TriggerRunner.run() marks subprocess as client context to prevent inheriting server privileges."""
         captured_context = {}
@@ -3049,6 +3444,19 @@ async def test_unknown_frame_id_doesnt_crash_reader(decoder_pair):
     assert not decoder._reader_task.done(), "reader loop crashed unexpectedly"
 
 
+@pytest.mark.asyncio
+async def test_wake_up_frame_calls_on_wake_up(decoder_pair):
+    """A WakeUp frame, which answers no request, is handed to ``on_wake_up``; the reader stays alive."""
+    decoder, server_sock = decoder_pair
+    woken_up = asyncio.Event()
+    decoder._on_wake_up = woken_up.set
+
+    server_sock.sendall(_ResponseFrame(id=0, body=messages.WakeUp().model_dump()).as_bytes())
+
+    await asyncio.wait_for(woken_up.wait(), timeout=5)
+    assert not decoder._reader_task.done()
+
+
 def test_trigger_state_messages_round_trip_with_seqs():
     """Event triples and persist confirmations survive the wire encode/decode."""
     changes_adapter = TypeAdapter(ToTriggerSupervisor)
@@ -3076,13 +3484,11 @@ def test_handle_events_records_persist_confirmations(jobless_supervisor):
     jobless_supervisor.events.append(TriggerEventEntry(1, event_with_seq, 7))
     jobless_supervisor.events.append(TriggerEventEntry(2, event_without_seq, None))
 
-    with mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True) as mock_event:
+    with mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True) as mock_events:
         jobless_supervisor.handle_events()
 
-    assert mock_event.mock_calls == [
-        mock.call(jobless_supervisor, trigger_id=1, event=event_with_seq),
-        mock.call(jobless_supervisor, trigger_id=2, event=event_without_seq),
-    ]
+    # All the events are submitted together, in order
+    mock_events.assert_called_once_with(jobless_supervisor, [(1, event_with_seq), (2, event_without_seq)])
     assert list(jobless_supervisor.persisted_event_seqs) == [7]
     assert len(jobless_supervisor.events) == 0
 
@@ -3091,16 +3497,60 @@ def test_handle_events_does_not_confirm_seq_when_persist_fails(jobless_superviso
     """A seq whose event failed to persist is never confirmed, so the broker advance fails out."""
     jobless_supervisor.events.append(TriggerEventEntry(1, TriggerEvent(True), 7))
 
-    with mock.patch.object(
-        TriggerRunnerSupervisor,
-        "on_trigger_event",
-        autospec=True,
-        side_effect=RuntimeError("db down"),
+    with (
+        mock.patch.object(
+            TriggerRunnerSupervisor, "on_trigger_events", autospec=True, side_effect=RuntimeError("db down")
+        ),
+        mock.patch.object(
+            TriggerRunnerSupervisor, "on_trigger_event", autospec=True, side_effect=RuntimeError("db down")
+        ),
     ):
         with pytest.raises(RuntimeError, match="db down"):
             jobless_supervisor.handle_events()
 
     assert list(jobless_supervisor.persisted_event_seqs) == []
+    # Kept to be persisted on the next loop
+    assert [entry.persist_seq for entry in jobless_supervisor.events] == [7]
+
+
+def test_handle_events_falls_back_to_one_by_one_when_batch_fails(jobless_supervisor):
+    """When the events can't be persisted together, those persisted one by one are confirmed."""
+    events = [TriggerEvent(i) for i in range(3)]
+    jobless_supervisor.events.extend(
+        TriggerEventEntry(trigger_id, event, seq)
+        for trigger_id, event, seq in zip([1, 2, 3], events, [7, 8, 9])
+    )
+
+    def submit_event(self, trigger_id, event):
+        if trigger_id == 2:
+            raise RuntimeError("bad event")
+
+    with (
+        mock.patch.object(
+            TriggerRunnerSupervisor, "on_trigger_events", autospec=True, side_effect=RuntimeError("bad event")
+        ) as mock_events,
+        mock.patch.object(
+            TriggerRunnerSupervisor, "on_trigger_event", autospec=True, side_effect=submit_event
+        ) as mock_event,
+    ):
+        with pytest.raises(RuntimeError, match="bad event"):
+            jobless_supervisor.handle_events()
+        mock_events.assert_called_once_with(
+            jobless_supervisor, [(1, events[0]), (2, events[1]), (3, events[2])]
+        )
+        assert mock_event.mock_calls == [
+            mock.call(jobless_supervisor, trigger_id=1, event=events[0]),
+            mock.call(jobless_supervisor, trigger_id=2, event=events[1]),
+        ]
+        assert list(jobless_supervisor.persisted_event_seqs) == [7]
+        assert [entry.persist_seq for entry in jobless_supervisor.events] == [8, 9]
+
+        # Once the failing event can be persisted, the next loop persists it and the one after it
+        mock_event.side_effect = None
+        jobless_supervisor.handle_events()
+
+    assert list(jobless_supervisor.persisted_event_seqs) == [7, 8, 9]
+    assert len(jobless_supervisor.events) == 0
 
 
 @pytest.mark.parametrize(
@@ -3121,7 +3571,7 @@ def test_handle_events_emits_team_name(jobless_supervisor, team_name, expected_t
     )
 
     with (
-        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_event", autospec=True),
+        mock.patch.object(TriggerRunnerSupervisor, "on_trigger_events", autospec=True),
         mock.patch("airflow.jobs.triggerer_job_runner.stats.incr") as mock_incr,
     ):
         jobless_supervisor.handle_events()
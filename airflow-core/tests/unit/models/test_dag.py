@@ -2782,6 +2782,72 @@ class TestDagModel:
             query, _ = DagModel.dags_needing_dagruns(session)
             query.all()
 
+    def test_dags_needing_dagruns_reads_the_asset_condition_once_per_dag_version(self, dag_maker, session):
+        assets = [Asset(uri=f"test://asset{i}", group="test-group") for i in range(2)]
+        with dag_maker(session=session, dag_id="my_dag", schedule=assets, start_date=pendulum.now()):
+            EmptyOperator(task_id="dummy")
+        asset_model = dag_maker.dag_model.schedule_assets[0]
+        event = AssetEvent(asset_id=asset_model.id, timestamp=timezone.utcnow())
+        session.add(event)
+        session.flush()
+        session.add(
+            AssetDagRunQueue(asset_id=asset_model.id, target_dag_id="my_dag", asset_event_id=event.id)
+        )
+        session.flush()
+
+        with mock.patch.object(
+            SerializedDagModel,
+            "get_latest_serialized_dags",
+            autospec=True,
+            side_effect=SerializedDagModel.get_latest_serialized_dags,
+        ) as get_latest_serialized_dags:
+            for _ in range(2):
+                query, _ = DagModel.dags_needing_dagruns(session)
+                assert query.all() == []
+
+        assert [call.kwargs["dag_ids"] for call in get_latest_serialized_dags.mock_calls] == [["my_dag"], []]
+
+    def test_dags_needing_dagruns_uses_the_asset_condition_of_a_dag_version_updated_in_place(
+        self, dag_maker, session
+    ):
+        asset_a = Asset(uri="test://asset_a", group="test-group")
+        asset_b = Asset(uri="test://asset_b", group="test-group")
+        with dag_maker(
+            session=session, dag_id="my_dag", schedule=asset_a & asset_b, start_date=pendulum.now()
+        ):
+            EmptyOperator(task_id="dummy")
+        dag_version_id = dag_maker.dag_model.dag_versions[0].id
+        asset_model = next(a for a in dag_maker.dag_model.schedule_assets if a.uri == asset_a.uri)
+        event = AssetEvent(asset_id=asset_model.id, timestamp=timezone.utcnow())
+        session.add(event)
+        session.flush()
+        session.add(
+            AssetDagRunQueue(asset_id=asset_model.id, target_dag_id="my_dag", asset_event_id=event.id)
+        )
+        session.flush()
+
+        query, _ = DagModel.dags_needing_dagruns(session)
+        assert query.all() == []
+
+        # Without task instances, the Dag version is rewritten in place when the schedule changes
+        with DAG("my_dag", schedule=asset_a | asset_b, start_date=pendulum.now()) as changed_dag:
+            EmptyOperator(task_id="dummy")
+        SerializedDagModel.write_dag(
+            LazyDeserializedDAG.from_dag(changed_dag),
+            bundle_name=dag_maker.dag_model.bundle_name,
+            session=session,
+        )
+        # As the scheduler would see it, from another process
+        session.flush()
+        session.expunge_all()
+        dag_version, _ = SerializedDagModel.get_latest_dag_versions(dag_ids=["my_dag"], session=session)[
+            "my_dag"
+        ]
+        assert dag_version == dag_version_id
+
+        query, _ = DagModel.dags_needing_dagruns(session)
+        assert [dag_model.dag_id for dag_model in query.all()] == ["my_dag"]
+
     def test_dags_needing_dagruns_asset_aliases(self, dag_maker, session):
         # link asset_alias hello_alias to asset hello
         asset_model = AssetModel(uri="hello")
@@ -24,10 +24,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 import time_machine
 from cachetools import LRUCache, TTLCache
+from sqlalchemy import select
 
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
-from airflow.models.dagbag import CachedDBDagBag, DBDagBag, _CacheEntry
+from airflow.models.dagbag import CachedDBDagBag, DBDagBag, _CacheEntry, _DagCache
 from airflow.models.dagbundle import DagBundleModel
 from airflow.models.serialized_dag import SerializedDagModel
 from airflow.providers.standard.operators.empty import EmptyOperator
@@ -36,12 +37,20 @@ from airflow.serialization.serialized_objects import LazyDeserializedDAG, Serial
 from airflow.utils.session import create_session
 
 from tests_common.test_utils import db
+from tests_common.test_utils.dag import create_scheduler_dag
 
 pytestmark = pytest.mark.db_test
 
 STATS_PATH = "airflow.models.dagbag.stats"
 
-CACHE_METRIC_SUFFIXES = ("cache_hit", "cache_miss", "cache_clear", "cache_size")
+CACHE_METRIC_SUFFIXES = (
+    "cache_hit",
+    "cache_miss",
+    "cache_clear",
+    "cache_eviction",
+    "cache_size",
+    "cache_bytes",
+)
 
 # Every namespace a component can report under. CachedDBDagBag builds names from the prefix each
 # component passes in, so the shared plumbing is exercised once per component.
@@ -87,6 +96,33 @@ class TestDBDagBag:
         assert (entry.dag, entry.dag_hash) == (mock_dag, "hash1")
         assert mock_serdag.load_op_links is True
 
+    def test__read_dag_builds_topology(self):
+        """It should build the topology index before the DAG is cached."""
+        with DAG("dag_with_topology") as dag:
+            EmptyOperator(task_id="task")
+        scheduler_dag = create_scheduler_dag(dag)
+        mock_serdag = MagicMock(spec=SerializedDagModel)
+        mock_serdag.dag = scheduler_dag
+        mock_serdag.dag_version_id = "v1"
+        mock_serdag.dag_hash = "hash1"
+
+        self.db_dag_bag._read_dag(mock_serdag)
+
+        assert "topology" in vars(scheduler_dag)
+        assert scheduler_dag.topology.leaf_task_ids == {"task"}
+
+    def test__read_dag_lazy_load_tasks(self, dag_maker, session):
+        """It should load the tasks of the DAG lazily, and not build the topology index up front."""
+        with dag_maker("dag_lazy"):
+            EmptyOperator(task_id="task1") >> EmptyOperator(task_id="task2")
+        serdag = session.scalar(select(SerializedDagModel).where(SerializedDagModel.dag_id == "dag_lazy"))
+
+        dag = DBDagBag(lazy_load_tasks=True)._read_dag(serdag)
+
+        assert "topology" not in vars(dag)
+        assert not isinstance(dag.task_dict, dict)
+        assert dag.get_task("task2").upstream_task_ids == {"task1"}
+
     def test__read_dag_returns_none_when_no_dag(self):
         """It should return None and not modify _dags when no DAG is present."""
         mock_serdag = MagicMock(spec=SerializedDagModel)
@@ -375,6 +411,82 @@ class TestDBDagBagCache:
         assert dag_bag._dags.get("version_2") is not None
         assert dag_bag._dags.get("version_3") is not None
 
+    def test_size_bounded_cache_selection(self):
+        dag_bag = CachedDBDagBag(
+            cache_size=10, cache_ttl=60, stats_prefix=STUB_PREFIX, cache_max_bytes=1000, cache_idle_ttl=30
+        )
+        assert isinstance(dag_bag._dags, _DagCache)
+        assert dag_bag._dags.maxsize == 1000
+        assert dag_bag._dags.max_entries == 10
+        assert dag_bag._dags.ttl == 60
+        assert dag_bag._dags.idle_ttl == 30
+
+    def test_size_bounded_eviction(self):
+        """The least recently used entries are evicted to keep the estimated size under the bound."""
+        evictions = []
+        cache = _DagCache(max_bytes=100, on_evict=lambda: evictions.append(1))
+
+        cache["version_1"] = _CacheEntry(MagicMock(), "hash", 0, size=40)
+        cache["version_2"] = _CacheEntry(MagicMock(), "hash", 0, size=40)
+        assert cache.get("version_1") is not None
+        cache["version_3"] = _CacheEntry(MagicMock(), "hash", 0, size=40)
+
+        assert set(cache) == {"version_1", "version_3"}
+        assert cache.currsize == 80
+        assert len(evictions) == 1
+
+        # A Dag larger than the whole budget is not cached, and does not evict anything.
+        cache["version_4"] = _CacheEntry(MagicMock(), "hash", 0, size=101)
+        assert set(cache) == {"version_1", "version_3"}
+        assert len(evictions) == 2
+
+    def test_size_bounded_cache_limits_entries(self):
+        cache = _DagCache(max_entries=2, max_bytes=1000)
+        for i in range(3):
+            cache[f"version_{i}"] = _CacheEntry(MagicMock(), "hash", 0, size=1)
+        assert set(cache) == {"version_1", "version_2"}
+
+    def test_idle_ttl_expiry(self):
+        """Entries expire once not read for the idle TTL, however recently they were stored."""
+        now = 0.0
+        evictions = []
+        cache = _DagCache(ttl=100, idle_ttl=10, timer=lambda: now, on_evict=lambda: evictions.append(1))
+
+        cache["read"] = _CacheEntry(MagicMock(), "hash", 0)
+        cache["idle"] = _CacheEntry(MagicMock(), "hash", 0)
+        now = 8
+        assert cache.get("read") is not None
+        now = 12
+        assert cache.get("idle") is None
+        assert cache.get("read") is not None
+        assert len(evictions) == 1
+
+        # Reads do not extend the TTL from the time the entry was stored.
+        now = 100
+        assert cache.get("read") is None
+        assert len(evictions) == 2
+
+    def test_size_bounded_cache_metrics(self):
+        """_read_dag measures the serialized Dag, and evictions and sizes are reported."""
+        dag_bag = CachedDBDagBag(cache_size=0, cache_ttl=0, stats_prefix=STUB_PREFIX, cache_max_bytes=150)
+
+        def make_serdag(version_id):
+            serdag = MagicMock()
+            serdag.dag = MagicMock()
+            serdag.dag_version_id = version_id
+            serdag.data_size = 100
+            return serdag
+
+        with patch(STATS_PATH) as mock_stats:
+            dag_bag._read_dag(make_serdag("version_1"))
+            dag_bag._read_dag(make_serdag("version_2"))
+            dag_bag._on_cache_size()
+
+        assert list(dag_bag._dags) == ["version_2"]
+        mock_stats.incr.assert_called_once_with(f"{STUB_PREFIX}.cache_eviction")
+        mock_stats.gauge.assert_any_call(f"{STUB_PREFIX}.cache_size", 1, rate=1.0)
+        mock_stats.gauge.assert_any_call(f"{STUB_PREFIX}.cache_bytes", 100, rate=1.0)
+
     def test_thread_safety_with_caching(self):
         """Test concurrent access doesn't cause race conditions with caching enabled."""
         dag_bag = _stub_dag_bag(cache_size=100, cache_ttl=60)
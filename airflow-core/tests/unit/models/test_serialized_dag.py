@@ -21,16 +21,19 @@ from __future__ import annotations
 
 import copy
 import logging
+import operator
 from datetime import timedelta
 from unittest import mock
 
 import pendulum
 import pytest
+from cachetools import LRUCache
 from sqlalchemy import delete, func, select, update
 
 import airflow.example_dags as example_dags_module
 from airflow._shared.observability.metrics.base_stats_logger import StatsLogger
 from airflow.dag_processing.dagbag import DagBag
+from airflow.exceptions import AirflowConfigException
 from airflow.models.asset import AssetActive, AssetAliasModel, AssetModel
 from airflow.models.dag import DagModel
 from airflow.models.dag_version import DagVersion
@@ -129,6 +132,67 @@ class TestSerializedDagModel:
                 # Verifies JSON schema.
                 DagSerialization.validate_schema(result.data)
 
+    def test_data_size(self, dag_maker, session):
+        """The size of the serialized Dag is the same whether read back compressed or not."""
+        with dag_maker("dag_size"):
+            EmptyOperator(task_id="task1")
+        written_size = SDM(LazyDeserializedDAG.from_dag(dag_maker.dag)).data_size
+        session.expunge_all()
+
+        result = session.scalar(select(SDM).where(SDM.dag_id == "dag_size"))
+        expected = len(json.dumps(result.data, sort_keys=True).encode("utf-8"))
+        # The length is measured by the database, rather than by dumping the data again.
+        with mock.patch("airflow.models.serialized_dag.json.dumps") as dumps:
+            assert result.data_size == written_size == expected
+        dumps.assert_not_called()
+
+    def test_lazy_load_tasks(self, dag_maker, session):
+        with dag_maker("dag_lazy"):
+            EmptyOperator(task_id="task1") >> EmptyOperator(task_id="task2")
+        sdm = session.scalar(select(SDM).where(SDM.dag_id == "dag_lazy"))
+
+        sdm.lazy_load_tasks = True
+        dag = sdm.dag
+        assert not isinstance(dag.task_dict, dict)
+        assert dag.get_task("task2").upstream_task_ids == {"task1"}
+
+    @pytest.mark.parametrize(("write_format", "read_format"), [("json", "msgpack"), ("msgpack", "json")])
+    def test_compressed_formats(self, dag_maker, session, monkeypatch, write_format, read_format):
+        """Rows compressed in any format are read back, whatever the format currently set."""
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", True)
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESSED_SERIALIZED_DAGS_FORMAT", write_format)
+        with dag_maker("dag_compressed", params={"threshold": float("nan")}):
+            BashOperator(task_id="task1", bash_command="echo 1") >> EmptyOperator(task_id="task2")
+        written = SDM(LazyDeserializedDAG.from_dag(dag_maker.dag))
+        session.expunge_all()
+
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESSED_SERIALIZED_DAGS_FORMAT", read_format)
+        result = session.scalar(select(SDM).where(SDM.dag_id == "dag_compressed"))
+        assert result._data is None
+        assert json.dumps(result.data, sort_keys=True) == json.dumps(written.data, sort_keys=True)
+        assert result.data_size == written.data_size
+        assert result.dag.get_task("task2").upstream_task_ids == {"task1"}
+
+    def test_compressed_format_msgpack_is_smaller(self, dag_maker, monkeypatch):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", True)
+        with dag_maker("dag_compressed", serialized=True):
+            EmptyOperator(task_id="task1")
+        sizes = {}
+        for compressed_format in ("json", "msgpack"):
+            monkeypatch.setattr(
+                "airflow.models.serialized_dag._COMPRESSED_SERIALIZED_DAGS_FORMAT", compressed_format
+            )
+            sizes[compressed_format] = len(SDM(LazyDeserializedDAG.from_dag(dag_maker.dag))._data_compressed)
+        assert sizes["msgpack"] < sizes["json"]
+
+    def test_invalid_compressed_format(self, monkeypatch):
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESS_SERIALIZED_DAGS", True)
+        monkeypatch.setattr("airflow.models.serialized_dag._COMPRESSED_SERIALIZED_DAGS_FORMAT", "yaml")
+        with DAG("dag_compressed", schedule=None) as dag:
+            EmptyOperator(task_id="task1")
+        with pytest.raises(AirflowConfigException, match="compressed_serialized_dags_format"):
+            SDM(LazyDeserializedDAG.from_dag(dag))
+
     def test_write_dag_when_python_callable_name_changes(self, dag_maker, session):
         def my_callable():
             pass
@@ -401,6 +465,54 @@ class TestSerializedDagModel:
         # assert that the hashes are the same
         assert first_hashes == get_hash_set()
 
+    def test_hash_matches_sorted_json(self):
+        """The stored JSON and the hash are built in one pass, but are the same as dumping the data."""
+
+        def sorted_json_hash(dag_data):
+            dag_data = SDM._sort_serialized_dag_dict(dag_data)
+            dag_data["dag"].pop("fileloc", None)
+            dag_data["dag"].pop("bundle_name", None)
+            return md5(json.dumps(dag_data, sort_keys=True).encode("utf-8")).hexdigest()
+
+        for dag in make_example_dags(example_dags_module).values():
+            dag_data = DagSerialization.to_dict(dag)
+            dag_data_json, dag_hash = SDM._encode(dag_data)
+            assert dag_data_json == json.dumps(dag_data, sort_keys=True).encode("utf-8")
+            assert dag_hash == sorted_json_hash(dag_data) == SDM.hash(dag_data)
+
+    def test_hash_only_sorts_changed_tasks(self, dag_maker, monkeypatch):
+        monkeypatch.setattr(
+            "airflow.models.serialized_dag._canonical_json_cache",
+            LRUCache(maxsize=1024 * 1024, getsizeof=operator.itemgetter(1)),
+        )
+        with dag_maker("dag_hash_cache", serialized=True):
+            for i in range(3):
+                EmptyOperator(task_id=f"task{i}")
+        dag_data = DagSerialization.to_dict(dag_maker.dag)
+        first_hash = SDM.hash(dag_data)
+
+        dag_data["dag"]["tasks"][0]["__var"]["retries"] = 5
+        with mock.patch.object(SDM, "_sort_serialized_dag_dict", wraps=SDM._sort_serialized_dag_dict) as sort:
+            assert SDM.hash(dag_data) != first_hash
+        # Only the changed task is sorted again, the others come from the cache.
+        changed, *unchanged = dag_data["dag"]["tasks"]
+        sorted_values = [c.args[0] for c in sort.call_args_list]
+        assert sorted_values[0] is changed
+        assert not any(value is task for value in sorted_values for task in unchanged)
+
+    def test_hash_cache_counts_keys_and_values(self, monkeypatch):
+        cache = LRUCache(maxsize=1024, getsizeof=operator.itemgetter(1))
+        monkeypatch.setattr("airflow.models.serialized_dag._canonical_json_cache", cache)
+
+        sorted_raw = '{"a": 1, "b": 2}'
+        assert SDM._canonical_json(sorted_raw, {"a": 1, "b": 2}) is sorted_raw
+        # The value is the key itself, so it is only counted once.
+        assert cache.currsize == len(sorted_raw)
+
+        unsorted_raw = '{"b": 2, "a": 1}'
+        assert SDM._canonical_json(unsorted_raw, {"b": 2, "a": 1}) == sorted_raw
+        assert cache.currsize == 2 * len(sorted_raw) + len(unsorted_raw)
+
     def test_get_latest_serdag_versions(self, dag_maker, session):
         # first dag
         with dag_maker("dag1") as dag:
@@ -20,7 +20,7 @@ import datetime
 import json
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pendulum
 import pytest
@@ -180,6 +180,28 @@ def test_clean_unused(session, dag_maker):
     assert {result.id for result in results} == {trigger1.id, trigger4.id, trigger5.id, trigger6.id}
 
 
+def test_clean_unused_notifies_triggerers_when_it_deleted_triggers(session):
+    with patch.object(Trigger, "notify_changed") as notify_changed:
+        Trigger.clean_unused(session=session)
+        notify_changed.assert_not_called()
+
+        session.add(Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}))
+        session.flush()
+        Trigger.clean_unused(session=session)
+        notify_changed.assert_called_once_with(session)
+
+
+@pytest.mark.parametrize(("dialect", "notifies"), [("postgresql", True), ("mysql", False), ("sqlite", False)])
+def test_notify_changed(dialect, notifies):
+    session = Mock()
+    with patch("airflow.models.trigger.get_dialect_name", return_value=dialect):
+        Trigger.notify_changed(session)
+    if notifies:
+        assert str(session.execute.call_args.args[0]) == "NOTIFY airflow_trigger_changes"
+    else:
+        session.execute.assert_not_called()
+
+
 @patch.object(TriggererCallback, "handle_event")
 def test_submit_event(mock_callback_handle_event, session, create_task_instance):
     """
@@ -324,6 +346,127 @@ def test_handle_event_submit_fails_task_when_the_event_payload_cannot_be_seriali
     assert "event payload could not be serialized" in task_instance.next_kwargs["error"]
 
 
+@patch.object(TriggererCallback, "handle_event")
+def test_submit_event_many(mock_callback_handle_event, session, dag_maker):
+    """
+    Tests that events submitted together do what submitting them one by one does: the first event of a
+    trigger resumes its task instances, every event goes to the assets and callback of its trigger.
+    """
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(4)]
+    session.add_all(triggers)
+    session.flush()
+
+    with dag_maker(session=session):
+        for i in range(3):
+            EmptyOperator(task_id=f"fake{i}")
+    dr = dag_maker.create_dagrun(logical_date=timezone.utcnow())
+    tis = {ti.task_id: ti for ti in dr.task_instances}
+    last_updated_at = timezone.utcnow() - datetime.timedelta(days=1)
+    for i, ti in enumerate(tis.values()):
+        ti.state = State.DEFERRED
+        ti.trigger_id = triggers[0 if i < 2 else 1].id
+        ti.next_kwargs = {"cheesecake": i}
+        ti.updated_at = last_updated_at
+    asset = AssetModel("test")
+    asset.add_trigger(triggers[2], "test_asset_watcher")
+    session.add(asset)
+    callback = TriggererCallback(callback_def=AsyncCallback("classpath.callback"))
+    callback.trigger = triggers[3]
+    session.add(callback)
+    session.commit()
+
+    events = [
+        (triggers[0].id, TriggerEvent("first")),
+        (triggers[2].id, TriggerEvent("asset one")),
+        (triggers[1].id, TriggerEvent("second")),
+        (triggers[0].id, TriggerEvent("first again")),
+        (triggers[2].id, TriggerEvent("asset two")),
+        (triggers[3].id, TriggerEvent("callback")),
+        # Already deleted
+        (-1, TriggerEvent("nobody")),
+    ]
+    Trigger.submit_event_many(events, session=session)
+
+    # The task instances loaded in the session are not left with the values from before the bulk update
+    assert {task_id: (ti.state, ti.trigger_id, ti.next_kwargs) for task_id, ti in tis.items()} == {
+        "fake0": (State.SCHEDULED, None, {"event": "first", "cheesecake": 0}),
+        "fake1": (State.SCHEDULED, None, {"event": "first", "cheesecake": 1}),
+        "fake2": (State.SCHEDULED, None, {"event": "second", "cheesecake": 2}),
+    }
+    assert all(ti.scheduled_dttm is not None for ti in tis.values())
+    # Set by the onupdate of the column, as the bulk update doesn't go through the unit of work
+    assert all(ti.updated_at > last_updated_at for ti in tis.values())
+    asset_events = session.scalars(select(AssetEvent).order_by(AssetEvent.id))
+    assert [asset_event.extra for asset_event in asset_events] == [
+        {"from_trigger": True, "payload": "asset one"},
+        {"from_trigger": True, "payload": "asset two"},
+    ]
+    mock_callback_handle_event.assert_called_once_with(events[5][1], session)
+
+
+@pytest.mark.parametrize("trigger_count", [1, 10])
+def test_submit_event_many_queries_do_not_grow_with_the_events(session, dag_maker, trigger_count):
+    triggers = [
+        Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in range(trigger_count)
+    ]
+    session.add_all(triggers)
+    session.flush()
+    with dag_maker(session=session):
+        for i in range(trigger_count):
+            EmptyOperator(task_id=f"fake{i}")
+    dr = dag_maker.create_dagrun(logical_date=timezone.utcnow())
+    for ti, trigger in zip(sorted(dr.task_instances, key=lambda ti: ti.task_id), triggers):
+        ti.state = State.DEFERRED
+        ti.trigger_id = trigger.id
+    session.commit()
+    events = [(trigger.id, TriggerEvent("payload")) for trigger in triggers]
+    session.expire_all()
+
+    # Read the task instances and update them, then read the triggers with their task instances,
+    # asset watchers and callbacks
+    with assert_queries_count(6, session=session):
+        Trigger.submit_event_many(events, session=session)
+
+
+def test_submit_event_many_fails_task_with_unusable_next_kwargs(session, create_task_instance):
+    trigger = Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={})
+    session.add(trigger)
+    task_instance = create_task_instance(
+        session=session, logical_date=timezone.utcnow(), state=State.DEFERRED
+    )
+    task_instance.trigger_id = trigger.id
+    task_instance.next_method = "execute_complete"
+    task_instance.next_kwargs = {"__type": "datetime", "__var": 1735689600.0}
+    session.commit()
+
+    Trigger.submit_event_many([(trigger.id, TriggerEvent("payload"))], session=session)
+
+    session.refresh(task_instance)
+    assert task_instance.state == State.SCHEDULED
+    assert task_instance.next_method == "__fail__"
+    assert task_instance.trigger_id is None
+    assert "stored next_kwargs could not be decoded" in task_instance.next_kwargs["error"]
+    assert isinstance(task_instance.next_kwargs["traceback"], list)
+
+
+def test_submit_event_many_task_end(session, create_task_instance):
+    """Events inheriting BaseTaskEndEvent end their task instances, as with ``submit_event``."""
+    trigger = Trigger(classpath="does.not.matter", kwargs={})
+    session.add(trigger)
+    task_instance = create_task_instance(
+        session=session, logical_date=timezone.utcnow(), state=State.DEFERRED
+    )
+    task_instance.trigger_id = trigger.id
+    task_instance.start_date = timezone.utcnow()
+    session.commit()
+
+    Trigger.submit_event_many([(trigger.id, TaskSuccessEvent())], session=session)
+
+    session.refresh(task_instance)
+    assert task_instance.state == State.SUCCESS
+    assert task_instance.trigger_id is None
+
+
 def test_submit_failure(session, create_task_instance):
     """
     Tests that failures submitted to a trigger fail their dependent
@@ -0,0 +1,116 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import attrs
+import pytest
+
+from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.sdk import DAG, TaskGroup, task, task_group
+from airflow.serialization.definitions.topology import DagTopology, get_leaf_task_ids
+
+from tests_common.test_utils.dag import create_scheduler_dag
+
+
+@pytest.fixture
+def scheduler_dag():
+    @task
+    def double(x):
+        return x * 2
+
+    @task_group
+    def mapped_group(x):
+        with TaskGroup("inner"):
+            double(x)
+
+    with DAG("topology", schedule=None) as dag:
+        setup = EmptyOperator(task_id="setup").as_setup()
+        teardown = EmptyOperator(task_id="teardown").as_teardown(setups=setup)
+        with TaskGroup("group"):
+            work = EmptyOperator(task_id="work")
+            more_work = EmptyOperator(task_id="more_work")
+        last = EmptyOperator(task_id="last")
+        setup >> work >> more_work >> teardown
+        more_work >> last
+        mapped_group.expand(x=[1, 2])
+    return create_scheduler_dag(dag)
+
+
+def _effective_leaves(dag):
+    """The leaves of the Dag as determined by walking the graph, before the topology index existed."""
+
+    def is_effective_leaf(t):
+        for down_task_id in t.downstream_task_ids:
+            down_task = dag.get_task(down_task_id)
+            if not down_task.is_teardown or down_task.on_failure_fail_dagrun:
+                return False
+        return not t.is_teardown or t.on_failure_fail_dagrun
+
+    return {t.task_id for t in dag.tasks if is_effective_leaf(t)}
+
+
+class TestDagTopology:
+    def test_does_not_copy_relatives(self, scheduler_dag):
+        """The index only keeps derived sets; the direct relatives stay on the tasks."""
+        assert {a.name for a in attrs.fields(DagTopology)} == {
+            "leaf_task_ids",
+            "_mapped_task_group_ids",
+            "_teardown_scopes",
+        }
+        assert set(scheduler_dag.topology._teardown_scopes) == {"teardown"}
+
+    def test_leaf_task_ids(self, scheduler_dag):
+        assert scheduler_dag.topology.leaf_task_ids == _effective_leaves(scheduler_dag)
+        assert "teardown" not in scheduler_dag.topology.leaf_task_ids
+
+    def test_leaf_task_ids_with_only_teardowns(self):
+        with DAG("only_teardowns", schedule=None) as dag:
+            EmptyOperator(task_id="t1").as_teardown() >> EmptyOperator(task_id="t2").as_teardown()
+        topology = DagTopology.build(create_scheduler_dag(dag))
+        assert topology.leaf_task_ids == {"t2"}
+
+    def test_leaf_task_ids_of_non_serialized_dag(self, scheduler_dag):
+        with DAG("non_serialized", schedule=None) as dag:
+            setup = EmptyOperator(task_id="setup").as_setup()
+            (
+                setup
+                >> EmptyOperator(task_id="work")
+                >> EmptyOperator(task_id="teardown").as_teardown(setups=setup)
+            )
+        assert get_leaf_task_ids(dag) == {"work"}
+        assert get_leaf_task_ids(scheduler_dag) == scheduler_dag.topology.leaf_task_ids
+
+    def test_teardown_scope(self, scheduler_dag):
+        topology = scheduler_dag.topology
+        assert topology.get_teardown_scope("teardown") == {"group.work"}
+        assert topology.get_teardown_scope("group.work") == frozenset()
+
+    def test_task_groups(self, scheduler_dag):
+        topology = scheduler_dag.topology
+        assert topology.get_mapped_task_group_ids("mapped_group.inner.double") == ("mapped_group",)
+        assert topology.is_in_mapped_task_group("mapped_group.inner.double")
+        assert topology.get_mapped_task_group_ids("group.work") == ()
+        assert not topology.is_in_mapped_task_group("group.work")
+
+    def test_built_once(self, scheduler_dag):
+        assert scheduler_dag.topology is scheduler_dag.topology
+
+    def test_partial_subset_does_not_share_topology(self, scheduler_dag):
+        topology = scheduler_dag.topology
+        subset = scheduler_dag.partial_subset("group.more_work", include_upstream=False)
+        assert subset.topology is not topology
+        assert subset.topology.leaf_task_ids == get_leaf_task_ids(subset) != topology.leaf_task_ids
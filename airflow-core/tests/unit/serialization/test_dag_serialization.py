@@ -1805,6 +1805,66 @@ class TestStringifiedDAGs:
 
         check_task_group(serialized_dag.task_group)
 
+    @pytest.mark.db_test
+    def test_lazy_deserialization_matches_eager(self):
+        """Tasks deserialized on access are the same as when the whole Dag is deserialized at once."""
+        dags, _ = collect_dags("airflow-core/src/airflow/example_dags")
+        for dag in dags.values():
+            serialized = DagSerialization.to_dict(dag)
+            eager = DagSerialization.from_dict(copy.deepcopy(serialized))
+            lazy = DagSerialization.from_dict(copy.deepcopy(serialized), lazy=True)
+
+            assert list(lazy.task_dict) == list(eager.task_dict)
+            # Load in reverse so that downstreams are loaded before their upstreams.
+            for task_id in reversed(eager.task_dict):
+                expected, actual = eager.task_dict[task_id], lazy.task_dict[task_id]
+                assert type(actual) is type(expected)
+                assert actual.dag is lazy
+                assert actual.upstream_task_ids == expected.upstream_task_ids
+                assert actual.downstream_task_ids == expected.downstream_task_ids
+                assert actual.task_group.group_id == expected.task_group.group_id
+                assert actual.start_date == expected.start_date
+                # References to other objects of the Dag are not equal between the two Dags.
+                references = {"dag", "task_group", "expand_input", "op_kwargs_expand_input"}
+                assert {k: v for k, v in vars(actual).items() if k not in references} == {
+                    k: v for k, v in vars(expected).items() if k not in references
+                }, f"{dag.dag_id}.{task_id}"
+            assert [t.task_id for t in lazy.task_group] == [t.task_id for t in eager.task_group]
+            assert (
+                lazy.task_group.get_task_group_dict().keys() == eager.task_group.get_task_group_dict().keys()
+            )
+
+    def test_lazy_deserialization_loads_tasks_on_access(self):
+        from airflow.providers.standard.operators.empty import EmptyOperator
+        from airflow.serialization.serialized_objects import _DeferredTask
+
+        with DAG("test_lazy_deserialization", schedule=None, start_date=datetime(2020, 1, 1)) as dag:
+            task1 = EmptyOperator(task_id="task1")
+            with TaskGroup("group"):
+                task2 = EmptyOperator(task_id="task2")
+                task3 = EmptyOperator(task_id="task3")
+            task1 >> task2 >> task3
+
+        lazy = DagSerialization.from_dict(DagSerialization.to_dict(dag), lazy=True)
+        assert lazy.task_ids == ["task1", "group.task2", "group.task3"]
+        assert "group.task2" in lazy.task_dict
+        assert all(isinstance(lazy.task_dict.peek(t), _DeferredTask) for t in lazy.task_ids)
+
+        task = lazy.get_task("group.task2")
+        assert task.upstream_task_ids == {"task1"}
+        assert task.downstream_task_ids == {"group.task3"}
+        assert task.task_group.group_id == "group"
+        assert task.dag is lazy
+        assert lazy.task_group.children["group"].children["group.task2"] is task
+        assert isinstance(lazy.task_dict.peek("task1"), _DeferredTask)
+        assert isinstance(lazy.task_dict.peek("group.task3"), _DeferredTask)
+
+        # Copies are complete, independent Dags.
+        subset = lazy.partial_subset("group.task2", include_upstream=True)
+        assert sorted(subset.task_dict) == ["group.task2", "task1"]
+        assert isinstance(subset.task_dict, dict)
+        assert subset.task_dict["group.task2"].upstream_task_ids == {"task1"}
+
     @staticmethod
     def assert_taskgroup_children(se_task_group, dag_task_group, expected_children):
         assert se_task_group.children.keys() == dag_task_group.children.keys() == expected_children
@@ -17,6 +17,7 @@
 # under the License.
 from __future__ import annotations
 
+import random
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime
@@ -30,7 +31,7 @@ from sqlalchemy import event
 
 import airflow.settings
 from airflow.models.dag_version import DagVersion
-from airflow.models.taskinstance import TaskInstance
+from airflow.models.taskinstance import TaskInstance, uuid7
 from airflow.providers.standard.operators.empty import EmptyOperator
 from airflow.sdk import task, task_group
 from airflow.sdk.bases.operator import BaseOperator
@@ -38,6 +39,7 @@ from airflow.task.trigger_rule import TriggerRule
 from airflow.ti_deps.dep_context import DepContext
 from airflow.ti_deps.deps.trigger_rule_dep import TriggerRuleDep, _UpstreamTIStates
 from airflow.utils.state import DagRunState, TaskInstanceState
+from airflow.utils.types import DagRunType
 
 pytestmark = pytest.mark.db_test
 
@@ -1056,6 +1058,42 @@ class TestTriggerRuleDep:
         # All in-scope tasks are in terminal states, teardown should proceed
         assert not dep_statuses
 
+    @pytest.mark.parametrize("serialized", [True, False])
+    def test_teardown_scope_without_topology_for_non_serialized_dag(self, session, dag_maker, serialized):
+        """The Dag is walked for a non-serialized Dag, rather than building a topology index per ti."""
+        from airflow.serialization.definitions.topology import DagTopology
+
+        with dag_maker(session=session):
+            setup = EmptyOperator(task_id="setup").as_setup()
+            t1 = EmptyOperator(task_id="t1")
+            t2 = EmptyOperator(task_id="t2")
+            teardown_task = EmptyOperator(task_id="teardown").as_teardown(setups=setup)
+            setup >> t1 >> t2 >> teardown_task
+
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+
+        tis["setup"].state = SUCCESS
+        tis["t2"].state = SUCCESS
+        for tid in ("setup", "t2"):
+            session.merge(tis[tid])
+        session.flush()
+
+        dag = dag_maker.serialized_dag if serialized else dag_maker.dag
+        teardown_ti = tis["teardown"]
+        teardown_ti.task = dag.get_task("teardown")
+
+        with mock.patch.object(DagTopology, "build", wraps=DagTopology.build) as build:
+            dep_statuses = tuple(
+                TriggerRuleDep()._evaluate_trigger_rule(
+                    ti=teardown_ti, dep_context=DepContext(), session=session
+                )
+            )
+        assert len(dep_statuses) == 1
+        assert not dep_statuses[0].passed
+        assert "in-scope" in dep_statuses[0].reason
+        assert build.call_count == (1 if serialized else 0)
+
     @pytest.mark.parametrize(("flag_upstream_failed", "expected_ti_state"), [(True, SKIPPED), (False, None)])
     def test_all_skipped_tr_failure(
         self, session, get_task_instance, flag_upstream_failed, expected_ti_state
@@ -2381,3 +2419,125 @@ class TestTriggerRuleUpstreamCountMemo:
         assert evolved.upstream_task_id_counts is dep_context.upstream_task_id_counts
         evolved.upstream_task_id_counts[("d", "r", frozenset({"u2"}))] = [("u2", 1)]
         assert ("d", "r", frozenset({"u2"})) in dep_context.upstream_task_id_counts
+
+
+@pytest.fixture(scope="module")
+def example_scheduler_dags():
+    from airflow import example_dags
+    from airflow.dag_processing.dagbag import DagBag
+
+    from tests_common.test_utils.dag import create_scheduler_dag
+
+    dagbag = DagBag(dag_folder=example_dags.__path__[0])
+    return [create_scheduler_dag(dag) for _, dag in sorted(dagbag.dags.items())]
+
+
+class TestTriggerRuleUpstreamStatesMemo:
+    """The upstream states are aggregated once per pass over the finished tis of the upstreams only."""
+
+    FINISHED_STATES = [SUCCESS, FAILED, SKIPPED, UPSTREAM_FAILED, REMOVED]
+
+    @staticmethod
+    def _make_run_tis(dag, states):
+        from airflow.models.dagrun import DagRun
+
+        dag_run = DagRun(dag_id=dag.dag_id, run_id="differential", run_type=DagRunType.MANUAL)
+        dag_version_id = uuid7()
+        tis = []
+        for task_id, op in dag.task_dict.items():
+            ti = TaskInstance(op, run_id=dag_run.run_id, dag_version_id=dag_version_id)
+            ti.state = states[task_id]
+            ti.dag_run = dag_run
+            tis.append(ti)
+        return tis
+
+    @staticmethod
+    def _evaluate(ti, dep_context, session):
+        return list(TriggerRuleDep()._evaluate_trigger_rule(ti=ti, dep_context=dep_context, session=session))
+
+    @staticmethod
+    def _evaluate_with_full_scan(ti, finished_tis, session):
+        """
+        Evaluate ti the way the trigger rule dep did before indexing and memoizing the finished tis.
+
+        Every lookup of the finished tis of an upstream scans all the finished tis of the run, and a
+        fresh DepContext memoizes nothing. Returns the decisions, and the upstream states calculated.
+        """
+
+        class FullScan(dict):
+            def get(self, task_id, default=None):
+                return [x for x in finished_tis if x.task_id == task_id]
+
+        calculated = []
+
+        def calculate(finished_upstreams):
+            calculated.append(original_calculate(finished_upstreams))
+            return calculated[-1]
+
+        original_calculate = _UpstreamTIStates.calculate
+        with (
+            mock.patch.object(DepContext, "ensure_finished_tis_by_task_id", return_value=FullScan()),
+            mock.patch.object(_UpstreamTIStates, "calculate", side_effect=calculate),
+        ):
+            decisions = TestTriggerRuleUpstreamStatesMemo._evaluate(
+                ti, DepContext(finished_tis=finished_tis), session
+            )
+        return decisions, calculated
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_identical_decisions_over_example_dags(self, example_scheduler_dags, session, seed):
+        """
+        Evaluating every ti of a run with one shared DepContext (as a scheduling pass does) must give
+        the same decisions as a full scan of the finished tis of the run for each ti, and the memoized
+        upstream states must match the states calculated by that scan.
+        """
+        rng = random.Random(seed)
+        for dag in example_scheduler_dags:
+            states = {
+                task_id: rng.choice([*self.FINISHED_STATES, None, TaskInstanceState.RUNNING])
+                for task_id in dag.task_dict
+            }
+            tis = self._make_run_tis(dag, states)
+            finished_tis = [ti for ti in tis if ti.state in self.FINISHED_STATES]
+            dep_context = DepContext(finished_tis=finished_tis)
+
+            for ti in tis:
+                if not ti.task.upstream_task_ids:
+                    continue
+                shared = self._evaluate(ti, dep_context, session)
+                reference, calculated = self._evaluate_with_full_scan(ti, finished_tis, session)
+                assert shared == reference, f"{dag.dag_id}.{ti.task_id}"
+
+                # The memoized states of the direct upstreams, whether calculated now or by another ti
+                # sharing them, are the states the full scan calculated
+                cache_key = (ti.dag_id, ti.run_id, frozenset(ti.task.upstream_task_ids))
+                if (upstream_states := dep_context.upstream_ti_states.get(cache_key)) is not None:
+                    assert upstream_states in calculated, f"{dag.dag_id}.{ti.task_id}"
+
+            for (_, _, relevant_ids), upstream_states in dep_context.upstream_ti_states.items():
+                assert upstream_states == _UpstreamTIStates.calculate(
+                    ti for ti in finished_tis if ti.task_id in relevant_ids
+                ), dag.dag_id
+
+    def test_memoized_across_downstreams_sharing_upstreams(self, dag_maker, session):
+        with dag_maker(session=session):
+            upstream = [EmptyOperator(task_id=f"u{i}") for i in range(3)]
+            upstream >> EmptyOperator(task_id="d0")
+            upstream >> EmptyOperator(task_id="d1")
+        dr = dag_maker.create_dagrun()
+        tis = {ti.task_id: ti for ti in dr.get_task_instances(session=session)}
+        for i in range(3):
+            tis[f"u{i}"].state = SUCCESS
+        dep_context = DepContext(finished_tis=[tis[f"u{i}"] for i in range(3)])
+
+        with mock.patch.object(
+            _UpstreamTIStates, "calculate", wraps=_UpstreamTIStates.calculate
+        ) as calculate:
+            assert self._evaluate(tis["d0"], dep_context, session) == []
+            assert self._evaluate(tis["d1"], dep_context, session) == []
+        assert calculate.call_count == 1
+
+        dep_context.invalidate_upstream_ti_states()
+        tis["u0"].state = FAILED
+        (status,) = self._evaluate(tis["d1"], dep_context, session)
+        assert "failed=1" in status.reason
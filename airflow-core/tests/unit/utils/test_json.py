@@ -112,3 +112,13 @@ class TestXComEncoder:
         i = frozenset({6, 7})
         e = json.loads(json.dumps(i, cls=utils_json.XComEncoder), cls=utils_json.XComDecoder)
         assert i == e
+
+    def test_bytes(self):
+        i = {"a": b"\x00\x01binary"}
+        s = json.dumps(i, cls=utils_json.XComEncoder)
+        assert json.loads(s)["a"] == {
+            "__classname__": "builtins.bytes",
+            "__version__": 1,
+            "__data__": "AAFiaW5hcnk=",
+        }
+        assert json.loads(s, cls=utils_json.XComDecoder) == i
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import math
+import os
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+
+import rich_click as click
+from sqlalchemy import delete, event, select, update
+
+DAG_ID = "perf_execution_api_heartbeat"
+TI_ID_HEADER = "X-Perf-TI-Id"
+
+
+def create_running_task_instances(num_tis, tasks_per_run, tis_per_host, session):
+    """
+    Create ``num_tis`` running task instances, spread over hosts running ``tis_per_host`` of them each.
+
+    Returns a list of ``(hostname, [(ti_id, pid), ...])`` tuples, one for each host.
+    """
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+    from airflow.utils import timezone
+    from airflow.utils.state import DagRunState, TaskInstanceState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+
+    with DAG(DAG_ID, schedule=None, max_active_tasks=tasks_per_run) as dag:
+        for i in range(tasks_per_run):
+            EmptyOperator(task_id=f"task_{i}")
+    scheduler_dag = sync_dag_to_db(dag, session=session)
+
+    now = timezone.utcnow()
+    for i in range(math.ceil(num_tis / tasks_per_run)):
+        scheduler_dag.create_dagrun(
+            run_id=f"perf_{i}",
+            logical_date=now + timedelta(seconds=i),
+            run_after=now,
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+    session.commit()
+
+    ti_ids = session.scalars(
+        select(TaskInstance.id).where(TaskInstance.dag_id == DAG_ID).order_by(TaskInstance.id).limit(num_tis)
+    ).all()
+    hosts: dict[str, list] = {}
+    for i, ti_id in enumerate(ti_ids):
+        hosts.setdefault(f"perf-host-{i // tis_per_host}", []).append((ti_id, 1000 + i))
+    session.execute(
+        update(TaskInstance),
+        [
+            {
+                "id": ti_id,
+                "state": TaskInstanceState.RUNNING,
+                "hostname": hostname,
+                "pid": pid,
+                "last_heartbeat_at": now,
+            }
+            for hostname, tis in hosts.items()
+            for ti_id, pid in tis
+        ],
+    )
+    session.commit()
+    return list(hosts.items())
+
+
+def create_api_client():
+    """
+    Create a test client for an in-process Execution API.
+
+    Authentication is replaced with a token for the task instance named in the ``X-Perf-TI-Id`` header, so
+    requests are authorized exactly as with a real token of that task instance, minus the JWT validation.
+    The tokens of the task instances in a bulk heartbeat are not validated either.
+    """
+    from uuid import UUID
+
+    from fastapi import Header
+    from fastapi.testclient import TestClient
+
+    from airflow.api_fastapi.execution_api.app import InProcessExecutionAPI
+    from airflow.api_fastapi.execution_api.datamodels.token import TIClaims, TIToken
+    from airflow.api_fastapi.execution_api.security import _jwt_bearer
+    from airflow.api_fastapi.execution_api.versions import bundle
+
+    app = InProcessExecutionAPI().app
+
+    async def token_from_header(ti_id: str = Header(alias=TI_ID_HEADER)):
+        return TIToken(id=UUID(ti_id), claims=TIClaims(scope="execution"))
+
+    app.dependency_overrides[_jwt_bearer] = token_from_header
+    return TestClient(app, headers={"Airflow-API-Version": bundle.versions[0].value})
+
+
+@contextmanager
+def count_updates():
+    """Count the UPDATE statements sent to the metadata database, in the ``updates`` key of a dict."""
+    from airflow import settings
+
+    counts = {"updates": 0}
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("UPDATE"):
+            counts["updates"] += 1
+
+    event.listen(settings.engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counts
+    finally:
+        event.remove(settings.engine, "before_cursor_execute", before_cursor_execute)
+
+
+def heartbeat_one_by_one(client, hosts):
+    """Heartbeat every task instance with its own request, as each task's supervisor does today."""
+    requests = 0
+    for hostname, tis in hosts:
+        for ti_id, pid in tis:
+            resp = client.put(
+                f"/task-instances/{ti_id}/heartbeat",
+                json={"hostname": hostname, "pid": pid},
+                headers={TI_ID_HEADER: str(ti_id)},
+            )
+            resp.raise_for_status()
+            requests += 1
+    return requests
+
+
+def heartbeat_in_bulk(client, hosts):
+    """Heartbeat the task instances of each host with one bulk request, as a heartbeat coalescer does."""
+    requests = 0
+    for hostname, tis in hosts:
+        resp = client.put(
+            "/task-instances/heartbeats",
+            json={
+                "hostname": hostname,
+                "heartbeats": [{"id": str(ti_id), "pid": pid, "token": str(ti_id)} for ti_id, pid in tis],
+            },
+            headers={TI_ID_HEADER: str(tis[0][0])},
+        )
+        resp.raise_for_status()
+        if any(result["status"] != "ok" for result in resp.json()["results"]):
+            raise RuntimeError(f"Unexpected bulk heartbeat results for {hostname}: {resp.json()}")
+        requests += 1
+    return requests
+
+
+@click.command()
+@click.option(
+    "--num-tis",
+    multiple=True,
+    type=int,
+    default=(10_000, 50_000),
+    show_default=True,
+    help="Number of running task instances to heartbeat. Can be passed multiple times.",
+)
+@click.option("--tasks-per-run", default=100, show_default=True, help="Number of tasks in each Dag run")
+@click.option(
+    "--tis-per-host", default=32, show_default=True, help="Running task instances on each worker host"
+)
+@click.option(
+    "--heartbeat-interval",
+    default=5.0,
+    show_default=True,
+    help="Seconds between two heartbeats of a task, used to turn one round into per-second rates",
+)
+def main(num_tis, tasks_per_run, tis_per_host, heartbeat_interval):
+    """
+    Compare the Execution API load of per-task heartbeats with bulk heartbeats of each worker host.
+
+    For each requested number of running task instances, this creates the task instances in the configured
+    metadata database, then runs one heartbeat round for all of them through an in-process Execution API:
+    first with one ``PUT /task-instances/{id}/heartbeat`` per task instance, then with one
+    ``PUT /task-instances/heartbeats`` per host. The CPU time of the round (API server and database client
+    both run in this process) and the UPDATE statements it sends are turned into the load an API server
+    sees when every task heartbeats each ``--heartbeat-interval`` seconds.
+
+    Run this against the database backend you want numbers for (e.g. PostgreSQL).
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    from airflow.utils.session import create_session
+
+    client = create_api_client()
+    results = []
+    with client:
+        for count in num_tis:
+            with create_session() as session:
+                click.echo(f"Creating {count} running task instances...")
+                hosts = create_running_task_instances(count, tasks_per_run, tis_per_host, session)
+            for mode, heartbeat in (("per-task", heartbeat_one_by_one), ("bulk", heartbeat_in_bulk)):
+                with count_updates() as counts:
+                    wall_start, cpu_start = time.perf_counter(), time.process_time()
+                    requests = heartbeat(client, hosts)
+                    wall, cpu = time.perf_counter() - wall_start, time.process_time() - cpu_start
+                results.append((count, mode, requests, wall, cpu, counts["updates"]))
+
+    click.echo()
+    click.echo(
+        f"{'TIs':>8} {'mode':>9} {'round (s)':>10} {'requests/s':>11} {'API CPU (cores)':>16} "
+        f"{'DB writes/s':>12}"
+    )
+    for count, mode, requests, wall, cpu, updates in results:
+        click.echo(
+            f"{count:>8} {mode:>9} {wall:>10.2f} {requests / heartbeat_interval:>11.1f} "
+            f"{cpu / heartbeat_interval:>16.2f} {updates / heartbeat_interval:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
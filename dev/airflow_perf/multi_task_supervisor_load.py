@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from textwrap import dedent
+
+import psutil
+import rich_click as click
+
+DAG_ID = "perf_multi_task_supervisor"
+DAG_FILE = "perf_multi_task_supervisor_dag.py"
+SLOW_TASK_ID = "slow"
+# The supervision modes, with the number of requests of the tasks each supervisor handles at once
+MODES = {"per-task": 1, "multi": 10, "multi-serial": 1}
+
+
+def write_dag_file(dags_folder: Path, marker_dir: Path, tasks: int, requests: int, interval: float) -> None:
+    """
+    Write a Dag with ``tasks`` tasks fetching a variable ``requests`` times, and one fetching a slow variable.
+
+    Each task writes the latencies of its requests to a file once it's done.
+    """
+    (dags_folder / DAG_FILE).write_text(
+        dedent(
+            f"""
+            import json
+            import time
+            from pathlib import Path
+
+            from airflow.providers.standard.operators.python import PythonOperator
+            from airflow.sdk import DAG, Variable
+
+
+            def fetch(ti):
+                key = "perf_slow" if ti.task_id == {SLOW_TASK_ID!r} else "perf_fast"
+                latencies = []
+                for _ in range({requests}):
+                    start = time.monotonic()
+                    Variable.get(key)
+                    latencies.append(time.monotonic() - start)
+                    time.sleep({interval})
+                Path({str(marker_dir)!r}, ti.task_id + ".json").write_text(json.dumps(latencies))
+
+
+            with DAG({DAG_ID!r}, schedule=None):
+                for task_id in [{SLOW_TASK_ID!r}] + [f"task_{{i}}" for i in range({tasks})]:
+                    PythonOperator(task_id=task_id, python_callable=fetch)
+            """
+        )
+    )
+
+
+def create_api_client(slow_delay: float):
+    """Create an API client with canned responses, taking ``slow_delay`` seconds to return one variable."""
+    import httpx
+
+    from airflow.sdk import timezone
+    from airflow.sdk.api.client import Client
+    from airflow.sdk.api.datamodels._generated import DagRun, DagRunState, DagRunType, TIRunContext
+
+    now = timezone.utcnow()
+    run_context = TIRunContext(
+        dag_run=DagRun(
+            dag_id=DAG_ID,
+            run_id="perf",
+            logical_date=now,
+            data_interval_start=now,
+            data_interval_end=now,
+            run_after=now,
+            start_date=now,
+            end_date=None,
+            run_type=DagRunType.MANUAL,
+            state=DagRunState.RUNNING,
+            consumed_asset_events=[],
+            partition_key=None,
+        ),
+        max_tries=0,
+    ).model_dump_json()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/run"):
+            return httpx.Response(200, content=run_context)
+        if request.url.path.endswith("/heartbeats"):
+            heartbeats = json.loads(request.content)["heartbeats"]
+            return httpx.Response(
+                200, json={"results": [{"id": hb["id"], "status": "ok"} for hb in heartbeats]}
+            )
+        if "/variables/" in request.url.path:
+            key = request.url.path.rsplit("/", 1)[-1]
+            if key == "perf_slow":
+                time.sleep(slow_delay)
+            return httpx.Response(200, json={"key": key, "value": "value"})
+        return httpx.Response(204)
+
+    return Client(base_url="http://perf/execution", token="", transport=httpx.MockTransport(handler))
+
+
+def make_task_instances(tasks: int):
+    from uuid6 import uuid7
+
+    from airflow.sdk.api.datamodels._generated import TaskInstance
+
+    return [
+        TaskInstance(
+            id=uuid7(),
+            dag_id=DAG_ID,
+            task_id=task_id,
+            run_id="perf",
+            try_number=1,
+            dag_version_id=uuid7(),
+            queue="default",
+        )
+        for task_id in [SLOW_TASK_ID] + [f"task_{i}" for i in range(tasks)]
+    ]
+
+
+def supervise_one(ti, slow_delay: float) -> None:
+    """Supervise a single task in this process, like a worker running one task per supervisor."""
+    import structlog
+
+    from airflow.executors.workloads import BundleInfo
+    from airflow.sdk.execution_time.supervisor import ActivitySubprocess
+
+    def drop(*_):
+        raise structlog.DropEvent
+
+    proc = ActivitySubprocess.start(
+        what=ti,
+        dag_rel_path=DAG_FILE,
+        bundle_info=BundleInfo(name="dags-folder"),
+        client=create_api_client(slow_delay),
+        logger=structlog.wrap_logger(
+            None, processors=[drop], wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+        ),
+        fork_from_zygote=False,
+    )
+    os._exit(proc.wait())
+
+
+def supervise_all(tis, slow_delay: float, max_concurrent_requests: int, log_dir: Path) -> None:
+    """Supervise all the tasks from one ``MultiTaskSupervisor`` in this process."""
+    from airflow.executors.workloads import BundleInfo
+    from airflow.sdk.execution_time.supervisor import MultiTaskSupervisor
+
+    exit_codes = []
+    with MultiTaskSupervisor(
+        client=create_api_client(slow_delay), max_concurrent_requests=max_concurrent_requests
+    ) as supervisor:
+        for ti in tis:
+            supervisor.start_task(
+                ti=ti,
+                bundle_info=BundleInfo(name="dags-folder"),
+                dag_rel_path=DAG_FILE,
+                token="",
+                log_path=str(log_dir / f"{ti.task_id}.log"),
+                on_finish=lambda exit_code, _: exit_codes.append(exit_code),
+            )
+        supervisor.run_until_complete()
+    os._exit(1 if any(exit_codes) else 0)
+
+
+def sample_memory(supervisor_depth: int, done: threading.Event, peaks: dict[str, float]) -> None:
+    """
+    Record the peak PSS and RSS of the processes started by the benchmark until ``done`` is set.
+
+    The processes are split into the supervisor side -- the processes up to ``supervisor_depth`` levels
+    below this one, i.e. the supervisor processes and the task zygote -- and the task processes below them.
+    """
+    while not done.wait(0.2):
+        totals = dict.fromkeys(("supervisor_pss", "supervisor_rss", "task_pss"), 0.0)
+        level, depth = psutil.Process().children(), 1
+        while level:
+            for proc in level:
+                try:
+                    memory = proc.memory_full_info()
+                except psutil.Error:
+                    continue
+                if depth > supervisor_depth:
+                    totals["task_pss"] += memory.pss
+                else:
+                    totals["supervisor_pss"] += memory.pss
+                    totals["supervisor_rss"] += memory.rss
+            level, depth = [child for proc in level for child in _children(proc)], depth + 1
+        for name, total in totals.items():
+            peaks[name] = max(peaks.get(name, 0.0), total / 2**20)
+
+
+def _children(proc: psutil.Process) -> list[psutil.Process]:
+    try:
+        return proc.children()
+    except psutil.Error:
+        return []
+
+
+def run(mode: str, tasks: int, slow_delay: float, max_concurrent_requests: int, tmp: Path) -> dict:
+    marker_dir = tmp / "markers"
+    for path in marker_dir.glob("*"):
+        path.unlink()
+    log_dir = tmp / f"logs-{mode}"
+    log_dir.mkdir(exist_ok=True)
+
+    tis = make_task_instances(tasks)
+    fork = multiprocessing.get_context("fork")
+    if mode == "per-task":
+        processes = [fork.Process(target=supervise_one, args=(ti, slow_delay)) for ti in tis]
+    else:
+        processes = [
+            fork.Process(target=supervise_all, args=(tis, slow_delay, max_concurrent_requests, log_dir))
+        ]
+
+    peaks: dict[str, float] = {}
+    done = threading.Event()
+    # The task processes of a ``MultiTaskSupervisor`` are forked from its task zygote
+    supervisor_depth = 1 if mode == "per-task" else 2
+    sampler = threading.Thread(target=sample_memory, args=(supervisor_depth, done, peaks))
+    start = time.monotonic()
+    for process in processes:
+        process.start()
+    sampler.start()
+    for process in processes:
+        process.join()
+    duration = time.monotonic() - start
+    done.set()
+    sampler.join()
+    if failed := [process.exitcode for process in processes if process.exitcode]:
+        raise RuntimeError(f"{len(failed)} supervisor(s) failed in {mode} mode")
+
+    latencies = [
+        latency for path in marker_dir.glob("task_*.json") for latency in json.loads(path.read_text())
+    ]
+    return {
+        **peaks,
+        "p50": statistics.median(latencies) * 1000,
+        "p99": statistics.quantiles(latencies, n=100, method="inclusive")[-1] * 1000,
+        "max": max(latencies) * 1000,
+        "duration": duration,
+    }
+
+
+@click.command()
+@click.option("--tasks", default=64, show_default=True, help="Number of tasks fetching the fast variable")
+@click.option("--requests", default=20, show_default=True, help="Number of variables fetched by each task")
+@click.option("--interval", default=0.1, show_default=True, help="Seconds between the requests of a task")
+@click.option("--slow-delay", default=1.0, show_default=True, help="Seconds to return the slow variable")
+@click.option(
+    "--mode",
+    "modes",
+    type=click.Choice(list(MODES)),
+    multiple=True,
+    default=list(MODES),
+    show_default=True,
+    help="How to supervise the tasks",
+)
+def main(tasks, requests, interval, slow_delay, modes):
+    """
+    Compare supervising concurrent tasks with a supervisor process each and with one ``MultiTaskSupervisor``.
+
+    Runs ``--tasks`` tasks which each fetch a variable ``--requests`` times, alongside one more task fetching
+    a variable which the (canned) API server takes ``--slow-delay`` seconds to return, and reports:
+
+    * the peak PSS and RSS of the supervisor side: the supervisor processes, and the task zygote,
+    * the peak PSS of the task processes,
+    * the latency of the requests of the tasks fetching the fast variable.
+
+    The tasks are supervised with a supervisor process each, as with ``[local_executor]
+    tasks_per_supervisor = 1``, with one ``MultiTaskSupervisor``, and with one ``MultiTaskSupervisor``
+    handling a single request at a time -- which is what the supervisor did before it handled requests in
+    threads.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dags_folder, marker_dir = Path(tmp, "dags"), Path(tmp, "markers")
+        dags_folder.mkdir()
+        marker_dir.mkdir()
+        write_dag_file(dags_folder, marker_dir, tasks, requests, interval)
+        os.environ["AIRFLOW__CORE__DAGS_FOLDER"] = str(dags_folder)
+
+        # Imported here, so the supervisor processes are forked with the modules loaded
+        from airflow.sdk.execution_time import supervisor  # noqa: F401
+
+        results = {}
+        for mode in modes:
+            results[mode] = run(mode, tasks, slow_delay, MODES[mode], Path(tmp))
+
+    click.echo(
+        f"{'mode':>13} {'sup. PSS (MiB)':>15} {'sup. RSS (MiB)':>15} {'task PSS (MiB)':>15} "
+        f"{'p50 (ms)':>9} {'p99 (ms)':>9} {'max (ms)':>9} {'time (s)':>9}"
+    )
+    for mode, result in results.items():
+        click.echo(
+            f"{mode:>13} {result['supervisor_pss']:>15.0f} {result['supervisor_rss']:>15.0f} "
+            f"{result['task_pss']:>15.0f} {result['p50']:>9.1f} {result['p99']:>9.1f} "
+            f"{result['max']:>9.1f} {result['duration']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
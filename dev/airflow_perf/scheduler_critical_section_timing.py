@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import math
+import os
+import statistics
+import time
+from datetime import timedelta
+
+import rich_click as click
+from sqlalchemy import delete, update
+
+DAG_ID = "perf_scheduler_critical_section"
+
+
+def create_dag_runs(num_tis, tasks_per_run, session):
+    """
+    Create a Dag with ``tasks_per_run`` tasks and enough running Dag runs to have ``num_tis`` task instances.
+    """
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+    from airflow.utils import timezone
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+
+    with DAG(DAG_ID, schedule=None, max_active_tasks=tasks_per_run) as dag:
+        for i in range(tasks_per_run):
+            EmptyOperator(task_id=f"task_{i}")
+    scheduler_dag = sync_dag_to_db(dag, session=session)
+
+    now = timezone.utcnow()
+    for i in range(math.ceil(num_tis / tasks_per_run)):
+        scheduler_dag.create_dagrun(
+            run_id=f"perf_{i}",
+            logical_date=now + timedelta(seconds=i),
+            run_after=now,
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+    session.commit()
+
+
+def reset_task_instances(pool_slots, session):
+    """Put every task instance of the benchmark Dag back into the scheduled state."""
+    from airflow.models.pool import Pool
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.state import TaskInstanceState
+
+    session.execute(
+        update(TaskInstance).where(TaskInstance.dag_id == DAG_ID).values(state=TaskInstanceState.SCHEDULED)
+    )
+    session.execute(update(Pool).where(Pool.pool == Pool.DEFAULT_POOL_NAME).values(slots=pool_slots))
+    session.commit()
+
+
+def time_critical_section(incremental, passes, max_tis, session):
+    """
+    Run the critical section ``passes`` times and return the duration of each pass.
+
+    Between passes, the task instances that were queued are marked successful, as if the executor had run
+    them, and released from the in-memory scheduling state, as executor events would.
+    """
+    from airflow.jobs.job import Job
+    from airflow.jobs.scheduler_job_runner import SchedulerJobRunner
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.state import TaskInstanceState
+
+    from tests_common.test_utils.config import conf_vars
+    from tests_common.test_utils.mock_executor import MockExecutor
+
+    with conf_vars({("scheduler", "use_incremental_scheduling_state"): str(incremental)}):
+        job_runner = SchedulerJobRunner(job=Job(), executors=[MockExecutor(parallelism=max_tis)])
+
+    durations = []
+    for _ in range(passes):
+        start = time.perf_counter()
+        queued = job_runner._executable_task_instances_to_queued(max_tis, session=session)
+        durations.append(time.perf_counter() - start)
+        session.commit()
+        if not queued:
+            break
+        session.execute(
+            update(TaskInstance)
+            .where(TaskInstance.id.in_([ti.id for ti in queued]))
+            .values(state=TaskInstanceState.SUCCESS)
+        )
+        session.commit()
+        if job_runner._scheduling_state is not None:
+            for ti in queued:
+                ti.state = TaskInstanceState.SUCCESS
+                job_runner._scheduling_state.release(ti)
+    return durations
+
+
+@click.command()
+@click.option(
+    "--num-tis",
+    multiple=True,
+    type=int,
+    default=(10_000, 50_000, 100_000),
+    show_default=True,
+    help="Number of scheduled task instances to benchmark with. Can be passed multiple times.",
+)
+@click.option("--tasks-per-run", default=100, show_default=True, help="Number of tasks in each Dag run")
+@click.option("--passes", default=20, show_default=True, help="Number of critical section passes to time")
+@click.option("--max-tis", default=512, show_default=True, help="Task instances to queue per pass")
+@click.option("--pool-slots", default=512, show_default=True, help="Slots of the default pool")
+def main(num_tis, tasks_per_run, passes, max_tis, pool_slots):
+    """
+    Compare the scheduler critical section latency with and without the incremental scheduling state.
+
+    For each requested number of scheduled task instances, this creates the task instances in the
+    configured metadata database, then times ``SchedulerJobRunner._executable_task_instances_to_queued``
+    with ``[scheduler] use_incremental_scheduling_state`` disabled and enabled. Task instances queued by a
+    pass are marked successful before the next pass, so each pass sees a similar backlog.
+
+    Run this against the database backend you want numbers for (e.g. PostgreSQL) - the relative cost of the
+    aggregate queries skipped by the incremental mode is very different on SQLite.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    from airflow.utils.session import create_session
+
+    results = []
+    for count in num_tis:
+        with create_session() as session:
+            click.echo(f"Creating {count} scheduled task instances...")
+            create_dag_runs(count, tasks_per_run, session)
+            for incremental in (False, True):
+                reset_task_instances(pool_slots, session)
+                durations = time_critical_section(incremental, passes, max_tis, session)
+                results.append((count, incremental, durations))
+
+    click.echo()
+    click.echo(f"{'TIs':>8} {'incremental':>12} {'passes':>7} {'mean (ms)':>10} {'median (ms)':>12}")
+    for count, incremental, durations in results:
+        click.echo(
+            f"{count:>8} {incremental!s:>12} {len(durations):>7} "
+            f"{statistics.mean(durations) * 1000:>10.1f} {statistics.median(durations) * 1000:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
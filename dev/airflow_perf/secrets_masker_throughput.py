@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import random
+import string
+import time
+
+import rich_click as click
+
+WORDS = (
+    "INFO Task started processing batch rows from upstream table with retries connection "
+    "opened to host using driver query returned records written to bucket path took seconds "
+    "scheduled running success queued worker pool slot operator hook sensor poke interval"
+).split()
+
+
+def make_secrets(count: int, rng: random.Random) -> list[str]:
+    alphabet = string.ascii_letters + string.digits
+    return ["".join(rng.choices(alphabet, k=rng.randint(12, 40))) for _ in range(count)]
+
+
+def make_lines(count: int, secrets: list[str], secret_ratio: float, rng: random.Random) -> list[str]:
+    """Make log lines of around 120 characters, ``secret_ratio`` of which contain a secret."""
+    lines = []
+    for _ in range(count):
+        words = rng.choices(WORDS, k=16)
+        if rng.random() < secret_ratio:
+            words.insert(rng.randrange(len(words)), rng.choice(secrets))
+        lines.append(" ".join(words))
+    return lines
+
+
+@click.command()
+@click.option(
+    "--secrets",
+    "secret_counts",
+    default="10,100,1000",
+    show_default=True,
+    help="Comma separated numbers of masked secrets to measure with",
+)
+@click.option("--lines", default=20_000, show_default=True, help="Number of log lines to redact")
+@click.option(
+    "--secret-ratio", default=0.01, show_default=True, help="Share of the log lines containing a secret"
+)
+def main(secret_counts, lines, secret_ratio):
+    """
+    Compare the throughput of the secrets masker engines redacting log lines.
+
+    For each number of masked secrets, masks them one by one with ``add_mask`` -- the way a task masks
+    the connections and variables it uses -- and reports the time that took, then redacts ``--lines``
+    log lines of around 120 characters and reports the log lines per second, for both the ``regex`` and
+    the ``trie`` engine of ``[logging] secret_mask_engine``.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    from airflow._shared.secrets_masker import SecretsMasker
+
+    click.echo(f"{'secrets':>8} {'engine':>10} {'mask all (s)':>13} {'lines/s':>10} {'same output':>12}")
+    for count in map(int, secret_counts.split(",")):
+        rng = random.Random(count)
+        secrets = make_secrets(count, rng)
+        log_lines = make_lines(lines, secrets, secret_ratio, rng)
+
+        outputs = {}
+        for engine in ("regex", "trie"):
+            masker = SecretsMasker()
+            masker.secret_mask_engine = engine
+            start = time.perf_counter()
+            for secret in secrets:
+                masker.add_mask(secret)
+            # The trie is compiled when it is first used
+            masker.redact("")
+            mask_time = time.perf_counter() - start
+
+            start = time.perf_counter()
+            outputs[engine] = [masker.redact(line) for line in log_lines]
+            lines_per_second = len(log_lines) / (time.perf_counter() - start)
+
+            same = "" if engine == "regex" else str(outputs[engine] == outputs["regex"])
+            click.echo(f"{count:>8} {engine:>10} {mask_time:>13.4f} {lines_per_second:>10.0f} {same:>12}")
+
+
+if __name__ == "__main__":
+    main()
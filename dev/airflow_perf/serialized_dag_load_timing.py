@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import statistics
+import time
+
+import rich_click as click
+
+DAG_ID = "perf_serialized_dag_load"
+
+
+def serialize_dag(num_tasks, group_size):
+    """Serialize a Dag of ``num_tasks`` chained Bash tasks, in task groups of ``group_size`` tasks."""
+    from airflow.providers.standard.operators.bash import BashOperator
+    from airflow.sdk import DAG, TaskGroup
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    with DAG(DAG_ID, schedule=None) as dag:
+        previous = None
+        for g in range(0, num_tasks, group_size):
+            with TaskGroup(f"group_{g // group_size}"):
+                for i in range(g, min(g + group_size, num_tasks)):
+                    task = BashOperator(task_id=f"task_{i}", bash_command=f"echo {i}", retries=i % 3)
+                    if previous is not None:
+                        previous >> task
+                    previous = task
+    return json.dumps(DagSerialization.to_dict(dag))
+
+
+def load_dag(serialized, warm_up, lazy, touched_task_ids, queue):
+    """Deserialize the Dag, access some of its tasks, and report the time it took and the RSS it added."""
+    import psutil
+
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    # Load plugins and lazily imported modules first, as a long-running process would have already.
+    DagSerialization.from_dict(json.loads(warm_up))
+
+    process = psutil.Process()
+    data = json.loads(serialized)
+    del serialized
+    rss_before = process.memory_info().rss
+    start = time.perf_counter()
+    dag = DagSerialization.from_dict(data, lazy=lazy)
+    for task_id in touched_task_ids:
+        dag.get_task(task_id)
+    duration = time.perf_counter() - start
+    queue.put((duration, process.memory_info().rss - rss_before))
+
+
+def time_load(serialized, warm_up, lazy, touched_task_ids):
+    # Each load runs in a new process, so that its RSS is not affected by memory freed by earlier loads.
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(
+        target=load_dag, args=(serialized, warm_up, lazy, touched_task_ids, queue)
+    )
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+@click.command()
+@click.option("--num-tasks", default=3000, show_default=True, help="Number of tasks in the Dag")
+@click.option("--group-size", default=50, show_default=True, help="Number of tasks in each task group")
+@click.option(
+    "--touch",
+    multiple=True,
+    type=int,
+    default=(1, 10, 100),
+    show_default=True,
+    help="Number of tasks to access after loading the Dag. Can be passed multiple times.",
+)
+@click.option("--repeat", default=5, show_default=True, help="Number of loads to time for each case")
+def main(num_tasks, group_size, touch, repeat):
+    """
+    Compare loading a serialized Dag with and without lazy task deserialization.
+
+    This serializes a Dag of ``--num-tasks`` tasks, then times ``DagSerialization.from_dict`` followed by
+    accessing ``--touch`` of its tasks, as the scheduler or an API route needing a few tasks does. All the
+    tasks are accessed in the eager case too, which only costs the lookups. The JSON parsing, which is the
+    same for both, is not included.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    serialized = serialize_dag(num_tasks, group_size)
+    warm_up = serialize_dag(1, group_size)
+    click.echo(f"Serialized Dag with {num_tasks} tasks: {len(serialized) / 1024 / 1024:.1f} MiB of JSON")
+
+    task_ids = [f"group_{i // group_size}.task_{i}" for i in range(num_tasks)]
+    cases = [(False, num_tasks)] + [(True, count) for count in sorted(set(touch)) + [num_tasks]]
+
+    click.echo()
+    click.echo(f"{'lazy':>6} {'touched':>8} {'median (ms)':>12} {'min (ms)':>9} {'RSS (MiB)':>10}")
+    for lazy, count in cases:
+        # Spread the touched tasks over the Dag.
+        touched = task_ids[:: max(1, num_tasks // count)][:count]
+        results = [time_load(serialized, warm_up, lazy, touched) for _ in range(repeat)]
+        durations = [duration for duration, _ in results]
+        rss = statistics.median(rss for _, rss in results)
+        click.echo(
+            f"{lazy!s:>6} {count:>8} {statistics.median(durations) * 1000:>12.1f} "
+            f"{min(durations) * 1000:>9.1f} {rss / 1024 / 1024:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
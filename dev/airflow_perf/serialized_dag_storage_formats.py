@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+import zlib
+
+import rich_click as click
+
+
+def load_example_dags():
+    """Serialize the example Dags, as the Dag processor would."""
+    import airflow.example_dags
+    from airflow.dag_processing.dagbag import DagBag
+    from airflow.serialization.serialized_objects import DagSerialization
+
+    dag_bag = DagBag(airflow.example_dags.__path__[0])
+    return [DagSerialization.to_dict(dag) for dag in dag_bag.dags.values()]
+
+
+def time_decode(decode, rows, repeat):
+    """Return the median time to decode all the rows."""
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            decode(row)
+        durations.append(time.perf_counter() - start)
+    return statistics.median(durations)
+
+
+@click.command()
+@click.option("--repeat", default=20, show_default=True, help="Number of times to decode all the Dags")
+def main(repeat):
+    """
+    Compare the size and decode time of the storage formats of serialized Dags, over the example Dags.
+
+    The size is the total length of the rows of the ``serialized_dag`` table, in ``data`` for uncompressed
+    Dags and in ``data_compressed`` otherwise. The decode time is the time to turn all the rows back into
+    dicts, as ``SerializedDagModel.data`` does. For uncompressed Dags, that is done by the database driver
+    with ``json.loads``.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    from airflow.models import serialized_dag
+
+    dags = load_example_dags()
+    dags_json = [json.dumps(dag, sort_keys=True).encode("utf-8") for dag in dags]
+
+    def compress(compressed_format):
+        serialized_dag._COMPRESSED_SERIALIZED_DAGS_FORMAT = compressed_format
+        return [serialized_dag._compress_dag_data(dag, dag_json)[0] for dag, dag_json in zip(dags, dags_json)]
+
+    def decode(row):
+        return serialized_dag._load_dag_data(serialized_dag._decompress_dag_data(row))
+
+    compressed_json = compress("json")
+    cases = [
+        ("json (uncompressed)", dags_json, json.loads),
+        ("json + zlib, json.loads", compressed_json, lambda row: json.loads(zlib.decompress(row))),
+        ("json + zlib", compressed_json, decode),
+        ("msgpack + zlib", compress("msgpack"), decode),
+    ]
+
+    click.echo(f"{len(dags)} example Dags")
+    click.echo()
+    click.echo(f"{'format':<26} {'size (KiB)':>11} {'decode (ms)':>12}")
+    for name, rows, decode_row in cases:
+        size = sum(len(row) for row in rows)
+        duration = time_decode(decode_row, rows, repeat)
+        click.echo(f"{name:<26} {size / 1024:>11.1f} {duration * 1000:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from textwrap import dedent
+
+import rich_click as click
+
+DAG_ID = "perf_task_startup"
+DAG_FILE = "perf_task_startup_dag.py"
+
+
+def write_dag_file(dags_folder: Path, marker_dir: Path) -> None:
+    """
+    Write a Dag with a single empty ``PythonOperator``.
+
+    The task writes the monotonic clock (which is shared by all processes on the host) to a file named
+    after its try number as the first thing it does, which is when its first log line would be written.
+    """
+    (dags_folder / DAG_FILE).write_text(
+        dedent(
+            f"""
+            import time
+            from pathlib import Path
+
+            from airflow.providers.standard.operators.python import PythonOperator
+            from airflow.sdk import DAG
+
+
+            def first_line(ti):
+                Path({str(marker_dir)!r}, str(ti.try_number)).write_text(str(time.monotonic()))
+
+
+            with DAG({DAG_ID!r}, schedule=None):
+                PythonOperator(task_id="noop", python_callable=first_line)
+            """
+        )
+    )
+
+
+def create_api_client():
+    """Create an API client answering every request of the task with a canned response."""
+    import httpx
+
+    from airflow.sdk import timezone
+    from airflow.sdk.api.client import Client
+    from airflow.sdk.api.datamodels._generated import DagRun, DagRunState, DagRunType, TIRunContext
+
+    now = timezone.utcnow()
+    run_context = TIRunContext(
+        dag_run=DagRun(
+            dag_id=DAG_ID,
+            run_id="perf",
+            logical_date=now,
+            data_interval_start=now,
+            data_interval_end=now,
+            run_after=now,
+            start_date=now,
+            end_date=None,
+            run_type=DagRunType.MANUAL,
+            state=DagRunState.RUNNING,
+            consumed_asset_events=[],
+            partition_key=None,
+        ),
+        max_tries=0,
+    ).model_dump_json()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/run"):
+            return httpx.Response(200, content=run_context)
+        return httpx.Response(204)
+
+    return Client(base_url="http://perf/execution", token="", transport=httpx.MockTransport(handler))
+
+
+def run_task(client, try_number: int, marker_dir: Path) -> tuple[float, float]:
+    """Run the task once, returning the time to its first line and to its end."""
+    import structlog
+    from uuid6 import uuid7
+
+    from airflow.executors.workloads import BundleInfo
+    from airflow.sdk.api.datamodels._generated import TaskInstance
+    from airflow.sdk.execution_time.supervisor import ActivitySubprocess
+
+    def drop(*_):
+        raise structlog.DropEvent
+
+    logger = structlog.wrap_logger(
+        None, processors=[drop], wrapper_class=structlog.make_filtering_bound_logger(logging.INFO)
+    )
+    start = time.monotonic()
+    proc = ActivitySubprocess.start(
+        what=TaskInstance(
+            id=uuid7(),
+            dag_id=DAG_ID,
+            task_id="noop",
+            run_id="perf",
+            try_number=try_number,
+            dag_version_id=uuid7(),
+            queue="default",
+        ),
+        dag_rel_path=DAG_FILE,
+        bundle_info=BundleInfo(name="dags-folder"),
+        client=client,
+        logger=logger,
+    )
+    if (rc := proc.wait()) != 0:
+        raise RuntimeError(f"Task exited with {rc}")
+    end = time.monotonic()
+    first_line = float((marker_dir / str(try_number)).read_text())
+    return first_line - start, end - start
+
+
+@click.command()
+@click.option("--runs", default=20, show_default=True, help="Number of task runs in each mode")
+@click.option(
+    "--warm-module",
+    "warm_modules",
+    multiple=True,
+    help="Module for the zygote to import up front, like [workers] task_zygote_warm_modules.",
+)
+def main(runs, warm_modules):
+    """
+    Compare the start-up time of a task forked from the supervisor with one forked from the task zygote.
+
+    Runs a Dag with an empty ``PythonOperator`` ``--runs`` times in each mode, with a canned API client,
+    and reports the time from starting the task process until the first line of the task's own code runs
+    (time to first task line) and until the task process has finished.
+
+    The first run of each mode isn't counted: in zygote mode it includes starting and warming up the zygote,
+    which is a one-off cost for each supervisor process.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dags_folder, marker_dir = Path(tmp, "dags"), Path(tmp, "markers")
+        dags_folder.mkdir()
+        marker_dir.mkdir()
+        write_dag_file(dags_folder, marker_dir)
+        os.environ["AIRFLOW__CORE__DAGS_FOLDER"] = str(dags_folder)
+        os.environ["AIRFLOW__WORKERS__TASK_ZYGOTE_WARM_MODULES"] = ",".join(warm_modules)
+
+        from airflow.sdk.execution_time import supervisor, zygote
+
+        client = create_api_client()
+        results = {}
+        try_number = 0
+        for mode in ("fork", "zygote"):
+            supervisor.TASK_ZYGOTE = mode == "zygote"
+            timings = []
+            for _ in range(runs + 1):
+                try_number += 1
+                timings.append(run_task(client, try_number, marker_dir))
+            # The first run in zygote mode starts the zygote and waits for it to warm up
+            click.echo(f"First run in {mode} mode: {timings[0][0]:.3f}s to first task line")
+            results[mode] = timings[1:]
+        zygote.get_task_zygote().close()
+
+    click.echo()
+    click.echo(f"{'mode':>7} {'first line p50 (s)':>19} {'first line p90 (s)':>19} {'total p50 (s)':>14}")
+    for mode, timings in results.items():
+        first_lines = [first_line for first_line, _ in timings]
+        p90 = statistics.quantiles(first_lines, n=10)[-1] if len(first_lines) > 1 else first_lines[0]
+        click.echo(
+            f"{mode:>7} {statistics.median(first_lines):>19.3f} {p90:>19.3f} "
+            f"{statistics.median(total for _, total in timings):>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
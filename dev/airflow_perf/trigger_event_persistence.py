@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import math
+import os
+import time
+from datetime import timedelta
+
+import rich_click as click
+from sqlalchemy import delete, func, select, update
+
+DAG_ID = "perf_trigger_event_persistence"
+
+
+def create_deferred_task_instances(num_events, tasks_per_run, session):
+    """
+    Create ``num_events`` task instances of a benchmark Dag and a trigger for each of them.
+
+    Return the ``(task instance id, trigger id)`` pairs.
+    """
+    from airflow.models.dagrun import DagRun
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.models.trigger import Trigger
+    from airflow.providers.standard.operators.empty import EmptyOperator
+    from airflow.sdk import DAG
+    from airflow.utils import timezone
+    from airflow.utils.state import DagRunState
+    from airflow.utils.types import DagRunTriggeredByType, DagRunType
+
+    from tests_common.test_utils.dag import sync_dag_to_db
+
+    session.execute(delete(TaskInstance).where(TaskInstance.dag_id == DAG_ID))
+    session.execute(delete(DagRun).where(DagRun.dag_id == DAG_ID))
+    session.execute(delete(Trigger))
+
+    with DAG(DAG_ID, schedule=None) as dag:
+        for i in range(tasks_per_run):
+            EmptyOperator(task_id=f"task_{i}")
+    scheduler_dag = sync_dag_to_db(dag, session=session)
+
+    now = timezone.utcnow()
+    for i in range(math.ceil(num_events / tasks_per_run)):
+        scheduler_dag.create_dagrun(
+            run_id=f"perf_{i}",
+            logical_date=now + timedelta(seconds=i),
+            run_after=now,
+            run_type=DagRunType.MANUAL,
+            triggered_by=DagRunTriggeredByType.TEST,
+            state=DagRunState.RUNNING,
+            session=session,
+        )
+    ti_ids = session.scalars(
+        select(TaskInstance.id)
+        .where(TaskInstance.dag_id == DAG_ID)
+        .order_by(TaskInstance.id)
+        .limit(num_events)
+    ).all()
+    triggers = [Trigger(classpath="airflow.triggers.testing.SuccessTrigger", kwargs={}) for _ in ti_ids]
+    session.add_all(triggers)
+    session.flush()
+    session.commit()
+    return [(ti_id, trigger.id) for ti_id, trigger in zip(ti_ids, triggers)]
+
+
+def defer_task_instances(deferred, session):
+    """Put the task instances back into the deferred state, each waiting on its trigger."""
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.state import TaskInstanceState
+
+    session.execute(
+        update(TaskInstance),
+        [
+            {
+                "id": ti_id,
+                "state": TaskInstanceState.DEFERRED,
+                "trigger_id": trigger_id,
+                "next_method": "execute_complete",
+                "next_kwargs": {"cheesecake": True},
+            }
+            for ti_id, trigger_id in deferred
+        ],
+    )
+    session.commit()
+
+
+def count_resumed(session):
+    """Return the number of task instances of the benchmark Dag that were resumed."""
+    from airflow.models.taskinstance import TaskInstance
+    from airflow.utils.state import TaskInstanceState
+
+    return session.scalar(
+        select(func.count()).where(
+            TaskInstance.dag_id == DAG_ID, TaskInstance.state == TaskInstanceState.SCHEDULED
+        )
+    )
+
+
+@click.command()
+@click.option(
+    "--events",
+    "event_counts",
+    default="1000,10000",
+    show_default=True,
+    help="Comma separated numbers of simultaneous trigger events to persist",
+)
+@click.option("--tasks-per-run", default=100, show_default=True, help="Number of tasks in each Dag run")
+def main(event_counts, tasks_per_run):
+    """
+    Compare the throughput of persisting trigger events one by one and all together.
+
+    For each number of events, creates as many task instances deferred on a trigger each in the configured
+    metadata database, then persists an event for every trigger -- once with ``Trigger.submit_event`` in a
+    transaction per event, as the triggerer used to, and once with a single ``Trigger.submit_event_many``
+    -- and reports the events persisted per second and the number of task instances resumed.
+
+    Run this against the database backend you want numbers for (e.g. PostgreSQL) - the cost of a
+    round trip and a commit is very different on SQLite.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    from airflow.models.trigger import Trigger
+    from airflow.triggers.base import TriggerEvent
+    from airflow.utils.session import create_session
+
+    click.echo(f"{'events':>8} {'method':>18} {'time (s)':>9} {'events/s':>9} {'resumed':>8}")
+    for count in map(int, event_counts.split(",")):
+        with create_session() as session:
+            deferred = create_deferred_task_instances(count, tasks_per_run, session)
+        events = [(trigger_id, TriggerEvent({"index": i})) for i, (_, trigger_id) in enumerate(deferred)]
+
+        for method in ("submit_event", "submit_event_many"):
+            with create_session() as session:
+                defer_task_instances(deferred, session)
+
+            start = time.perf_counter()
+            if method == "submit_event":
+                for trigger_id, event in events:
+                    Trigger.submit_event(trigger_id=trigger_id, event=event)
+            else:
+                Trigger.submit_event_many(events)
+            duration = time.perf_counter() - start
+
+            with create_session() as session:
+                resumed = count_resumed(session)
+            click.echo(
+                f"{count:>8} {method:>18} {duration:>9.2f} {len(events) / duration:>9.0f} {resumed:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
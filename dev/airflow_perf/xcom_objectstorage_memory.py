@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import multiprocessing
+import os
+import resource
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import rich_click as click
+
+ITEM_SIZE = 1024
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def make_value(size_mb: int, shape: str) -> list[str] | dict[str, list[str]]:
+    """
+    Build a list of distinct strings of ``ITEM_SIZE`` characters adding up to ``size_mb``.
+
+    With the ``nested`` shape the list is the only value of a dict, i.e. a single large item.
+    """
+    value = [f"{i:0{ITEM_SIZE}d}" for i in range(size_mb * 1024 * 1024 // ITEM_SIZE)]
+    return {"rows": value} if shape == "nested" else value
+
+
+def write_in_one_go(value, path: Path, compression: str | None) -> str:
+    """Store the value the way ``XComObjectStorageBackend`` did before it streamed values."""
+    import json
+
+    from airflow.providers.common.io.xcom.backend import ObjectStoragePath
+    from airflow.utils.json import XComEncoder
+
+    s_val_encoded = json.dumps(value, cls=XComEncoder).encode("utf-8")
+    p = ObjectStoragePath(f"file://{path}")
+    with p.open(mode="wb", compression=compression) as f:
+        f.write(s_val_encoded)
+    return str(p)
+
+
+def read_in_one_go(stored: str):
+    """Read the value back the way ``XComObjectStorageBackend`` did before it streamed values."""
+    import json
+
+    from airflow.providers.common.io.xcom.backend import ObjectStoragePath
+    from airflow.utils.json import XComDecoder
+
+    with ObjectStoragePath(stored).open(mode="rb", compression="infer") as f:
+        return json.load(f, cls=XComDecoder)
+
+
+def measure_write(
+    mode: str, size_mb: int, shape: str, path: Path, compression: str | None
+) -> tuple[str, float, float]:
+    """Serialize the value in a fresh process, returning where it went, the peak RSS increase and the time."""
+    from airflow.providers.common.io.xcom.backend import XComObjectStorageBackend
+
+    value = make_value(size_mb, shape)
+    before = peak_rss_mb()
+    start = time.monotonic()
+    if mode == "before":
+        stored = write_in_one_go(value, path, compression)
+    else:
+        stored = XComObjectStorageBackend.serialize_value(
+            value, key="perf", dag_id="perf", run_id="perf", task_id="perf"
+        )
+    return stored, peak_rss_mb() - before, time.monotonic() - start
+
+
+def measure_read(mode: str, stored: str) -> tuple[float, float]:
+    """Deserialize the value in a fresh process, returning the peak RSS increase and the time."""
+    from unittest.mock import Mock
+
+    from airflow.providers.common.io.xcom.backend import XComObjectStorageBackend
+
+    before = peak_rss_mb()
+    start = time.monotonic()
+    if mode == "before":
+        value = read_in_one_go(stored)
+    else:
+        value = XComObjectStorageBackend.deserialize_value(Mock(value=stored))
+    elapsed = time.monotonic() - start
+    peak = peak_rss_mb() - before
+    del value
+    return peak, elapsed
+
+
+def in_fresh_process(fn, *args):
+    with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+        return pool.submit(fn, *args).result()
+
+
+@click.command()
+@click.option("--size-mb", default=1024, show_default=True, help="Size of the XCom value, in MiB of JSON")
+@click.option(
+    "--compression",
+    default=None,
+    help="Compression to store the value with, like [common.io] xcom_objectstorage_compression.",
+)
+@click.option(
+    "--shape",
+    type=click.Choice(["list", "nested"]),
+    default="list",
+    show_default=True,
+    help="Push the list itself, or a dict with the list as its only value.",
+)
+def main(size_mb, compression, shape):
+    """
+    Compare the peak memory use of storing a large XCom in object storage in one go and item by item.
+
+    Pushes a list of ``--size-mb`` MiB of strings through ``XComObjectStorageBackend`` to the local
+    filesystem and pulls it back, each in a fresh process, and reports how much the peak RSS of the process
+    went up while doing so. "before" is the previous implementation, which encoded the whole value to JSON
+    and then to bytes before writing it, and read all of the file back before decoding it; "after" is the
+    current one, which writes and reads the value an item per line. A list nested in a dict (``--shape
+    nested``) is written in chunks as well, but read back whole.
+
+    For the read the increase includes the value itself, which is the same in both modes.
+    """
+    os.environ["AIRFLOW__CORE__UNIT_TEST_MODE"] = "True"
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["AIRFLOW__COMMON_IO__XCOM_OBJECTSTORAGE_PATH"] = f"file://{tmp}"
+        os.environ["AIRFLOW__COMMON_IO__XCOM_OBJECTSTORAGE_THRESHOLD"] = "0"
+        os.environ["AIRFLOW__COMMON_IO__XCOM_OBJECTSTORAGE_COMPRESSION"] = compression or ""
+
+        click.echo(
+            f"{'mode':>7} {'write peak (MiB)':>17} {'write (s)':>10} {'read peak (MiB)':>16} {'read (s)':>9}"
+        )
+        for mode in ("before", "after"):
+            stored, write_peak, write_time = in_fresh_process(
+                measure_write, mode, size_mb, shape, Path(tmp, mode), compression
+            )
+            read_peak, read_time = in_fresh_process(measure_read, mode, stored)
+            click.echo(
+                f"{mode:>7} {write_peak:>17.0f} {write_time:>10.2f} {read_peak:>16.0f} {read_time:>9.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -39,7 +39,7 @@ from typing import TYPE_CHECKING, Any
 from celery import Celery, states as celery_states
 from celery.backends.base import BaseKeyValueStoreBackend
 from celery.backends.database import DatabaseBackend, Task as TaskDb, retry, session_cleanup
-from celery.signals import import_modules as celery_import_modules, worker_ready
+from celery.signals import import_modules as celery_import_modules, worker_process_init, worker_ready
 from sqlalchemy import select
 
 from airflow.executors.base_executor import BaseExecutor
@@ -220,6 +220,17 @@ def on_celery_worker_ready(*args, **kwargs):
     gc.unfreeze()
 
 
+@worker_process_init.connect
+def on_celery_worker_process_init(*args, **kwargs):
+    """Start the task zygote of this pool process, if enabled, before it sets anything up for a task."""
+    try:
+        from airflow.sdk.execution_time.zygote import start_task_zygote
+    except ImportError:
+        # Airflow versions without a task zygote
+        return
+    start_task_zygote()
+
+
 # Once Celery 5.5 is out of beta, we can pass `pydantic=True` to the decorator and it will handle the validation
 # and deserialization for us.
 @app.task(name="execute_workload")
@@ -17,10 +17,12 @@
 from __future__ import annotations
 
 import contextlib
+import io
+import itertools
 import json
 import uuid
 from functools import cache
-from typing import TYPE_CHECKING, Any, TypeVar
+from typing import IO, TYPE_CHECKING, Any, TypeVar
 from urllib.parse import urlsplit
 
 import fsspec.utils
@@ -30,6 +32,8 @@ from airflow.providers.common.io.version_compat import AIRFLOW_V_3_0_PLUS
 from airflow.utils.json import XComDecoder, XComEncoder
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
     from sqlalchemy.orm import Session
 
     from airflow.sdk.execution_time.comms import XComResult
@@ -45,6 +49,11 @@ T = TypeVar("T")
 
 SECTION = "common.io"
 
+# Size of the writes of an encoded value to the object store
+_WRITE_SIZE = 1024 * 1024
+# Size from which the lists and dicts nested in a value are encoded an item at a time
+_STREAM_MIN_ITEMS = 1000
+
 
 def _get_compression_suffix(compression: str) -> str:
     """
@@ -74,6 +83,113 @@ def _get_threshold() -> int:
     return conf.getint(SECTION, "xcom_objectstorage_threshold", fallback=-1)
 
 
+def _iter_json(encoder: XComEncoder, value: Any) -> Iterator[str]:
+    """
+    Encode an XCom value, or part of one, to JSON a chunk at a time.
+
+    Lists and dicts of at least ``_STREAM_MIN_ITEMS`` items, at any depth, are encoded an item at a time, so
+    a large value is never all in memory as JSON. Anything else is encoded in one go, which is much faster.
+    The chunks never contain a line break, like JSON encoded in one go.
+    """
+    if type(value) is list and len(value) >= _STREAM_MIN_ITEMS:
+        yield "["
+        for i, item in enumerate(value):
+            if i:
+                yield ", "
+            yield from _iter_json(encoder, item)
+        yield "]"
+    elif type(value) is dict and len(value) >= _STREAM_MIN_ITEMS:
+        yield "{"
+        for i, (k, v) in enumerate(value.items()):
+            # Encoding a dict of one item converts the key to str, like for all of it
+            yield (", " if i else "") + json.JSONEncoder.encode(encoder, {k: None})[1 : -len("null}")]
+            yield from _iter_json(encoder, v)
+        yield "}"
+    else:
+        # XComEncoder.encode turns a tuple into a serialized tuple, which it only does for the value itself
+        yield json.JSONEncoder.encode(encoder, value)
+
+
+def _iter_json_lines(value: Any) -> Iterator[str]:
+    """
+    Encode the value to JSON an item at a time.
+
+    The items of a list, or of a dict, are put on a line of their own, which keeps the document valid JSON
+    while letting it be written, and read back by :func:`_iter_json_items`, without having all of it in
+    memory. Any other value is a single line. Large lists and dicts within the value, or within an item, are
+    encoded in chunks too, see :func:`_iter_json`, but have to be read back whole.
+    """
+    encoder = XComEncoder()
+    if type(value) is list:
+        yield "[\n"
+        for i, item in enumerate(value):
+            if i:
+                yield ",\n"
+            yield from _iter_json(encoder, item)
+        yield "\n]" if value else "]"
+    elif type(value) is dict:
+        yield "{\n"
+        for i, (k, v) in enumerate(value.items()):
+            # Encoding a dict of one item converts the key to str, and rejects reserved keys, like for all of it
+            yield (",\n" if i else "") + encoder.encode({k: None})[1 : -len("null}")]
+            yield from _iter_json(encoder, v)
+        yield "\n}" if value else "}"
+    elif isinstance(value, (dict, tuple)):
+        # Checked, or turned into a serialized tuple, by XComEncoder.encode
+        yield encoder.encode(value)
+    else:
+        yield from _iter_json(encoder, value)
+
+
+def _iter_json_items(f: IO[bytes]) -> tuple[type | None, Iterator[Any]]:
+    """
+    Decode a value written by :func:`_iter_json_lines` an item at a time.
+
+    :return: ``list`` and the items, or ``dict`` and the (key, value) pairs, when the value was written
+        an item per line; ``None`` and the whole value otherwise, like values written in one go before.
+    """
+    decoder = XComDecoder()
+    lines = io.TextIOWrapper(f, encoding="utf-8")
+    first = lines.readline()
+    # An item line holds nothing else than the item and the separator after it, which raw_decode ignores
+    if first == "[\n":
+        return list, (decoder.raw_decode(line)[0] for line in lines if line != "]")
+    if first == "{\n":
+
+        def iter_pairs() -> Iterator[tuple[str, Any]]:
+            for line in lines:
+                if line == "}":
+                    break
+                key, end = decoder.raw_decode(line)
+                value, _ = decoder.raw_decode(line, end + len(": "))
+                # Decoding the whole dict passes it to the object hook as well
+                yield next(iter(decoder.object_hook({key: value}).items()))
+
+        return dict, iter_pairs()
+    rest = lines.read()
+    return None, iter([decoder.decode(first + rest if rest else first)])
+
+
+def _write_chunks(f: IO[bytes], chunks: Iterable[str]) -> None:
+    """Write the chunks of an encoded value, small ones together and large ones in pieces."""
+    batch: list[str] = []
+    size = 0
+    for chunk in chunks:
+        if len(chunk) > _WRITE_SIZE:
+            f.write("".join(batch).encode("utf-8"))
+            batch, size = [], 0
+            # A single item can be large too, e.g. a serialized DataFrame, don't encode it all at once
+            for start in range(0, len(chunk), _WRITE_SIZE):
+                f.write(chunk[start : start + _WRITE_SIZE].encode("utf-8"))
+            continue
+        batch.append(chunk)
+        size += len(chunk)
+        if size >= _WRITE_SIZE:
+            f.write("".join(batch).encode("utf-8"))
+            batch, size = [], 0
+    f.write("".join(batch).encode("utf-8"))
+
+
 class XComObjectStorageBackend(BaseXCom):
     """
     XCom backend that stores data in an object store or database depending on the size of the data.
@@ -117,23 +233,29 @@ class XComObjectStorageBackend(BaseXCom):
         run_id: str | None = None,
         map_index: int | None = None,
     ) -> bytes | str:
-        # We will use this serialized value to write to the object store.
-        s_val = json.dumps(value, cls=XComEncoder)
-        s_val_encoded = s_val.encode("utf-8")
+        threshold = _get_threshold()
+        if threshold < 0:  # No threshold, everything is stored in the database.
+            return XComObjectStorageBackend._serialize_for_db(value)
+
+        # The value is encoded, and written to the object store, an item at a time so a large value does
+        # not have to be in memory a second time as JSON. Only up to the threshold is buffered to decide
+        # where it goes. XComEncoder escapes non-ASCII characters, so the length is the size in bytes.
+        chunks = _iter_json_lines(value)
+        head: list[str] = []
+        size = 0
+        for chunk in chunks:
+            head.append(chunk)
+            size += len(chunk)
+            if size >= threshold:
+                break
+        else:  # The value is small enough.
+            return XComObjectStorageBackend._serialize_for_db(value)
 
         if compression := _get_compression():
             suffix = f".{_get_compression_suffix(compression)}"
         else:
             suffix = ""
 
-        threshold = _get_threshold()
-        if threshold < 0 or len(s_val_encoded) < threshold:  # Either no threshold or value is small enough.
-            if AIRFLOW_V_3_0_PLUS:
-                return BaseXCom.serialize_value(value)
-            # TODO: Remove this branch once we drop support for Airflow 2
-            # This is for Airflow 2.10 where the value is expected to be bytes
-            return s_val_encoded
-
         base_path = _get_base_path()
         while True:  # Safeguard against collisions.
             p = base_path.joinpath(
@@ -146,10 +268,24 @@ class XComObjectStorageBackend(BaseXCom):
                 break
         p.parent.mkdir(parents=True, exist_ok=True)
 
-        with p.open(mode="wb", compression=compression) as f:
-            f.write(s_val_encoded)
+        try:
+            with p.open(mode="wb", compression=compression) as f:
+                _write_chunks(f, itertools.chain(head, chunks))
+        except BaseException:
+            # Don't leave a partial value behind if the rest of the value could not be serialized
+            with contextlib.suppress(OSError):
+                p.unlink(missing_ok=True)
+            raise
         return BaseXCom.serialize_value(str(p))
 
+    @staticmethod
+    def _serialize_for_db(value: Any) -> bytes | str:
+        if AIRFLOW_V_3_0_PLUS:
+            return BaseXCom.serialize_value(value)
+        # TODO: Remove this branch once we drop support for Airflow 2
+        # This is for Airflow 2.10 where the value is expected to be bytes
+        return json.dumps(value, cls=XComEncoder).encode("utf-8")
+
     @staticmethod
     def deserialize_value(result) -> Any:
         """
@@ -171,10 +307,75 @@ class XComObjectStorageBackend(BaseXCom):
             return data
         try:
             with path.open(mode="rb", compression="infer") as f:
-                return json.load(f, cls=XComDecoder)
+                kind, items = _iter_json_items(f)
+                return next(items) if kind is None else kind(items)
         except (FileNotFoundError, TypeError, ValueError):
             return data
 
+    @staticmethod
+    def iter_value(result) -> Iterator[Any]:
+        """
+        Iterate over the items of a list value, or the (key, value) pairs of a dict value.
+
+        Unlike :meth:`deserialize_value`, a value in object storage is read and deserialized an item at a
+        time, so a large value doesn't have to fit in memory.
+
+        :param result: the XCom as stored in the database, like for :meth:`deserialize_value`
+        :raises TypeError: if the value is neither a list nor a dict
+        """
+        try:
+            path = XComObjectStorageBackend._get_full_path(BaseXCom.deserialize_value(result))
+        except (TypeError, ValueError):  # Likely value stored directly in the database.
+            path = None
+
+        if path is not None and path.exists():
+            with path.open(mode="rb", compression="infer") as f:
+                kind, items = _iter_json_items(f)
+                if kind is not None:
+                    yield from items
+                    return
+                value = next(items)
+        else:
+            value = XComObjectStorageBackend.deserialize_value(result)
+        if isinstance(value, dict):
+            yield from value.items()
+        elif isinstance(value, list):
+            yield from value
+        else:
+            raise TypeError(f"Cannot iterate over an XCom value of type {type(value).__name__}")
+
+    @classmethod
+    def iter_one(
+        cls,
+        *,
+        key: str,
+        dag_id: str,
+        task_id: str,
+        run_id: str,
+        map_index: int | None = None,
+    ) -> Iterator[Any]:
+        """
+        Retrieve an XCom value from a task, and iterate over it like :meth:`iter_value`.
+
+        Unlike ``xcom_pull``, which deserializes all of the value, this lets a task go over a large list or
+        dict an item at a time. Nothing is yielded if there is no such XCom. Requires Airflow 3.
+
+        :param key: A key for the XCom.
+        :param dag_id: Dag ID of the task which pushed the XCom.
+        :param task_id: Task ID of the task which pushed the XCom.
+        :param run_id: Dag run ID of the task which pushed the XCom.
+        :param map_index: Map index of the task which pushed the XCom, if mapped.
+        :raises TypeError: if the value is neither a list nor a dict
+        """
+        if not AIRFLOW_V_3_0_PLUS:
+            raise RuntimeError("XComObjectStorageBackend.iter_one requires Airflow 3")
+        result = cls._get_xcom_db_ref(
+            key=key, dag_id=dag_id, task_id=task_id, run_id=run_id, map_index=map_index
+        )
+        if result.value is None:
+            return iter(())
+        return cls.iter_value(result)
+
     @staticmethod
     def purge(xcom: XComResult, session: Session | None = None) -> None:
         if not isinstance(xcom.value, str):
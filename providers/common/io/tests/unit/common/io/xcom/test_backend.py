@@ -17,13 +17,20 @@
 # under the License.
 from __future__ import annotations
 
+import io
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 import airflow.models.xcom
-from airflow.providers.common.io.xcom.backend import XComObjectStorageBackend
+from airflow.providers.common.io.xcom.backend import (
+    XComObjectStorageBackend,
+    _iter_json_items,
+    _iter_json_lines,
+)
 from airflow.providers.standard.operators.empty import EmptyOperator
+from airflow.utils.json import XComDecoder, XComEncoder
 
 from tests_common.test_utils import db
 from tests_common.test_utils.compat import timezone
@@ -464,3 +471,129 @@ class TestXComObjectStorageBackend:
             deserialized_data = XCom.deserialize_value(mock_xcom_ser)
 
             assert deserialized_data == expected_value
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(["bigvalue" * 10, (1, 2), {"key": "value"}, None], id="list"),
+            pytest.param({"key": "bigvalue" * 10, 1: [1, 2], "nested": {"key": "value"}}, id="dict"),
+            pytest.param([], id="empty_list"),
+            pytest.param("bigvalue" * 10, id="str"),
+        ],
+    )
+    @pytest.mark.parametrize("compression", [None, "gzip"])
+    def test_serialize_streams_items(self, value, compression):
+        with conf_vars(
+            {
+                ("common.io", "xcom_objectstorage_threshold"): "0",
+                ("common.io", "xcom_objectstorage_compression"): compression or "",
+            }
+        ):
+            serialized = XComObjectStorageBackend.serialize_value(
+                value, key="key", dag_id="dag_id", run_id="run_id", task_id="task_id"
+            )
+        path = XComObjectStorageBackend._get_full_path(serialized)
+        with path.open(mode="rb", compression="infer") as f:
+            stored = f.read().decode()
+
+        # Still a single JSON document, with the same content as encoding the value in one go
+        assert json.loads(stored) == json.loads(json.dumps(value, cls=XComEncoder))
+        if isinstance(value, (list, dict)):
+            assert stored.count("\n") == len(value) + 1
+        expected = json.loads(json.dumps(value, cls=XComEncoder), cls=XComDecoder)
+        assert XComObjectStorageBackend.deserialize_value(MagicMock(value=serialized)) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param({"rows": [[i, str(i)] for i in range(5)], "n": {1: (1, 2), "x": None}}, id="dict"),
+            pytest.param([list(range(5)), {"key": list(range(5))}], id="list"),
+            pytest.param({"key": list(range(5))} | {str(i): i for i in range(5)}, id="nested"),
+        ],
+    )
+    def test_serialize_streams_nested_values(self, value):
+        with patch("airflow.providers.common.io.xcom.backend._STREAM_MIN_ITEMS", 2):
+            chunks = list(_iter_json_lines(value))
+
+        # Each item is encoded in several chunks, and still on a line of its own
+        assert len(chunks) > len(value) + 2
+        stored = "".join(chunks)
+        assert stored.count("\n") == len(value) + 1
+        assert json.loads(stored) == json.loads(json.dumps(value, cls=XComEncoder))
+        kind, items = _iter_json_items(io.BytesIO(stored.encode()))
+        assert kind(items) == json.loads(json.dumps(value, cls=XComEncoder), cls=XComDecoder)
+
+    def test_serialize_below_threshold_in_db(self, tmp_path):
+        value = ["small", "value"]
+        serialized = XComObjectStorageBackend.serialize_value(
+            value, key="key", dag_id="dag_id", run_id="run_id", task_id="task_id"
+        )
+        assert XComObjectStorageBackend.deserialize_value(MagicMock(value=serialized)) == value
+        assert not list((tmp_path / "xcom").rglob("*.*"))
+
+    def test_serialize_error_removes_partial_value(self, tmp_path):
+        with pytest.raises(TypeError):
+            XComObjectStorageBackend.serialize_value(
+                ["bigvalue" * 10, object()], key="key", dag_id="dag_id", run_id="run_id", task_id="task_id"
+            )
+        assert not [p for p in (tmp_path / "xcom").rglob("*") if p.is_file()]
+
+    def test_deserialize_value_written_in_one_go(self):
+        value = {"key": ["bigvalue" * 10]}
+        path = ObjectStoragePath(self.path) / "dag_id" / "run_id" / "task_id" / "value"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(value, cls=XComEncoder))
+
+        assert XComObjectStorageBackend.deserialize_value(MagicMock(value=str(path))) == value
+        assert list(XComObjectStorageBackend.iter_value(MagicMock(value=str(path)))) == list(value.items())
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            pytest.param(["bigvalue" * 10, "more"], ["bigvalue" * 10, "more"], id="list"),
+            pytest.param({"key": "bigvalue" * 10}, [("key", "bigvalue" * 10)], id="dict"),
+            pytest.param(["small"], ["small"], id="in_db"),
+        ],
+    )
+    def test_iter_value(self, value, expected):
+        serialized = XComObjectStorageBackend.serialize_value(
+            value, key="key", dag_id="dag_id", run_id="run_id", task_id="task_id"
+        )
+        assert list(XComObjectStorageBackend.iter_value(MagicMock(value=serialized))) == expected
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Tasks retrieve XComs through the supervisor")
+    def test_iter_one(self, mock_supervisor_comms):
+        serialized = XComObjectStorageBackend.serialize_value(
+            ["bigvalue" * 10, "more"], key="key", dag_id="dag_id", run_id="run_id", task_id="task_id"
+        )
+        mock_supervisor_comms.send.return_value = XComResult(key="key", value=serialized)
+
+        items = XComObjectStorageBackend.iter_one(
+            key="key", dag_id="dag_id", task_id="task_id", run_id="run_id"
+        )
+
+        assert list(items) == ["bigvalue" * 10, "more"]
+        request = mock_supervisor_comms.send.call_args.args[0]
+        assert (request.key, request.dag_id, request.task_id, request.run_id) == (
+            "key",
+            "dag_id",
+            "task_id",
+            "run_id",
+        )
+
+    @pytest.mark.skipif(not AIRFLOW_V_3_0_PLUS, reason="Tasks retrieve XComs through the supervisor")
+    def test_iter_one_missing(self, mock_supervisor_comms):
+        mock_supervisor_comms.send.return_value = XComResult(key="key", value=None)
+
+        items = XComObjectStorageBackend.iter_one(
+            key="key", dag_id="dag_id", task_id="task_id", run_id="run_id"
+        )
+
+        assert list(items) == []
+
+    def test_iter_value_not_iterable(self):
+        serialized = XComObjectStorageBackend.serialize_value(
+            "bigvalue" * 10, key="key", dag_id="dag_id", run_id="run_id", task_id="task_id"
+        )
+        with pytest.raises(TypeError, match="Cannot iterate over an XCom value of type str"):
+            list(XComObjectStorageBackend.iter_value(MagicMock(value=serialized)))
@@ -80,10 +80,18 @@ class DateTimeTrigger(BaseTrigger):
             await asyncio.sleep(1)
         if self.end_from_trigger:
             self.log.info("Sensor time condition reached; marking task successful and exiting")
-            yield TaskSuccessEvent()
         else:
             self.log.info("yielding event with payload %r", self.moment)
-            yield TriggerEvent(self.moment)
+        yield self.timer_event()
+
+    def fires_at(self) -> datetime.datetime:
+        """Have triggerers supporting it wait for the moment in their timer queue, rather than run this."""
+        return self.moment
+
+    def timer_event(self) -> TriggerEvent:
+        if self.end_from_trigger:
+            return TaskSuccessEvent()
+        return TriggerEvent(self.moment)
 
 
 class TimeDeltaTrigger(DateTimeTrigger):
@@ -25,7 +25,7 @@ import pytest
 
 from airflow.providers.common.compat.sdk import timezone
 from airflow.providers.standard.triggers.temporal import DateTimeTrigger, TimeDeltaTrigger
-from airflow.triggers.base import TriggerEvent
+from airflow.triggers.base import TaskSuccessEvent, TriggerEvent
 from airflow.utils.state import TaskInstanceState
 
 # Bound at import time so tests patching ``temporal.timezone.utcnow`` still read a real clock here.
@@ -76,6 +76,22 @@ def test_timedelta_trigger_serialization():
     assert -2 < (kwargs["moment"] - expected_moment).total_seconds() < 2
 
 
+@pytest.mark.parametrize(
+    ("end_from_trigger", "expected_event_class"),
+    [(False, TriggerEvent), (True, TaskSuccessEvent)],
+)
+def test_datetime_trigger_timer(end_from_trigger, expected_event_class):
+    """The DateTimeTrigger can wait in the timer queue of the triggerer, firing the event it yields."""
+    moment = pendulum.instance(datetime.datetime(2020, 4, 1, 13, 0), pendulum.UTC)
+    trigger = DateTimeTrigger(moment, end_from_trigger=end_from_trigger)
+
+    assert trigger.fires_at() == moment
+    event = trigger.timer_event()
+    assert type(event) is expected_event_class
+    if not end_from_trigger:
+        assert event.payload == moment
+
+
 @pytest.mark.parametrize(
     ("tz", "end_from_trigger"),
     [
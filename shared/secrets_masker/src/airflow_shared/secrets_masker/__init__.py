@@ -26,6 +26,7 @@ from .secrets_masker import (
     _secrets_masker,
     mask_secret,
     merge,
+    record_masked_secrets,
     redact,
     reset_secrets_masker,
     should_hide_value_for_key,
@@ -35,6 +36,7 @@ __all__ = [
     "SecretsMasker",
     "mask_secret",
     "redact",
+    "record_masked_secrets",
     "reset_secrets_masker",
     "_is_v1_env_var",
     "RedactedIO",
@@ -25,7 +25,9 @@ import inspect
 import logging
 import re
 import sys
+import threading
 from collections.abc import Generator, Iterable, Iterator
+from contextvars import ContextVar
 from enum import Enum
 from functools import cache, cached_property
 from re import Pattern
@@ -79,6 +81,8 @@ DEFAULT_SENSITIVE_FIELDS = frozenset(
 SECRETS_TO_SKIP_MASKING = {"airflow"}
 """Common terms that should be excluded from masking in both production and tests"""
 
+_recorded_secrets: ContextVar[set[str] | None] = ContextVar("_recorded_secrets", default=None)
+
 
 def should_hide_value_for_key(name):
     """
@@ -150,7 +154,7 @@ def _secrets_masker() -> SecretsMasker:
     return SecretsMasker()
 
 
-def reset_secrets_masker() -> None:
+def reset_secrets_masker(keep: Iterable[str] = ()) -> None:
     """
     Reset the secrets masker to clear existing patterns and replacer.
 
@@ -159,8 +163,27 @@ def reset_secrets_masker() -> None:
 
     New processor types should invoke this method when setting up their own masking to avoid
     inheriting masking rules from existing execution environments.
+
+    :param keep: Secrets to go on masking, as collected with ``record_masked_secrets``.
+    """
+    _secrets_masker().reset_masker(keep)
+
+
+@contextlib.contextmanager
+def record_masked_secrets() -> Generator[set[str], None, None]:
+    """
+    Collect the secrets masked in this context, as the strings the masker looks for.
+
+    This lets a process masking the secrets of several executions at once (e.g. one supervising several
+    tasks) reset the masker once one of them is done, and keep masking the secrets of the others with
+    ``reset_secrets_masker(keep=...)``.
     """
-    _secrets_masker().reset_masker()
+    recorded: set[str] = set()
+    token = _recorded_secrets.set(recorded)
+    try:
+        yield recorded
+    finally:
+        _recorded_secrets.reset(token)
 
 
 def _is_v1_env_var(v: Any) -> TypeGuard[_V1EnvVarLike]:
@@ -186,10 +209,136 @@ def _get_v1_env_var_type_cached() -> type:
         return type("V1EnvVar", (), {})
 
 
+def _trie_pattern(node: dict[str, dict]) -> str:
+    """
+    Return a regular expression matching the secrets of a trie.
+
+    A secret ends in the nodes which have an empty string key. Where one does, the longer secrets going on
+    from there are tried first, so the longest secret is matched.
+    """
+    alternatives = []
+    for ch in sorted(k for k in node if k):
+        literal, child = ch, node[ch]
+        # Characters that only lead to one other are matched as one literal
+        while len(child) == 1 and "" not in child:
+            ((next_ch, child),) = child.items()
+            literal += next_ch
+        alternatives.append(re.escape(literal) + _trie_pattern(child))
+    if not alternatives:
+        return ""
+    pattern = alternatives[0] if len(alternatives) == 1 else f"(?:{'|'.join(alternatives)})"
+    return f"(?:{pattern})?" if "" in node else pattern
+
+
+class SecretsTrie:
+    """
+    Find and replace secrets with a trie of them compiled into a regular expression.
+
+    This can stand in for the regex alternation of all the secrets as the ``replacer`` of
+    :class:`SecretsMasker`: it has the same ``sub`` method and gives the same result, replacing the longest
+    secret starting leftmost each time. Where the alternation makes the regex engine try every secret at
+    each position of the string, in the trie it follows a single branch, so the time it takes to look for
+    the secrets grows much slower with the number of secrets.
+
+    Compiling the trie of many secrets takes a while, so new secrets go into a small alternation of recent
+    secrets first, and only once there are ``RECENT_SECRETS`` of them into the trie. Either is compiled
+    when the trie is next used, so adding many secrets at once compiles it once.
+
+    Secrets can be added while other threads are finding secrets: adding and compiling hold a lock, and the
+    regexes are swapped in together once compiled, so that finding secrets never goes without them.
+    """
+
+    RECENT_SECRETS = 32
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._secrets: set[str] = set()
+        self._min_length = 0
+        self._trie: dict[str, dict] = {}
+        self._recent: list[str] = []
+        # The compiled trie and recent secrets, each None when there are none
+        self._regexes: tuple[Pattern | None, Pattern | None] = (None, None)
+        self._changed = False
+
+    def __len__(self) -> int:
+        return len(self._secrets)
+
+    def add(self, secret: str) -> None:
+        """Add a secret to find."""
+        if not secret:
+            return
+        with self._lock:
+            if secret in self._secrets:
+                return
+            self._secrets.add(secret)
+            self._min_length = min(self._min_length or len(secret), len(secret))
+
+            node = self._trie
+            for ch in secret:
+                node = node.setdefault(ch, {})
+            node[""] = {}
+            self._recent.append(secret)
+            self._changed = True
+
+    def _compile(self) -> None:
+        with self._lock:
+            if not self._changed:
+                return
+            trie_regex, recent_regex = self._regexes
+            if len(self._recent) >= self.RECENT_SECRETS:
+                trie_regex = re.compile(_trie_pattern(self._trie))
+                self._recent = []
+            recent_regex = None
+            if self._recent:
+                # Longest first, so that of the secrets starting at the same place the longest one is
+                # replaced
+                recent_regex = re.compile(
+                    "|".join(map(re.escape, sorted(self._recent, key=len, reverse=True)))
+                )
+            self._regexes = (trie_regex, recent_regex)
+            self._changed = False
+
+    def sub(self, repl: str, string: str) -> str:
+        """Return ``string`` with every secret replaced by ``repl``."""
+        if self._changed:
+            self._compile()
+        if len(string) < self._min_length:
+            return string
+        trie_regex, recent_regex = self._regexes
+        if recent_regex is None or trie_regex is None:
+            regex = recent_regex or trie_regex
+            return regex.sub(repl, string) if regex else string
+
+        # Replace the longest of the matches of both starting leftmost, like a single regex would
+        trie_match = trie_regex.search(string)
+        recent_match = recent_regex.search(string)
+        parts = []
+        pos = 0
+        while trie_match or recent_match:
+            if not recent_match or (
+                trie_match
+                and (trie_match.start(), -trie_match.end()) <= (recent_match.start(), -recent_match.end())
+            ):
+                match = trie_match
+            else:
+                match = recent_match
+            parts.append(string[pos : match.start()])
+            parts.append(match.expand(repl))
+            pos = match.end()
+            if trie_match and trie_match.start() < pos:
+                trie_match = trie_regex.search(string, pos)
+            if recent_match and recent_match.start() < pos:
+                recent_match = recent_regex.search(string, pos)
+        if not parts:
+            return string
+        parts.append(string[pos:])
+        return "".join(parts)
+
+
 class SecretsMasker(logging.Filter):
     """Redact secrets from logs."""
 
-    replacer: Pattern | None = None
+    replacer: Pattern | SecretsTrie | None = None
     patterns: set[str]
 
     ALREADY_FILTERED_FLAG = "__SecretsMasker_filtered"
@@ -199,12 +348,23 @@ class SecretsMasker(logging.Filter):
 
     min_length_to_mask = 5
     secret_mask_adapter = None
+    # How to find the secrets in a string: "trie", a SecretsTrie, or "regex", an alternation of all of them,
+    # which gets slow when there are many secrets
+    secret_mask_engine = "trie"
+    # How many redacted strings and sensitive key names to remember, so that redacting the same values
+    # again (e.g. the rendered fields of a task on every refresh of the UI) is cheap. 0 to disable
+    redact_cache_size = 0
 
     def __init__(self):
         super().__init__()
         self.patterns = set()
         self.sensitive_variables_fields = []
         self.hide_sensitive_var_conn_fields = True
+        # Bumped whenever the secrets to mask change, which invalidates what redact_cache_size remembers
+        self.generation = 0
+        self._redacted_strings: dict[tuple[str, str], str] = {}
+        self._hidden_keys: dict[Any, bool] = {}
+        self._redact_cache_state: tuple | None = None
 
     @classmethod
     def __init_subclass__(cls, **kwargs):
@@ -354,7 +514,11 @@ class SecretsMasker(logging.Filter):
             # must fail closed at any nesting level. The depth cutoff below is
             # only used to bound the work of pattern-based string masking and
             # to terminate recursion through self-referential iterables.
-            if name and self.should_hide_value_for_key(name):
+            if name and (
+                self._should_hide_value_for_key_cached(name)
+                if self.redact_cache_size > 0
+                else self.should_hide_value_for_key(name)
+            ):
                 return self._redact_all(item, depth, max_depth, replacement=replacement)
             # Always walk dicts so deeper sensitive keys are still caught;
             # JSON-loaded payloads cannot be self-referential, and any
@@ -412,6 +576,8 @@ class SecretsMasker(logging.Filter):
                     # We can't replace specific values, but the key-based redacting
                     # can still happen, so we can't short-circuit, we need to walk
                     # the structure.
+                    if self.redact_cache_size > 0:
+                        return self._redact_string_cached(item, replacement)
                     return self.replacer.sub(replacement, str(item))
                 return item
             return item
@@ -430,6 +596,49 @@ class SecretsMasker(logging.Filter):
             # Rather than expose sensitive info, lets play it safe
             return "<redaction-failed>"
 
+    def _check_redact_cache(self) -> None:
+        """Forget the redacted strings and sensitive key names remembered if what they depend on changed."""
+        # The replacer and the sensitive fields are checked too, as they can be set directly
+        state = (
+            self.generation,
+            self.replacer,
+            self.hide_sensitive_var_conn_fields,
+            tuple(self.sensitive_variables_fields),
+        )
+        if state != self._redact_cache_state:
+            self._redacted_strings = {}
+            self._hidden_keys = {}
+            self._redact_cache_state = state
+
+    def _redact_string_cached(self, item: str, replacement: str) -> str:
+        key = (item, replacement)
+        # Taken before redacting: if a secret is added meanwhile (by another thread), the string may have been
+        # redacted without it, and must not be remembered in the cache cleared for it
+        generation, redacted_strings = self.generation, self._redacted_strings
+        try:
+            return redacted_strings[key]
+        except KeyError:
+            pass
+        redacted = self.replacer.sub(replacement, str(item))  # type: ignore[union-attr]
+        if self.generation != generation:
+            return redacted
+        if len(redacted_strings) >= self.redact_cache_size:
+            # Rather than keeping track of what was used least recently, start over, like the re module does
+            redacted_strings = self._redacted_strings = {}
+        redacted_strings[key] = redacted
+        return redacted
+
+    def _should_hide_value_for_key_cached(self, name) -> bool:
+        try:
+            return self._hidden_keys[name]
+        except KeyError:
+            pass
+        hide = self.should_hide_value_for_key(name)
+        if len(self._hidden_keys) >= self.redact_cache_size:
+            self._hidden_keys = {}
+        self._hidden_keys[name] = hide
+        return hide
+
     def _merge(
         self,
         new_item: Redacted,
@@ -533,6 +742,8 @@ class SecretsMasker(logging.Filter):
         :func:`should_hide_value_for_key`) then all string values in the item
         is redacted.
         """
+        if self.redact_cache_size > 0:
+            self._check_redact_cache()
         return self._redact(
             item, name, depth=0, max_depth=max_depth or self.MAX_RECURSION_DEPTH, replacement=replacement
         )
@@ -610,7 +821,8 @@ class SecretsMasker(logging.Filter):
                     SecretsMasker._has_warned_short_secret = True
                 return
 
-            new_mask = False
+            new_secrets = []
+            recorded = _recorded_secrets.get()
             for s in self._adaptations(secret):
                 if s:
                     if len(s) < min_length:
@@ -619,21 +831,49 @@ class SecretsMasker(logging.Filter):
                     if s.lower() in SECRETS_TO_SKIP_MASKING:
                         continue
 
+                    if name and not self.should_hide_value_for_key(name):
+                        continue
+
+                    if recorded is not None:
+                        recorded.add(s)
                     pattern = re.escape(s)
-                    if pattern not in self.patterns and (not name or self.should_hide_value_for_key(name)):
+                    if pattern not in self.patterns:
                         self.patterns.add(pattern)
-                        new_mask = True
-            if new_mask:
-                self.replacer = re.compile("|".join(self.patterns))
+                        new_secrets.append(s)
+            if new_secrets:
+                self._update_replacer(new_secrets)
 
         elif isinstance(secret, collections.abc.Iterable):
             for v in secret:
                 self.add_mask(v, name)
 
-    def reset_masker(self):
-        """Reset the patterns and the replacer in the masker instance."""
-        self.patterns = set()
-        self.replacer = None
+    def _update_replacer(self, new_secrets: list[str]) -> None:
+        if self.secret_mask_engine == "trie" and isinstance(self.replacer, SecretsTrie):
+            for secret in new_secrets:
+                self.replacer.add(secret)
+        else:
+            # Also the secrets added before, e.g. with the other engine
+            self.replacer = self._build_replacer(self.patterns)
+        # Only once the replacer masks the new secrets, see _redact_string_cached
+        self.generation += 1
+
+    def _build_replacer(self, patterns: set[str]) -> Pattern | SecretsTrie:
+        # Filled before it replaces the current replacer, which other threads may be redacting with
+        if self.secret_mask_engine == "trie":
+            trie = SecretsTrie()
+            for pattern in patterns:
+                trie.add(re.sub(r"\\(.)", r"\1", pattern, flags=re.DOTALL))
+            return trie
+        # Longest first, so that of the secrets starting at the same place the longest one is replaced,
+        # like SecretsTrie does, rather than whichever comes first in the set
+        return re.compile("|".join(sorted(patterns, key=len, reverse=True)))
+
+    def reset_masker(self, keep: Iterable[str] = ()):
+        """Reset the patterns and the replacer in the masker instance, other than for the secrets in ``keep``."""
+        patterns = {re.escape(secret) for secret in keep}
+        self.patterns = patterns
+        self.replacer = self._build_replacer(patterns) if patterns else None
+        self.generation += 1
 
 
 class RedactedIO(TextIO):
@@ -21,8 +21,10 @@ import inspect
 import logging
 import logging.config
 import os
+import re
 import sys
 import textwrap
+import threading
 from enum import Enum
 from io import StringIO
 from unittest.mock import patch
@@ -33,8 +35,10 @@ from airflow_shared.secrets_masker.secrets_masker import (
     DEFAULT_SENSITIVE_FIELDS,
     RedactedIO,
     SecretsMasker,
+    SecretsTrie,
     mask_secret,
     merge,
+    record_masked_secrets,
     redact,
     reset_secrets_masker,
 )
@@ -793,6 +797,33 @@ class TestSecretsMasker:
             got = redact(val)
             assert got == val
 
+    @pytest.mark.parametrize("engine", ["trie", "regex"])
+    def test_reset_secrets_masker_keeping_recorded_secrets(self, engine):
+        secrets_masker = SecretsMasker()
+        configure_secrets_masker_for_test(secrets_masker)
+        secrets_masker.secret_mask_engine = engine
+
+        with patch(
+            "airflow_shared.secrets_masker.secrets_masker._secrets_masker", return_value=secrets_masker
+        ):
+            with record_masked_secrets() as first:
+                mask_secret("first_secret")
+                mask_secret({"password": "first_password", "not_sensitive": "first_value"})
+            with record_masked_secrets() as second:
+                # Also recorded when it is masked already
+                mask_secret("first_secret")
+                mask_secret("second_secret")
+            mask_secret("unrecorded_secret")
+
+            assert first == {"first_secret", "first_password"}
+            assert second == {"first_secret", "second_secret"}
+
+            reset_secrets_masker(keep=second)
+
+            assert redact("first_secret second_secret first_password unrecorded_secret") == (
+                "*** *** first_password unrecorded_secret"
+            )
+
     def test_property_for_log_masking(self, monkeypatch):
         """Test that log masking enable/disable methods."""
 
@@ -1187,6 +1218,172 @@ class TestEdgeCases:
         assert " and " in redacted
 
 
+class TestSecretsTrie:
+    @staticmethod
+    def _regex_sub(secrets, string):
+        return re.sub("|".join(map(re.escape, sorted(secrets, key=len, reverse=True))), "***", string)
+
+    @pytest.mark.parametrize(
+        ("secrets", "string"),
+        [
+            pytest.param(["secret"], "a secret and a secret", id="single"),
+            pytest.param(["abc", "abcdef", "abcd"], "xabcdefx abcdx abcx", id="longest-of-prefixes"),
+            pytest.param(["abcde", "cdefg"], "abcdefg", id="overlapping-leftmost"),
+            pytest.param(["a.b*c", "(x|y)", "\\d+"], "a.b*c (x|y) \\d+ abbc x", id="special-chars"),
+            pytest.param(["secret"], "nothing to see here", id="no-match"),
+            pytest.param(["secret"], "sec", id="shorter-than-secrets"),
+        ],
+    )
+    def test_sub_same_as_regex(self, secrets, string):
+        trie = SecretsTrie()
+        for secret in secrets:
+            trie.add(secret)
+
+        assert trie.sub("***", string) == self._regex_sub(secrets, string)
+
+    def test_sub_with_recent_and_compiled_secrets(self, monkeypatch):
+        monkeypatch.setattr(SecretsTrie, "RECENT_SECRETS", 4)
+        secrets = [f"secret{i}" for i in range(10)] + ["secret1x", "ecret3", "secret77"]
+        string = " ".join(f"{s}-{s[::-1]}" for s in secrets) + " secret1xy secret777"
+
+        trie = SecretsTrie()
+        for secret in secrets:
+            trie.add(secret)
+            # Secrets are either in the compiled trie or still in the recent ones
+            assert trie.sub("***", string) == self._regex_sub(trie._secrets, string)
+
+        assert len(trie) == len(secrets)
+
+    def test_secrets_added_while_other_threads_find_secrets_are_found(self, monkeypatch):
+        monkeypatch.setattr(SecretsTrie, "RECENT_SECRETS", 8)
+        # Switch threads as often as possible, for them to interleave within add and sub
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        trie = SecretsTrie()
+        added: list[str] = []
+        leaked: list[str] = []
+        done = threading.Event()
+
+        def find_secrets():
+            while not done.is_set():
+                # Every secret added before this looks for them must be found
+                secrets = list(added)
+                redacted = trie.sub("***", " ".join(secrets))
+                leaked.extend(secret for secret in secrets if secret in redacted)
+
+        threads = [threading.Thread(target=find_secrets) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        try:
+            for i in range(1000):
+                secret = f"secret-{i:04}"
+                trie.add(secret)
+                added.append(secret)
+        finally:
+            done.set()
+            for thread in threads:
+                thread.join()
+            sys.setswitchinterval(switch_interval)
+
+        assert leaked == []
+        assert trie.sub("***", " ".join(added)) == " ".join(["***"] * len(added))
+
+    def test_masker_engines_mask_the_same(self):
+        secrets = ["password", "password123", "word12345"]
+        string = "password123 password word12345 password1"
+        redacted = {}
+        for engine in ("regex", "trie"):
+            masker = SecretsMasker()
+            configure_secrets_masker_for_test(masker)
+            masker.secret_mask_engine = engine
+            for secret in secrets:
+                masker.add_mask(secret)
+            redacted[engine] = masker.redact(string)
+
+        assert redacted["trie"] == redacted["regex"] == "*** *** *** ***1"
+
+    def test_switching_engine_keeps_secrets(self):
+        masker = SecretsMasker()
+        configure_secrets_masker_for_test(masker)
+        masker.secret_mask_engine = "regex"
+        masker.add_mask("first_secret")
+
+        masker.secret_mask_engine = "trie"
+        masker.add_mask("second_secret")
+
+        assert isinstance(masker.replacer, SecretsTrie)
+        assert masker.redact("first_secret and second_secret") == "*** and ***"
+
+
+class TestRedactCache:
+    @pytest.fixture
+    def masker(self):
+        masker = SecretsMasker()
+        configure_secrets_masker_for_test(masker)
+        masker.redact_cache_size = 100
+        masker.add_mask("first_secret")
+        return masker
+
+    def test_redacts_the_same_as_without_cache(self, masker):
+        value = {"sql": "select first_secret", "password": "plain", "nested": [("first_secret", 1)]}
+        uncached = SecretsMasker()
+        configure_secrets_masker_for_test(uncached)
+        uncached.add_mask("first_secret")
+
+        assert masker.redact(value) == masker.redact(value) == uncached.redact(value)
+        assert masker.redact(value, replacement="-") == uncached.redact(value, replacement="-")
+
+    def test_redacted_string_is_remembered(self, masker):
+        masker.redact("select first_secret")
+        with patch.object(masker.replacer, "sub", side_effect=AssertionError("not cached")):
+            assert masker.redact("select first_secret") == "select ***"
+
+    def test_add_mask_invalidates_cache(self, masker):
+        generation = masker.generation
+        assert masker.redact("first_secret second_secret") == "*** second_secret"
+
+        masker.add_mask("second_secret")
+
+        assert masker.generation > generation
+        assert masker.redact("first_secret second_secret") == "*** ***"
+
+    def test_string_redacted_while_adding_mask_is_not_remembered(self, masker):
+        sub = masker.replacer.sub
+
+        def sub_while_adding_mask(replacement, item):
+            redacted = sub(replacement, item)
+            # What another thread could do while this one is redacting
+            masker.add_mask("second_secret")
+            masker._check_redact_cache()
+            return redacted
+
+        with patch.object(masker.replacer, "sub", side_effect=sub_while_adding_mask):
+            assert masker.redact("first_secret second_secret") == "*** second_secret"
+
+        assert masker.redact("first_secret second_secret") == "*** ***"
+
+    def test_reset_masker_invalidates_cache(self, masker):
+        assert masker.redact("first_secret") == "***"
+
+        masker.reset_masker()
+
+        assert masker.redact("first_secret") == "first_secret"
+
+    def test_sensitive_fields_change_invalidates_cache(self, masker):
+        assert masker.redact({"custom_field": "value"}) == {"custom_field": "value"}
+
+        masker.sensitive_variables_fields = [*masker.sensitive_variables_fields, "custom"]
+
+        assert masker.redact({"custom_field": "value"}) == {"custom_field": "***"}
+
+    def test_cache_size_is_bounded(self, masker):
+        for i in range(250):
+            masker.redact({f"key_{i}": f"value {i}"})
+
+        assert len(masker._redacted_strings) <= masker.redact_cache_size
+        assert len(masker._hidden_keys) <= masker.redact_cache_size
+
+
 class TestDirectMethodCalls:
     def test_redact_all_directly(self):
         secrets_masker = SecretsMasker()
@@ -17,6 +17,8 @@
 
 from __future__ import annotations
 
+import importlib.util
+import json
 import logging
 import ssl
 import sys
@@ -71,6 +73,9 @@ from airflow.sdk.api.datamodels._generated import (
     TaskStateStoreResponse,
     TerminalStateNonSuccess,
     TIAwaitingInputStatePayload,
+    TIBulkHeartbeatBody,
+    TIBulkHeartbeatItem,
+    TIBulkHeartbeatResponse,
     TIDeferredStatePayload,
     TIEnterRunningPayload,
     TIHeartbeatInfo,
@@ -108,6 +113,7 @@ from airflow.sdk.execution_time.comms import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
     from datetime import datetime
     from typing import ParamSpec
 
@@ -181,6 +187,7 @@ _trace_propagator = TraceContextTextMapPropagator()
 _log_retry_warning = before_log(log, logging.WARNING)
 
 __all__ = [
+    "AsyncClient",
     "Client",
     "ConnectionOperations",
     "ServerResponseError",
@@ -331,6 +338,21 @@ class TaskInstanceOperations:
         body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
         self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
 
+    def bulk_heartbeat(self, heartbeats: Mapping[uuid.UUID, tuple[int, str]]) -> TIBulkHeartbeatResponse:
+        """
+        Heartbeat many TIs running on this host in one request, returning the status of each of them.
+
+        Each TI is given with its pid and its own token, by which the server authorizes its heartbeat.
+        """
+        body = TIBulkHeartbeatBody(
+            hostname=get_hostname(),
+            heartbeats=[
+                TIBulkHeartbeatItem(id=id, pid=pid, token=token) for id, (pid, token) in heartbeats.items()
+            ],
+        )
+        resp = self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+        return TIBulkHeartbeatResponse.model_validate_json(resp.read())
+
     def skip_downstream_tasks(self, id: uuid.UUID, msg: SkipDownstreamTasks):
         """Tell the API server to skip the downstream tasks of this TI."""
         body = TISkippedDownstreamTasksStatePayload(tasks=msg.tasks)
@@ -458,6 +480,32 @@ class TaskInstanceOperations:
         return InactiveAssetsResponse.model_validate_json(resp.read())
 
 
+class AsyncTaskInstanceOperations:
+    """The subset of ``TaskInstanceOperations`` used by the asyncio supervisor, for ``AsyncClient``."""
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def heartbeat(self, id: uuid.UUID, pid: int):
+        body = TIHeartbeatInfo(pid=pid, hostname=get_hostname())
+        await self.client.put(f"task-instances/{id}/heartbeat", content=body.model_dump_json())
+
+    async def bulk_heartbeat(
+        self, heartbeats: Mapping[uuid.UUID, tuple[int, str]]
+    ) -> TIBulkHeartbeatResponse:
+        """Heartbeat many TIs running on this host in one request, see ``TaskInstanceOperations``."""
+        body = TIBulkHeartbeatBody(
+            hostname=get_hostname(),
+            heartbeats=[
+                TIBulkHeartbeatItem(id=id, pid=pid, token=token) for id, (pid, token) in heartbeats.items()
+            ],
+        )
+        resp = await self.client.put("task-instances/heartbeats", content=body.model_dump_json())
+        return TIBulkHeartbeatResponse.model_validate_json(resp.content)
+
+
 class ConnectionOperations:
     __slots__ = ("client",)
 
@@ -633,7 +681,12 @@ class XComOperations:
             params["map_index"] = map_index
         if mapped_length is not None and mapped_length >= 0:
             params["mapped_length"] = mapped_length
-        self.client.post(f"xcoms/{dag_id}/{run_id}/{task_id}/{key}", params=params, json=value)
+        self.client.post(
+            f"xcoms/{dag_id}/{run_id}/{task_id}/{key}",
+            params=params,
+            content=json.dumps(value, default=_xcom_json_default),
+            headers={"Content-Type": "application/json"},
+        )
         # Any error from the server will anyway be propagated down to the supervisor,
         # so we choose to send a generic response to the supervisor over the server response to
         # decouple from the server response string
@@ -1109,6 +1162,15 @@ class BearerAuth(httpx.Auth):
 
 # This exists as an aid for debugging or local running via the `dry_run` argument to Client. It doesn't make
 # sense for returning connections etc.
+def _xcom_json_default(o: object) -> Any:
+    # Serialized XCom values may hold binary data, which the task passes to the supervisor as it is
+    if isinstance(o, bytes):
+        from airflow.sdk.serde import encode_bytes
+
+        return encode_bytes(o)
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
 def noop_handler(request: httpx.Request) -> httpx.Response:
     path = request.url.path
     log.debug("Dry-run request", method=request.method, path=path)
@@ -1146,6 +1208,9 @@ API_CLIENT_SSL_KEY = conf.get("api", "client_ssl_key", fallback=None)
 API_CLIENT_USE_PUBLIC_CERTS = conf.getboolean("api", "client_use_public_certs", fallback=True)
 
 
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
 def _should_retry_api_request(exception: BaseException) -> bool:
     """Determine if an API request should be retried based on the exception type."""
     if isinstance(exception, httpx.HTTPStatusError):
@@ -1154,6 +1219,42 @@ def _should_retry_api_request(exception: BaseException) -> bool:
     return isinstance(exception, httpx.RequestError)
 
 
+def _client_init_kwargs(*, base_url: str | None, dry_run: bool, token: str, **kwargs: Any) -> dict[str, Any]:
+    """Build the arguments shared by ``Client`` and ``AsyncClient`` for their httpx base class."""
+    if (not base_url) ^ dry_run:
+        raise ValueError(f"Can only specify one of {base_url=} or {dry_run=}")
+    auth = BearerAuth(token)
+
+    if dry_run:
+        # If dry run is requested, install a no op handler so that simple tasks can "heartbeat" using a
+        # real client, but just don't make any HTTP requests
+        kwargs.setdefault("transport", httpx.MockTransport(noop_handler))
+        kwargs.setdefault("base_url", "dry-run://server")
+    else:
+        kwargs["base_url"] = base_url
+        # Call via the class to avoid binding lru_cache wires to an instance.
+        kwargs["verify"] = Client._get_ssl_context_cached(API_SSL_CA_FILE_PATH, API_SSL_CERT_PATH)
+
+        if API_CLIENT_SSL_CERT or API_CLIENT_SSL_KEY:
+            if not (API_CLIENT_SSL_CERT and API_CLIENT_SSL_KEY):
+                raise ValueError("Both client_ssl_cert and client_ssl_key must be set.")
+
+            kwargs["cert"] = (API_CLIENT_SSL_CERT, API_CLIENT_SSL_KEY)
+
+    # Set timeout if not explicitly provided
+    kwargs.setdefault("timeout", API_TIMEOUT)
+
+    pyver = f"{'.'.join(map(str, sys.version_info[:3]))}"
+    return {
+        "auth": auth,
+        "headers": {
+            "user-agent": f"apache-airflow-task-sdk/{__version__} (Python/{pyver})",
+            "airflow-api-version": API_VERSION,
+        },
+        **kwargs,
+    }
+
+
 class Client(httpx.Client):
     @lru_cache()
     @staticmethod
@@ -1175,47 +1276,48 @@ class Client(httpx.Client):
         return ctx
 
     def __init__(self, *, base_url: str | None, dry_run: bool = False, token: str, **kwargs: Any):
-        if (not base_url) ^ dry_run:
-            raise ValueError(f"Can only specify one of {base_url=} or {dry_run=}")
-        auth = BearerAuth(token)
-
-        if dry_run:
-            # If dry run is requested, install a no op handler so that simple tasks can "heartbeat" using a
-            # real client, but just don't make any HTTP requests
-            kwargs.setdefault("transport", httpx.MockTransport(noop_handler))
-            kwargs.setdefault("base_url", "dry-run://server")
-        else:
-            kwargs["base_url"] = base_url
-            # Call via the class to avoid binding lru_cache wires to this instance.
-            kwargs["verify"] = type(self)._get_ssl_context_cached(API_SSL_CA_FILE_PATH, API_SSL_CERT_PATH)
-
-            if API_CLIENT_SSL_CERT or API_CLIENT_SSL_KEY:
-                if not (API_CLIENT_SSL_CERT and API_CLIENT_SSL_KEY):
-                    raise ValueError("Both client_ssl_cert and client_ssl_key must be set.")
-
-                kwargs["cert"] = (API_CLIENT_SSL_CERT, API_CLIENT_SSL_KEY)
-
-        # Set timeout if not explicitly provided
-        kwargs.setdefault("timeout", API_TIMEOUT)
-
-        pyver = f"{'.'.join(map(str, sys.version_info[:3]))}"
+        # Remembered to create an AsyncClient for the same server, see ``make_async``. A custom transport
+        # (the in-process API server, tests) can't be shared with an async client.
+        self._async_init_kwargs = (
+            None if "transport" in kwargs else {"base_url": base_url, "dry_run": dry_run}
+        )
         super().__init__(
-            auth=auth,
-            headers={
-                "user-agent": f"apache-airflow-task-sdk/{__version__} (Python/{pyver})",
-                "airflow-api-version": API_VERSION,
-            },
             event_hooks={
                 "response": [self._update_auth, raise_on_4xx_5xx],
                 "request": [add_correlation_id, inject_trace_context],
             },
-            **kwargs,
+            **_client_init_kwargs(base_url=base_url, dry_run=dry_run, token=token, **kwargs),
         )
 
+    def make_async(self, **kwargs: Any) -> AsyncClient | None:
+        """
+        Create an ``AsyncClient`` for the same API server, sharing the authentication of this client.
+
+        A token refreshed by the API server in a response to either client is used by both from then on.
+        Returns None if this client uses a custom transport.
+        """
+        if self._async_init_kwargs is None:
+            return None
+        token = self.auth.token  # type: ignore[attr-defined]
+        async_client = AsyncClient(token=token, **self._async_init_kwargs, **kwargs)
+        async_client.auth = self.auth
+        return async_client
+
+    def with_token(self, token: str) -> Client:
+        """
+        Create a client for the same API server, authenticated with another token.
+
+        The new client sends its requests over the connection pool of this one, so a supervisor running
+        several tasks can keep one set of connections to the API server while each task uses its own token.
+        Only this client should be closed: closing it closes the connections of the new client too.
+        """
+        return Client(base_url=str(self.base_url), token=token, transport=self._transport)
+
     def _update_auth(self, response: httpx.Response):
         if new_token := response.headers.get("Refreshed-API-Token"):
             log.debug("Execution API issued us a refreshed Task token")
-            self.auth = BearerAuth(new_token)
+            # Updated in place, as the auth may be shared with another client, see ``Client.make_async``
+            self.auth.token = new_token  # type: ignore[attr-defined]
 
     @retry(
         retry=retry_if_exception(_should_retry_api_request),
@@ -1311,6 +1413,71 @@ class Client(httpx.Client):
         return DagsOperations(self)
 
 
+async def _araise_on_4xx_5xx(response: httpx.Response):
+    # The error body is parsed synchronously, so it has to be read first
+    if response.is_error:
+        await response.aread()
+    return raise_on_4xx_5xx(response)
+
+
+async def _aadd_correlation_id(request: httpx.Request):
+    add_correlation_id(request)
+
+
+async def _ainject_trace_context(request: httpx.Request) -> None:
+    inject_trace_context(request)
+
+
+class AsyncClient(httpx.AsyncClient):
+    """
+    Asyncio counterpart of :class:`Client`, for callers running several API calls concurrently.
+
+    It is configured, authenticated and retried like ``Client``. When the ``h2`` package is installed
+    (``pip install 'httpx[http2]'``) it talks HTTP/2 to the API server, so concurrent requests share one
+    keep-alive connection instead of opening one each.
+
+    Only the operations the asyncio supervisor needs are available so far.
+    """
+
+    def __init__(self, *, base_url: str | None, dry_run: bool = False, token: str, **kwargs: Any):
+        kwargs.setdefault("http2", _HTTP2_AVAILABLE)
+        super().__init__(
+            event_hooks={
+                "response": [self._update_auth, _araise_on_4xx_5xx],
+                "request": [_aadd_correlation_id, _ainject_trace_context],
+            },
+            **_client_init_kwargs(base_url=base_url, dry_run=dry_run, token=token, **kwargs),
+        )
+
+    async def _update_auth(self, response: httpx.Response):
+        if new_token := response.headers.get("Refreshed-API-Token"):
+            log.debug("Execution API issued us a refreshed Task token")
+            # Updated in place, as the auth may be shared with another client, see ``Client.make_async``
+            self.auth.token = new_token  # type: ignore[attr-defined]
+
+    @retry(
+        retry=retry_if_exception(_should_retry_api_request),
+        stop=stop_after_attempt(API_RETRIES),
+        wait=wait_random_exponential(min=API_RETRY_WAIT_MIN, max=API_RETRY_WAIT_MAX),
+        before_sleep=_log_and_trace_retry,
+        reraise=True,
+    )
+    async def request(self, *args, **kwargs):
+        """Implement a convenience for httpx.AsyncClient.request with a retry layer."""
+        if kwargs.get("content", None) is not None and "content-type" not in (
+            kwargs.get("headers", {}) or {}
+        ):
+            kwargs["headers"] = {"content-type": "application/json"}
+
+        return await super().request(*args, **kwargs)
+
+    @lru_cache()  # type: ignore[misc]
+    @property
+    def task_instances(self) -> AsyncTaskInstanceOperations:
+        """Operations related to TaskInstances."""
+        return AsyncTaskInstanceOperations(self)
+
+
 # This is only used for parsing. ServerResponseError is raised instead
 class _ErrorBody(BaseModel):
     detail: list[RemoteValidationError] | dict[str, Any] | str
@@ -261,6 +261,19 @@ class TIAwaitingInputStatePayload(BaseModel):
     rendered_map_index: Annotated[str | None, Field(title="Rendered Map Index")] = None
 
 
+class TIBulkHeartbeatItem(BaseModel):
+    """
+    A TaskInstance heartbeating in a bulk heartbeat request, with the token it was issued.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    id: Annotated[UUID, Field(title="Id")]
+    pid: Annotated[int, Field(title="Pid")]
+    token: Annotated[str, Field(title="Token")]
+
+
 class TIDeferredStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a deferred state.
@@ -306,6 +319,19 @@ class TIHeartbeatInfo(BaseModel):
     pid: Annotated[int, Field(title="Pid")]
 
 
+class TIHeartbeatStatus(str, Enum):
+    """
+    Outcome of the heartbeat of a TaskInstance in a bulk heartbeat request.
+    """
+
+    OK = "ok"
+    RUNNING_ELSEWHERE = "running_elsewhere"
+    NOT_RUNNING = "not_running"
+    GONE = "gone"
+    NOT_FOUND = "not_found"
+    UNAUTHORIZED = "unauthorized"
+
+
 class TIRescheduleStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a up_for_reschedule state.
@@ -713,6 +739,28 @@ class LiteralArgBinding(BaseModel):
     from_default: Annotated[bool | None, Field(title="From Default")] = False
 
 
+class TIBulkHeartbeatBody(BaseModel):
+    """
+    Schema for the bulk TaskInstance heartbeat endpoint, for TaskInstances running on the same host.
+    """
+
+    model_config = ConfigDict(
+        extra="forbid",
+    )
+    hostname: Annotated[str, Field(title="Hostname")]
+    heartbeats: Annotated[list[TIBulkHeartbeatItem], Field(min_length=1, title="Heartbeats")]
+
+
+class TIBulkHeartbeatResult(BaseModel):
+    """
+    Outcome of the heartbeat of one TaskInstance, with a new token for it when its token expires soon.
+    """
+
+    id: Annotated[UUID, Field(title="Id")]
+    status: TIHeartbeatStatus
+    token: Annotated[str | None, Field(title="Token")] = None
+
+
 class TITerminalStatePayload(BaseModel):
     """
     Schema for updating TaskInstance to a terminal state except SUCCESS state.
@@ -813,6 +861,14 @@ class TaskArgBinding(RootModel[XComArgBinding | LiteralArgBinding]):
     root: Annotated[XComArgBinding | LiteralArgBinding, Field(discriminator="kind", title="TaskArgBinding")]
 
 
+class TIBulkHeartbeatResponse(BaseModel):
+    """
+    Response of the bulk TaskInstance heartbeat endpoint, with one result per TaskInstance heartbeating.
+    """
+
+    results: Annotated[list[TIBulkHeartbeatResult], Field(title="Results")]
+
+
 class TIRunContext(BaseModel):
     """
     Response schema for TaskInstance run context.
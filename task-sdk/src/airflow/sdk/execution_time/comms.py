@@ -65,6 +65,7 @@ import attrs
 import msgspec
 import structlog
 from pydantic import AwareDatetime, BaseModel, ConfigDict, Field, JsonValue, TypeAdapter
+from typing_extensions import TypeAliasType
 
 from airflow.sdk.api.datamodels._generated import (
     AssetEventDagRunReference,
@@ -119,6 +120,17 @@ if TYPE_CHECKING:
 SendMsgType = TypeVar("SendMsgType", bound=BaseModel)
 ReceiveMsgType = TypeVar("ReceiveMsgType", bound=BaseModel)
 
+XComValue = TypeAliasType(
+    "XComValue",
+    "list[XComValue] | dict[str, XComValue] | bytes | str | bool | int | float | None",
+)
+"""
+A serialized XCom value: JSON, except it may hold binary data (e.g. a DataFrame as Parquet).
+
+msgpack carries the bytes as they are; where the value has to be JSON they are encoded with
+:func:`airflow.sdk.serde.encode_bytes`.
+"""
+
 
 class DeadlockImminentError(BaseException):
     """
@@ -950,7 +962,7 @@ class GetXComSequenceSlice(BaseModel):
 
 class SetXCom(BaseModel):
     key: str
-    value: JsonValue
+    value: XComValue
     dag_id: str
     run_id: str
     task_id: str
@@ -23,6 +23,9 @@ Usage:
 
 Arguments:
     input_file (str): Path to the JSON file containing the workload definition.
+
+The JSON can also be a list of task workloads, which are then run concurrently and supervised from this one
+process.
 """
 
 from __future__ import annotations
@@ -58,6 +61,38 @@ def execute_workload(workload: ExecuteTask) -> None:
     )
 
 
+def execute_workloads(workloads: list[ExecuteTask]) -> None:
+    """Run several task workloads concurrently, supervising all of their processes from this one."""
+    from airflow.executors.base_executor import get_execution_api_server_url
+    from airflow.sdk.execution_time.supervisor import MultiTaskSupervisor
+    from airflow.sdk.log import configure_logging
+    from airflow.settings import dispose_orm
+
+    dispose_orm(do_log=False)
+
+    configure_logging(output=sys.stdout.buffer, json_output=True)
+
+    with MultiTaskSupervisor(
+        server=get_execution_api_server_url(), subprocess_logs_to_stdout=True
+    ) as supervisor:
+        for workload in workloads:
+            log.info("Executing workload", workload=workload)
+            try:
+                # workload.ti is a TaskInstanceDTO which duck-types as TaskInstance.
+                supervisor.start_task(
+                    ti=workload.ti,  # type: ignore[arg-type]
+                    bundle_info=workload.bundle_info,
+                    dag_rel_path=workload.dag_rel_path,
+                    token=workload.token,
+                    log_path=workload.log_path,
+                    sentry_integration=workload.sentry_integration,
+                )
+            except Exception:
+                # Keep running the workloads that did start
+                log.exception("Failed to start workload", workload=workload)
+        supervisor.run_until_complete()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Execute a workload in a Containerised executor using the task SDK."
@@ -82,7 +117,9 @@ def main():
 
     from airflow.executors import workloads
 
-    decoder = TypeAdapter[workloads.All](workloads.All)
+    decoder = TypeAdapter[workloads.All | list[workloads.ExecuteTask]](
+        workloads.All | list[workloads.ExecuteTask]
+    )
     if args.json_path:
         try:
             with open(args.json_path) as file:
@@ -99,7 +136,10 @@ def main():
             log.error("Failed to parse input JSON string", error=str(e))
             sys.exit(1)
 
-    execute_workload(workload)
+    if isinstance(workload, list):
+        execute_workloads(workload)
+    else:
+        execute_workload(workload)
 
 
 if __name__ == "__main__":
@@ -39,26 +39,61 @@ _XComWrapper = collections.namedtuple("_XComWrapper", "value")
 log = structlog.get_logger(logger_name=__name__)
 
 
+def _default_page_size() -> int:
+    from airflow.sdk.configuration import conf
+
+    return conf.getint("core", "xcom_sequence_page_size")
+
+
 @attrs.define
 class LazyXComIterator(Iterator[T]):
+    """
+    Iterate over a :class:`LazyXComSequence`.
+
+    Unless ``page_size`` is 1 or less, the values are fetched ``page_size`` at a time with one
+    ``GetXComSequenceSlice`` request, and only the current page is kept in memory.
+    """
+
     seq: LazyXComSequence[T]
     index: int = 0
     dir: Literal[1, -1] = 1
+    page_size: int = attrs.field(factory=_default_page_size)
+    _page: collections.deque[T] = attrs.field(factory=collections.deque, init=False, repr=False)
+    _last_page: bool = attrs.field(default=False, init=False, repr=False)
 
     def __next__(self) -> T:
         if self.index < 0:
             # When iterating backwards, avoid extra HTTP request
             raise StopIteration()
-        try:
-            val = self.seq[self.index]
-        except IndexError:
-            raise StopIteration from None
+        if self.page_size > 1:
+            if not self._page and not self._fetch_page():
+                raise StopIteration()
+            val = self._page.popleft()
+        else:
+            try:
+                val = self.seq[self.index]
+            except IndexError:
+                raise StopIteration from None
         self.index += self.dir
         return val
 
     def __iter__(self) -> Iterator[T]:
         return self
 
+    def _fetch_page(self) -> bool:
+        """Fetch the next page of values in the direction of iteration, returning whether there are any."""
+        if self._last_page:
+            return False
+        if self.dir == 1:
+            values = self.seq[self.index : self.index + self.page_size]
+            self._last_page = len(values) < self.page_size
+        else:
+            start = max(0, self.index - self.page_size + 1)
+            values = self.seq[start : self.index + 1][::-1]
+            self._last_page = start == 0
+        self._page.extend(values)
+        return bool(self._page)
+
 
 @attrs.define
 class LazyXComSequence(Sequence[T]):
@@ -87,6 +122,9 @@ class LazyXComSequence(Sequence[T]):
     def __iter__(self) -> Iterator[T]:
         return LazyXComIterator(seq=self)
 
+    def __reversed__(self) -> Iterator[T]:
+        return LazyXComIterator(seq=self, index=len(self) - 1, dir=-1)
+
     def __len__(self) -> int:
         if self._len is None:
             from airflow.sdk.execution_time.comms import ErrorResponse, GetXComCount, XComCountResponse
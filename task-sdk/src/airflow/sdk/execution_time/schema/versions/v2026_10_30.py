@@ -18,8 +18,10 @@
 from __future__ import annotations
 
 from cadwyn import VersionChange, schema
+from pydantic import JsonValue
 
 from airflow.sdk.api.datamodels._generated import TIRunContext
+from airflow.sdk.execution_time.comms import SetXCom
 
 
 class AddArgBindingsToSupervisorTIRunContext(VersionChange):
@@ -34,3 +36,16 @@ class AddArgBindingsToSupervisorTIRunContext(VersionChange):
     description = __doc__
 
     instructions_to_migrate_to_previous_version = (schema(TIRunContext).field("arg_bindings").didnt_exist,)
+
+
+class AllowBytesInSetXComValue(VersionChange):
+    """
+    Allow binary data in the serialized ``value`` of ``SetXCom``.
+
+    Serializers such as the pandas and numpy ones now produce raw bytes, which msgpack carries as
+    they are instead of as a hex string.
+    """
+
+    description = __doc__
+
+    instructions_to_migrate_to_previous_version = (schema(SetXCom).field("value").had(type=JsonValue),)
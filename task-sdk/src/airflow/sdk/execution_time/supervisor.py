@@ -19,6 +19,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import atexit
 import contextlib
 import functools
@@ -34,6 +35,7 @@ import time
 import weakref
 from collections import deque
 from collections.abc import Callable, Generator
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager, suppress
 from datetime import datetime, timezone
 from http import HTTPStatus
@@ -50,12 +52,13 @@ import structlog
 from pydantic import BaseModel, TypeAdapter
 
 from airflow.sdk._shared.logging.structlog import reconfigure_logger
-from airflow.sdk.api.client import Client, ServerResponseError
+from airflow.sdk.api.client import AsyncClient, Client, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetResponse,
     ConnectionResponse,
     TaskInstance,
     TaskInstanceState,
+    TIHeartbeatStatus,
 )
 from airflow.sdk.configuration import conf
 from airflow.sdk.exceptions import ErrorType
@@ -132,7 +135,11 @@ from airflow.sdk.execution_time.comms import (
     _RequestFrame,
     _ResponseFrame,
 )
-from airflow.sdk.execution_time.coordinator import get_coordinator_manager
+from airflow.sdk.execution_time.coordinator import (
+    InvalidCoordinatorError,
+    _PythonCoordinator,
+    get_coordinator_manager,
+)
 from airflow.sdk.execution_time.request_handlers import (
     handle_delete_variable,
     handle_delete_xcom,
@@ -173,6 +180,7 @@ if TYPE_CHECKING:
     from airflow.executors.workloads import BundleInfo
     from airflow.sdk.bases.secrets_backend import BaseSecretsBackend
     from airflow.sdk.definitions.connection import Connection
+    from airflow.sdk.execution_time.zygote import Zygote
     from airflow.sdk.types import RuntimeTaskInstanceProtocol as RuntimeTI
 
 __all__ = ["ActivitySubprocess", "WatchedSubprocess", "supervise", "supervise_task"]
@@ -183,6 +191,10 @@ HEARTBEAT_TIMEOUT: int = conf.getint("scheduler", "task_instance_heartbeat_timeo
 # Don't heartbeat more often than this
 MIN_HEARTBEAT_INTERVAL: int = conf.getint("workers", "min_heartbeat_interval")
 MAX_FAILED_HEARTBEATS: int = conf.getint("workers", "max_failed_heartbeats")
+# Monitor the task process on an asyncio event loop, see ActivitySubprocess._amonitor_subprocess
+ASYNCIO_SUPERVISOR: bool = conf.getboolean("workers", "asyncio_supervisor")
+# Fork task processes from a pre-warmed zygote process, see airflow.sdk.execution_time.zygote
+TASK_ZYGOTE: bool = conf.getboolean("workers", "task_zygote")
 
 SOCKET_CLEANUP_TIMEOUT: float = conf.getfloat("workers", "socket_cleanup_timeout")
 
@@ -685,6 +697,7 @@ class WatchedSubprocess:
         logger: FilteringBoundLogger | None = None,
         use_exec: bool = False,
         new_process_group: bool = False,
+        zygote: Zygote | None = None,
         **constructor_kwargs,
     ) -> Self:
         """
@@ -702,6 +715,9 @@ class WatchedSubprocess:
             can be delivered to the child's whole process tree via
             ``os.killpg``. Task execution opts in; DAG processor and triggerer
             keep the supervisor's process group and are signalled directly.
+        :param zygote: Fork the child from this pre-warmed zygote process rather than from the
+            supervisor itself, falling back to the latter should the zygote fail. ``target`` is
+            passed to the zygote by name, so it has to be importable.
         """
         if use_exec and "<" in getattr(target, "__qualname__", "<"):
             # Closures/lambdas (``<locals>`` / ``<lambda>`` in the qualname) and
@@ -717,7 +733,23 @@ class WatchedSubprocess:
         # Open the socketpair before forking off the child, so that it is open when we fork.
         child_logs, read_logs = socketpair()
 
-        pid = os.fork()
+        tracker: ProcessTracker | None = None
+        if zygote is not None:
+            from airflow.sdk.execution_time.zygote import ZygoteError
+
+            try:
+                tracker = zygote.fork(
+                    target,
+                    child_requests=child_requests,
+                    child_stdout=child_stdout,
+                    child_stderr=child_stderr,
+                    child_logs=child_logs,
+                    new_process_group=new_process_group,
+                )
+            except ZygoteError:
+                log.warning("Failed to fork from the task zygote, forking from the supervisor", exc_info=True)
+
+        pid = tracker.pid if tracker is not None else os.fork()
         if pid == 0:
             if new_process_group:
                 # Put the task-runner into its own process group so its PGID
@@ -783,7 +815,7 @@ class WatchedSubprocess:
             # do then _THINGS GET WEIRD_.. (Normally `_fork_main` itself will `_exit()` so we never get here)
             os._exit(124)
 
-        if new_process_group:
+        if new_process_group and tracker is None:
             # Mirror of the child-side setpgid, so the group is guaranteed to
             # exist once start() returns. Without this, kill() invoked before
             # the child is first scheduled (e.g. task_instances.start()
@@ -800,7 +832,7 @@ class WatchedSubprocess:
         proc = cls(
             pid=pid,
             stdin=read_requests,
-            process=PsutilTracker(psutil.Process(pid)),
+            process=tracker if tracker is not None else PsutilTracker(psutil.Process(pid)),
             process_log=logger,
             start_time=time.monotonic(),
             new_process_group=new_process_group,
@@ -814,6 +846,9 @@ class WatchedSubprocess:
             read_logs,
             data={},
         )
+        if tracker is not None and zygote is not None:
+            # The exit code of the child comes from the zygote, wake up for it like for the child's sockets
+            zygote.watch(proc.selector)
 
         return proc
 
@@ -1017,8 +1052,13 @@ class WatchedSubprocess:
         for sock in sockets:
             sock.close()
 
-    def _cleanup_open_sockets(self):
-        """Force-close any sockets that never reported EOF."""
+    def _cleanup_open_sockets(self, close_selector: bool = True):
+        """
+        Force-close any sockets that never reported EOF.
+
+        :param close_selector: Whether to close the selector too, which mustn't be done when it is shared
+            with the supervisors of other tasks (see ``MultiTaskSupervisor``).
+        """
         # In extremely busy environments the selector can fail to deliver a
         # final read event before the subprocess exits. Without closing these
         # sockets the supervisor would wait forever thinking they are still
@@ -1028,6 +1068,8 @@ class WatchedSubprocess:
             fileno = "unknown"
             with suppress(Exception):
                 fileno = sock.fileno()
+                self.selector.unregister(sock)
+            with suppress(Exception):
                 sock.close()
             stuck_sockets.append(f"{socket_type}(fd={fileno})")
 
@@ -1035,7 +1077,8 @@ class WatchedSubprocess:
             log.warning("Force-closed stuck sockets", pid=self.pid, sockets=stuck_sockets)
 
         self._open_sockets.clear()
-        self.selector.close()
+        if close_selector:
+            self.selector.close()
         self.stdin.close()
 
     def _signal_subprocess(self, sig: signal.Signals) -> None:
@@ -1160,31 +1203,37 @@ class WatchedSubprocess:
         timeout = max(0.01, max_wait_time)
         events = self.selector.select(timeout=timeout)
         for key, _ in events:
-            # Retrieve the handler responsible for processing this file object (e.g., stdout, stderr)
-            socket_handler, on_close = key.data
-
-            # Example of handler behavior:
-            # If the subprocess writes "Hello, World!" to stdout:
-            # - `socket_handler` reads and processes the message.
-            # - If EOF is reached, the handler returns False to signal no more reads are expected.
-            # - BrokenPipeError should be caught and treated as if the handler returned false, similar
-            # to EOF case
-            try:
-                need_more = socket_handler(key.fileobj)
-            except (BrokenPipeError, ConnectionResetError):
-                need_more = False
-
-            # If the handler signals that the file object is no longer needed (EOF, closed, etc.)
-            # unregister it from the selector to stop monitoring; `wait()` blocks until all selectors
-            # are removed.
-            if not need_more:
-                sock: socket = key.fileobj  # type: ignore[assignment]
-                on_close(sock)
-                sock.close()
+            self._handle_socket_event(key)
 
         # Check if the subprocess has exited
         return self._check_subprocess_exit(raise_on_timeout=raise_on_timeout, expect_signal=expect_signal)
 
+    @staticmethod
+    def _handle_socket_event(key: selectors.SelectorKey) -> bool:
+        """Process the activity on one of the registered sockets, returning whether it is still open."""
+        # Retrieve the handler responsible for processing this file object (e.g., stdout, stderr)
+        socket_handler, on_close = key.data
+
+        # Example of handler behavior:
+        # If the subprocess writes "Hello, World!" to stdout:
+        # - `socket_handler` reads and processes the message.
+        # - If EOF is reached, the handler returns False to signal no more reads are expected.
+        # - BrokenPipeError should be caught and treated as if the handler returned false, similar
+        # to EOF case
+        try:
+            need_more = socket_handler(key.fileobj)
+        except (BrokenPipeError, ConnectionResetError):
+            need_more = False
+
+        # If the handler signals that the file object is no longer needed (EOF, closed, etc.)
+        # unregister it from the selector to stop monitoring; `wait()` blocks until all selectors
+        # are removed.
+        if not need_more:
+            sock: socket = key.fileobj  # type: ignore[assignment]
+            on_close(sock)
+            sock.close()
+        return need_more
+
     def _check_subprocess_exit(
         self, raise_on_timeout: bool = False, expect_signal: None | int = None
     ) -> int | None:
@@ -1360,6 +1409,94 @@ def _remote_logging_conn(client: Client):
         del client
 
 
+@attrs.define
+class HeartbeatCoalescer:
+    """
+    Send the heartbeats of several supervisors running in this process as one bulk request.
+
+    Each supervisor sharing the coalescer adds itself once its heartbeat is due, and the pending heartbeats
+    are sent together with ``PUT /task-instances/heartbeats`` by ``flush`` once the oldest of them has
+    waited ``max_delay`` seconds. A supervisor driving many tasks should call ``flush_if_due`` on every
+    iteration of its loop; with the default ``max_delay`` of 0 every heartbeat is sent straight away.
+
+    Only supervisors in one process can share a coalescer, which is why it is used by
+    ``MultiTaskSupervisor``; the supervisor processes started by ``supervise_task`` heartbeat on their own.
+
+    Each task instance is sent with its own token, and the server authorizes each of them on its own, so a
+    stale task instance in the batch does not affect the others. The outcome of each task instance is
+    handed back to its supervisor, which reacts exactly as it would to the equivalent single heartbeat
+    response. The supervisors of task instances the server could not heartbeat in bulk -- because their
+    token was refused, or the whole request failed -- send a single heartbeat instead.
+    """
+
+    max_delay: float = 0.0
+    _pending: dict[UUID, ActivitySubprocess] = attrs.field(factory=dict, init=False)
+    _first_pending_at: float | None = attrs.field(default=None, init=False)
+
+    def add(self, proc: ActivitySubprocess) -> None:
+        if not self._pending:
+            self._first_pending_at = time.monotonic()
+        self._pending[proc.id] = proc
+
+    def remove(self, proc: ActivitySubprocess) -> None:
+        self._pending.pop(proc.id, None)
+        if not self._pending:
+            self._first_pending_at = None
+
+    def flush_if_due(self) -> None:
+        if self._first_pending_at is not None and time.monotonic() - self._first_pending_at >= self.max_delay:
+            self.flush()
+
+    def time_until_due(self) -> float | None:
+        """Return the number of seconds until the pending heartbeats are due, or None if there are none."""
+        if self._first_pending_at is None:
+            return None
+        return self._first_pending_at + self.max_delay - time.monotonic()
+
+    def flush(self) -> None:
+        """Send all the pending heartbeats."""
+        if not self._pending:
+            return
+        # Tasks that finished while waiting for the batch no longer need (or want) a heartbeat
+        pending = {
+            ti_id: proc
+            for ti_id, proc in self._pending.items()
+            if proc._exit_code is None and not proc._terminal_state
+        }
+        self._pending, self._first_pending_at = {}, None
+        if not pending:
+            return
+
+        # Each task instance is authorized by the token sent with it, the request only needs a valid token, so
+        # use the client of one of the supervisors in the batch.
+        client = next(iter(pending.values())).client
+        try:
+            resp = client.task_instances.bulk_heartbeat(
+                {ti_id: (proc.pid, proc.client.auth.token) for ti_id, proc in pending.items()}
+            )
+        except Exception:
+            log.warning(
+                "Bulk heartbeat failed; sending the heartbeats one by one", count=len(pending), exc_info=True
+            )
+            for proc in pending.values():
+                proc._send_heartbeat()
+            return
+
+        for result in resp.results:
+            if (proc := pending.get(result.id)) is None:
+                continue
+            if result.token:
+                # The server only refreshes the token of the request itself, so it hands back the others.
+                # Updated in place, as the auth may be shared with another client, see ``Client.make_async``
+                proc.client.auth.token = result.token  # type: ignore[attr-defined]
+            if result.status == TIHeartbeatStatus.OK:
+                proc._handle_heartbeat_success()
+            elif result.status == TIHeartbeatStatus.UNAUTHORIZED:
+                proc._send_heartbeat()
+            else:
+                proc._handle_heartbeat_rejected(detail=result.status.value)
+
+
 @attrs.define(kw_only=True)
 class ActivitySubprocess(WatchedSubprocess):
     client: Client
@@ -1383,6 +1520,9 @@ class ActivitySubprocess(WatchedSubprocess):
     _last_successful_heartbeat: float = attrs.field(default=0, init=False)
     _last_heartbeat_attempt: float = attrs.field(default=0, init=False)
 
+    heartbeat_coalescer: HeartbeatCoalescer | None = None
+    """When set, heartbeats are sent in bulk with those of the other supervisors sharing this coalescer."""
+
     _should_retry: bool = attrs.field(default=False, init=False)
     """Whether the task should retry or not as decided by the API server."""
 
@@ -1409,13 +1549,27 @@ class ActivitySubprocess(WatchedSubprocess):
         target: Callable[[], None] = _subprocess_main,
         logger: FilteringBoundLogger | None = None,
         sentry_integration: str = "",
+        fork_from_zygote: bool | None = None,
         **kwargs,
     ) -> Self:
-        """Fork and start a new subprocess to execute the given task."""
+        """
+        Fork and start a new subprocess to execute the given task.
+
+        :param fork_from_zygote: Whether to fork the task process from the task zygote, rather than from
+            this process. Defaults to ``[workers] task_zygote``.
+        """
         # Opt in to fork+exec on platforms that need it (currently macOS).
         # Tests override `target` with a local stub to exercise the base
         # infrastructure; keep bare fork for those.
         use_exec = target is _subprocess_main and _should_use_exec()
+        if fork_from_zygote is None:
+            fork_from_zygote = TASK_ZYGOTE
+        zygote = None
+        if fork_from_zygote and not use_exec and "<" not in getattr(target, "__qualname__", "<"):
+            # Started before the sockets of this task are created, so it doesn't hold on to them
+            from airflow.sdk.execution_time.zygote import get_task_zygote
+
+            zygote = get_task_zygote()
         proc: Self = super().start(
             id=what.id,
             client=client,
@@ -1423,6 +1577,7 @@ class ActivitySubprocess(WatchedSubprocess):
             logger=logger,
             use_exec=use_exec,
             new_process_group=True,
+            zygote=zygote,
             **kwargs,
         )
         # Tell the task process what it needs to do!
@@ -1485,10 +1640,17 @@ class ActivitySubprocess(WatchedSubprocess):
             return self._exit_code
 
         try:
-            self._monitor_subprocess()
+            if ASYNCIO_SUPERVISOR:
+                asyncio.run(self._amonitor_subprocess())
+            else:
+                self._monitor_subprocess()
         finally:
             self.selector.close()
 
+        return self._finalize()
+
+    def _finalize(self) -> int:
+        """Report the final state of the task and upload its logs, once the process is done with."""
         # self._monitor_subprocess() will set the exit code when the process has finished
         # If it hasn't, assume it's failed
         self._exit_code = self._exit_code if self._exit_code is not None else 1
@@ -1649,6 +1811,112 @@ class ActivitySubprocess(WatchedSubprocess):
 
                 self._handle_process_overtime_if_needed()
 
+    async def _amonitor_subprocess(self):
+        """
+        Monitor the subprocess until it exits, like ``_monitor_subprocess`` but on an asyncio event loop.
+
+        Logs are forwarded and heartbeats sent on the event loop, while requests from the task are handled
+        in a worker thread, so a slow API call (such as a large XCom push) doesn't hold back the logs or the
+        heartbeats of the task. The heartbeats use an ``AsyncClient`` when the API client can make one.
+        """
+        loop = asyncio.get_running_loop()
+        activity = asyncio.Event()
+        # The sockets the event loop is watching, mirroring the ones registered in ``self.selector``
+        readers: dict[int, selectors.SelectorKey] = {}
+        request_tasks: set[asyncio.Task] = set()
+        heartbeat: asyncio.Task | None = None
+        async_client = self.client.make_async()
+
+        def sync_readers():
+            try:
+                keys = {key.fd: key for key in tuple(self.selector.get_map().values())}
+            except RuntimeError:
+                # A request handled in a thread registered a socket while we were reading them: it is
+                # picked up on the next pass.
+                return
+            for fd in [fd for fd, key in readers.items() if keys.get(fd) is not key]:
+                loop.remove_reader(fd)
+                del readers[fd]
+            for fd, key in keys.items():
+                if fd not in readers:
+                    loop.add_reader(fd, on_readable, key)
+                    readers[fd] = key
+
+        def on_readable(key: selectors.SelectorKey):
+            activity.set()
+            if self._open_sockets.get(key.fileobj) == "requests":  # type: ignore[call-overload]
+                # Stop watching the socket while a worker thread reads and handles the request.
+                self.selector.unregister(key.fileobj)
+                task = asyncio.create_task(handle_request(key))
+                request_tasks.add(task)
+                task.add_done_callback(request_tasks.discard)
+            else:
+                self._handle_socket_event(key)
+            sync_readers()
+
+        async def handle_request(key: selectors.SelectorKey):
+            try:
+                if await asyncio.to_thread(self._handle_socket_event, key):
+                    self.selector.register(key.fileobj, selectors.EVENT_READ, key.data)
+                else:
+                    # Already unregistered from the selector, so _on_socket_closed didn't get to this
+                    self._open_sockets.pop(key.fileobj, None)  # type: ignore[call-overload]
+            finally:
+                activity.set()
+
+        try:
+            sync_readers()
+            while self._exit_code is None or self._open_sockets:
+                last_heartbeat_ago = time.monotonic() - self._last_successful_heartbeat
+                max_wait_time = max(
+                    0.01, min(HEARTBEAT_TIMEOUT - last_heartbeat_ago * 0.75, MIN_HEARTBEAT_INTERVAL)
+                )
+                activity.clear()
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(activity.wait(), timeout=max_wait_time)
+                sync_readers()
+                alive = self._check_subprocess_exit() is None
+
+                if self._exit_code is not None and self._open_sockets and not request_tasks:
+                    if (
+                        self._process_exit_monotonic
+                        and time.monotonic() - self._process_exit_monotonic > SOCKET_CLEANUP_TIMEOUT
+                    ):
+                        log.warning(
+                            "Process exited with open sockets; cleaning up after timeout",
+                            pid=self.pid,
+                            exit_code=self._exit_code,
+                            socket_types=list(self._open_sockets.values()),
+                            timeout_seconds=SOCKET_CLEANUP_TIMEOUT,
+                        )
+                        self._cleanup_open_sockets()
+                        break
+
+                if alive:
+                    if heartbeat is None or heartbeat.done():
+                        heartbeat = asyncio.create_task(self._asend_heartbeat_if_needed(async_client))
+                    self._handle_process_overtime_if_needed()
+        finally:
+            for fd in readers:
+                loop.remove_reader(fd)
+            await asyncio.gather(*request_tasks, *filter(None, [heartbeat]), return_exceptions=True)
+            if async_client is not None:
+                await async_client.aclose()
+
+    async def _asend_heartbeat_if_needed(self, async_client: AsyncClient | None):
+        """Send a heartbeat like ``_send_heartbeat_if_needed``, without blocking the event loop."""
+        if not self._start_heartbeat_if_needed():
+            return
+
+        try:
+            if async_client is not None:
+                await async_client.task_instances.heartbeat(self.id, pid=self._process.pid)
+            else:
+                await asyncio.to_thread(self.client.task_instances.heartbeat, self.id, pid=self._process.pid)
+            self._handle_heartbeat_success()
+        except Exception as e:
+            self._handle_heartbeat_error(e)
+
     def _handle_process_overtime_if_needed(self):
         """Handle termination of auxiliary processes if the task exceeds the configured overtime."""
         # If the task has reached a terminal state, we can start monitoring the overtime
@@ -1668,43 +1936,75 @@ class ActivitySubprocess(WatchedSubprocess):
 
     def _send_heartbeat_if_needed(self):
         """Send a heartbeat to the client if heartbeat interval has passed."""
+        if not self._start_heartbeat_if_needed():
+            return
+        self._send_heartbeat()
+
+    def _send_heartbeat(self):
+        try:
+            self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
+            self._handle_heartbeat_success()
+        except Exception as e:
+            self._handle_heartbeat_error(e)
+
+    def _start_heartbeat_if_needed(self) -> bool:
+        """
+        Record a heartbeat attempt if the heartbeat interval has passed.
+
+        Returns whether the caller should send the heartbeat: it doesn't need to when it is handed to the
+        heartbeat coalescer instead.
+        """
         # Respect the minimum interval between heartbeat attempts
         if (time.monotonic() - self._last_heartbeat_attempt) < MIN_HEARTBEAT_INTERVAL:
-            return
+            return False
 
         if self._terminal_state:
             # If the task has finished, and we are in "overtime" (running OL listeners etc) we shouldn't
             # heartbeat
-            return
+            return False
 
         self._last_heartbeat_attempt = time.monotonic()
-        try:
-            self.client.task_instances.heartbeat(self.id, pid=self._process.pid)
-            # Update the last heartbeat time on success
-            self._last_successful_heartbeat = time.monotonic()
+        if self.heartbeat_coalescer is not None:
+            # The coalescer sends this heartbeat together with those of the other supervisors it batches,
+            # and reports the outcome back through the same methods as a single heartbeat.
+            self.heartbeat_coalescer.add(self)
+            self.heartbeat_coalescer.flush_if_due()
+            return False
+        return True
 
-            # Reset the counter on success
-            self.failed_heartbeats = 0
-        except ServerResponseError as e:
-            if e.response.status_code in {HTTPStatus.NOT_FOUND, HTTPStatus.GONE, HTTPStatus.CONFLICT}:
-                log.error(
-                    "Server indicated the task shouldn't be running anymore",
-                    detail=e.detail,
-                    status_code=e.response.status_code,
-                    ti_id=self.id,
-                )
-                self.process_log.error(
-                    "Server indicated the task shouldn't be running anymore. Terminating process",
-                    detail=e.detail,
-                )
-                self.kill(signal.SIGTERM, force=True)
-                self.process_log.error("Task killed!")
-                self._terminal_state = SERVER_TERMINATED
-            else:
-                # If we get any other error, we'll just log it and try again next time
-                self._handle_heartbeat_failures(e)
-        except Exception as e:
-            self._handle_heartbeat_failures(e)
+    def _handle_heartbeat_error(self, exc: Exception):
+        if isinstance(exc, ServerResponseError) and exc.response.status_code in {
+            HTTPStatus.NOT_FOUND,
+            HTTPStatus.GONE,
+            HTTPStatus.CONFLICT,
+        }:
+            self._handle_heartbeat_rejected(detail=exc.detail, status_code=exc.response.status_code)
+        else:
+            # If we get any other error, we'll just log it and try again next time
+            self._handle_heartbeat_failures(exc)
+
+    def _handle_heartbeat_success(self):
+        # Update the last heartbeat time on success
+        self._last_successful_heartbeat = time.monotonic()
+
+        # Reset the counter on success
+        self.failed_heartbeats = 0
+
+    def _handle_heartbeat_rejected(self, detail: Any, status_code: int | None = None):
+        """Terminate the process when the server says the task instance shouldn't be running anymore."""
+        log.error(
+            "Server indicated the task shouldn't be running anymore",
+            detail=detail,
+            status_code=status_code,
+            ti_id=self.id,
+        )
+        self.process_log.error(
+            "Server indicated the task shouldn't be running anymore. Terminating process",
+            detail=detail,
+        )
+        self.kill(signal.SIGTERM, force=True)
+        self.process_log.error("Task killed!")
+        self._terminal_state = SERVER_TERMINATED
 
     def _handle_heartbeat_failures(self, exc: Exception):
         """Increment the failed heartbeats counter and kill the process if too many failures."""
@@ -2511,6 +2811,39 @@ def _configure_logging(log_path: str, client: Client) -> tuple[FilteringBoundLog
     return logger, log_file_descriptor
 
 
+def _validate_server_url(server: str | None, dry_run: bool) -> None:
+    """Check the execution API server URL a supervisor was given before creating a client for it."""
+    if dry_run and server:
+        raise ValueError(f"Can only specify one of {server=} or {dry_run=}")
+
+    if dry_run:
+        return
+
+    if not server:
+        raise ValueError("Invalid execution API server URL. Please ensure that a valid URL is configured.")
+
+    try:
+        parsed_url = urlparse(server)
+    except Exception as e:
+        raise ValueError(
+            f"Invalid execution API server URL '{server}': {e}. Please ensure that a valid URL is configured."
+        ) from e
+
+    if parsed_url.scheme not in ("http", "https"):
+        raise ValueError(
+            f"Invalid execution API server URL '{server}': "
+            "URL must use http:// or https:// scheme. "
+            "Please ensure that a valid URL is configured."
+        )
+
+    if not parsed_url.netloc:
+        raise ValueError(
+            f"Invalid execution API server URL '{server}': "
+            "URL must include a valid host. "
+            "Please ensure that a valid URL is configured."
+        )
+
+
 def supervise_task(
     *,
     ti: TaskInstance,
@@ -2548,36 +2881,7 @@ def supervise_task(
     from airflow.sdk._shared.secrets_masker import reset_secrets_masker
 
     if not client:
-        if dry_run and server:
-            raise ValueError(f"Can only specify one of {server=} or {dry_run=}")
-
-        if not dry_run:
-            if not server:
-                raise ValueError(
-                    "Invalid execution API server URL. Please ensure that a valid URL is configured."
-                )
-
-            try:
-                parsed_url = urlparse(server)
-            except Exception as e:
-                raise ValueError(
-                    f"Invalid execution API server URL '{server}': {e}. "
-                    "Please ensure that a valid URL is configured."
-                ) from e
-
-            if parsed_url.scheme not in ("http", "https"):
-                raise ValueError(
-                    f"Invalid execution API server URL '{server}': "
-                    "URL must use http:// or https:// scheme. "
-                    "Please ensure that a valid URL is configured."
-                )
-
-            if not parsed_url.netloc:
-                raise ValueError(
-                    f"Invalid execution API server URL '{server}': "
-                    "URL must include a valid host. "
-                    "Please ensure that a valid URL is configured."
-                )
+        _validate_server_url(server, dry_run)
 
     if not dag_rel_path:
         raise ValueError("dag_path is required")
@@ -2639,6 +2943,381 @@ def supervise_task(
                 provider.force_flush(timeout_millis=5000)  # upper bound, not a fixed wait
 
 
+@attrs.define
+class _SupervisedTask:
+    proc: ActivitySubprocess
+    log_file_descriptor: BinaryIO | TextIO | None
+    on_finish: Callable[[int, Exception | None], None] | None
+    start: float = attrs.field(factory=time.monotonic)
+    # The request of the task being handled in a thread, if any, and the key its socket was registered with
+    request: tuple[selectors.SelectorKey, Future[bool]] | None = None
+    # The final state of the task being reported in a thread, once its process is done with
+    finalizing: Future[int] | None = None
+    # The secrets masked for the task, to go on masking while it runs, see MultiTaskSupervisor._finish_task
+    secrets: set[str] = attrs.field(factory=set)
+
+
+@attrs.define(kw_only=True)
+class MultiTaskSupervisor:
+    """
+    Supervise the processes of several tasks running concurrently, from this one process.
+
+    Each task still runs in a process of its own, monitored by an ``ActivitySubprocess`` just like with
+    ``supervise_task``, but all of them are serviced by one loop over a shared selector instead of one
+    supervisor process per task. What ``supervise_task`` sets up for every task is done once here: the
+    clients of the tasks share one connection pool to the API server, the secrets backends are loaded once,
+    and the heartbeats of the tasks are sent in bulk through a ``HeartbeatCoalescer``.
+
+    The requests of the tasks are handled in a pool of threads, so that a slow API call only holds up the
+    task that made it; the final state of the tasks is reported and their logs uploaded in that pool too.
+    The loop itself only forwards logs, sends heartbeats and watches the processes. As this process has
+    threads, the task processes are forked from a task zygote started along with the supervisor, before
+    any of them.
+
+    The secrets masker masks the secrets of all the running tasks. It is reset once a task finishes, like
+    ``supervise_task`` does for every task, but keeps masking the secrets of the tasks still running.
+
+    Tasks are added with ``start_task`` and serviced by calling ``serve`` in a loop (or
+    ``run_until_complete``); ``on_finish`` is called with the exit code of a task once its final state has
+    been reported. Only tasks run by the default Python coordinator can be supervised this way, see
+    ``can_supervise``.
+
+    :param server: Base URL of the API server.
+    :param dry_run: If True, execute without actual task execution (simulate run).
+    :param subprocess_logs_to_stdout: Should task logs also be sent to stdout via the main logger.
+    :param client: Optional preconfigured client whose connections are shared by the tasks (Mostly for tests).
+    :param heartbeat_max_delay: How long, in seconds, a due heartbeat may wait to be sent with others.
+    :param max_concurrent_requests: How many requests of the tasks are handled at once.
+    :param fork_from_zygote: Fork the task processes from the task zygote rather than from this process.
+    """
+
+    server: str | None = None
+    dry_run: bool = False
+    subprocess_logs_to_stdout: bool = False
+    client: Client | None = None
+    heartbeat_max_delay: float = 1.0
+    max_concurrent_requests: int = 10
+    fork_from_zygote: bool = True
+
+    _client: Client = attrs.field(init=False, repr=False)
+    _request_pool: ThreadPoolExecutor = attrs.field(init=False, repr=False)
+    _masker_reset_pending: bool = attrs.field(default=False, init=False)
+
+    selector: selectors.BaseSelector = attrs.field(factory=selectors.DefaultSelector, init=False, repr=False)
+    heartbeat_coalescer: HeartbeatCoalescer = attrs.field(init=False, repr=False)
+    _owns_client: bool = attrs.field(default=False, init=False)
+    _tasks: dict[UUID, _SupervisedTask] = attrs.field(factory=dict, init=False)
+    _tasks_by_request_socket: dict[socket, _SupervisedTask] = attrs.field(factory=dict, init=False)
+    _wakeup_sockets: tuple[socket, socket] = attrs.field(factory=socketpair, init=False, repr=False)
+
+    @heartbeat_coalescer.default
+    def _default_heartbeat_coalescer(self) -> HeartbeatCoalescer:
+        return HeartbeatCoalescer(max_delay=self.heartbeat_max_delay)
+
+    def __attrs_post_init__(self):
+        from airflow.sdk._shared.secrets_masker import reset_secrets_masker
+
+        _make_process_nondumpable()
+
+        if self.fork_from_zygote and not _should_use_exec():
+            from airflow.sdk.execution_time.zygote import get_task_zygote
+
+            # Before this process starts any thread, see start_task
+            get_task_zygote()
+
+        if self.client is None:
+            _validate_server_url(self.server, self.dry_run)
+            # One connection for each thread handling requests, and one for the heartbeats
+            limits = httpx.Limits(
+                max_keepalive_connections=self.max_concurrent_requests + 1,
+                max_connections=self.max_concurrent_requests + 1,
+            )
+            # The tasks authenticate with their own token, see ``Client.with_token``
+            self._client = Client(base_url=self.server or "", limits=limits, dry_run=self.dry_run, token="")
+            self._owns_client = True
+            log.debug("Connecting to execution API server", server=self.server)
+        else:
+            self._client = self.client
+
+        backends = ensure_secrets_backend_loaded()
+        log.info(
+            "Secrets backends loaded for worker",
+            count=len(backends),
+            backend_classes=[type(b).__name__ for b in backends],
+        )
+
+        reset_secrets_masker()
+
+        self._request_pool = ThreadPoolExecutor(
+            max_workers=self.max_concurrent_requests, thread_name_prefix="task-requests"
+        )
+
+        wakeup_receiver, wakeup_sender = self._wakeup_sockets
+        wakeup_sender.setblocking(False)
+        wakeup_receiver.setblocking(False)
+        self.selector.register(
+            wakeup_receiver, selectors.EVENT_READ, (self._drain_wakeup_socket, self._on_wakeup_socket_closed)
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def running_tasks(self) -> int:
+        """The number of tasks supervised that haven't finished yet."""
+        return len(self._tasks)
+
+    @staticmethod
+    def can_supervise(queue: str | None) -> bool:
+        """Return whether the tasks of the queue run in a Python task process, which can be supervised here."""
+        try:
+            coordinator = get_coordinator_manager().for_queue(queue or "default")
+        except InvalidCoordinatorError:
+            return False
+        return isinstance(coordinator, _PythonCoordinator)
+
+    def start_task(
+        self,
+        *,
+        ti: TaskInstance,
+        bundle_info: BundleInfo,
+        dag_rel_path: str | os.PathLike[str],
+        token: str,
+        log_path: str | None = None,
+        sentry_integration: str = "",
+        on_finish: Callable[[int, Exception | None], None] | None = None,
+        target: Callable[[], None] = _subprocess_main,
+    ) -> ActivitySubprocess:
+        """
+        Start running a task, supervised by this process from now on.
+
+        :param ti: The task instance to run.
+        :param bundle_info: Information of the Dag bundle to use for this task instance.
+        :param dag_rel_path: The file path to the Dag.
+        :param token: Authentication token of the task for the API client.
+        :param log_path: Path to write logs, if required.
+        :param sentry_integration: If the executor has a Sentry integration, import
+            path to a callable to initialize it (empty means no integration).
+        :param on_finish: Called with the exit code of the process once the task finished, and the exception
+            raised reporting its final state to the API server, if any.
+        :param target: The function to run in the task process.
+        :return: The supervisor of the task process.
+        :raises ValueError: If the task can't be run by this supervisor.
+        """
+        if not dag_rel_path:
+            raise ValueError("dag_path is required")
+        if not self.can_supervise(ti.queue):
+            raise ValueError(f"Tasks on queue {ti.queue!r} aren't run by the Python coordinator")
+
+        client = self._client.with_token(token)
+        logger: FilteringBoundLogger | None = None
+        log_file_descriptor: BinaryIO | TextIO | None = None
+        if log_path:
+            logger, log_file_descriptor = _configure_logging(log_path, client)
+
+        registered_fds = set(self.selector.get_map())
+        try:
+            proc = ActivitySubprocess.start(
+                what=ti,
+                dag_rel_path=dag_rel_path,
+                bundle_info=bundle_info,
+                client=client,
+                target=target,
+                logger=logger,
+                sentry_integration=sentry_integration,
+                subprocess_logs_to_stdout=self.subprocess_logs_to_stdout,
+                selector=self.selector,
+                heartbeat_coalescer=self.heartbeat_coalescer,
+                # Forking this process, which has threads, could leave the child with locks it can't release
+                fork_from_zygote=self.fork_from_zygote,
+            )
+        except BaseException:
+            # The process was killed before it was handed over: stop watching its sockets
+            for fd in set(self.selector.get_map()) - registered_fds:
+                with suppress(Exception):
+                    self.selector.unregister(fd).fileobj.close()  # type: ignore[union-attr]
+            if log_file_descriptor:
+                log_file_descriptor.close()
+            raise
+
+        task = _SupervisedTask(proc=proc, log_file_descriptor=log_file_descriptor, on_finish=on_finish)
+        self._tasks[proc.id] = task
+        self._tasks_by_request_socket[proc.stdin] = task
+        return proc
+
+    def wakeup(self) -> None:
+        """Make a running or upcoming ``serve`` return early; safe to call from any thread."""
+        with suppress(BlockingIOError, OSError):
+            self._wakeup_sockets[1].send(b"\0")
+
+    @staticmethod
+    def _drain_wakeup_socket(sock: socket) -> bool:
+        with suppress(BlockingIOError):
+            while sock.recv(BUFFER_SIZE):
+                pass
+        return True
+
+    def _on_wakeup_socket_closed(self, sock: socket) -> None:
+        with suppress(KeyError):
+            self.selector.unregister(sock)
+
+    def serve(self) -> None:
+        """
+        Wait for activity of the supervised tasks, and service them.
+
+        This does for every task what ``ActivitySubprocess.wait`` does for a single one, and returns after at
+        most ``MIN_HEARTBEAT_INTERVAL`` seconds, or as soon as something happened.
+        """
+        now = time.monotonic()
+        max_wait_time = float(MIN_HEARTBEAT_INTERVAL)
+        for task in self._tasks.values():
+            if task.finalizing is not None:
+                continue
+            # Ensure we heartbeat _at most_ 75% through the task instance heartbeat timeout time
+            last_heartbeat_ago = now - task.proc._last_successful_heartbeat
+            max_wait_time = min(max_wait_time, HEARTBEAT_TIMEOUT - last_heartbeat_ago * 0.75)
+        if (heartbeats_due_in := self.heartbeat_coalescer.time_until_due()) is not None:
+            max_wait_time = min(max_wait_time, heartbeats_due_in)
+
+        # Ensure minimum timeout to prevent CPU spike with tight loop when timeout is 0 or negative
+        for key, _ in self.selector.select(timeout=max(0.01, max_wait_time)):
+            if (task := self._tasks_by_request_socket.get(key.fileobj)) is not None:  # type: ignore[arg-type]
+                self._handle_request(task, key)
+            else:
+                WatchedSubprocess._handle_socket_event(key)
+
+        for task in self._tasks.values():
+            if task.request is not None and task.request[1].done():
+                self._on_request_handled(task)
+
+        for task in list(self._tasks.values()):
+            if task.finalizing is not None:
+                if task.finalizing.done():
+                    self._finish_task(task)
+                continue
+            proc = task.proc
+            alive = proc._check_subprocess_exit() is None
+            if alive:
+                proc._send_heartbeat_if_needed()
+                proc._handle_process_overtime_if_needed()
+                continue
+
+            if (
+                proc._open_sockets
+                and task.request is None
+                and proc._process_exit_monotonic
+                and time.monotonic() - proc._process_exit_monotonic > SOCKET_CLEANUP_TIMEOUT
+            ):
+                log.warning(
+                    "Process exited with open sockets; cleaning up after timeout",
+                    pid=proc.pid,
+                    exit_code=proc._exit_code,
+                    socket_types=list(proc._open_sockets.values()),
+                    timeout_seconds=SOCKET_CLEANUP_TIMEOUT,
+                )
+                proc._cleanup_open_sockets(close_selector=False)
+            if not proc._open_sockets:
+                self._finalize_task(task)
+
+        self.heartbeat_coalescer.flush_if_due()
+
+        if self._masker_reset_pending and not any(
+            task.request or task.finalizing for task in self._tasks.values()
+        ):
+            # Only once no thread can be masking secrets, which would be lost with the reset
+            from airflow.sdk._shared.secrets_masker import reset_secrets_masker
+
+            reset_secrets_masker(keep=set().union(*(task.secrets for task in self._tasks.values())))
+            self._masker_reset_pending = False
+
+    def _handle_request(self, task: _SupervisedTask, key: selectors.SelectorKey) -> None:
+        # Stop watching the socket while a thread reads and handles the request, like _amonitor_subprocess
+        self.selector.unregister(key.fileobj)
+        task.request = (key, self._request_pool.submit(self._handle_request_in_thread, task, key))
+
+    def _handle_request_in_thread(self, task: _SupervisedTask, key: selectors.SelectorKey) -> bool:
+        from airflow.sdk._shared.secrets_masker import record_masked_secrets
+
+        with record_masked_secrets() as secrets:
+            try:
+                return WatchedSubprocess._handle_socket_event(key)
+            finally:
+                task.secrets |= secrets
+                self.wakeup()
+
+    def _on_request_handled(self, task: _SupervisedTask) -> None:
+        key, future = cast("tuple[selectors.SelectorKey, Future[bool]]", task.request)
+        task.request = None
+        if future.result():
+            self.selector.register(key.fileobj, selectors.EVENT_READ, key.data)
+        else:
+            # Already unregistered from the selector, so _on_socket_closed didn't get to this
+            task.proc._open_sockets.pop(key.fileobj, None)  # type: ignore[call-overload]
+
+    def _finalize_task(self, task: _SupervisedTask) -> None:
+        # Reporting the final state and uploading the logs can take a while, so it is done in a thread like
+        # the requests of the tasks; the task is reaped by _finish_task once done.
+        proc = task.proc
+        self._tasks_by_request_socket.pop(proc.stdin, None)
+        self.heartbeat_coalescer.remove(proc)
+        task.finalizing = self._request_pool.submit(self._finalize_in_thread, proc)
+
+    def _finalize_in_thread(self, proc: ActivitySubprocess) -> int:
+        try:
+            return proc._finalize()
+        finally:
+            self.wakeup()
+
+    def _finish_task(self, task: _SupervisedTask) -> None:
+        proc = task.proc
+        del self._tasks[proc.id]
+        # Stop masking the secrets of the task, like supervise_task does for every task
+        self._masker_reset_pending = True
+
+        error: Exception | None = None
+        try:
+            exit_code = cast("Future[int]", task.finalizing).result()
+        except Exception as e:
+            log.exception("Failed to report the final state of the task", ti_id=proc.id)
+            exit_code, error = proc._exit_code or 1, e
+        else:
+            log.info(
+                "Workload finished",
+                workload_type="ExecuteTask",
+                workload_id=str(proc.id),
+                exit_code=exit_code,
+                duration=time.monotonic() - task.start,
+                final_state=proc.final_state,
+            )
+        finally:
+            if task.log_file_descriptor:
+                task.log_file_descriptor.close()
+
+        if task.on_finish:
+            task.on_finish(exit_code, error)
+
+    def run_until_complete(self) -> None:
+        """Service the supervised tasks until all of them have finished."""
+        while self._tasks:
+            self.serve()
+
+    def close(self) -> None:
+        """Release the resources of the supervisor; the tasks still running aren't supervised anymore."""
+        self._request_pool.shutdown(wait=False, cancel_futures=True)
+        self.selector.close()
+        for sock in self._wakeup_sockets:
+            sock.close()
+        if self._owns_client:
+            with suppress(Exception):
+                self._client.close()
+        provider = trace.get_tracer_provider()
+        if hasattr(provider, "force_flush"):
+            provider.force_flush(timeout_millis=5000)  # upper bound, not a fixed wait
+
+
 def supervise(**kwargs) -> int:
     """
     Call ``supervise_task()`` with a deprecation warning.
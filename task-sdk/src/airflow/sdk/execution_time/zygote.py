@@ -0,0 +1,450 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A pre-forked "zygote" process that task processes are forked from.
+
+Forking the task process straight from the supervisor means every task has to import the task runner,
+the providers and whatever the Dag file needs from scratch. The zygote is a long-lived child of the
+supervisor which has done those imports once and then moved everything it holds into the permanent
+generation with :func:`gc.freeze`, so task processes forked from it start warm and share those pages
+copy-on-write with the zygote and with each other.
+
+The supervisor and the zygote talk over a socketpair: the supervisor passes the child ends of the four
+task sockets (requests, stdout, stderr and structured logs) over it with ``SCM_RIGHTS``, and the zygote
+answers with the pid of the task process it forked. As only the zygote can ``waitpid`` its children, it
+also reports their exit codes back over the same socket, and :class:`ZygoteChildTracker` reads them from
+there.
+"""
+
+from __future__ import annotations
+
+import enum
+import gc
+import json
+import os
+import pkgutil
+import select
+import selectors
+import signal
+import socket
+import sys
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Collection, Sequence
+from contextlib import suppress
+from typing import TYPE_CHECKING, Any, NoReturn
+
+import attrs
+import psutil
+import structlog
+
+from airflow.sdk.configuration import conf
+from airflow.sdk.execution_time.supervisor import ProcessTracker
+
+if TYPE_CHECKING:
+    from structlog.typing import FilteringBoundLogger
+
+__all__ = ["Zygote", "ZygoteChildTracker", "ZygoteError", "get_task_zygote", "start_task_zygote"]
+
+log: FilteringBoundLogger = structlog.get_logger(logger_name="supervisor")
+
+_WARM_MODULES = ("airflow.sdk.execution_time.task_runner", "airflow.dag_processing.dagbag")
+"""Modules every zygote imports, on top of the ones listed in ``[workers] task_zygote_warm_modules``."""
+
+# psutil reports the exit code of a process killed by a signal as a negative ``Negsignal`` enum member,
+# which the supervisor uses to log the name of the signal. Do the same for the exit codes we get from
+# the zygote.
+_NegSignal = enum.IntEnum("_NegSignal", {sig.name: -sig.value for sig in signal.Signals})  # type: ignore[misc]
+
+
+def _exit_code(code: int) -> int:
+    if code < 0:
+        with suppress(ValueError):
+            return _NegSignal(code)
+    return code
+
+
+class ZygoteError(RuntimeError):
+    """The zygote process went away, or failed to fork a task process."""
+
+
+def _close_inherited_fds(keep: Collection[int]) -> None:
+    """
+    Let go of the descriptors the zygote inherited from the supervisor, other than stdio and ``keep``.
+
+    Every task process would otherwise inherit them in turn: log files, connections to the API server and
+    whatever else the supervisor had open when it started the zygote. Each one is pointed at /dev/null
+    rather than closed, so that an object still holding on to its number can't later end up reading or
+    writing a file or socket the zygote opened under the same number.
+    """
+    try:
+        fds = [int(fd) for fd in os.listdir("/dev/fd")]
+    except OSError:
+        return
+    devnull = os.open(os.devnull, os.O_RDWR)
+    try:
+        for fd in fds:
+            if fd <= 2 or fd == devnull or fd in keep:
+                continue
+            with suppress(OSError):
+                # Fails for the descriptor that listdir used, which is closed already
+                os.fstat(fd)
+                os.dup2(devnull, fd)
+    finally:
+        os.close(devnull)
+
+
+def _warm_up(modules: Sequence[str]) -> None:
+    """Import and initialize everything the task processes forked from the zygote would otherwise redo."""
+    from airflow.sdk.listener import get_listener_manager
+    from airflow.sdk.providers_manager_runtime import ProvidersManagerTaskRuntime
+
+    for name in (*_WARM_MODULES, *modules):
+        try:
+            pkgutil.resolve_name(name)
+        except Exception:
+            log.warning("Failed to import module in the task zygote", module=name, exc_info=True)
+
+    try:
+        ProvidersManagerTaskRuntime().initialize_providers_list()
+        ProvidersManagerTaskRuntime().initialize_providers_hooks()
+        # Loads the plugins, which the task runner does first thing to call the listeners
+        get_listener_manager()
+    except Exception:
+        log.warning("Failed to initialize providers and plugins in the task zygote", exc_info=True)
+
+
+def _send(sock: socket.socket, **msg: Any) -> None:
+    sock.sendall(json.dumps(msg).encode() + b"\n")
+
+
+def _fork_task(control: socket.socket, request: dict[str, Any], fds: list[int], *to_close) -> int:
+    """Fork one task process from the zygote, returning its pid."""
+    from airflow.sdk.execution_time.supervisor import _fork_main
+
+    child_requests, child_stdout, child_stderr, child_logs = (socket.socket(fileno=fd) for fd in fds)
+    new_process_group = request.get("new_process_group", False)
+
+    pid = os.fork()
+    if pid == 0:
+        if new_process_group:
+            with suppress(OSError):
+                os.setpgid(0, 0)
+        # Drop everything that is only of use to the zygote itself
+        signal.set_wakeup_fd(-1)
+        signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+        for obj in (control, *to_close):
+            with suppress(Exception):
+                obj.close()
+        try:
+            target = pkgutil.resolve_name(request["target"])
+            _fork_main(child_requests, child_stdout, child_stderr, child_logs.fileno(), target)
+        except BaseException as e:
+            import traceback
+
+            with suppress(BaseException):
+                print("Exception in child process, exiting with code 124", file=sys.stderr)
+                traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+        os._exit(124)
+
+    if new_process_group:
+        # Mirror of the child-side setpgid, see WatchedSubprocess.start
+        with suppress(OSError):
+            os.setpgid(pid, pid)
+    for sock in (child_requests, child_stdout, child_stderr, child_logs):
+        sock.close()
+    return pid
+
+
+def _zygote_main(control: socket.socket, warm_modules: Sequence[str]) -> NoReturn:
+    """
+    Entrypoint of the zygote process.
+
+    Serve fork requests from the supervisor until it closes its end of the ``control`` socket, reporting
+    the exit code of each task process back to it once the zygote has reaped it.
+    """
+    # A Ctrl-C in the terminal goes to the whole process group; it is up to the supervisor to stop its
+    # task processes, and to close the control socket which then stops the zygote.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+    _close_inherited_fds(keep={control.fileno()})
+    _warm_up(warm_modules)
+
+    # Wake the loop up as soon as a task process exits, so that its exit code is reported without delay.
+    wakeup_r, wakeup_w = socket.socketpair()
+    wakeup_r.setblocking(False)
+    wakeup_w.setblocking(False)
+    signal.set_wakeup_fd(wakeup_w.fileno())
+    signal.signal(signal.SIGCHLD, lambda *_: None)
+
+    selector = selectors.DefaultSelector()
+    selector.register(control, selectors.EVENT_READ)
+    selector.register(wakeup_r, selectors.EVENT_READ)
+
+    # Everything imported so far is shared with the task processes, keep the GC from touching (and so
+    # copying) those pages.
+    gc.freeze()
+
+    while True:
+        for key, _ in selector.select():
+            if key.fileobj is wakeup_r:
+                with suppress(BlockingIOError):
+                    while wakeup_r.recv(4096):
+                        pass
+                continue
+
+            msg, fds, _, _ = socket.recv_fds(control, 4096, 4)
+            if not msg:
+                # The supervisor has gone away
+                os._exit(0)
+            pid = _fork_task(control, json.loads(msg), fds, selector, wakeup_r, wakeup_w)
+            _send(control, pid=pid)
+
+        while True:
+            try:
+                pid, status = os.waitpid(-1, os.WNOHANG)
+            except ChildProcessError:
+                break
+            if pid == 0:
+                break
+            _send(control, exited=pid, code=os.waitstatus_to_exitcode(status))
+
+
+@attrs.define(kw_only=True)
+class Zygote:
+    """
+    Handle to a running zygote process, as held by the supervisor.
+
+    :meta private:
+    """
+
+    pid: int
+    _control: socket.socket = attrs.field(alias="control", repr=False)
+    _lock: threading.RLock = attrs.field(factory=threading.RLock, init=False, repr=False)
+    _buffer: bytes = attrs.field(default=b"", init=False, repr=False)
+    _spawned: deque[int] = attrs.field(factory=deque, init=False, repr=False)
+    _exit_codes: dict[int, int] = attrs.field(factory=dict, init=False, repr=False)
+    alive: bool = attrs.field(default=True, init=False)
+
+    @classmethod
+    def start(cls, warm_modules: Sequence[str] = ()) -> Zygote:
+        """Fork a new zygote process, which imports ``warm_modules`` before it serves any fork requests."""
+        control, zygote_control = socket.socketpair()
+        pid = os.fork()
+        if pid == 0:
+            control.close()
+            try:
+                _zygote_main(zygote_control, warm_modules)
+            except BaseException as e:
+                import traceback
+
+                with suppress(BaseException):
+                    print("Exception in task zygote, exiting with code 124", file=sys.stderr)
+                    traceback.print_exception(type(e), e, e.__traceback__, file=sys.stderr)
+            os._exit(124)
+
+        zygote_control.close()
+        log.debug("Started task zygote", pid=pid)
+        return cls(pid=pid, control=control)
+
+    def fork(
+        self,
+        target: Callable[[], None],
+        *,
+        child_requests: socket.socket,
+        child_stdout: socket.socket,
+        child_stderr: socket.socket,
+        child_logs: socket.socket,
+        new_process_group: bool = False,
+    ) -> ZygoteChildTracker:
+        """
+        Fork a process from the zygote which runs ``target`` over the given child ends of the task sockets.
+
+        ``target`` is passed to the zygote by name, so it has to be importable. The sockets are still
+        owned, and so have to be closed, by the caller.
+        """
+        if "<" in getattr(target, "__qualname__", "<"):
+            raise ValueError(f"The task zygote requires a top-level importable target, got {target!r}")
+        request = json.dumps(
+            {"target": f"{target.__module__}:{target.__qualname__}", "new_process_group": new_process_group}
+        ).encode()
+        fds = [sock.fileno() for sock in (child_requests, child_stdout, child_stderr, child_logs)]
+        with self._lock:
+            if not self.alive:
+                raise ZygoteError("The task zygote is not running")
+            try:
+                socket.send_fds(self._control, [request], fds)
+            except OSError as e:
+                self.alive = False
+                raise ZygoteError("The task zygote is not running") from e
+            while not self._spawned:
+                if not self.poll(timeout=None):
+                    raise ZygoteError("The task zygote exited before it forked the task process")
+            pid = self._spawned.popleft()
+        return ZygoteChildTracker(self, pid)
+
+    def poll(self, timeout: float | None) -> bool:
+        """
+        Read the messages the zygote sent, waiting up to ``timeout`` seconds for one to arrive.
+
+        :returns: Whether the zygote is still running
+        """
+        with self._lock:
+            if not self.alive:
+                return False
+            readable, _, _ = select.select([self._control], [], [], timeout)
+            if readable:
+                try:
+                    data = self._control.recv(65536)
+                except OSError:
+                    data = b""
+                if not data:
+                    self.alive = False
+                    return False
+                *lines, self._buffer = (self._buffer + data).split(b"\n")
+                for line in lines:
+                    msg = json.loads(line)
+                    if "pid" in msg:
+                        self._spawned.append(msg["pid"])
+                    else:
+                        self._exit_codes[msg["exited"]] = _exit_code(msg["code"])
+            return True
+
+    def pop_exit_code(self, pid: int) -> int | None:
+        with self._lock:
+            return self._exit_codes.pop(pid, None)
+
+    def watch(self, selector: selectors.BaseSelector) -> None:
+        """
+        Read the messages of the zygote when ``selector`` reports them, instead of only on the next poll.
+
+        Without this, a supervisor waiting on the task sockets in ``selector`` wouldn't wake up for the
+        exit code of a task process whose sockets are all closed already.
+        """
+        with suppress(KeyError, ValueError):
+            selector.get_key(self._control)
+            return
+        if self.alive:
+            selector.register(
+                self._control,
+                selectors.EVENT_READ,
+                (self._on_readable, lambda sock: selector.unregister(sock)),
+            )
+
+    def _on_readable(self, sock: socket.socket) -> bool:
+        if self.poll(timeout=0):
+            return True
+        # Leave it to the selector to close the control socket, so it is unregistered first
+        return False
+
+    def close(self) -> None:
+        """Stop the zygote. Task processes forked from it keep running."""
+        self.alive = False
+        with suppress(OSError):
+            self._control.close()
+        with suppress(ChildProcessError, OSError):
+            os.waitpid(self.pid, 0)
+
+
+class ZygoteChildTracker(ProcessTracker):
+    """
+    Tracks a task process forked from the zygote, whose exit code the zygote reports back to us.
+
+    :meta private:
+    """
+
+    ProcessNotFound = psutil.NoSuchProcess
+    TimeoutExpired = psutil.TimeoutExpired
+
+    def __init__(self, zygote: Zygote, pid: int) -> None:
+        self._zygote = zygote
+        self._pid = pid
+        self._returncode: int | None = None
+
+    @property
+    def pid(self) -> int:
+        return self._pid
+
+    def send_signal(self, s: signal.Signals) -> None:
+        if self._returncode is not None:
+            raise self.ProcessNotFound(self._pid)
+        try:
+            os.kill(self._pid, s)
+        except ProcessLookupError:
+            raise self.ProcessNotFound(self._pid)
+
+    def wait(self, timeout: float | None) -> int:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._returncode is None:
+            self._returncode = self._zygote.pop_exit_code(self._pid)
+            if self._returncode is not None:
+                break
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            if not self._zygote.poll(remaining):
+                self._returncode = self._zygote.pop_exit_code(self._pid)
+                if self._returncode is None:
+                    self._returncode = self._wait_orphan(remaining)
+            elif deadline is not None and time.monotonic() >= deadline:
+                self._returncode = self._zygote.pop_exit_code(self._pid)
+                if self._returncode is None:
+                    raise self.TimeoutExpired(timeout, pid=self._pid)
+        return self._returncode
+
+    def _wait_orphan(self, timeout: float | None) -> int:
+        # The zygote died before it could tell us how the task process exited. We can still wait for the
+        # process to go away, but its exit code is lost.
+        with suppress(psutil.NoSuchProcess):
+            psutil.Process(self._pid).wait(timeout)
+        log.warning("Exit code of task process lost, the task zygote exited", pid=self._pid)
+        return 1
+
+
+_task_zygote: Zygote | None = None
+
+
+def get_task_zygote() -> Zygote:
+    """
+    Return the zygote of this supervisor process to fork task processes from, starting it if needed.
+
+    The zygote inherits the configuration, secrets backend and imports of the supervisor. Workers start
+    it with :func:`start_task_zygote` before their first task, otherwise it is started on first use, and
+    it is restarted should it exit.
+    """
+    global _task_zygote
+
+    if _task_zygote is None or not _task_zygote.alive:
+        if _task_zygote is not None:
+            _task_zygote.close()
+        _task_zygote = Zygote.start(conf.getlist("workers", "task_zygote_warm_modules", fallback=[]))
+    return _task_zygote
+
+
+def start_task_zygote() -> Zygote | None:
+    """
+    Start the zygote of this worker process ahead of its first task, if ``[workers] task_zygote`` is on.
+
+    Workers call this as they start up, before they set anything up for a task. Started by the first task
+    instead, the zygote would be forked with the log file, API client and token of that task in memory.
+    """
+    from airflow.sdk.execution_time.supervisor import TASK_ZYGOTE, _should_use_exec
+
+    if not TASK_ZYGOTE or _should_use_exec():
+        return None
+    return get_task_zygote()
@@ -16,6 +16,7 @@
 # under the License.
 from __future__ import annotations
 
+import base64
 import dataclasses
 import enum
 import functools
@@ -64,7 +65,7 @@ DEFAULT_VERSION = 0
 SUPPORTS_OPERATOR_DESERIALIZATION_WALKER = True
 
 T = TypeVar("T", bool, float, int, dict, list, str, tuple, set)
-U = bool | float | int | dict | list | str | tuple | set
+U = bool | float | int | dict | list | str | tuple | set | bytes
 S = list | tuple | set
 
 _serializers: dict[str, ModuleType] = {}
@@ -81,6 +82,17 @@ def encode(cls: str, version: int, data: T) -> dict[str, str | int | T]:
     return {CLASSNAME: cls, VERSION: version, DATA: data}
 
 
+def encode_bytes(o: bytes) -> dict[str, str | int]:
+    """
+    Encode binary data for a JSON document, such as the XCom value sent to the API server.
+
+    Binary data (e.g. the Parquet file of a DataFrame) takes this base64 form where the value has to be
+    JSON, and ``deserialize`` turns it back into ``bytes``. ``serialize`` only leaves it as ``bytes``
+    with ``keep_bytes``, for XCom values the task process passes on to the supervisor untouched.
+    """
+    return encode("builtins.bytes", 1, base64.b64encode(o).decode("ascii"))
+
+
 def allow_class(cls: type) -> None:
     """
     Register a class as deserialization-allowed for the current process.
@@ -175,18 +187,19 @@ def decode(d: dict[str, Any]) -> tuple[str, int, Any]:
 
 
 @overload
-def serialize(o: dict, depth: int = 0) -> dict: ...
+def serialize(o: dict, depth: int = 0, *, keep_bytes: bool = False) -> dict: ...
 @overload
-def serialize(o: None, depth: int = 0) -> None: ...
+def serialize(o: None, depth: int = 0, *, keep_bytes: bool = False) -> None: ...
 @overload
-def serialize(o: object, depth: int = 0) -> U | None: ...
+def serialize(o: object, depth: int = 0, *, keep_bytes: bool = False) -> U | None: ...
 
 
-def serialize(o: object, depth: int = 0) -> U | None:
+def serialize(o: object, depth: int = 0, *, keep_bytes: bool = False) -> U | None:
     """
     Serialize an object into a representation consisting only built-in types.
 
-    Primitives (int, float, bool, str) are returned as-is. Built-in collections
+    Primitives (int, float, bool, str) are returned as-is. Binary data (bytes) is
+    encoded with ``encode_bytes``, unless ``keep_bytes`` is set. Built-in collections
     are iterated over, where it is assumed that keys in a dict can be represented
     as str.
 
@@ -204,6 +217,8 @@ def serialize(o: object, depth: int = 0) -> U | None:
 
     :param o: The object to serialize.
     :param depth: Private tracker for nested serialization.
+    :param keep_bytes: Return binary data as ``bytes`` instead of its JSON form. Only for
+        transports that carry bytes, such as XCom values sent to the supervisor.
     :raise TypeError: A serializer cannot be found.
     :raise RecursionError: The object is too nested for the function to handle.
     :return: A representation of ``o`` that consists of only built-in types.
@@ -215,14 +230,18 @@ def serialize(o: object, depth: int = 0) -> U | None:
     if o is None:
         return o
 
+    # binary data is encoded for JSON, unless the caller's transport carries bytes
+    if type(o) is bytes:
+        return o if keep_bytes else encode_bytes(o)
+
     if isinstance(o, list):
-        return [serialize(d, depth + 1) for d in o]
+        return [serialize(d, depth + 1, keep_bytes=keep_bytes) for d in o]
 
     if isinstance(o, dict):
         if CLASSNAME in o or SCHEMA_ID in o:
             raise AttributeError(f"reserved key {CLASSNAME} or {SCHEMA_ID} found in dict to serialize")
 
-        return {str(k): serialize(v, depth + 1) for k, v in o.items()}
+        return {str(k): serialize(v, depth + 1, keep_bytes=keep_bytes) for k, v in o.items()}
 
     cls = type(o)
     qn = qualname(o)
@@ -245,7 +264,9 @@ def serialize(o: object, depth: int = 0) -> U | None:
     if qn in _serializers:
         data, serialized_classname, version, is_serialized = _serializers[qn].serialize(o)
         if is_serialized:
-            return encode(classname or serialized_classname, version, serialize(data, depth + 1))
+            return encode(
+                classname or serialized_classname, version, serialize(data, depth + 1, keep_bytes=keep_bytes)
+            )
 
     # primitive types are returned as is
     if isinstance(o, _primitives):
@@ -266,7 +287,7 @@ def serialize(o: object, depth: int = 0) -> U | None:
 
         # if we end up with a structure, ensure its values are serialized
         if isinstance(data, dict):
-            data = serialize(data, depth + 1)
+            data = serialize(data, depth + 1, keep_bytes=keep_bytes)
 
         dct[DATA] = data
         return dct
@@ -275,14 +296,14 @@ def serialize(o: object, depth: int = 0) -> U | None:
     if dataclasses.is_dataclass(cls):
         # fixme: unfortunately using asdict with nested dataclasses it looses information
         data = dataclasses.asdict(o)  # type: ignore[call-overload]
-        dct[DATA] = serialize(data, depth + 1)
+        dct[DATA] = serialize(data, depth + 1, keep_bytes=keep_bytes)
         return dct
 
     # attr annotated
     if attr.has(cls):
         # Only include attributes which we can pass back to the classes constructor
         data = attr.asdict(cast("attr.AttrsInstance", o), recurse=False, filter=lambda a, v: a.init)
-        dct[DATA] = serialize(data, depth + 1)
+        dct[DATA] = serialize(data, depth + 1, keep_bytes=keep_bytes)
         return dct
 
     raise TypeError(
@@ -0,0 +1,49 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import base64
+
+from airflow.sdk.module_loading import qualname
+
+# bytes are serialized as-is, this only decodes the JSON form written by airflow.sdk.serde.encode_bytes
+deserializers = ["builtins.bytes"]
+stringifiers = deserializers
+
+__version__ = 1
+
+
+def deserialize(cls: type, version: int, data: object) -> bytes:
+    if version > __version__:
+        raise TypeError(f"serialized version {version} is newer than class version {__version__}")
+
+    if cls is not bytes:
+        raise TypeError(f"do not know how to deserialize {qualname(cls)}")
+
+    if isinstance(data, bytes):
+        return data
+    if not isinstance(data, str):
+        raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
+    return base64.b64decode(data)
+
+
+def stringify(classname: str, version: int, data: str) -> str:
+    if classname not in stringifiers:
+        raise TypeError(f"do not know how to stringify {classname}")
+
+    return f"<{len(base64.b64decode(data))} bytes>"
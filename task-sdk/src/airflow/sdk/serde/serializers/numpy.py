@@ -38,6 +38,7 @@ serializers = [
     "numpy.complex64",
     "numpy.bool",
     "numpy.bool_",
+    "numpy.ndarray",
 ]
 
 if TYPE_CHECKING:
@@ -78,11 +79,30 @@ def serialize(o: object) -> tuple[U, str, int, bool]:
     if isinstance(o, (np.float16, np.float32, np.float64, np.complex64, np.complex128)):
         return float(o), *metadata
 
+    if isinstance(o, np.ndarray) and not o.dtype.hasobject:
+        # arrays of Python objects could only be stored pickled
+        from io import BytesIO
+
+        with BytesIO() as buf:
+            np.save(buf, o, allow_pickle=False)
+            return buf.getvalue(), *metadata
+
     return "", "", 0, False
 
 
-def deserialize(cls: type, version: int, data: str) -> Any:
+def deserialize(cls: type, version: int, data: str | bytes) -> Any:
     if version > __version__:
         raise TypeError("serialized version is newer than class version")
 
+    import numpy as np
+
+    if cls is np.ndarray:
+        if not isinstance(data, bytes):
+            raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
+
+        from io import BytesIO
+
+        with BytesIO(data) as buf:
+            return np.load(buf, allow_pickle=False)
+
     return cls(data)
@@ -36,7 +36,8 @@ if TYPE_CHECKING:
 
     from airflow.sdk.serde import U
 
-__version__ = 1
+# version 1 hex-encoded the Parquet file into a str, version 2 keeps it as bytes
+__version__ = 2
 
 
 def serialize(o: object) -> tuple[U, str, int, bool]:
@@ -54,7 +55,7 @@ def serialize(o: object) -> tuple[U, str, int, bool]:
     buf = pa.BufferOutputStream()
     pq.write_table(table, buf, compression="snappy")
 
-    return buf.getvalue().hex().decode("utf-8"), qualname(o), __version__, True
+    return buf.getvalue().to_pybytes(), qualname(o), __version__, True
 
 
 def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
@@ -66,14 +67,16 @@ def deserialize(cls: type, version: int, data: object) -> pd.DataFrame:
     if cls is not pd.DataFrame:
         raise TypeError(f"do not know how to deserialize {qualname(cls)}")
 
-    if not isinstance(data, str):
+    if isinstance(data, str) and version == 1:
+        data = bytes.fromhex(data)
+    if not isinstance(data, bytes):
         raise TypeError(f"serialized {qualname(cls)} has wrong data type {type(data)}")
 
     from io import BytesIO
 
     from pyarrow import parquet as pq
 
-    with BytesIO(bytes.fromhex(data)) as buf:
+    with BytesIO(data) as buf:
         df = pq.read_table(buf).to_pandas()
 
     return df
@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import pickle
 import sys
@@ -33,7 +34,7 @@ from task_sdk import make_client, make_client_w_dry_run, make_client_w_responses
 from uuid6 import uuid7
 
 from airflow.sdk import timezone
-from airflow.sdk.api.client import Client, RemoteValidationError, ServerResponseError
+from airflow.sdk.api.client import AsyncClient, Client, RemoteValidationError, ServerResponseError
 from airflow.sdk.api.datamodels._generated import (
     AssetEventsResponse,
     AssetResponse,
@@ -47,6 +48,9 @@ from airflow.sdk.api.datamodels._generated import (
     HITLUser,
     TaskStateStoreResponse,
     TerminalTIState,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
+    TIHeartbeatStatus,
     VariableResponse,
     XComResponse,
 )
@@ -329,6 +333,95 @@ class TestClient:
         with pytest.raises(ValueError, match="Both client_ssl_cert and client_ssl_key must be set"):
             make_client(httpx.MockTransport(handle_request))
 
+    def test_with_token(self):
+        seen = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            seen.append((request.url.path, request.headers["Authorization"]))
+            return httpx.Response(status_code=204)
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        task_client = client.with_token("task-token")
+        task_client.get("/task-instances")
+
+        assert seen == [("/task-instances", "Bearer task-token")]
+        # Requests of both clients go through the same connection pool
+        assert task_client._transport is client._transport
+
+
+class TestAsyncClient:
+    def test_heartbeat(self):
+        ti_id = uuid6.uuid7()
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == f"/task-instances/{ti_id}/heartbeat":
+                assert request.headers["Authorization"] == "Bearer abc"
+                assert json.loads(request.read()) == {"hostname": mock.ANY, "pid": 100}
+                return httpx.Response(status_code=204, headers={"Refreshed-API-Token": "def"})
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        async def heartbeat():
+            async with AsyncClient(
+                base_url="http://test", token="abc", transport=httpx.MockTransport(handle_request)
+            ) as client:
+                await client.task_instances.heartbeat(ti_id, pid=100)
+                return client.auth.token
+
+        assert asyncio.run(heartbeat()) == "def"
+
+    def test_error_parsing(self):
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(409, json={"detail": {"reason": "not_running"}})
+
+        async def heartbeat():
+            async with AsyncClient(
+                base_url="http://test", token="abc", transport=httpx.MockTransport(handle_request)
+            ) as client:
+                await client.task_instances.heartbeat(uuid6.uuid7(), pid=100)
+
+        with pytest.raises(ServerResponseError) as err:
+            asyncio.run(heartbeat())
+        assert err.value.response.status_code == 409
+        assert err.value.detail == {"reason": "not_running"}
+
+    def test_make_async(self):
+        client = Client(base_url="http://test", token="abc")
+        async_client = client.make_async()
+        assert isinstance(async_client, AsyncClient)
+        assert async_client.base_url == client.base_url
+        assert async_client.auth.token == "abc"
+
+        # Clients with a custom transport (i.e. tests) don't have an async counterpart
+        assert make_client(transport=httpx.MockTransport(lambda r: httpx.Response(204))).make_async() is None
+
+    def test_make_async_shares_refreshed_token(self):
+        ti_id = uuid6.uuid7()
+        seen = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            seen.append((request.url.path, request.headers["Authorization"]))
+            if request.url.path == f"/task-instances/{ti_id}/heartbeat":
+                return httpx.Response(status_code=204, headers={"Refreshed-API-Token": "def"})
+            return httpx.Response(status_code=200, json={"key": "my_var", "value": "value"})
+
+        # Mounted rather than passed as transport, which would leave the client without an async counterpart
+        client = Client(
+            base_url="http://test", token="abc", mounts={"http://": httpx.MockTransport(handle_request)}
+        )
+        async_client = client.make_async(transport=httpx.MockTransport(handle_request))
+
+        async def heartbeat():
+            async with async_client:
+                await async_client.task_instances.heartbeat(ti_id, pid=100)
+
+        asyncio.run(heartbeat())
+        client.variables.get("my_var")
+
+        assert seen == [
+            (f"/task-instances/{ti_id}/heartbeat", "Bearer abc"),
+            ("/variables/my_var", "Bearer def"),
+        ]
+
 
 class TestTaskInstanceOperations:
     """
@@ -458,6 +551,40 @@ class TestTaskInstanceOperations:
         client = make_client(transport=httpx.MockTransport(handle_request))
         client.task_instances.heartbeat(ti_id, 100)
 
+    def test_task_instance_bulk_heartbeat(self):
+        ti_ids = [uuid6.uuid7(), uuid6.uuid7()]
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/task-instances/heartbeats" and request.method == "PUT":
+                actual_body = json.loads(request.read())
+                assert actual_body["hostname"]
+                assert actual_body["heartbeats"] == [
+                    {"id": str(ti_ids[0]), "pid": 100, "token": "token-0"},
+                    {"id": str(ti_ids[1]), "pid": 101, "token": "token-1"},
+                ]
+                return httpx.Response(
+                    status_code=200,
+                    json={
+                        "results": [
+                            {"id": str(ti_ids[0]), "status": "ok", "token": "refreshed-token-0"},
+                            {"id": str(ti_ids[1]), "status": "not_running"},
+                        ]
+                    },
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        resp = client.task_instances.bulk_heartbeat(
+            {ti_ids[0]: (100, "token-0"), ti_ids[1]: (101, "token-1")}
+        )
+
+        assert resp == TIBulkHeartbeatResponse(
+            results=[
+                TIBulkHeartbeatResult(id=ti_ids[0], status=TIHeartbeatStatus.OK, token="refreshed-token-0"),
+                TIBulkHeartbeatResult(id=ti_ids[1], status=TIHeartbeatStatus.NOT_RUNNING),
+            ]
+        )
+
     @pytest.mark.parametrize("queues_enabled", [False, True])
     def test_task_instance_defer(self, queues_enabled: bool):
         # Simulate a successful response from the server that defers a task
@@ -1075,6 +1202,36 @@ class TestXCOMOperations:
         )
         assert result == OKResponse(ok=True)
 
+    def test_xcom_set_bytes(self):
+        # Binary data in the serialized value is sent to the API server base64 encoded
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path == "/xcoms/dag_id/run_id/task_id/key":
+                assert request.headers["Content-Type"] == "application/json"
+                assert json.loads(request.read()) == {
+                    "__classname__": "pandas.DataFrame",
+                    "__version__": 2,
+                    "__data__": {
+                        "__classname__": "builtins.bytes",
+                        "__version__": 1,
+                        "__data__": "UEFSMQ==",
+                    },
+                }
+                return httpx.Response(
+                    status_code=201,
+                    json={"message": "XCom successfully set"},
+                )
+            return httpx.Response(status_code=400, json={"detail": "Bad Request"})
+
+        client = make_client(transport=httpx.MockTransport(handle_request))
+        result = client.xcoms.set(
+            dag_id="dag_id",
+            run_id="run_id",
+            task_id="task_id",
+            key="key",
+            value={"__classname__": "pandas.DataFrame", "__version__": 2, "__data__": b"PAR1"},
+        )
+        assert result == OKResponse(ok=True)
+
     def test_xcom_set_with_map_index(self):
         # Simulate a successful response from the server when setting an xcom with map_index passed
         def handle_request(request: httpx.Request) -> httpx.Response:
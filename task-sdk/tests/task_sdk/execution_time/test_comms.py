@@ -31,6 +31,7 @@ from airflow.sdk.execution_time.comms import (
     DeadlockImminentError,
     GetVariable,
     MaskSecret,
+    SetXCom,
     StartupDetails,
     VariableResult,
     _RequestFrame,
@@ -61,6 +62,15 @@ class TestCommsModels:
         mask_secret_object = MaskSecret(value=object_to_mask, name="test_secret")
         assert mask_secret_object.value == object_to_mask
 
+    def test_set_xcom_with_bytes(self):
+        value = {"__classname__": "numpy.ndarray", "__version__": 1, "__data__": b"\x93NUMPY"}
+        msg = SetXCom(key="k", value=value, dag_id="d", run_id="r", task_id="t")
+        assert msg.value == value
+
+        # msgpack carries the bytes as they are, without encoding them
+        decoded = msgspec.msgpack.decode(msgspec.msgpack.encode(msg.model_dump()))
+        assert SetXCom.model_validate(decoded).value == value
+
 
 class TestCommsDecoder:
     """Test the communication between the subprocess and the "supervisor"."""
@@ -73,6 +73,7 @@ def test_len(mock_supervisor_comms, lazy_sequence):
     )
 
 
+@conf_vars({("core", "xcom_sequence_page_size"): "1"})
 def test_iter(mock_supervisor_comms, lazy_sequence):
     it = iter(lazy_sequence)
 
@@ -105,6 +106,59 @@ def test_iter(mock_supervisor_comms, lazy_sequence):
     )
 
 
+def _slice_request(start, stop):
+    return call(
+        GetXComSequenceSlice(
+            key=BaseXCom.XCOM_RETURN_KEY,
+            dag_id="dag",
+            task_id="task",
+            run_id="run",
+            start=start,
+            stop=stop,
+            step=None,
+        ),
+    )
+
+
+@conf_vars({("core", "xcom_sequence_page_size"): "2"})
+def test_iter_paged(mock_supervisor_comms, lazy_sequence):
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=["a", "b"]),
+        XComSequenceSliceResult(root=["c", "d"]),
+        XComSequenceSliceResult(root=["e"]),
+    ]
+    assert list(iter(lazy_sequence)) == ["a", "b", "c", "d", "e"]
+    # The short last page tells us we're done, without another request
+    assert mock_supervisor_comms.send.mock_calls == [
+        _slice_request(0, 2),
+        _slice_request(2, 4),
+        _slice_request(4, 6),
+    ]
+
+
+@conf_vars({("core", "xcom_sequence_page_size"): "2"})
+def test_iter_paged_ends_on_empty_page(mock_supervisor_comms, lazy_sequence):
+    mock_supervisor_comms.send.side_effect = [
+        XComSequenceSliceResult(root=["a", "b"]),
+        XComSequenceSliceResult(root=[]),
+    ]
+    it = iter(lazy_sequence)
+    assert list(it) == ["a", "b"]
+    assert list(it) == []
+    assert mock_supervisor_comms.send.mock_calls == [_slice_request(0, 2), _slice_request(2, 4)]
+
+
+@conf_vars({("core", "xcom_sequence_page_size"): "2"})
+def test_reversed_paged(mock_supervisor_comms, lazy_sequence):
+    mock_supervisor_comms.send.side_effect = [
+        XComCountResponse(len=3),
+        XComSequenceSliceResult(root=["b", "c"]),
+        XComSequenceSliceResult(root=["a"]),
+    ]
+    assert list(reversed(lazy_sequence)) == ["c", "b", "a"]
+    assert mock_supervisor_comms.send.mock_calls[1:] == [_slice_request(1, 3), _slice_request(0, 1)]
+
+
 def test_getitem_index(mock_supervisor_comms, lazy_sequence):
     mock_supervisor_comms.send.return_value = XComSequenceIndexResult(root="f")
     assert lazy_sequence[4] == "f"
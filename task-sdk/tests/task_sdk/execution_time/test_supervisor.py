@@ -17,6 +17,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import inspect
 import json
 import logging
@@ -27,6 +28,7 @@ import signal
 import socket
 import subprocess
 import sys
+import threading
 import time
 from contextlib import nullcontext
 from dataclasses import dataclass, field
@@ -67,6 +69,9 @@ from airflow.sdk.api.datamodels._generated import (
     PreviousTIResponse,
     TaskInstance,
     TaskInstanceState,
+    TIBulkHeartbeatResponse,
+    TIBulkHeartbeatResult,
+    TIHeartbeatStatus,
 )
 from airflow.sdk.exceptions import AirflowRuntimeError, ErrorType, TaskAlreadyRunningError
 from airflow.sdk.execution_time import supervisor, task_runner
@@ -162,8 +167,10 @@ from airflow.sdk.execution_time.comms import (
 from airflow.sdk.execution_time.supervisor import (
     SERVER_TERMINATED,
     ActivitySubprocess,
+    HeartbeatCoalescer,
     InProcessSupervisorComms,
     InProcessTestSupervisor,
+    MultiTaskSupervisor,
     ProcessTracker,
     WatchedSubprocess,
     _make_process_nondumpable,
@@ -300,7 +307,14 @@ class TestWatchedSubprocess:
             lambda: [EnvironmentVariablesBackend(), fresh_execution_backend()],
         )
 
-    def test_reading_from_pipes(self, captured_logs, time_machine, client_with_ti_start):
+    @pytest.mark.parametrize("asyncio_supervisor", [False, True], ids=["selector", "asyncio"])
+    def test_reading_from_pipes(
+        self, captured_logs, time_machine, client_with_ti_start, monkeypatch, asyncio_supervisor
+    ):
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.ASYNCIO_SUPERVISOR", asyncio_supervisor)
+        # Heartbeat through the (mocked) sync client from the asyncio loop too
+        client_with_ti_start.make_async.return_value = None
+
         def subprocess_main():
             # This is run in the subprocess!
 
@@ -847,7 +861,10 @@ class TestWatchedSubprocess:
         } in captured_logs
 
     @pytest.mark.parametrize("captured_logs", [logging.ERROR], indirect=True, ids=["log_level=error"])
-    def test_state_conflict_on_heartbeat(self, captured_logs, monkeypatch, mocker, make_ti_context_dict):
+    @pytest.mark.parametrize("asyncio_supervisor", [False, True], ids=["selector", "asyncio"])
+    def test_state_conflict_on_heartbeat(
+        self, captured_logs, monkeypatch, mocker, make_ti_context_dict, asyncio_supervisor
+    ):
         """
         Test that ensures that the Supervisor does not cause the task to fail if the Task Instance is no longer
         in the running state. Instead, it logs the error and terminates the task process if it
@@ -859,6 +876,7 @@ class TestWatchedSubprocess:
 
         # Heartbeat every time around the loop
         monkeypatch.setattr(airflow.sdk.execution_time.supervisor, "MIN_HEARTBEAT_INTERVAL", 0.0)
+        monkeypatch.setattr(airflow.sdk.execution_time.supervisor, "ASYNCIO_SUPERVISOR", asyncio_supervisor)
 
         def subprocess_main():
             CommsDecoder()._get_response()
@@ -1078,6 +1096,153 @@ class TestWatchedSubprocess:
             "loc": mocker.ANY,
         } in captured_logs
 
+    def test_heartbeats_are_coalesced(self, mocker):
+        """Supervisors sharing a HeartbeatCoalescer heartbeat with one bulk request."""
+        mocker.patch("airflow.sdk.execution_time.supervisor.MIN_HEARTBEAT_INTERVAL", 0)
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+        coalescer = HeartbeatCoalescer(max_delay=10)
+
+        procs = []
+        for pid in (101, 102, 103):
+            client = mocker.Mock()
+            client.auth.token = f"token-{pid}"
+            procs.append(
+                ActivitySubprocess(
+                    process_log=mocker.MagicMock(),
+                    id=uuid7(),
+                    pid=pid,
+                    stdin=mocker.MagicMock(),
+                    client=client,
+                    process=mocker.Mock(pid=pid),
+                    heartbeat_coalescer=coalescer,
+                )
+            )
+        bulk_heartbeat = procs[0].client.task_instances.bulk_heartbeat
+        bulk_heartbeat.return_value = TIBulkHeartbeatResponse(
+            results=[
+                TIBulkHeartbeatResult(id=procs[0].id, status=TIHeartbeatStatus.OK),
+                TIBulkHeartbeatResult(id=procs[1].id, status=TIHeartbeatStatus.RUNNING_ELSEWHERE),
+                TIBulkHeartbeatResult(id=procs[2].id, status=TIHeartbeatStatus.OK),
+            ]
+        )
+        procs[2].failed_heartbeats = 2
+
+        for proc in procs:
+            proc._send_heartbeat_if_needed()
+        # Nothing is sent until the oldest pending heartbeat has waited for `max_delay`
+        bulk_heartbeat.assert_not_called()
+
+        coalescer.flush()
+
+        bulk_heartbeat.assert_called_once_with({proc.id: (proc.pid, f"token-{proc.pid}") for proc in procs})
+        for proc in procs:
+            proc.client.task_instances.heartbeat.assert_not_called()
+        assert procs[0]._last_successful_heartbeat > 0
+        assert procs[2].failed_heartbeats == 0
+        assert procs[1]._terminal_state == SERVER_TERMINATED
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+
+        # When the bulk request fails, each supervisor in it sends its own heartbeat instead
+        bulk_heartbeat.side_effect = httpx.ConnectError("boom")
+        procs[2].client.task_instances.heartbeat.side_effect = httpx.ConnectError("boom")
+        for proc in procs:
+            proc._send_heartbeat_if_needed()
+        coalescer.flush()
+        assert bulk_heartbeat.call_count == 2
+        # The server-terminated task isn't heartbeated again
+        assert bulk_heartbeat.call_args.args[0] == {
+            procs[0].id: (101, "token-101"),
+            procs[2].id: (103, "token-103"),
+        }
+        procs[0].client.task_instances.heartbeat.assert_called_once_with(procs[0].id, pid=101)
+        procs[1].client.task_instances.heartbeat.assert_not_called()
+        procs[2].client.task_instances.heartbeat.assert_called_once_with(procs[2].id, pid=103)
+        assert [proc.failed_heartbeats for proc in procs] == [0, 0, 1]
+
+    def test_coalesced_heartbeats_with_stale_task_instance(self, mocker):
+        """A task instance refused in a bulk heartbeat doesn't affect the others, and heartbeats on its own."""
+        mocker.patch("airflow.sdk.execution_time.supervisor.MIN_HEARTBEAT_INTERVAL", 0)
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+        coalescer = HeartbeatCoalescer()
+
+        procs = []
+        for pid in (101, 102):
+            client = mocker.Mock()
+            client.auth.token = f"token-{pid}"
+            procs.append(
+                ActivitySubprocess(
+                    process_log=mocker.MagicMock(),
+                    id=uuid7(),
+                    pid=pid,
+                    stdin=mocker.MagicMock(),
+                    client=client,
+                    process=mocker.Mock(pid=pid),
+                    heartbeat_coalescer=coalescer,
+                )
+            )
+        stale, running = procs
+        stale.client.task_instances.heartbeat.side_effect = ServerResponseError.from_response(
+            httpx.Response(
+                404,
+                json={"detail": {"reason": "not_found"}},
+                request=httpx.Request("PUT", "http://test"),
+            )
+        )
+        for proc in procs:
+            proc.client.task_instances.bulk_heartbeat.return_value = TIBulkHeartbeatResponse(
+                results=[
+                    TIBulkHeartbeatResult(id=stale.id, status=TIHeartbeatStatus.UNAUTHORIZED),
+                    TIBulkHeartbeatResult(id=running.id, status=TIHeartbeatStatus.OK, token="refreshed"),
+                ]
+            )
+
+        stale._send_heartbeat_if_needed()
+        running._send_heartbeat_if_needed()
+        coalescer.flush()
+
+        assert running._last_successful_heartbeat > 0
+        assert running.client.auth.token == "refreshed"
+        assert running._terminal_state is None
+        running.client.task_instances.heartbeat.assert_not_called()
+        # The refused task instance heartbeats with its own token, and reacts to that response
+        stale.client.task_instances.heartbeat.assert_called_once_with(stale.id, pid=101)
+        assert stale._terminal_state == SERVER_TERMINATED
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+
+    def test_async_heartbeat(self, mocker):
+        """The asyncio supervisor loop heartbeats through the async client, with the same outcome handling."""
+        mocker.patch("airflow.sdk.execution_time.supervisor.MIN_HEARTBEAT_INTERVAL", 0)
+        mock_kill = mocker.patch("airflow.sdk.execution_time.supervisor.WatchedSubprocess.kill")
+        proc = ActivitySubprocess(
+            process_log=mocker.MagicMock(),
+            id=uuid7(),
+            pid=mocker.Mock(),
+            stdin=mocker.MagicMock(),
+            client=mocker.Mock(),
+            process=mocker.Mock(pid=101),
+        )
+        proc.failed_heartbeats = 1
+        async_client = mocker.Mock()
+        async_client.task_instances.heartbeat = mocker.AsyncMock()
+
+        asyncio.run(proc._asend_heartbeat_if_needed(async_client))
+
+        async_client.task_instances.heartbeat.assert_awaited_once_with(proc.id, pid=101)
+        proc.client.task_instances.heartbeat.assert_not_called()
+        assert proc.failed_heartbeats == 0
+
+        async_client.task_instances.heartbeat.side_effect = ServerResponseError.from_response(
+            httpx.Response(
+                409,
+                json={"detail": {"reason": "not_running"}},
+                request=httpx.Request("PUT", "http://test"),
+            )
+        )
+        asyncio.run(proc._asend_heartbeat_if_needed(async_client))
+
+        assert proc._terminal_state == SERVER_TERMINATED
+        mock_kill.assert_called_once_with(signal.SIGTERM, force=True)
+
     @pytest.mark.parametrize(
         ("terminal_state", "task_end_time_monotonic", "overtime_threshold", "expected_kill"),
         [
@@ -1309,6 +1474,230 @@ class TestWatchedSubprocess:
             proc.kill(signal.SIGKILL, force=True)
 
 
+@pytest.mark.usefixtures("disable_capturing")
+class TestMultiTaskSupervisor:
+    @pytest.fixture(autouse=True)
+    def disable_log_upload(self, spy_agency):
+        spy_agency.spy_on(ActivitySubprocess._upload_logs, call_original=False)
+
+    def test_supervises_several_tasks(self, monkeypatch, make_ti_context_dict):
+        """Tasks are run concurrently with their own tokens, and heartbeat together."""
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.MIN_HEARTBEAT_INTERVAL", 0)
+
+        def subprocess_main():
+            msg = CommsDecoder()._get_response()
+            sleep(1)
+            # Exit code 1 for the first task, 0 for the others
+            exit(int(msg.ti.task_id == "t0"))
+
+        tis = [
+            TaskInstance(
+                id=uuid7(),
+                task_id=f"t{i}",
+                dag_id="c",
+                run_id="d",
+                try_number=1,
+                dag_version_id=uuid7(),
+                queue="default",
+            )
+            for i in range(3)
+        ]
+        requests = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            requests.append((request.method, request.url.path, request.headers["Authorization"]))
+            if request.url.path.endswith("/run"):
+                return httpx.Response(200, json=make_ti_context_dict())
+            if request.url.path == "/task-instances/heartbeats":
+                heartbeats = json.loads(request.read())["heartbeats"]
+                return httpx.Response(
+                    200, json={"results": [{"id": h["id"], "status": "ok"} for h in heartbeats]}
+                )
+            return httpx.Response(status_code=204)
+
+        finished = {}
+        with MultiTaskSupervisor(
+            client=make_client(transport=httpx.MockTransport(handle_request)), heartbeat_max_delay=0.2
+        ) as supervisor:
+            for ti in tis:
+                supervisor.start_task(
+                    ti=ti,
+                    bundle_info=FAKE_BUNDLE,
+                    dag_rel_path=os.devnull,
+                    token=f"token-{ti.task_id}",
+                    target=subprocess_main,
+                    on_finish=lambda exit_code, error, ti_id=ti.id: finished.__setitem__(
+                        ti_id, (exit_code, error)
+                    ),
+                )
+            assert supervisor.running_tasks == 3
+            supervisor.run_until_complete()
+
+        assert finished == {tis[0].id: (1, None), tis[1].id: (0, None), tis[2].id: (0, None)}
+        for ti in tis:
+            assert ("PATCH", f"/task-instances/{ti.id}/run", f"Bearer token-{ti.task_id}") in requests
+        assert [path for _, path, _ in requests if path.endswith("/state")] == [
+            f"/task-instances/{tis[0].id}/state"
+        ]
+        # The tasks heartbeat in bulk, never one by one
+        assert ("PUT", "/task-instances/heartbeats") in {(method, path) for method, path, _ in requests}
+        assert not any(path.endswith("/heartbeat") for _, path, _ in requests)
+
+    @staticmethod
+    def _make_tis(*task_ids: str) -> list[TaskInstance]:
+        return [
+            TaskInstance(
+                id=uuid7(),
+                task_id=task_id,
+                dag_id="c",
+                run_id="d",
+                try_number=1,
+                dag_version_id=uuid7(),
+                queue="default",
+            )
+            for task_id in task_ids
+        ]
+
+    def test_slow_request_does_not_hold_up_other_tasks(self, make_ti_context_dict):
+        def subprocess_main():
+            comms = CommsDecoder()
+            msg = comms._get_response()
+            comms.send(GetVariable(key=msg.ti.task_id))
+
+        fast_handled = threading.Event()
+        slow_waited_for_fast = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/run"):
+                return httpx.Response(200, json=make_ti_context_dict())
+            if request.url.path == "/variables/slow":
+                # Only returns early if the request of the other task is handled in the meantime
+                slow_waited_for_fast.append(fast_handled.wait(timeout=10))
+            elif request.url.path == "/variables/fast":
+                fast_handled.set()
+            if request.url.path.startswith("/variables/"):
+                return httpx.Response(200, json={"key": request.url.path.rsplit("/")[-1], "value": "value"})
+            return httpx.Response(status_code=204)
+
+        finished = {}
+        with MultiTaskSupervisor(client=make_client(transport=httpx.MockTransport(handle_request))) as sup:
+            for ti in self._make_tis("slow", "fast"):
+                sup.start_task(
+                    ti=ti,
+                    bundle_info=FAKE_BUNDLE,
+                    dag_rel_path=os.devnull,
+                    token="",
+                    target=subprocess_main,
+                    on_finish=lambda exit_code, error, task_id=ti.task_id: finished.__setitem__(
+                        task_id, exit_code
+                    ),
+                )
+            sup.run_until_complete()
+
+        assert slow_waited_for_fast == [True]
+        assert finished == {"slow": 0, "fast": 0}
+
+    def test_slow_finalization_does_not_hold_up_other_tasks(self, make_ti_context_dict):
+        def subprocess_main():
+            comms = CommsDecoder()
+            msg = comms._get_response()
+            if msg.ti.task_id == "slow":
+                # Reported as failed by the supervisor once the process exited
+                exit(1)
+            sleep(0.5)
+            comms.send(GetVariable(key="fast"))
+
+        tis = self._make_tis("slow", "fast")
+        fast_handled = threading.Event()
+        slow_waited_for_fast = []
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/run"):
+                return httpx.Response(200, json=make_ti_context_dict())
+            if request.url.path == f"/task-instances/{tis[0].id}/state":
+                # Only returns early if the request of the other task is handled in the meantime
+                slow_waited_for_fast.append(fast_handled.wait(timeout=10))
+            elif request.url.path == "/variables/fast":
+                fast_handled.set()
+                return httpx.Response(200, json={"key": "fast", "value": "value"})
+            return httpx.Response(status_code=204)
+
+        finished = {}
+        with MultiTaskSupervisor(client=make_client(transport=httpx.MockTransport(handle_request))) as sup:
+            for ti in tis:
+                sup.start_task(
+                    ti=ti,
+                    bundle_info=FAKE_BUNDLE,
+                    dag_rel_path=os.devnull,
+                    token="",
+                    target=subprocess_main,
+                    on_finish=lambda exit_code, error, task_id=ti.task_id: finished.__setitem__(
+                        task_id, (exit_code, error)
+                    ),
+                )
+            sup.run_until_complete()
+
+        assert slow_waited_for_fast == [True]
+        assert finished == {"slow": (1, None), "fast": (0, None)}
+
+    @pytest.mark.enable_redact
+    def test_secrets_of_finished_tasks_are_no_longer_masked(self, make_ti_context_dict):
+        from airflow.sdk._shared.secrets_masker import redact
+
+        def subprocess_main():
+            comms = CommsDecoder()
+            msg = comms._get_response()
+            if msg.ti.task_id == "short":
+                # After the long-running task has masked its secret
+                sleep(0.5)
+            comms.send(MaskSecret(value=f"secret-of-{msg.ti.task_id}"))
+            if msg.ti.task_id == "long":
+                sleep(2)
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/run"):
+                return httpx.Response(200, json=make_ti_context_dict())
+            return httpx.Response(status_code=204)
+
+        finished = set()
+        with MultiTaskSupervisor(client=make_client(transport=httpx.MockTransport(handle_request))) as sup:
+            for ti in self._make_tis("long", "short"):
+                sup.start_task(
+                    ti=ti,
+                    bundle_info=FAKE_BUNDLE,
+                    dag_rel_path=os.devnull,
+                    token="",
+                    target=subprocess_main,
+                    on_finish=lambda exit_code, error, task_id=ti.task_id: finished.add(task_id),
+                )
+            while "short" not in finished:
+                sup.serve()
+            sup.serve()
+
+            assert "long" not in finished
+            assert redact("secret-of-short secret-of-long") == "secret-of-short ***"
+
+            sup.run_until_complete()
+
+        assert redact("secret-of-short secret-of-long") == "secret-of-short secret-of-long"
+
+    def test_start_task_rejects_other_coordinators(self, monkeypatch):
+        monkeypatch.setattr(MultiTaskSupervisor, "can_supervise", staticmethod(lambda queue: False))
+        ti = TaskInstance(
+            id=uuid7(),
+            task_id="b",
+            dag_id="c",
+            run_id="d",
+            try_number=1,
+            dag_version_id=uuid7(),
+            queue="java",
+        )
+        with MultiTaskSupervisor(client=make_client(transport=httpx.MockTransport(lambda r: None))) as sup:
+            with pytest.raises(ValueError, match="aren't run by the Python coordinator"):
+                sup.start_task(ti=ti, bundle_info=FAKE_BUNDLE, dag_rel_path=os.devnull, token="")
+            assert sup.running_tasks == 0
+
+
 class TestWatchedSubprocessKill:
     @pytest.fixture
     def mock_process(self, mocker):
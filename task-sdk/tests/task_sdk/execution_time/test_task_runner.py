@@ -98,6 +98,7 @@ from airflow.sdk.exceptions import (
     AirflowTaskTimeout,
     DownstreamTasksSkipped,
     ErrorType,
+    TaskAwaitingInput,
     TaskDeferred,
 )
 from airflow.sdk.execution_time import task_runner
@@ -106,6 +107,7 @@ from airflow.sdk.execution_time.comms import (
     AssetEventsResult,
     AssetResult,
     AssetsByAliasResult,
+    AwaitInputTask,
     BundleInfo,
     ClearAssetStateStoreByName,
     ClearTaskStateStore,
@@ -172,6 +174,7 @@ from airflow.sdk.execution_time.context import (
 from airflow.sdk.execution_time.task_runner import (
     RuntimeTaskInstance,
     TaskRunnerMarker,
+    _await_input_task,
     _defer_task,
     _execute_task,
     _make_task_span,
@@ -988,6 +991,75 @@ def test_defer_task_queue_assignment(
     )
 
 
+class PayloadTrigger(BaseTrigger):
+    """Trigger with a kwarg, for testing how trigger kwargs are serialized"""
+
+    def __init__(self, payload):
+        super().__init__()
+        self.payload = payload
+
+    def serialize(self) -> tuple[str, dict[str, Any]]:
+        return ("tests.task_sdk.execution_time.test_task_runner.PayloadTrigger", {"payload": self.payload})
+
+    async def run(self):
+        yield TriggerEvent(True)
+
+
+def test_defer_task_with_binary_kwargs(create_runtime_ti):
+    """Binary data in the kwargs is sent in its JSON form, which the Execution API accepts."""
+    from airflow.providers.standard.operators.empty import EmptyOperator
+
+    runtime_ti = create_runtime_ti(dag_id="deferred_run", task=EmptyOperator(task_id="binary_kwargs"))
+    msg, _ = _defer_task(
+        defer=TaskDeferred(
+            trigger=PayloadTrigger(payload=b"\x00trigger"),
+            method_name="foo",
+            kwargs={"data": [b"\x00next"]},
+        ),
+        ti=runtime_ti,
+        log=mock.MagicMock(),
+    )
+
+    assert isinstance(msg, DeferTask)
+    assert DeferTask.model_validate_json(msg.model_dump_json()) == msg
+    assert deserialize(msg.trigger_kwargs) == {"payload": b"\x00trigger"}
+    assert deserialize(msg.next_kwargs) == {"data": [b"\x00next"]}
+
+
+def test_defer_task_with_dataframe_kwargs(create_runtime_ti):
+    """A DataFrame, which is serialized to a Parquet file, can be passed on to the method resuming the task."""
+    pytest.importorskip("pyarrow")
+    from airflow.providers.standard.operators.empty import EmptyOperator
+
+    df = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+    runtime_ti = create_runtime_ti(dag_id="deferred_run", task=EmptyOperator(task_id="dataframe_kwargs"))
+    msg, _ = _defer_task(
+        defer=TaskDeferred(trigger=SuccessTrigger(), method_name="foo", kwargs={"df": df}),
+        ti=runtime_ti,
+        log=mock.MagicMock(),
+    )
+
+    assert isinstance(msg, DeferTask)
+    msg = DeferTask.model_validate_json(msg.model_dump_json())
+    assert deserialize(msg.next_kwargs)["df"].equals(df)
+
+
+def test_await_input_task_with_binary_kwargs(create_runtime_ti):
+    from airflow.providers.standard.operators.empty import EmptyOperator
+
+    runtime_ti = create_runtime_ti(dag_id="awaiting_input_run", task=EmptyOperator(task_id="binary_kwargs"))
+    msg, state = _await_input_task(
+        awaiting=TaskAwaitingInput(method_name="foo", kwargs={"data": b"\x00next"}),
+        ti=runtime_ti,
+        log=mock.MagicMock(),
+    )
+
+    assert isinstance(msg, AwaitInputTask)
+    assert state == TaskInstanceState.AWAITING_INPUT
+    assert AwaitInputTask.model_validate_json(msg.model_dump_json()) == msg
+    assert deserialize(msg.next_kwargs) == {"data": b"\x00next"}
+
+
 @pytest.mark.parametrize(
     ("should_retry", "expected_state"),
     [
@@ -0,0 +1,226 @@
+#
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import os
+import signal
+import sys
+import time
+from socket import socketpair
+from unittest.mock import MagicMock
+
+import httpx
+import psutil
+import pytest
+from task_sdk import FAKE_BUNDLE, make_client
+from uuid6 import uuid7
+
+from airflow.sdk.api import client as sdk_client
+from airflow.sdk.api.datamodels._generated import TaskInstance
+from airflow.sdk.execution_time import zygote as zygote_module
+from airflow.sdk.execution_time.comms import CommsDecoder
+from airflow.sdk.execution_time.supervisor import ActivitySubprocess, MultiTaskSupervisor
+from airflow.sdk.execution_time.zygote import Zygote, ZygoteChildTracker, ZygoteError
+
+pytestmark = pytest.mark.skipif(sys.platform == "darwin", reason="The task zygote is not used on macOS")
+
+
+def _print_and_exit():
+    # Run in a process forked from the zygote, so it has to be importable by name
+    print(f"forked from {os.getppid()}")
+    sys.exit(3)
+
+
+def _sleep_forever():
+    while True:
+        time.sleep(1)
+
+
+def _print_inherited_fd():
+    print(os.readlink(f"/proc/self/fd/{os.environ['_ZYGOTE_TEST_FD']}"))
+
+
+def _task_main():
+    CommsDecoder()._get_response()
+    print("Hello from the zygote")
+
+
+@pytest.fixture
+def zygote():
+    zygote = Zygote.start()
+    yield zygote
+    zygote.close()
+
+
+def _fork(zygote: Zygote, target) -> tuple[ZygoteChildTracker, list]:
+    pairs = [socketpair() for _ in range(4)]
+    tracker = zygote.fork(
+        target,
+        child_requests=pairs[0][0],
+        child_stdout=pairs[1][0],
+        child_stderr=pairs[2][0],
+        child_logs=pairs[3][0],
+        new_process_group=True,
+    )
+    for child_end, _ in pairs:
+        child_end.close()
+    return tracker, [read_end for _, read_end in pairs]
+
+
+@pytest.mark.usefixtures("disable_capturing")
+class TestZygote:
+    def test_fork_reports_exit_code(self, zygote):
+        tracker, (requests, stdout, *_) = _fork(zygote, _print_and_exit)
+
+        assert tracker.wait(timeout=10) == 3
+        # The task process is a child of the zygote, not of us, and got a process group of its own
+        assert stdout.makefile().read() == f"forked from {zygote.pid}\n"
+        with pytest.raises(psutil.NoSuchProcess):
+            tracker.send_signal(signal.SIGTERM)
+
+    def test_fork_reports_signal(self, zygote):
+        tracker, _ = _fork(zygote, _sleep_forever)
+
+        with pytest.raises(ZygoteChildTracker.TimeoutExpired):
+            tracker.wait(timeout=0)
+        assert os.getpgid(tracker.pid) == tracker.pid
+
+        tracker.send_signal(signal.SIGTERM)
+        rc = tracker.wait(timeout=10)
+        assert rc == -signal.SIGTERM
+        # Named like the psutil exit codes, for the supervisor to log
+        assert rc.name == "SIGTERM"
+
+    def test_fork_requires_importable_target(self, zygote):
+        def local_target():
+            pass
+
+        with pytest.raises(ValueError, match="top-level importable target"):
+            _fork(zygote, local_target)
+
+    def test_fork_after_zygote_exited(self, zygote):
+        os.kill(zygote.pid, signal.SIGKILL)
+        os.waitpid(zygote.pid, 0)
+
+        with pytest.raises(ZygoteError):
+            _fork(zygote, _print_and_exit)
+        assert not zygote.alive
+
+    def test_inherited_fds_not_passed_on(self, tmp_path, monkeypatch):
+        # Say the log file of a task, open in the supervisor as the zygote starts
+        with open(tmp_path / "task.log", "w") as log_file:
+            monkeypatch.setenv("_ZYGOTE_TEST_FD", str(log_file.fileno()))
+            zygote = Zygote.start()
+        try:
+            tracker, (requests, stdout, *_) = _fork(zygote, _print_inherited_fd)
+            assert tracker.wait(timeout=10) == 0
+            assert stdout.makefile().read() == f"{os.devnull}\n"
+        finally:
+            zygote.close()
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_start_task_zygote(self, enabled, monkeypatch):
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.TASK_ZYGOTE", enabled)
+        monkeypatch.setattr(zygote_module, "_task_zygote", None)
+
+        zygote = zygote_module.start_task_zygote()
+        try:
+            assert zygote is zygote_module._task_zygote
+            assert (zygote is not None) is enabled
+        finally:
+            if zygote is not None:
+                zygote.close()
+
+    def test_get_task_zygote_restarts_dead_zygote(self, monkeypatch):
+        monkeypatch.setattr(zygote_module, "_task_zygote", None)
+        first = zygote_module.get_task_zygote()
+        try:
+            assert zygote_module.get_task_zygote() is first
+
+            first.alive = False
+            second = zygote_module.get_task_zygote()
+            assert second is not first
+            assert second.alive
+        finally:
+            zygote_module.get_task_zygote().close()
+
+    def test_activity_subprocess_forked_from_zygote(self, captured_logs, make_ti_context, monkeypatch):
+        monkeypatch.setattr("airflow.sdk.execution_time.supervisor.TASK_ZYGOTE", True)
+        monkeypatch.setattr(zygote_module, "_task_zygote", None)
+        client = MagicMock(spec=sdk_client.Client)
+        client.task_instances.start.return_value = make_ti_context()
+
+        try:
+            proc = ActivitySubprocess.start(
+                dag_rel_path=os.devnull,
+                bundle_info=FAKE_BUNDLE,
+                what=TaskInstance(
+                    id=uuid7(),
+                    task_id="b",
+                    dag_id="c",
+                    run_id="d",
+                    try_number=1,
+                    dag_version_id=uuid7(),
+                    queue="default",
+                ),
+                client=client,
+                target=_task_main,
+            )
+            assert isinstance(proc._process, ZygoteChildTracker)
+            assert psutil.Process(proc.pid).ppid() == zygote_module._task_zygote.pid
+
+            assert proc.wait() == 0
+        finally:
+            zygote_module._task_zygote.close()
+
+        assert {"logger": "task.stdout", "event": "Hello from the zygote"} in [
+            {k: log[k] for k in ("logger", "event")} for log in captured_logs
+        ]
+
+    def test_multi_task_supervisor_forks_from_zygote(self, make_ti_context_dict, monkeypatch):
+        monkeypatch.setattr(zygote_module, "_task_zygote", None)
+
+        def handle_request(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/run"):
+                return httpx.Response(200, json=make_ti_context_dict())
+            return httpx.Response(status_code=204)
+
+        with MultiTaskSupervisor(client=make_client(transport=httpx.MockTransport(handle_request))) as sup:
+            # Started with the supervisor, before it has any thread
+            zygote = zygote_module._task_zygote
+            assert zygote is not None
+            try:
+                proc = sup.start_task(
+                    ti=TaskInstance(
+                        id=uuid7(),
+                        task_id="b",
+                        dag_id="c",
+                        run_id="d",
+                        try_number=1,
+                        dag_version_id=uuid7(),
+                        queue="default",
+                    ),
+                    bundle_info=FAKE_BUNDLE,
+                    dag_rel_path=os.devnull,
+                    token="",
+                    target=_task_main,
+                )
+                assert psutil.Process(proc.pid).ppid() == zygote.pid
+                sup.run_until_complete()
+            finally:
+                zygote.close()
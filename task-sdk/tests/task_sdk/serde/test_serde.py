@@ -44,6 +44,7 @@ from airflow.sdk.serde import (
     _match_regexp,
     allow_class,
     deserialize,
+    encode_bytes,
     iter_pydantic_models,
     serialize,
 )
@@ -261,6 +262,25 @@ class TestSerDe:
         e = deserialize(serialize(i))
         assert i == e
 
+    def test_ser_bytes(self):
+        i = b"\x00\x01binary"
+        e = serialize({"a": [i]})
+        assert e == {"a": [encode_bytes(i)]}
+        assert deserialize(e) == {"a": [i]}
+
+    def test_ser_bytes_keep_bytes(self):
+        i = b"\x00\x01binary"
+        e = serialize({"a": [i]}, keep_bytes=True)
+        assert e == {"a": [i]}
+        assert deserialize(e) == {"a": [i]}
+
+    def test_encode_bytes(self):
+        i = b"\x00\x01binary"
+        e = encode_bytes(i)
+        assert e == {CLASSNAME: "builtins.bytes", VERSION: 1, DATA: "AAFiaW5hcnk="}
+        assert deserialize(e) == i
+        assert deserialize(e, full=False) == "<8 bytes>"
+
     def test_der_collections_compat(self):
         i = [1, 2]
         e = deserialize(i)
@@ -18,6 +18,7 @@ from __future__ import annotations
 
 import datetime
 import decimal
+import json
 import uuid
 from importlib import metadata
 from typing import ClassVar
@@ -253,12 +254,42 @@ class TestSerializers:
             assert serialize(np.float64(3.14)) == (float(np.float64(3.14)), "numpy.float64", 1, True)
         else:
             assert serialize(np.float32(3.14)) == (float(np.float32(3.14)), "numpy.float32", 1, True)
-        assert serialize(np.array([1, 2, 3])) == ("", "", 0, False)
+        data, classname, ver, ok = serialize(np.array([1, 2, 3]))
+        assert isinstance(data, bytes)
+        assert (classname, ver, ok) == ("numpy.ndarray", 1, True)
+        assert serialize(np.array([object()])) == ("", "", 0, False)
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            np.array([1, 2, 3], dtype=np.int32),
+            np.arange(12, dtype=np.float64).reshape(3, 4),
+            np.array([True, False]),
+        ],
+    )
+    def test_numpy_ndarray(self, value):
+        e = serialize(value, keep_bytes=True)
+        assert isinstance(e[DATA], bytes)
+        d = deserialize(e)
+        assert isinstance(d, np.ndarray)
+        assert d.dtype == value.dtype
+        np.testing.assert_array_equal(d, value)
+
+    def test_numpy_ndarray_from_json(self):
+        from airflow.sdk.serde import encode_bytes
+
+        value = np.array([1, 2, 3])
+        e = serialize(value)
+        # the form the value takes when it is stored as JSON
+        assert e[DATA] == encode_bytes(serialize(value, keep_bytes=True)[DATA])
+        assert json.loads(json.dumps(e)) == e
+        np.testing.assert_array_equal(deserialize(e), value)
 
     @pytest.mark.parametrize(
         ("klass", "ver", "value", "msg"),
         [
             (np.int32, 999, 123, r"serialized version is newer"),
+            (np.ndarray, 1, "", r"serialized numpy\.ndarray has wrong data type .*<class 'str'>"),
         ],
     )
     def test_numpy_deserialize_errors(self, klass, ver, value, msg):
@@ -300,6 +331,23 @@ class TestSerializers:
         d = deserialize(e)
         assert i.equals(d)
 
+    def test_pandas_binary_payload(self):
+        import pandas as pd
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+        e = serialize(i, keep_bytes=True)
+        assert e[VERSION] == 2
+        assert isinstance(e[DATA], bytes)
+        assert e[DATA].startswith(b"PAR1")
+
+    def test_pandas_deserialize_v1_hex(self):
+        from airflow.sdk.serde.serializers.pandas import deserialize as pandas_deserialize
+
+        i = pd.DataFrame(data={"col1": [1, 2], "col2": [3, 4]})
+        # version 1 stored the Parquet file as a hex str
+        d = pandas_deserialize(pd.DataFrame, 1, serialize(i, keep_bytes=True)[DATA].hex())
+        assert i.equals(d)
+
     def test_pandas_serializers(self):
         from airflow.sdk.serde.serializers.pandas import serialize
 
@@ -313,7 +361,7 @@ class TestSerializers:
                 pd.DataFrame,
                 999,
                 "",
-                r"serialized 999 of pandas(\.core\.frame)?\.DataFrame > 1",
+                r"serialized 999 of pandas(\.core\.frame)?\.DataFrame > 2",
             ),  # version too new
             (
                 pd.DataFrame,
@@ -321,6 +369,12 @@ class TestSerializers:
                 123,
                 r"serialized pandas(\.core\.frame)?\.DataFrame has wrong data type .*<class 'int'>",
             ),  # bad payload type
+            (
+                pd.DataFrame,
+                2,
+                "",
+                r"serialized pandas(\.core\.frame)?\.DataFrame has wrong data type .*<class 'str'>",
+            ),  # hex payload is only written by version 1
             (str, 1, "", r"do not know how to deserialize builtins.str"),  # bad class
         ],
     )